@@ -0,0 +1 @@
+"""Benchmarks of the glnova clients."""
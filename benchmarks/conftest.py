@@ -0,0 +1,27 @@
+"""Fixtures of the memory and soak suites."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+
+from benchmarks.process import start_mock_server
+
+
+@pytest.fixture(scope="session")
+def records() -> int:
+    """Get the number of synthetic issues listed by the memory suite from ``GLNOVA_MEMORY_RECORDS``."""
+    return int(os.environ.get("GLNOVA_MEMORY_RECORDS", "100000"))
+
+
+@pytest.fixture(scope="session")
+def mock_url(records: int) -> Iterator[str]:
+    """Serve ``records`` issues spread over 10 projects from a separate process."""
+    process, url = start_mock_server("--projects", "10", "--issues-per-project", str(max(1, records // 10)))
+    try:
+        yield url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
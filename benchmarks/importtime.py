@@ -0,0 +1,177 @@
+"""Import-time budgets of the package and the CLI.
+
+Runs every scenario in a fresh interpreter with ``python -X importtime``, adds up the
+cumulative import time of the modules it imports on top of the interpreter startup, and
+checks it against its budget. Budgets are multiples of the import time of ``requests``,
+measured the same way, so they follow the speed of the machine running them. It also checks that the scenario does not import modules
+it does not need, e.g. aiohttp for a synchronous CLI command or Typer for shell completion::
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --runs 10
+
+The CLI scenarios go through the console script and run against a mock GitLab started in a separate process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections.abc import Sequence
+
+from benchmarks.process import start_mock_server
+
+RUN_CLI = "import sys; from glnova.cli.entry import main; sys.argv[0] = 'glnova'; main()"
+
+COMPLETE_CLI = (
+    "import os; os.environ.update(_GLNOVA_COMPLETE='complete_bash', COMP_WORDS='glnova issue list --st', "
+    "COMP_CWORD='3'); from glnova.cli.entry import main; main()"
+)
+
+BASELINE = "import requests"
+
+# Name, Python code, CLI arguments, budget as a multiple of the baseline import time and modules
+# that must not be imported. The CLI arguments get ``--token`` and ``--base-url`` of the mock appended.
+# The budgets leave at least 50% of headroom over the times measured when they were set.
+SCENARIOS: list[tuple[str, str, tuple[str, ...], float, tuple[str, ...]]] = [
+    ("import glnova", "import glnova", (), 0.1, ("requests", "aiohttp", "rich", "typer")),
+    (
+        "import glnova.client.gitlab",
+        "import glnova.client.gitlab",
+        (),
+        2.5,
+        ("aiohttp", "rich", "typer", "pydantic", "yaml"),
+    ),
+    ("glnova completion", COMPLETE_CLI, (), 0.25, ("typer", "requests", "aiohttp", "rich")),
+    (
+        "glnova issue get",
+        RUN_CLI,
+        ("issue", "get", "--project-id", "1", "--issue-iid", "1"),
+        4.0,
+        ("aiohttp", "rich", "pydantic", "yaml"),
+    ),
+    (
+        "glnova issue list",
+        RUN_CLI,
+        ("issue", "list", "--project", "1", "--per-page", "5"),
+        4.0,
+        ("aiohttp", "rich", "pydantic", "yaml"),
+    ),
+]
+
+
+def parse_importtime(output: str) -> dict[str, int]:
+    """Parse the output of ``python -X importtime``.
+
+    Args:
+        output: The standard error of the interpreter.
+
+    Returns:
+        The cumulative import time in microseconds of every top-level import, by module.
+        Modules imported by other modules are included with a time of 0.
+
+    """
+    modules: dict[str, int] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue
+        module = name.strip()
+        top_level = not name[1:].startswith(" ")
+        modules[module] = modules.get(module, 0) + (int(cumulative) if top_level else 0)
+    return modules
+
+
+def run_importtime(code: str, arguments: Sequence[str] = ()) -> dict[str, int]:
+    """Run Python code in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        code: The code.
+        arguments: The command-line arguments passed to the code.
+
+    Returns:
+        The parsed import times.
+
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *arguments],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{code} {' '.join(arguments)} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure_scenarios(base_url: str, runs: int = 5) -> list[dict[str, object]]:
+    """Measure the import time of every scenario.
+
+    Args:
+        base_url: The base URL of the GitLab the CLI scenarios run against.
+        runs: Number of runs of every scenario, of which the median is kept.
+
+    Returns:
+        The name, median import time in milliseconds, budget in milliseconds and unwanted imported modules
+        of every scenario.
+
+    """
+    startup = set(run_importtime("pass"))
+
+    def measure(code: str, arguments: Sequence[str] = ()) -> tuple[float, set[str]]:
+        times = []
+        imported: set[str] = set()
+        for _ in range(runs):
+            modules = run_importtime(code, arguments)
+            times.append(sum(time for module, time in modules.items() if module not in startup) / 1000)
+            imported |= set(modules)
+        return statistics.median(times), imported
+
+    baseline, _ = measure(BASELINE)
+    results = []
+    for name, code, arguments, budget, forbidden in SCENARIOS:
+        cli_arguments = (*arguments, "--token", "token", "--base-url", base_url) if arguments else ()
+        ms, imported = measure(code, cli_arguments)
+        unwanted = sorted({module.split(".")[0] for module in imported} & set(forbidden))
+        results.append({"name": name, "ms": ms, "budget": budget * baseline, "unwanted": unwanted})
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the import-time budgets from the command line.
+
+    Args:
+        argv: Command-line arguments.
+
+    Returns:
+        The exit status, 1 if a scenario exceeds its budget or imports unwanted modules.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Runs of every scenario, of which the median is kept.")
+    args = parser.parse_args(argv)
+
+    process, url = start_mock_server("--projects", "2", "--issues-per-project", "10")
+    try:
+        results = measure_scenarios(base_url=url, runs=args.runs)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+    failed = False
+    for result in results:
+        over = result["ms"] > result["budget"]
+        failed = failed or over or bool(result["unwanted"])
+        unwanted = f", imports {', '.join(result['unwanted'])}" if result["unwanted"] else ""
+        print(f"{result['name']:<32} {result['ms']:8.1f} ms  budget {result['budget']:6.1f} ms{unwanted}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Benchmark the per-request overhead of the default middleware pipeline.
+
+The transport is a function returning a prepared response, so the measured time is
+the cost of the middleware hooks alone.
+
+Usage:
+    python benchmarks/middleware_overhead.py [--requests N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from glnova.client.base import Client
+from glnova.client.middleware import Request, default_middlewares, run_middlewares
+
+
+class _Response:
+    """Response passing the status check."""
+
+    def raise_for_status(self) -> None:
+        """Accept every status."""
+
+
+def measure(requests: int) -> float:
+    """Measure the mean time of a request through the default pipeline.
+
+    Args:
+        requests: Number of requests to time.
+
+    Returns:
+        The mean time per request in microseconds.
+
+    """
+    client = Client(token="bench", base_url="https://gitlab.com")
+    middlewares = default_middlewares()
+    response = _Response()
+    start = time.perf_counter()
+    for _ in range(requests):
+        run_middlewares(middlewares, client, Request("GET", "/projects", etag='"abc"'), lambda request: response)
+    elapsed = time.perf_counter() - start
+    return elapsed / requests * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the mean time per request."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000, help="Number of requests to time.")
+    args = parser.parse_args()
+
+    measure(min(args.requests, 1000))  # Warm up.
+    print(f"middlewares: {measure(args.requests):8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Helpers shared by the benchmark suites."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+
+def start_mock_server(*arguments: str) -> tuple[subprocess.Popen[str], str]:
+    """Start a mock GitLab in a separate process.
+
+    Running it out of process keeps its allocations and CPU time out of the measurements.
+
+    Args:
+        *arguments: Command-line arguments of ``python -m glnova.testing``.
+
+    Returns:
+        The process and the base URL of the server.
+
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "glnova.testing", "--port", "0", *arguments],
+        stdout=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    assert process.stdout is not None
+    line = process.stdout.readline()
+    if not line.startswith("Serving a mock GitLab at "):
+        process.kill()
+        raise RuntimeError(f"The mock GitLab did not start: {line!r}")
+    return process, line.rsplit(" ", 1)[-1].strip()
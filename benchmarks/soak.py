@@ -0,0 +1,392 @@
+"""Soak harness checking the clients for connection, file descriptor, task and memory leaks.
+
+Runs a mixed workload of the synchronous and asynchronous clients against a mock GitLab
+in a separate process, with injected latency and faults, for a long time. It samples the
+open file descriptors and sockets, the asyncio tasks, the threads and the memory of the
+process at a fixed interval, and fails if any of them keeps growing after the warm-up.
+
+The workload includes long-lived clients, clients opened and closed for every request,
+conditional requests answered with 304, edits, 404s, injected 5xx answers and requests
+cancelled in flight.
+
+Usage:
+    python -m benchmarks.soak --duration 4h --interval 30 --output soak.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from benchmarks.process import start_mock_server
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.gitlab import GitLab
+
+# Growth of a metric between the start and the end of the run, after the warm-up, above
+# which it counts as a leak.
+TOLERANCES: dict[str, float] = {
+    "fds": 8,
+    "sockets": 8,
+    "tasks": 8,
+    "threads": 2,
+    "rss_mb": 32,
+    "allocated_blocks": 50000,
+}
+
+WARMUP_FRACTION = 0.2
+
+MOCK_ARGUMENTS = ("--projects", "10", "--issues-per-project", "200", "--jitter", "0.005", "--fault-rate", "0.02")
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration such as ``90``, ``30s``, ``15m`` or ``4h``.
+
+    Args:
+        value: The duration.
+
+    Returns:
+        The duration in seconds.
+
+    Raises:
+        argparse.ArgumentTypeError: If the duration is invalid.
+
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smh]?)", value.strip())
+    if match is None:
+        raise argparse.ArgumentTypeError(f"Invalid duration: {value}.")
+    return float(match.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600}[match.group(2)]
+
+
+def count_descriptors() -> tuple[int | None, int | None]:
+    """Count the open file descriptors and sockets of the process.
+
+    Returns:
+        The number of file descriptors and of sockets, None if they cannot be listed.
+
+    """
+    try:
+        names = os.listdir("/proc/self/fd")
+    except OSError:
+        return None, None
+    sockets = 0
+    for name in names:
+        try:
+            if os.readlink(f"/proc/self/fd/{name}").startswith("socket:"):
+                sockets += 1
+        except OSError:
+            continue
+    return len(names), sockets
+
+
+def read_rss() -> float | None:
+    """Read the resident set size of the process.
+
+    Returns:
+        The resident set size in MiB, or None if it cannot be read.
+
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def take_sample(elapsed: float, tasks: int, counts: Counter[str]) -> dict[str, Any]:
+    """Sample the resources of the process.
+
+    Args:
+        elapsed: Seconds since the start of the run.
+        tasks: Number of asyncio tasks of the event loop.
+        counts: Number of operations by outcome so far.
+
+    Returns:
+        The sample.
+
+    """
+    fds, sockets = count_descriptors()
+    return {
+        "elapsed": round(elapsed, 3),
+        "fds": fds,
+        "sockets": sockets,
+        "tasks": tasks,
+        "threads": threading.active_count(),
+        "rss_mb": read_rss(),
+        "allocated_blocks": sys.getallocatedblocks(),
+        "operations": sum(counts.values()),
+        "errors": sum(count for outcome, count in counts.items() if outcome != "ok"),
+    }
+
+
+def detect_growth(
+    samples: list[dict[str, Any]], tolerances: dict[str, float] | None = None, warmup_fraction: float = WARMUP_FRACTION
+) -> dict[str, float]:
+    """Find the metrics that grew without bound.
+
+    The samples of the warm-up are dropped. A metric leaks if the highest value of the last
+    quarter of the remaining samples exceeds the highest value of their first quarter by
+    more than its tolerance, i.e. if it is still climbing at the end of the run.
+
+    Args:
+        samples: The samples, in order.
+        tolerances: The allowed growth of every metric. Defaults to `TOLERANCES`.
+        warmup_fraction: Fraction of the samples treated as warm-up.
+
+    Returns:
+        The growth of every leaking metric.
+
+    """
+    tolerances = TOLERANCES if tolerances is None else tolerances
+    measured = samples[int(len(samples) * warmup_fraction) :]
+    quarter = max(1, len(measured) // 4)
+    if len(measured) < 2 * quarter:
+        return {}
+    leaks = {}
+    for metric, tolerance in tolerances.items():
+        first = [sample[metric] for sample in measured[:quarter] if sample.get(metric) is not None]
+        last = [sample[metric] for sample in measured[-quarter:] if sample.get(metric) is not None]
+        if first and last and max(last) - max(first) > tolerance:
+            leaks[metric] = max(last) - max(first)
+    return leaks
+
+
+def _sync_workload(base_url: str, stop: threading.Event, counts: Counter[str], seed: int) -> None:
+    """Run the synchronous part of the workload until stopped.
+
+    Args:
+        base_url: The URL of the mock GitLab.
+        stop: Event ending the workload.
+        counts: Number of operations by outcome, updated in place.
+        seed: Seed of the random choice of operations.
+
+    """
+    rng = random.Random(seed)
+    with GitLab(token="soak", base_url=base_url) as client:
+        etag = None
+        while not stop.is_set():
+            operation = rng.choice(("list", "get", "conditional", "edit", "missing", "short-lived"))
+            try:
+                if operation == "list":
+                    client.issue.list_issues(project=rng.randint(1, 10), per_page=50, page=rng.randint(1, 4))
+                elif operation == "get":
+                    client.issue.get_issue(project_id=1, issue_iid=rng.randint(1, 200))
+                elif operation == "conditional":
+                    _, info = client.issue.get_issue(project_id=1, issue_iid=1, etag=etag)
+                    etag = info["etag"]
+                elif operation == "edit":
+                    client.issue.edit_issue(project_id=2, issue_iid=rng.randint(1, 200), title="soak")
+                elif operation == "missing":
+                    client.user.get_user(account_id=10**6)
+                else:
+                    with GitLab(token="soak", base_url=base_url) as short_lived:
+                        short_lived.user.get_user()
+                counts["ok"] += 1
+            except Exception as error:  # noqa: BLE001
+                counts[type(error).__name__] += 1
+
+
+async def _async_worker(
+    client: AsyncGitLab,
+    base_url: str,
+    deadline: float,
+    counts: Counter[str],
+    rng: random.Random,
+) -> None:
+    """Run one worker of the asynchronous part of the workload until the deadline.
+
+    Args:
+        client: The long-lived client.
+        base_url: The URL of the mock GitLab.
+        deadline: Monotonic time at which the worker stops.
+        counts: Number of operations by outcome, updated in place.
+        rng: Random choice of operations.
+
+    """
+    etag = None
+    while time.monotonic() < deadline:
+        operation = rng.choice(("list", "get", "conditional", "edit", "missing", "cancelled", "short-lived"))
+        try:
+            if operation == "list":
+                await client.issue.list_issues(project=rng.randint(1, 10), per_page=50, page=rng.randint(1, 4))
+            elif operation == "get":
+                await client.issue.get_issue(project_id=1, issue_iid=rng.randint(1, 200))
+            elif operation == "conditional":
+                _, info = await client.issue.get_issue(project_id=1, issue_iid=1, etag=etag)
+                etag = info["etag"]
+            elif operation == "edit":
+                await client.issue.edit_issue(project_id=3, issue_iid=rng.randint(1, 200), title="soak")
+            elif operation == "missing":
+                await client.user.get_user(account_id=10**6)
+            elif operation == "cancelled":
+                await asyncio.wait_for(client.issue.list_issues(per_page=100), timeout=rng.uniform(0.0005, 0.005))
+            else:
+                async with AsyncGitLab(token="soak", base_url=base_url) as short_lived:
+                    await short_lived.user.get_user()
+            counts["ok"] += 1
+        except Exception as error:  # noqa: BLE001
+            counts[type(error).__name__] += 1
+
+
+async def _run_async(  # noqa: PLR0913
+    base_url: str,
+    duration: float,
+    interval: float,
+    concurrency: int,
+    counts: Counter[str],
+    on_sample: Callable[[dict[str, Any]], None],
+    seed: int,
+) -> None:
+    """Run the asynchronous workload and sample the resources until the duration has passed.
+
+    Args:
+        base_url: The URL of the mock GitLab.
+        duration: Length of the run in seconds.
+        interval: Seconds between samples.
+        concurrency: Number of asynchronous workers.
+        counts: Number of operations by outcome, updated in place.
+        on_sample: Callable receiving every sample.
+        seed: Seed of the random choice of operations.
+
+    """
+    start = time.monotonic()
+    deadline = start + duration
+
+    async def sample() -> None:
+        while True:
+            now = time.monotonic()
+            on_sample(take_sample(now - start, tasks=len(asyncio.all_tasks()), counts=counts))
+            if now >= deadline:
+                return
+            await asyncio.sleep(min(interval, max(0.0, deadline - now)))
+
+    async with AsyncGitLab(token="soak", base_url=base_url) as client:
+        workers = [
+            _async_worker(client, base_url, deadline=deadline, counts=counts, rng=random.Random(seed + index))
+            for index in range(concurrency)
+        ]
+        await asyncio.gather(sample(), *workers)
+
+
+def run_soak(  # noqa: PLR0913
+    duration: float,
+    interval: float,
+    concurrency: int = 8,
+    sync_threads: int = 2,
+    base_url: str | None = None,
+    on_sample: Callable[[dict[str, Any]], None] | None = None,
+    seed: int = 0,
+) -> tuple[list[dict[str, Any]], Counter[str]]:
+    """Run the mixed workload and sample the resources of the process.
+
+    Args:
+        duration: Length of the run in seconds.
+        interval: Seconds between samples.
+        concurrency: Number of asynchronous workers.
+        sync_threads: Number of threads running the synchronous workload.
+        base_url: URL of the server to run against. Defaults to a mock GitLab started in a separate process.
+        on_sample: Callable receiving every sample as it is taken.
+        seed: Seed of the random choice of operations.
+
+    Returns:
+        The samples and the number of operations by outcome.
+
+    """
+    samples: list[dict[str, Any]] = []
+    counts: Counter[str] = Counter()
+
+    def record(sample: dict[str, Any]) -> None:
+        samples.append(sample)
+        if on_sample is not None:
+            on_sample(sample)
+
+    process = None
+    if base_url is None:
+        process, base_url = start_mock_server(*MOCK_ARGUMENTS)
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=_sync_workload, args=(base_url, stop, counts, seed + 1000 + index), daemon=True)
+        for index in range(sync_threads)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        asyncio.run(
+            _run_async(
+                base_url,
+                duration=duration,
+                interval=interval,
+                concurrency=concurrency,
+                counts=counts,
+                on_sample=record,
+                seed=seed,
+            )
+        )
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+    return samples, counts
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the soak harness.
+
+    Args:
+        argv: The command-line arguments. Defaults to ``sys.argv``.
+
+    Returns:
+        1 if a resource leaked, 0 otherwise.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=parse_duration, default=parse_duration("1h"), help="Length, e.g. 4h.")
+    parser.add_argument("--interval", type=parse_duration, default=parse_duration("30s"), help="Sampling interval.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of asynchronous workers.")
+    parser.add_argument("--sync-threads", type=int, default=2, help="Number of threads of synchronous clients.")
+    parser.add_argument("--base-url", default=None, help="Run against this server instead of a mock GitLab.")
+    parser.add_argument("--output", default="", help="Append the samples to this JSONL file.")
+    args = parser.parse_args(argv)
+
+    output_path = Path(args.output) if args.output else None
+
+    def on_sample(sample: dict[str, Any]) -> None:
+        line = json.dumps(sample)
+        print(line, flush=True)
+        if output_path is not None:
+            with output_path.open("a", encoding="utf-8") as output:
+                output.write(line + "\n")
+
+    samples, counts = run_soak(
+        duration=args.duration,
+        interval=args.interval,
+        concurrency=args.concurrency,
+        sync_threads=args.sync_threads,
+        base_url=args.base_url,
+        on_sample=on_sample,
+    )
+    print(f"Operations by outcome: {dict(counts)}")
+    leaks = detect_growth(samples)
+    for metric, growth in leaks.items():
+        print(f"LEAK: {metric} grew by {growth:g} (tolerance {TOLERANCES[metric]:g})")
+    return 1 if leaks else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
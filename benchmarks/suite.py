@@ -0,0 +1,379 @@
+"""Benchmark the list, get and edit paths of the synchronous and asynchronous clients.
+
+The clients are run against a local mock GitLab (`glnova.testing.MockGitLab`) started on
+a background thread, or against the server at ``--base-url``, e.g. a mock started in
+another process with ``python -m glnova.testing``. Every scenario reports
+the throughput and latency percentiles of its calls. Results can be stored as baselines
+and compared to report regressions.
+
+Usage:
+    python -m benchmarks.suite run [--operations N] [--concurrency C] [--save-baseline NAME]
+    python -m benchmarks.suite compare BASELINE CURRENT [--threshold 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.gitlab import GitLab
+from glnova.testing import MockGitLab
+from glnova.version import __version__
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+PATHS = ("get", "conditional-get", "list", "edit")
+
+WARMUP = 10
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Get a percentile of sorted values with the nearest-rank method.
+
+    Args:
+        values: The sorted values.
+        fraction: The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        The percentile, or 0 if there are no values.
+
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+def summarize(latencies: list[float], elapsed: float, errors: int) -> dict[str, float]:
+    """Summarize the latencies of a scenario.
+
+    Args:
+        latencies: The latency of every call in seconds.
+        elapsed: The wall time of the scenario in seconds.
+        errors: Number of calls that raised.
+
+    Returns:
+        The throughput in calls per second and the latency statistics in milliseconds.
+
+    """
+    values = sorted(latencies)
+    return {
+        "operations": len(values),
+        "errors": errors,
+        "seconds": elapsed,
+        "throughput": len(values) / elapsed if elapsed else 0.0,
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+    }
+
+
+def _arguments(path: str, index: int, etag: str | None) -> dict[str, Any]:
+    """Get the arguments of the index-th call of a path.
+
+    Args:
+        path: The benchmarked path.
+        index: The index of the call.
+        etag: The ETag for conditional requests.
+
+    Returns:
+        The keyword arguments of the resource method.
+
+    """
+    project = index % 10 + 1
+    if path == "list":
+        return {"project": project, "per_page": 100, "page": index % 5 + 1}
+    if path == "edit":
+        return {"project_id": project, "issue_iid": index % 50 + 1, "title": f"Benchmark {index}"}
+    if path == "conditional-get":
+        return {"project_id": 1, "issue_iid": 1, "etag": etag}
+    return {"project_id": project, "issue_iid": index % 50 + 1}
+
+
+def run_sync(base_url: str, path: str, operations: int) -> dict[str, float]:
+    """Benchmark a path of the synchronous client, one call at a time.
+
+    Args:
+        base_url: The URL of the server.
+        path: The benchmarked path.
+        operations: Number of calls.
+
+    Returns:
+        The summary of the scenario.
+
+    """
+    latencies: list[float] = []
+    errors = 0
+    with GitLab(token="benchmark", base_url=base_url) as client:
+        method: Callable[..., Any] = {
+            "get": client.issue.get_issue,
+            "conditional-get": client.issue.get_issue,
+            "list": client.issue.list_issues,
+            "edit": client.issue.edit_issue,
+        }[path]
+        etag = client.issue.get_issue(project_id=1, issue_iid=1)[1]["etag"]
+        for index in range(WARMUP):
+            method(**_arguments(path, index, etag))
+        start = time.perf_counter()
+        for index in range(operations):
+            call_start = time.perf_counter()
+            try:
+                method(**_arguments(path, index, etag))
+            except Exception:  # noqa: BLE001
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - call_start)
+        elapsed = time.perf_counter() - start
+    return summarize(latencies, elapsed=elapsed, errors=errors)
+
+
+async def run_async(base_url: str, path: str, operations: int, concurrency: int) -> dict[str, float]:
+    """Benchmark a path of the asynchronous client with a number of concurrent workers.
+
+    Args:
+        base_url: The URL of the server.
+        path: The benchmarked path.
+        operations: Number of calls.
+        concurrency: Number of calls in flight.
+
+    Returns:
+        The summary of the scenario.
+
+    """
+    latencies: list[float] = []
+    errors = 0
+    async with AsyncGitLab(token="benchmark", base_url=base_url) as client:
+        method: Callable[..., Awaitable[Any]] = {
+            "get": client.issue.get_issue,
+            "conditional-get": client.issue.get_issue,
+            "list": client.issue.list_issues,
+            "edit": client.issue.edit_issue,
+        }[path]
+        etag = (await client.issue.get_issue(project_id=1, issue_iid=1))[1]["etag"]
+        for index in range(WARMUP):
+            await method(**_arguments(path, index, etag))
+        indexes = iter(range(operations))
+
+        async def worker() -> None:
+            nonlocal errors
+            for index in indexes:
+                call_start = time.perf_counter()
+                try:
+                    await method(**_arguments(path, index, etag))
+                except Exception:  # noqa: BLE001
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - call_start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return summarize(latencies, elapsed=elapsed, errors=errors)
+
+
+def run_suite(base_url: str, operations: int, concurrency: int, paths: tuple[str, ...] = PATHS) -> dict[str, Any]:
+    """Run every scenario.
+
+    Args:
+        base_url: The URL of the server.
+        operations: Number of calls per scenario.
+        concurrency: Number of concurrent calls of the concurrent asynchronous scenarios.
+        paths: The benchmarked paths.
+
+    Returns:
+        The summary of every scenario by ``"mode/path"``.
+
+    """
+    results: dict[str, Any] = {}
+    for path in paths:
+        results[f"sync/{path}"] = run_sync(base_url, path=path, operations=operations)
+        results[f"async/{path}"] = asyncio.run(run_async(base_url, path=path, operations=operations, concurrency=1))
+        results[f"async-c{concurrency}/{path}"] = asyncio.run(
+            run_async(base_url, path=path, operations=operations, concurrency=concurrency)
+        )
+    return results
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> tuple[list[str], bool]:
+    """Compare two benchmark results.
+
+    A scenario regresses if its throughput dropped, or its p95 latency grew, by more than
+    the threshold.
+
+    Args:
+        baseline: The baseline results.
+        current: The current results.
+        threshold: The relative change counted as a regression, e.g. 0.1 for 10 %.
+
+    Returns:
+        The lines of the comparison table and whether any scenario regressed.
+
+    """
+    lines = [f"{'scenario':<28} {'ops/s':>10} {'change':>8} {'p95 ms':>9} {'change':>8}  status"]
+    regressed = False
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            lines.append(f"{name:<28} {result['throughput']:>10.1f} {'':>8} {result['p95_ms']:>9.2f} {'':>8}  new")
+            continue
+        throughput_change = result["throughput"] / base["throughput"] - 1 if base["throughput"] else 0.0
+        latency_change = result["p95_ms"] / base["p95_ms"] - 1 if base["p95_ms"] else 0.0
+        status = "ok"
+        if throughput_change < -threshold or latency_change > threshold:
+            status = "REGRESSION"
+            regressed = True
+        elif throughput_change > threshold or latency_change < -threshold:
+            status = "improved"
+        lines.append(
+            f"{name:<28} {result['throughput']:>10.1f} {throughput_change:>+8.1%} "
+            f"{result['p95_ms']:>9.2f} {latency_change:>+8.1%}  {status}"
+        )
+    return lines, regressed
+
+
+def format_results(results: dict[str, Any]) -> list[str]:
+    """Format benchmark results as a table.
+
+    Args:
+        results: The summary of every scenario.
+
+    Returns:
+        The lines of the table.
+
+    """
+    lines = [f"{'scenario':<28} {'ops/s':>10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<28} {result['throughput']:>10.1f} {result['mean_ms']:>9.2f} {result['p50_ms']:>9.2f} "
+            f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['errors']:>7}"
+        )
+    return lines
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Run the suite and store or compare the results.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit status.
+
+    """
+    config = {
+        "operations": args.operations,
+        "concurrency": args.concurrency,
+        "latency": args.latency,
+        "projects": 10,
+        "issues_per_project": args.issues_per_project,
+    }
+    paths = tuple(args.paths.split(",")) if args.paths else PATHS
+    if args.base_url:
+        results = run_suite(args.base_url, operations=args.operations, concurrency=args.concurrency, paths=paths)
+    else:
+        with MockGitLab(projects=10, issues_per_project=args.issues_per_project, latency=args.latency) as server:
+            results = run_suite(server.url, operations=args.operations, concurrency=args.concurrency, paths=paths)
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "glnova": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+        },
+        "results": results,
+    }
+    print("\n".join(format_results(results)))
+
+    output = args.output
+    if args.save_baseline:
+        output = BASELINE_DIR / f"{args.save_baseline}.json"
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {output}")
+    if args.compare:
+        lines, regressed = compare(_load(args.compare), report, threshold=args.threshold)
+        print("\n".join(lines))
+        return 1 if regressed else 0
+    return 0
+
+
+def _load(name_or_path: str) -> dict[str, Any]:
+    """Load stored results.
+
+    Args:
+        name_or_path: A path, or the name of a baseline in the baselines directory.
+
+    Returns:
+        The results.
+
+    """
+    path = Path(name_or_path)
+    if not path.exists():
+        path = BASELINE_DIR / f"{name_or_path}.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    """Compare stored results.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        1 if any scenario regressed, 0 otherwise.
+
+    """
+    lines, regressed = compare(_load(args.baseline), _load(args.current), threshold=args.threshold)
+    print("\n".join(lines))
+    return 1 if regressed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the arguments and run a command.
+
+    Args:
+        argv: The command-line arguments. Defaults to ``sys.argv``.
+
+    Returns:
+        The exit status.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks.")
+    run.add_argument("--operations", type=int, default=500, help="Number of calls per scenario.")
+    run.add_argument("--concurrency", type=int, default=16, help="Concurrent calls of the concurrent async scenarios.")
+    run.add_argument("--paths", default="", help=f"Comma-separated paths to run, from {', '.join(PATHS)}.")
+    run.add_argument("--latency", type=float, default=0.0, help="Latency of the mock server in seconds.")
+    run.add_argument("--issues-per-project", type=int, default=1000, help="Issues of each of the 10 mock projects.")
+    run.add_argument("--base-url", default="", help="Benchmark this server instead of an in-process mock.")
+    run.add_argument("--output", default="", help="Write the results to this JSON file.")
+    run.add_argument("--save-baseline", default="", help="Store the results as a named baseline.")
+    run.add_argument("--compare", default="", help="Compare the results to this baseline name or file.")
+    run.add_argument("--threshold", type=float, default=0.1, help="Relative change counted as a regression.")
+    run.set_defaults(handler=run_command)
+
+    compare_parser = commands.add_parser("compare", help="Compare two stored results.")
+    compare_parser.add_argument("baseline", help="Baseline name or results file.")
+    compare_parser.add_argument("current", help="Baseline name or results file to compare.")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="Relative change counted as a regression.")
+    compare_parser.set_defaults(handler=compare_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Import-time budgets of the package and the CLI.
+
+Runs the scenarios of `benchmarks.importtime`::
+
+    python -m pytest benchmarks/test_importtime.py -s
+"""
+
+from __future__ import annotations
+
+from benchmarks.importtime import measure_scenarios, parse_importtime
+
+
+class TestImportTime:
+    """Startup cost of importing the package and running CLI commands."""
+
+    def test_parse_importtime(self):
+        """Test that only top-level imports carry their cumulative time."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   typer.core\n"
+            "import time:       200 |        300 | typer\n"
+            "import time:        50 |         50 | json\n"
+        )
+
+        assert parse_importtime(output) == {"typer.core": 0, "typer": 300, "json": 50}
+
+    def test_budgets(self, mock_url):
+        """Test that every scenario stays within its budget and imports only what it needs."""
+        results = measure_scenarios(base_url=mock_url)
+
+        for result in results:
+            print(f"\n{result['name']}: {result['ms']:.1f} ms, budget {result['budget']:.1f} ms")
+        assert not [result["name"] for result in results if result["unwanted"]]
+        assert not [result["name"] for result in results if result["ms"] > result["budget"]]
@@ -0,0 +1,252 @@
+"""Memory regression suite for large issue listings.
+
+Lists ``GLNOVA_MEMORY_RECORDS`` (100,000 by default) synthetic issues through every
+listing path and asserts peak memory budgets per record, measured with tracemalloc and,
+on Linux, with the peak resident set size. Run it with::
+
+    python -m pytest benchmarks/test_memory.py -s
+    GLNOVA_MEMORY_RECORDS=1000000 python -m pytest benchmarks/test_memory.py -s
+
+The budgets pin the current behavior: lower them when a change reduces memory usage.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import requests
+
+from glnova.cli.utils.api import execute_api_command
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.gitlab import GitLab
+from glnova.testing.mock_server import MockGitLab
+from glnova.utils.response import process_response_with_last_modified
+
+PER_PAGE = 100
+
+FAN_OUT = 16
+
+# Peak bytes per listed record. A decoded issue of the mock holds about 1.6 KB.
+BUDGETS = {
+    "decode": 3000,
+    "pages": 2500,
+    "fan-out": 2500,
+    "cli": 5000,
+}
+
+# Peak bytes of iterating the pages one at a time, independent of the number of records.
+STREAMING_BUDGET = 8 * 1024 * 1024
+
+# Allowance for the allocator overhead and fragmentation seen in the resident set size.
+RSS_FACTOR = 2.0
+
+
+class MemoryUsage:
+    """Peak memory of a measured call.
+
+    Attributes:
+        peak: Peak traced Python allocations in bytes.
+        rss: Growth of the peak resident set size in bytes, or None if it cannot be measured.
+
+    """
+
+    def __init__(self, peak: int, rss: int | None) -> None:
+        """Initialize the MemoryUsage.
+
+        Args:
+            peak: Peak traced Python allocations in bytes.
+            rss: Growth of the peak resident set size in bytes, or None if it cannot be measured.
+
+        """
+        self.peak = peak
+        self.rss = rss
+
+    def __str__(self) -> str:
+        """Return a string representation of the usage.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<MemoryUsage peak={self.peak} rss={self.rss}>"
+
+
+def _read_status(field: str) -> int | None:
+    """Read a memory field of ``/proc/self/status``.
+
+    Args:
+        field: The field, e.g. ``VmHWM``.
+
+    Returns:
+        The value in bytes, or None if it is not available.
+
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the peak resident set size of the process.
+
+    Returns:
+        Whether the peak could be reset, which needs Linux 4.0 or later.
+
+    """
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def measure(call: Callable[[], Any]) -> tuple[Any, MemoryUsage]:
+    """Measure the peak memory of a call.
+
+    Args:
+        call: The call.
+
+    Returns:
+        The result of the call and its memory usage.
+
+    """
+    gc.collect()
+    rss_start = _read_status("VmRSS") if _reset_peak_rss() else None
+    tracemalloc.start()
+    try:
+        result = call()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    rss_peak = _read_status("VmHWM")
+    rss = rss_peak - rss_start if rss_start is not None and rss_peak is not None else None
+    return result, MemoryUsage(peak=peak, rss=rss)
+
+
+def check_budget(name: str, usage: MemoryUsage, records: int) -> None:
+    """Assert that a measured call stays within the budget of its path.
+
+    Args:
+        name: The path, a key of `BUDGETS`.
+        usage: The measured usage.
+        records: Number of records processed.
+
+    """
+    per_record = usage.peak / records
+    rss_per_record = None if usage.rss is None else usage.rss / records
+    rss_text = "n/a" if rss_per_record is None else f"{rss_per_record:.0f}"
+    print(f"\n{name}: {per_record:.0f} B/record traced, {rss_text} B/record RSS, budget {BUDGETS[name]}")
+    assert per_record <= BUDGETS[name], f"{name} peaked at {per_record:.0f} B/record, budget {BUDGETS[name]}"
+    if rss_per_record is not None:
+        assert rss_per_record <= BUDGETS[name] * RSS_FACTOR, f"{name} RSS grew {rss_per_record:.0f} B/record"
+
+
+def list_pages(client: GitLab, handle_page: Callable[[list[dict[str, Any]]], None]) -> None:
+    """List every issue of the instance, one page at a time, until an empty page.
+
+    Args:
+        client: The client.
+        handle_page: Callable receiving every page.
+
+    """
+    page = 1
+    while True:
+        issues, _ = client.issue.list_issues(page=page, per_page=PER_PAGE)
+        if not issues:
+            return
+        handle_page(issues)
+        page += 1
+
+
+class TestListingMemory:
+    """Peak memory of listing large numbers of issues."""
+
+    def test_single_page_decode(self, records):
+        """Test the peak memory of decoding one response holding every record."""
+        server = MockGitLab(projects=10, issues_per_project=max(1, records // 10))
+        body = json.dumps([server._work_item("issues", index // (records // 10) + 1, 1) for index in range(records)])
+        response = requests.Response()
+        response._content = body.encode()
+        response.status_code = 200
+        response.headers["Etag"] = '"v1"'
+        del body
+
+        (data, status, _), usage = measure(lambda: process_response_with_last_modified(response))
+
+        assert status == 200  # noqa: PLR2004
+        assert len(data) == records
+        check_budget("decode", usage, records)
+
+    def test_page_streaming(self, mock_url, records):
+        """Test that handling the pages one at a time uses constant memory."""
+        counts = []
+
+        def run() -> None:
+            with GitLab(token="token", base_url=mock_url) as client:
+                list_pages(client, lambda issues: counts.append(len(issues)))
+
+        _, usage = measure(run)
+
+        assert sum(counts) == records
+        print(f"\npage streaming: {usage.peak} B peak for {records} records, budget {STREAMING_BUDGET}")
+        assert usage.peak <= STREAMING_BUDGET
+
+    def test_accumulated_pages(self, mock_url, records):
+        """Test the peak memory of collecting every page into one list."""
+        issues: list[dict[str, Any]] = []
+
+        def run() -> None:
+            with GitLab(token="token", base_url=mock_url) as client:
+                list_pages(client, issues.extend)
+
+        _, usage = measure(run)
+
+        assert len(issues) == records
+        check_budget("pages", usage, records)
+
+    def test_async_fan_out(self, mock_url, records):
+        """Test the peak memory of fetching the pages concurrently with the asynchronous client."""
+        pages = -(-records // PER_PAGE)
+
+        async def run() -> list[dict[str, Any]]:
+            semaphore = asyncio.Semaphore(FAN_OUT)
+            async with AsyncGitLab(token="token", base_url=mock_url) as client:
+
+                async def fetch(page: int) -> list[dict[str, Any]]:
+                    async with semaphore:
+                        issues, _ = await client.issue.list_issues(page=page, per_page=PER_PAGE)
+                        return issues
+
+                results = await asyncio.gather(*(fetch(page) for page in range(1, pages + 1)))
+            return [issue for issues in results for issue in issues]
+
+        issues, usage = measure(lambda: asyncio.run(run()))
+
+        assert len(issues) == records
+        check_budget("fan-out", usage, records)
+
+    def test_cli_output(self, records):
+        """Test the peak memory of printing a listing with the printer of the CLI."""
+        server = MockGitLab(projects=10, issues_per_project=max(1, records // 10))
+        issues = [server._work_item("issues", index % 10 + 1, index // 10 + 1) for index in range(records)]
+
+        def run() -> None:
+            with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+                execute_api_command(lambda: (issues, {"status_code": 200, "etag": None}), command_name="issue list")
+
+        _, usage = measure(run)
+
+        check_budget("cli", usage, records)
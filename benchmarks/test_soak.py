@@ -0,0 +1,43 @@
+"""Soak test of the clients for connection, file descriptor, task and memory leaks.
+
+Runs the workload of `benchmarks.soak` for ``GLNOVA_SOAK_SECONDS`` (60 by default)::
+
+    GLNOVA_SOAK_SECONDS=3600 python -m pytest benchmarks/test_soak.py -s
+
+For multi-hour runs with the samples written to a file, use ``python -m benchmarks.soak``.
+"""
+
+from __future__ import annotations
+
+import os
+
+from benchmarks.soak import TOLERANCES, detect_growth, run_soak
+
+SAMPLES = 30
+
+
+class TestSoak:
+    """Resource usage of the clients under a long mixed workload."""
+
+    def test_detect_growth(self):
+        """Test that a steadily growing metric is reported and a fluctuating one is not."""
+        samples = [
+            {"fds": 10 + index % 3, "sockets": 4 + index, "tasks": None, "rss_mb": 40.0} for index in range(SAMPLES)
+        ]
+
+        assert detect_growth(samples) == {"sockets": 18}
+        assert detect_growth(samples[:1]) == {}
+
+    def test_no_leaks(self):
+        """Test that no resource keeps growing while the workload runs."""
+        duration = float(os.environ.get("GLNOVA_SOAK_SECONDS", "60"))
+
+        samples, counts = run_soak(duration=duration, interval=duration / SAMPLES)
+
+        print(f"\nOperations by outcome: {dict(counts)}")
+        print(f"First sample: {samples[0]}\nLast sample: {samples[-1]}")
+        assert counts["ok"] > 0
+        leaks = detect_growth(samples)
+        assert not leaks, ", ".join(
+            f"{metric} grew by {leaks[metric]:g} (> {TOLERANCES[metric]:g})" for metric in leaks
+        )
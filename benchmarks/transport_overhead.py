@@ -0,0 +1,81 @@
+"""Benchmark the per-call overhead of the transports of the synchronous client.
+
+A local HTTP server answers every request with a small JSON payload, so the
+measured time is dominated by the client stack rather than by the network.
+
+Usage:
+    python benchmarks/transport_overhead.py [--calls N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from glnova.client.gitlab import GitLab
+from glnova.client.transport import Urllib3Transport
+
+PAYLOAD = b'{"id": 1, "username": "bench"}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler answering every GET with the same payload."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        """Reply with the payload."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Silence the request log."""
+
+
+def measure(client: GitLab, calls: int) -> float:
+    """Measure the mean time of a call.
+
+    Args:
+        client: The client to benchmark; must not be open.
+        calls: Number of calls to time.
+
+    Returns:
+        The mean time per call in microseconds.
+
+    """
+    with client:
+        client.user.get_user()  # Warm up the connection pool.
+        start = time.perf_counter()
+        for _ in range(calls):
+            client.user.get_user()
+        elapsed = time.perf_counter() - start
+    return elapsed / calls * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the mean time per call of each transport."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000, help="Number of calls per transport.")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        transports = {"requests": None, "urllib3": Urllib3Transport}
+        for name, transport in transports.items():
+            mean = measure(GitLab(token="bench", base_url=base_url, transport=transport), calls=args.calls)
+            print(f"{name:>10}: {mean:8.1f} us/call")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from glnova import client
-from glnova.version import __version__
+from typing import TYPE_CHECKING
+
+from glnova.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from glnova import client
+    from glnova.version import __version__
+
+__getattr__, __dir__ = lazy_exports(__name__, {"__version__": "glnova.version", "client": "glnova.client"})
 
 __all__ = ["__version__", "client"]
@@ -0,0 +1,8 @@
+"""Caching utilities for glnova."""
+
+from __future__ import annotations
+
+from glnova.cache.path_id import PathIDCache
+from glnova.cache.ttl import TTLCache
+
+__all__ = ["PathIDCache", "TTLCache"]
@@ -0,0 +1,208 @@
+"""Persistent cache mapping project paths to numeric IDs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Literal
+
+import platformdirs
+
+logger = logging.getLogger("glnova")
+
+# Kind of resource of the cached paths; the kind is part of the cache file format.
+PathKind = Literal["projects"]
+
+
+class PathIDCache:
+    """Persistent cache mapping project paths to numeric IDs.
+
+    GitLab resolves a URL-encoded path such as ``group%2Fproject`` on every request.
+    Numeric IDs are stable across renames, so once a path has been resolved the
+    client can address the resource by ID instead. Entries are keyed by the base URL
+    of the GitLab instance and stored as JSON, so the cache can be shared by
+    several clients and across sessions.
+    """
+
+    def __init__(self, filename: Path | str | None = None, ttl: float | None = 86400.0) -> None:
+        """Initialize the PathIDCache.
+
+        Args:
+            filename: Path to the cache file. Defaults to ``path_ids.json`` in the user cache directory.
+            ttl: Maximum age of an entry in seconds. Bounds how long a path can point to a project
+                that has since been renamed away. If None, entries never expire.
+
+        """
+        filename = filename or Path(platformdirs.user_cache_dir(appname="glnova")) / "path_ids.json"
+        self.cache_path = Path(filename)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, dict[str, list[Any]]]] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of cached entries.
+
+        Returns:
+            The number of cached entries across all instances and kinds.
+
+        """
+        with self._lock:
+            entries = self._get_entries()
+            return sum(len(paths) for kinds in entries.values() for paths in kinds.values())
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        """Normalize a path for use as a cache key.
+
+        GitLab paths are case-insensitive and may be given with surrounding slashes.
+
+        Args:
+            path: The project path.
+
+        Returns:
+            The normalized path.
+
+        """
+        return path.strip("/").lower()
+
+    def _get_entries(self) -> dict[str, dict[str, dict[str, list[Any]]]]:
+        """Get the in-memory entries, loading them from disk on first use.
+
+        Returns:
+            The cache entries keyed by base URL, kind and path.
+
+        """
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self) -> dict[str, dict[str, dict[str, list[Any]]]]:
+        """Load the cache entries from disk.
+
+        Returns:
+            The cache entries, or an empty dictionary if the file is missing or unreadable.
+
+        """
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with self.cache_path.open("r", encoding="utf-8") as file:
+                raw = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable path ID cache '%s': %s", self.cache_path, e)
+            return {}
+        return raw if isinstance(raw, dict) else {}
+
+    def _save(self) -> None:
+        """Write the cache entries to disk atomically."""
+        if self._entries is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_path.parent, prefix=".path_ids.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(self._entries, file)
+            Path(tmp_name).replace(self.cache_path)
+        except OSError as e:
+            logger.warning("Failed to write path ID cache '%s': %s", self.cache_path, e)
+
+    def _is_expired(self, stored_at: float) -> bool:
+        """Check whether an entry stored at the given time has expired.
+
+        Args:
+            stored_at: The UNIX timestamp at which the entry was stored.
+
+        Returns:
+            True if the entry is older than the TTL, False otherwise.
+
+        """
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def get(self, base_url: str, kind: PathKind, path: str) -> int | None:
+        """Get the numeric ID for a path.
+
+        Args:
+            base_url: The base URL of the GitLab instance.
+            kind: The kind of resource, "projects".
+            path: The full path of the project.
+
+        Returns:
+            The numeric ID, or None if the path is not cached or the entry has expired.
+
+        """
+        key = self._normalize_path(path)
+        with self._lock:
+            paths = self._get_entries().get(base_url, {}).get(kind, {})
+            entry = paths.get(key)
+            if entry is None:
+                return None
+            resource_id, stored_at = entry
+            if self._is_expired(stored_at):
+                del paths[key]
+                return None
+            return int(resource_id)
+
+    def set(self, base_url: str, kind: PathKind, path: str, resource_id: int) -> None:
+        """Store the numeric ID for a path.
+
+        Args:
+            base_url: The base URL of the GitLab instance.
+            kind: The kind of resource, "projects".
+            path: The full path of the project.
+            resource_id: The numeric ID.
+
+        """
+        self.update(base_url=base_url, kind=kind, mapping={path: resource_id})
+
+    def update(self, base_url: str, kind: PathKind, mapping: dict[str, int]) -> None:
+        """Store several path to ID mappings and write the cache once.
+
+        Any other cached path that points to one of the given IDs is dropped,
+        since it refers to a location the resource has been renamed away from.
+
+        Args:
+            base_url: The base URL of the GitLab instance.
+            kind: The kind of resource, "projects".
+            mapping: A dictionary mapping paths to numeric IDs.
+
+        """
+        if not mapping:
+            return
+        now = time.time()
+        normalized = {self._normalize_path(path): int(resource_id) for path, resource_id in mapping.items()}
+        ids = set(normalized.values())
+        with self._lock:
+            paths = self._get_entries().setdefault(base_url, {}).setdefault(kind, {})
+            renamed = [path for path, (cached_id, _) in paths.items() if cached_id in ids and path not in normalized]
+            for path in renamed:
+                logger.debug("Dropping renamed %s path '%s' on %s.", kind, path, base_url)
+                del paths[path]
+            for path, resource_id in normalized.items():
+                paths[path] = [resource_id, now]
+            self._save()
+
+    def invalidate(self, base_url: str, kind: PathKind, path: str) -> None:
+        """Remove a path from the cache.
+
+        Args:
+            base_url: The base URL of the GitLab instance.
+            kind: The kind of resource, "projects".
+            path: The full path of the project.
+
+        """
+        with self._lock:
+            paths = self._get_entries().get(base_url, {}).get(kind, {})
+            if paths.pop(self._normalize_path(path), None) is not None:
+                logger.debug("Invalidated cached ID for %s '%s' on %s.", kind, path, base_url)
+                self._save()
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries = {}
+            self._save()
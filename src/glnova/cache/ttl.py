@@ -0,0 +1,99 @@
+"""In-memory cache with per-entry expiry."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe in-memory cache whose entries expire after a fixed time to live."""
+
+    def __init__(self, ttl: float | None = 300.0, maxsize: int | None = 10000) -> None:
+        """Initialize the TTLCache.
+
+        Args:
+            ttl: Time to live of an entry in seconds. If None, entries never expire.
+            maxsize: Maximum number of entries. The oldest entry is evicted when the cache is full.
+                If None, the cache is unbounded.
+
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[V, float]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired entries not yet evicted.
+
+        Returns:
+            The number of entries.
+
+        """
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key has a live entry.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            True if the key is cached and has not expired, False otherwise.
+
+        """
+        return isinstance(key, str) and self.get(key) is not None
+
+    def get(self, key: str) -> V | None:
+        """Get a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if the key is missing or has expired.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: V) -> None:
+        """Store a value.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+
+        """
+        expires_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            if self.maxsize is not None and len(self._entries) >= self.maxsize:
+                # Dictionaries keep insertion order, so the first key is the oldest entry.
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (value, expires_at)
+
+    def invalidate(self, key: str) -> None:
+        """Remove a key from the cache.
+
+        Args:
+            key: The cache key.
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1 @@
+"""Bench CLI command for glnova."""
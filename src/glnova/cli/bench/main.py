@@ -0,0 +1,145 @@
+"""Bench command for glnova."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+import typer
+
+
+def bench_command(  # noqa: PLR0913
+    ctx: typer.Context,
+    project: Annotated[
+        str | None,
+        typer.Option(
+            "--project",
+            help="The ID or path of the project whose issues are listed, read and edited. Defaults to 1 with --mock.",
+        ),
+    ] = None,
+    mix: Annotated[
+        str,
+        typer.Option("--mix", help="Relative weights of the list, get and edit operations, e.g. list=7,get=2,edit=1."),
+    ] = "list=7,get=3",
+    concurrency: Annotated[int, typer.Option("--concurrency", min=1, help="Number of calls in flight.")] = 8,
+    duration: Annotated[
+        float, typer.Option("--duration", min=0.0, help="Seconds during which new calls are started.")
+    ] = 30.0,
+    rate: Annotated[
+        float,
+        typer.Option("--rate", min=0.0, help="Target number of calls per second, 0 for as many as possible."),
+    ] = 0.0,
+    per_page: Annotated[int, typer.Option("--per-page", min=1, max=100, help="Page size of the list calls.")] = 20,
+    seed: Annotated[int | None, typer.Option("--seed", help="Seed of the random choice of operations.")] = None,
+    mock: Annotated[
+        bool,
+        typer.Option("--mock", help="Run against an in-process mock GitLab instead of a configured account."),
+    ] = False,
+    mock_latency: Annotated[
+        float, typer.Option("--mock-latency", min=0.0, help="Delay added to every mock response in seconds.")
+    ] = 0.0,
+    mock_fault_rate: Annotated[
+        float,
+        typer.Option("--mock-fault-rate", min=0.0, max=1.0, help="Probability of a mock response being a 5xx error."),
+    ] = 0.0,
+    mock_rate_limit: Annotated[
+        int | None,
+        typer.Option("--mock-rate-limit", min=1, help="Requests per minute allowed by the mock before answering 429."),
+    ] = None,
+    account_name: Annotated[
+        str | None,
+        typer.Option(
+            "--account-name",
+            help="Name of the account to use for authentication.",
+        ),
+    ] = None,
+    token: Annotated[
+        str | None,
+        typer.Option(
+            "--token",
+            help="Token for authentication. If not provided, the token from the specified account will be used.",
+        ),
+    ] = None,
+    base_url: Annotated[
+        str | None,
+        typer.Option(
+            "--base-url",
+            help="Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.",
+        ),
+    ] = None,
+) -> None:
+    """Drive a concurrent mix of issue calls against GitLab and report throughput, latency and errors.
+
+    Edit calls write back the current title of the issue, so they leave the issues unchanged.
+
+    Args:
+        ctx: Typer context.
+        project: The ID or path of the project whose issues are listed, read and edited.
+        mix: Relative weights of the list, get and edit operations.
+        concurrency: Number of calls in flight.
+        duration: Seconds during which new calls are started.
+        rate: Target number of calls per second, 0 for as many as possible.
+        per_page: Page size of the list calls.
+        seed: Seed of the random choice of operations.
+        mock: Whether to run against an in-process mock GitLab.
+        mock_latency: Delay added to every mock response in seconds.
+        mock_fault_rate: Probability of a mock response being a 5xx error.
+        mock_rate_limit: Requests per minute allowed by the mock before answering 429.
+        account_name: Name of the account to use for authentication.
+        token: Token for authentication. If not provided, the token from the specified account will be used.
+        base_url: Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.
+
+    """
+    import asyncio  # noqa: PLC0415
+    import contextlib  # noqa: PLC0415
+    import json  # noqa: PLC0415
+
+    from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+    from glnova.cli.utils.convert import str_to_int_or_none  # noqa: PLC0415
+    from glnova.client.async_gitlab import AsyncGitLab  # noqa: PLC0415
+    from glnova.testing.load import parse_mix, run_load  # noqa: PLC0415
+
+    try:
+        weights = parse_mix(mix)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+
+    server = None
+    if mock:
+        from glnova.testing.mock_server import MockGitLab  # noqa: PLC0415
+
+        server = MockGitLab(latency=mock_latency, fault_rate=mock_fault_rate, rate_limit=mock_rate_limit)
+        project = project or "1"
+    elif project is None:
+        typer.echo("Error: --project is required unless --mock is used.", err=True)
+        raise typer.Exit(code=1)
+
+    async def run(token: str, base_url: str) -> dict:
+        async with AsyncGitLab(token=token, base_url=base_url) as client:
+            return await run_load(
+                client,
+                project=str_to_int_or_none(project),
+                mix=weights,
+                concurrency=concurrency,
+                duration=duration,
+                rate=rate or None,
+                per_page=per_page,
+                seed=seed,
+            )
+
+    with server if server is not None else contextlib.nullcontext():
+        if server is not None:
+            token, base_url = "token", server.url
+        else:
+            token, base_url = get_auth_params(
+                config_path=ctx.obj["config_path"],
+                account_name=account_name,
+                token=token,
+                base_url=base_url,
+            )
+        try:
+            report = asyncio.run(run(token=token, base_url=base_url))
+        except Exception as e:
+            typer.echo(f"Error: cannot start the benchmark: {e}", err=True)
+            raise typer.Exit(code=1) from e
+    print(json.dumps(report, indent=2))
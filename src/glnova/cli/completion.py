@@ -0,0 +1,267 @@
+"""Shell completion served from a precomputed index of the CLI.
+
+Completing through Typer imports Typer, click and the command modules for every key press.
+The index lists the commands, options and choices of the CLI in ``completion_index.json``
+next to this module, so that `serve_completion` answers the completion requests of bash,
+zsh and fish with only the standard library. Regenerate the index after changing a command::
+
+    python -m glnova.cli.completion
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shlex
+import sys
+from pathlib import Path
+from typing import Any
+
+INDEX_PATH = Path(__file__).with_name("completion_index.json")
+
+COMPLETE_VAR = "_GLNOVA_COMPLETE"
+
+_WHITESPACE = re.compile(r"\s")
+
+
+def build_index() -> dict[str, Any]:
+    """Build the completion index from the Typer apps of the CLI.
+
+    Returns:
+        The root command, with its options and its subcommands, recursively.
+
+    """
+    import typer  # noqa: PLC0415
+
+    from glnova.cli.main import app  # noqa: PLC0415
+
+    root = typer.main.get_group(app)
+    return _describe(root, typer.Context(root))
+
+
+def _describe(command: Any, ctx: Any) -> dict[str, Any]:
+    """Describe a click command for the completion index.
+
+    Args:
+        command: The click command or group.
+        ctx: A click context of the command.
+
+    Returns:
+        The options and the subcommands of the command.
+
+    """
+    options = []
+    for param in command.get_params(ctx):
+        if param.param_type_name != "option" or param.hidden:
+            continue
+        choices = getattr(param.type, "choices", None)
+        options.append(
+            {
+                "names": [*param.opts, *param.secondary_opts],
+                "help": param.help or "",
+                "takes_value": not param.is_flag and not param.count,
+                "multiple": param.multiple,
+                "choices": [str(choice) for choice in choices] if choices is not None else None,
+            }
+        )
+    node: dict[str, Any] = {"options": options, "commands": {}}
+    for name in getattr(command, "list_commands", lambda _: [])(ctx):
+        subcommand = command.get_command(ctx, name)
+        if subcommand is None or subcommand.hidden:
+            continue
+        child = _describe(subcommand, ctx.__class__(subcommand, parent=ctx, info_name=name))
+        child["help"] = subcommand.get_short_help_str()
+        node["commands"][name] = child
+    return node
+
+
+def write_index(path: Path = INDEX_PATH) -> None:
+    """Write the completion index.
+
+    Args:
+        path: The index file.
+
+    """
+    path.write_text(json.dumps(build_index(), indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_index(path: Path = INDEX_PATH) -> dict[str, Any] | None:
+    """Load the completion index.
+
+    Args:
+        path: The index file.
+
+    Returns:
+        The index, or None if it cannot be read.
+
+    """
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def complete(index: dict[str, Any], args: list[str], incomplete: str) -> list[tuple[str, str]]:
+    """Complete a command line the way click does.
+
+    Args:
+        index: The completion index.
+        args: The complete words after the program name.
+        incomplete: The word being completed.
+
+    Returns:
+        The candidates and their help.
+
+    """
+    if incomplete == "=":
+        incomplete = ""
+    elif incomplete.startswith("-") and "=" in incomplete:
+        name, _, incomplete = incomplete.partition("=")
+        args = [*args, name]
+
+    node = index
+    used: set[str] = set()
+    pending: dict[str, Any] | None = None
+    for arg in args:
+        if pending is not None:
+            pending = None
+            continue
+        option = _find_option(node, arg.partition("=")[0]) if arg.startswith("-") else None
+        if option is not None:
+            used.update(option["names"])
+            if option["takes_value"] and "=" not in arg:
+                pending = option
+        elif arg in node["commands"]:
+            node = node["commands"][arg]
+            used = set()
+
+    if pending is not None:
+        return [(choice, "") for choice in pending["choices"] or [] if choice.startswith(incomplete)]
+    if incomplete.startswith("-"):
+        return [
+            (name, option["help"])
+            for option in node["options"]
+            if option["multiple"] or not used.intersection(option["names"])
+            for name in option["names"]
+            if name.startswith(incomplete)
+        ]
+    return [(name, command["help"]) for name, command in node["commands"].items() if name.startswith(incomplete)]
+
+
+def _find_option(node: dict[str, Any], name: str) -> dict[str, Any] | None:
+    """Find an option of a command by one of its names.
+
+    Args:
+        node: The command in the index.
+        name: The option name.
+
+    Returns:
+        The option, or None if the command has no such option.
+
+    """
+    for option in node["options"]:
+        if name in option["names"]:
+            return option
+    return None
+
+
+def _split(value: str) -> list[str]:
+    """Split a command line like a shell, keeping an unterminated last word.
+
+    Args:
+        value: The command line.
+
+    Returns:
+        The words.
+
+    """
+    lexer = shlex.shlex(value, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    words: list[str] = []
+    try:
+        words.extend(lexer)
+    except ValueError:
+        words.append(lexer.token)
+    return words
+
+
+def _zsh_escape(value: str) -> str:
+    """Escape a value for the ``_arguments`` specification of zsh.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The escaped value.
+
+    """
+    return value.replace('"', '""').replace("'", "''").replace("$", "\\$").replace("`", "\\`").replace(":", r"\\:")
+
+
+def render_completion(shell: str, index: dict[str, Any], env: dict[str, str]) -> tuple[str, int]:
+    """Answer a completion request in the format of the Typer completion scripts.
+
+    Args:
+        shell: ``bash``, ``zsh`` or ``fish``.
+        index: The completion index.
+        env: The environment set by the completion script.
+
+    Returns:
+        The output and the exit status.
+
+    """
+    if shell == "bash":
+        words = _split(env.get("COMP_WORDS", ""))
+        cword = int(env.get("COMP_CWORD", "0"))
+        args, incomplete = words[1:cword], words[cword] if cword < len(words) else ""
+    else:
+        line = env.get("_TYPER_COMPLETE_ARGS", "")
+        args = _split(line)[1:]
+        incomplete = args.pop() if args and not line.endswith(" ") else ""
+    candidates = complete(index, args, incomplete)
+
+    if shell == "bash":
+        return "\n".join(value for value, _ in candidates), 0
+    if shell == "zsh":
+        if not candidates:
+            return "_files", 0
+        specs = "\n".join(
+            f'"{_zsh_escape(value)}":"{_zsh_escape(help_text)}"' if help_text else f'"{_zsh_escape(value)}"'
+            for value, help_text in candidates
+        )
+        return f"_arguments '*: :(({specs}))'", 0
+    if env.get("_TYPER_COMPLETE_FISH_ACTION") == "is-args":
+        return "", 0 if candidates else 1
+    lines = [f"{value}\t{_WHITESPACE.sub(' ', help_text)}" if help_text else value for value, help_text in candidates]
+    return "\n".join(lines), 0
+
+
+def serve_completion(env: dict[str, str] | None = None) -> int | None:
+    """Answer a shell completion request from the index, if the process is one.
+
+    Args:
+        env: The environment, ``os.environ`` by default.
+
+    Returns:
+        The exit status if the request was answered, otherwise None. Requests of other shells,
+        requests for the completion scripts and requests without a readable index are left to Typer.
+
+    """
+    env = dict(os.environ if env is None else env)
+    shell = env.get(COMPLETE_VAR, "").removeprefix("complete_")
+    if shell not in ("bash", "zsh", "fish"):
+        return None
+    index = load_index()
+    if index is None:
+        return None
+    output, status = render_completion(shell, index, env)
+    if output:
+        sys.stdout.write(output + "\n")
+    sys.stdout.flush()
+    return status
+
+
+if __name__ == "__main__":
+    write_index()
@@ -0,0 +1 @@
+"""Background process serving the CLI commands with warm imports, connections and configuration."""
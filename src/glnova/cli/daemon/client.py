@@ -0,0 +1,172 @@
+"""Routing of CLI commands to ``glnova daemon``."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from glnova.cli.daemon.protocol import (
+    DISABLE_ENV,
+    EXIT,
+    REPLY,
+    REQUEST,
+    STDERR,
+    STDOUT,
+    default_socket_path,
+    recv_frame,
+    send_frame,
+)
+
+# Commands run by the daemon. The other commands edit the configuration, manage the daemon
+# or run for long enough that the startup time does not matter.
+ROUTED_COMMANDS = frozenset({"issue", "merge-request", "project", "user"})
+
+# Options of the root command taking a value, to find the command among the arguments.
+_ROOT_OPTIONS_WITH_VALUE = frozenset({"--config-path", "--verbose", "-v", "--profile-out", "--trace"})
+
+
+def find_command(args: Sequence[str]) -> str | None:
+    """Find the command of a command line.
+
+    Args:
+        args: The arguments after the program name.
+
+    Returns:
+        The first argument that is neither an option of the root command nor its value, if any.
+
+    """
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg.startswith("-"):
+            skip = arg in _ROOT_OPTIONS_WITH_VALUE
+        else:
+            return arg
+    return None
+
+
+def connect(path: Path) -> Any:
+    """Connect to the socket of the daemon.
+
+    Args:
+        path: The socket path.
+
+    Returns:
+        The connected socket, or None if no daemon is listening.
+
+    """
+    if not path.exists():
+        return None
+    import socket  # noqa: PLC0415
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def request_daemon(path: Path, op: str) -> dict[str, Any] | None:
+    """Send a control request, such as ``status`` or ``stop``, to the daemon.
+
+    Args:
+        path: The socket path.
+        op: The request.
+
+    Returns:
+        The reply, or None if no daemon is listening.
+
+    """
+    sock = connect(path)
+    if sock is None:
+        return None
+    with sock:
+        send_frame(sock, REQUEST, json.dumps({"op": op}).encode("utf-8"))
+        frame = recv_frame(sock)
+    if frame is None or frame[0] != REPLY:
+        return None
+    return json.loads(frame[1])
+
+
+def route_command(
+    args: Sequence[str],
+    env: Mapping[str, str] | None = None,
+    stdout: BinaryIO | None = None,
+    stderr: BinaryIO | None = None,
+) -> int | None:
+    """Run a command in the daemon, if it is running and the command is one it runs.
+
+    The daemon runs the command in the working directory and with the environment of the caller,
+    and the output is written to the standard streams of the caller as the command writes it.
+
+    Args:
+        args: The arguments after the program name.
+        env: The environment, ``os.environ`` by default. Setting ``GLNOVA_NO_DAEMON`` disables the routing.
+        stdout: The binary output stream, stdout by default.
+        stderr: The binary error stream, stderr by default.
+
+    Returns:
+        The exit status of the command, or None if it was not routed and must run in the process.
+
+    """
+    env = os.environ if env is None else env
+    if env.get(DISABLE_ENV) or find_command(args) not in ROUTED_COMMANDS:
+        return None
+    sock = connect(default_socket_path(env))
+    if sock is None:
+        return None
+    stdout = stdout or sys.stdout.buffer
+    stderr = stderr or sys.stderr.buffer
+    request = {
+        "op": "run",
+        "args": list(args),
+        "cwd": os.getcwd(),
+        "env": dict(env),
+        "isatty": [stdout.isatty(), stderr.isatty()],
+    }
+    with sock:
+        send_frame(sock, REQUEST, json.dumps(request).encode("utf-8"))
+        while True:
+            frame = recv_frame(sock)
+            if frame is None:
+                stderr.write(b"Error: the glnova daemon closed the connection before the command finished.\n")
+                stderr.flush()
+                return 1
+            kind, payload = frame
+            if kind == EXIT:
+                return int(json.loads(payload)["status"])
+            stream = stdout if kind == STDOUT else stderr if kind == STDERR else None
+            if stream is None:
+                continue
+            try:
+                stream.write(payload)
+                stream.flush()
+            except BrokenPipeError:
+                # The consumer of the output is gone, e.g. ``head``; closing the connection stops the command.
+                _silence(stream)
+                return 0
+
+
+def _silence(stream: BinaryIO) -> None:
+    """Point a standard stream to the null device after its consumer closed it.
+
+    Args:
+        stream: The stream.
+
+    """
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, fd)
+    os.close(devnull)
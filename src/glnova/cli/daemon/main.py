@@ -0,0 +1,25 @@
+"""Daemon CLI commands for glnova."""
+
+from __future__ import annotations
+
+import typer
+
+daemon_app = typer.Typer(
+    name="daemon",
+    help="Run CLI commands in a background process keeping connections and configuration warm.",
+    rich_markup_mode="rich",
+)
+
+
+def register_commands() -> None:
+    """Register daemon subcommands."""
+    from glnova.cli.daemon.start import start_command  # noqa: PLC0415
+    from glnova.cli.daemon.status import status_command  # noqa: PLC0415
+    from glnova.cli.daemon.stop import stop_command  # noqa: PLC0415
+
+    daemon_app.command(name="start", help="Start the glnova daemon.")(start_command)
+    daemon_app.command(name="stop", help="Stop the glnova daemon.")(stop_command)
+    daemon_app.command(name="status", help="Show the status of the glnova daemon.")(status_command)
+
+
+register_commands()
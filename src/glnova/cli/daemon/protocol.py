@@ -0,0 +1,110 @@
+"""Wire protocol between the CLI and ``glnova daemon``.
+
+A connection carries frames of a one-byte kind, a four-byte big-endian length and a payload.
+The CLI sends a `REQUEST` frame with a JSON object; the daemon answers a ``run`` request with
+`STDOUT` and `STDERR` frames as the command writes, then an `EXIT` frame with the exit status,
+and other requests with a single `REPLY` frame. Only the standard library is used, so that
+routing a command to the daemon costs no imports.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+HEADER = struct.Struct(">cI")
+
+REQUEST = b"q"
+REPLY = b"r"
+STDOUT = b"o"
+STDERR = b"e"
+EXIT = b"x"
+
+# Largest `REQUEST` payload the daemon accepts, so that a peer cannot make it allocate an arbitrary buffer.
+MAX_REQUEST_SIZE = 4 * 1024 * 1024
+
+# Environment variable of the socket path, and environment variable disabling the routing to the daemon.
+SOCKET_ENV = "GLNOVA_DAEMON_SOCKET"
+DISABLE_ENV = "GLNOVA_NO_DAEMON"
+
+
+def default_socket_path(env: Mapping[str, str] | None = None) -> Path:
+    """Get the path of the socket of the daemon.
+
+    Args:
+        env: The environment, ``os.environ`` by default.
+
+    Returns:
+        ``GLNOVA_DAEMON_SOCKET`` if set, otherwise ``daemon.sock`` in a directory of the user
+        under ``XDG_RUNTIME_DIR``, ``TMPDIR`` or ``/tmp``.
+
+    """
+    env = os.environ if env is None else env
+    if env.get(SOCKET_ENV):
+        return Path(env[SOCKET_ENV])
+    base = env.get("XDG_RUNTIME_DIR") or env.get("TMPDIR") or "/tmp"
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return Path(base) / f"glnova-{user}" / "daemon.sock"
+
+
+def send_frame(sock: Any, kind: bytes, payload: bytes) -> None:
+    """Send a frame.
+
+    Args:
+        sock: The connected socket.
+        kind: The kind of the frame.
+        payload: The payload.
+
+    """
+    sock.sendall(HEADER.pack(kind, len(payload)) + payload)
+
+
+def recv_frame(sock: Any, max_size: int | None = None) -> tuple[bytes, bytes] | None:
+    """Receive a frame.
+
+    Args:
+        sock: The connected socket.
+        max_size: Largest payload accepted, in bytes. Unbounded if None.
+
+    Returns:
+        The kind and the payload of the frame, or None if the connection was closed.
+
+    Raises:
+        ValueError: If the payload is larger than ``max_size``.
+
+    """
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    kind, size = HEADER.unpack(header)
+    if max_size is not None and size > max_size:
+        raise ValueError(f"Frame of {size} bytes exceeds the limit of {max_size} bytes.")
+    payload = _recv_exact(sock, size)
+    if payload is None:
+        return None
+    return kind, payload
+
+
+def _recv_exact(sock: Any, size: int) -> bytes | None:
+    """Receive an exact number of bytes.
+
+    Args:
+        sock: The connected socket.
+        size: The number of bytes.
+
+    Returns:
+        The bytes, or None if the connection was closed before all of them arrived.
+
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            return None
+        received += count
+    return bytes(buffer)
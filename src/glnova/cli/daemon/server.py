@@ -0,0 +1,295 @@
+"""Server of ``glnova daemon``."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import logging
+import os
+import socket
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Any
+
+from glnova.cli.daemon.client import ROUTED_COMMANDS
+from glnova.cli.daemon.protocol import (
+    EXIT,
+    MAX_REQUEST_SIZE,
+    REPLY,
+    REQUEST,
+    STDERR,
+    STDOUT,
+    recv_frame,
+    send_frame,
+)
+from glnova.client.transport import SharedTransport, set_default_transport
+
+logger = logging.getLogger("glnova")
+
+
+class _FrameWriter(io.RawIOBase):
+    """Raw stream sending what is written to it as frames of one kind."""
+
+    def __init__(self, conn: socket.socket, kind: bytes, tty: bool) -> None:
+        """Initialize the _FrameWriter.
+
+        Args:
+            conn: The connection of the client.
+            kind: The kind of the frames.
+            tty: Whether the stream of the client is a terminal.
+
+        """
+        super().__init__()
+        self.conn = conn
+        self.kind = kind
+        self.tty = tty
+
+    def writable(self) -> bool:
+        """Return whether the stream is writable.
+
+        Returns:
+            True.
+
+        """
+        return True
+
+    def isatty(self) -> bool:
+        """Return whether the stream of the client is a terminal.
+
+        Returns:
+            Whether the stream of the client is a terminal.
+
+        """
+        return self.tty
+
+    def write(self, data: Any) -> int:
+        """Send data to the client.
+
+        Args:
+            data: The bytes.
+
+        Returns:
+            The number of bytes sent.
+
+        Raises:
+            BrokenPipeError: If the client is gone.
+
+        """
+        payload = bytes(data)
+        try:
+            send_frame(self.conn, self.kind, payload)
+        except OSError as e:
+            raise BrokenPipeError(str(e)) from e
+        return len(payload)
+
+
+class DaemonServer:
+    """Server running the CLI commands sent by the ``glnova`` processes of the user.
+
+    The CLI, the clients and their dependencies are imported once, the configuration file is
+    parsed once until it changes, and the `GitLab` clients created by the commands share one
+    `SharedTransport`, so connections to GitLab stay open between commands. The transport keeps
+    separate sessions per GitLab host and token. Commands run one at a time, in the working
+    directory and with the environment of the process that sent them.
+    """
+
+    def __init__(self, socket_path: Path, idle_timeout: float | None = 3600.0, request_timeout: float = 5.0) -> None:
+        """Initialize the DaemonServer.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on.
+            idle_timeout: Seconds without a request after which the server stops, or None to never stop.
+            request_timeout: Seconds a client has to send its request once connected.
+
+        """
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.request_timeout = request_timeout
+        self.transport = SharedTransport()
+        self.commands = 0
+        self.started = time.time()
+        self.running = False
+        self._sock: socket.socket | None = None
+        self._command: Any = None
+
+    def __str__(self) -> str:
+        """Return a string representation of the server.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<DaemonServer socket={self.socket_path} commands={self.commands}>"
+
+    def bind(self) -> None:
+        """Create the socket, in a directory only the user can access.
+
+        Raises:
+            RuntimeError: If the directory of the socket belongs to another user, or a daemon is already listening.
+
+        """
+        directory = self.socket_path.parent
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if hasattr(os, "getuid") and directory.stat().st_uid != os.getuid():
+            raise RuntimeError(f"{directory} belongs to another user.")
+        if self.socket_path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                self.socket_path.unlink()
+            else:
+                raise RuntimeError(f"A glnova daemon is already listening on {self.socket_path}.")
+            finally:
+                probe.close()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        sock.listen()
+        self._sock = sock
+
+    def load(self) -> None:
+        """Import the CLI and the commands routed to the daemon, and share the transport of the clients."""
+        import typer  # noqa: PLC0415
+
+        from glnova.cli.main import app  # noqa: PLC0415
+
+        self._command = typer.main.get_command(app)
+        ctx = self._command.make_context("glnova", [], resilient_parsing=True)
+        for name in sorted(ROUTED_COMMANDS):
+            self._command.get_command(ctx, name)
+        set_default_transport(self.transport)
+
+    def serve_forever(self) -> None:
+        """Serve requests until a ``stop`` request or the idle timeout."""
+        if self._sock is None:
+            self.bind()
+        if self._command is None:
+            self.load()
+        sock = self._sock
+        sock.settimeout(1.0)
+        self.running = True
+        last_request = time.monotonic()
+        logger.info("glnova daemon listening on %s", self.socket_path)
+        try:
+            while self.running:
+                try:
+                    conn, _ = sock.accept()
+                except TimeoutError:
+                    if self.idle_timeout is not None and time.monotonic() - last_request > self.idle_timeout:
+                        logger.info("glnova daemon idle for %s seconds, stopping", self.idle_timeout)
+                        break
+                    continue
+                with conn:
+                    conn.settimeout(self.request_timeout)
+                    self.handle(conn)
+                last_request = time.monotonic()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening, remove the socket and close the shared connections."""
+        self.running = False
+        set_default_transport(None)
+        self.transport.shutdown()
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+
+    def status(self) -> dict[str, Any]:
+        """Get the status of the server.
+
+        Returns:
+            The process ID, socket, uptime and number of commands and requests served.
+
+        """
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime": round(time.time() - self.started, 3),
+            "commands": self.commands,
+            "requests": self.transport.requests,
+        }
+
+    def handle(self, conn: socket.socket) -> None:
+        """Answer the request of a connection.
+
+        A client that stays silent for the request timeout before its request is complete
+        is dropped, so it cannot block the other ones, and so is a request larger than
+        `MAX_REQUEST_SIZE`.
+
+        Args:
+            conn: The connection of the client.
+
+        """
+        try:
+            frame = recv_frame(conn, max_size=MAX_REQUEST_SIZE)
+            if frame is None or frame[0] != REQUEST:
+                return
+            conn.settimeout(None)
+            request = json.loads(frame[1])
+            op = request.get("op")
+            if op == "run":
+                status = self.run(conn, request)
+                send_frame(conn, EXIT, json.dumps({"status": status}).encode("utf-8"))
+            elif op == "stop":
+                self.running = False
+                send_frame(conn, REPLY, json.dumps({"stopped": True, **self.status()}).encode("utf-8"))
+            elif op == "status":
+                send_frame(conn, REPLY, json.dumps(self.status()).encode("utf-8"))
+            else:
+                send_frame(conn, REPLY, json.dumps({"error": f"Unknown request {op!r}."}).encode("utf-8"))
+        except (OSError, ValueError) as e:
+            logger.debug("Dropped daemon connection: %s", e)
+
+    def run(self, conn: socket.socket, request: dict[str, Any]) -> int:
+        """Run a CLI command, with its output sent to the client.
+
+        Args:
+            conn: The connection of the client.
+            request: The arguments, working directory, environment and terminal flags of the command.
+
+        Returns:
+            The exit status of the command.
+
+        """
+        from glnova.cli.main import reset_start_time  # noqa: PLC0415
+
+        args = list(request.get("args", []))
+        stdout_tty, stderr_tty = [*request.get("isatty", []), False, False][:2]
+        stdout = io.TextIOWrapper(io.BufferedWriter(_FrameWriter(conn, STDOUT, stdout_tty)), encoding="utf-8")
+        stderr = io.TextIOWrapper(
+            io.BufferedWriter(_FrameWriter(conn, STDERR, stderr_tty)), encoding="utf-8", line_buffering=True
+        )
+        saved_streams = sys.stdout, sys.stderr
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        status = 0
+        try:
+            os.environ.clear()
+            os.environ.update(request.get("env", saved_env))
+            os.chdir(request.get("cwd", saved_cwd))
+            sys.stdout, sys.stderr = stdout, stderr
+            reset_start_time()
+            try:
+                self._command.main(args=args, prog_name="glnova", standalone_mode=True)
+            except SystemExit as e:
+                status = e.code if isinstance(e.code, int) else 0 if e.code is None else 1
+            except Exception:  # noqa: BLE001
+                traceback.print_exc()
+                status = 1
+            for stream in (stdout, stderr):
+                with contextlib.suppress(OSError, ValueError):
+                    stream.flush()
+        finally:
+            sys.stdout, sys.stderr = saved_streams
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+            self.commands += 1
+        return status
@@ -0,0 +1,124 @@
+"""Start command for daemon CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+# Seconds to wait for a daemon started in the background to listen.
+START_TIMEOUT = 10.0
+
+
+def start_command(
+    socket_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            help="Path of the Unix socket. Defaults to `GLNOVA_DAEMON_SOCKET` or a directory of the user in the runtime directory.",
+        ),
+    ] = None,
+    idle_timeout: Annotated[
+        float,
+        typer.Option(
+            "--idle-timeout", help="Stop after this number of seconds without a command, 0 to never stop.", min=0
+        ),
+    ] = 3600.0,
+    foreground: Annotated[
+        bool,
+        typer.Option("--foreground", help="Serve in this process instead of starting a background process."),
+    ] = False,
+) -> None:
+    """Start the glnova daemon.
+
+    While it runs, the issue, merge-request, project and user commands are sent to it
+    and run without the startup cost of a new process. Set ``GLNOVA_NO_DAEMON`` to run
+    a command in its own process.
+
+    Args:
+        socket_path: Path of the Unix socket.
+        idle_timeout: Seconds without a command after which the daemon stops, 0 to never stop.
+        foreground: Whether to serve in this process.
+
+    """
+    import json  # noqa: PLC0415
+
+    from glnova.cli.daemon.client import request_daemon  # noqa: PLC0415
+    from glnova.cli.daemon.protocol import default_socket_path  # noqa: PLC0415
+
+    socket_path = socket_path or default_socket_path()
+    status = request_daemon(socket_path, "status")
+    if status is not None:
+        typer.echo(f"Error: a glnova daemon is already running on {socket_path} (pid {status['pid']}).", err=True)
+        raise typer.Exit(code=1)
+
+    if foreground:
+        from glnova.cli.daemon.server import DaemonServer  # noqa: PLC0415
+
+        server = DaemonServer(socket_path=socket_path, idle_timeout=idle_timeout or None)
+        try:
+            server.bind()
+        except (OSError, RuntimeError) as e:
+            typer.echo(f"Error: cannot listen on {socket_path}: {e}", err=True)
+            raise typer.Exit(code=1) from e
+        server.serve_forever()
+        return
+
+    status = spawn_daemon(socket_path=socket_path, idle_timeout=idle_timeout)
+    if status is None:
+        typer.echo(
+            f"Error: the glnova daemon did not start on {socket_path}. Run `glnova daemon start --foreground` to see why.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    print(json.dumps(status, indent=2))
+
+
+def spawn_daemon(socket_path: Path, idle_timeout: float) -> dict | None:
+    """Start the daemon in a background process and wait for it to listen.
+
+    Args:
+        socket_path: Path of the Unix socket.
+        idle_timeout: Seconds without a command after which the daemon stops, 0 to never stop.
+
+    Returns:
+        The status of the daemon, or None if it exited or did not listen in time.
+
+    """
+    import os  # noqa: PLC0415
+    import subprocess  # noqa: PLC0415
+    import sys  # noqa: PLC0415
+    import time  # noqa: PLC0415
+
+    from glnova.cli.daemon.client import request_daemon  # noqa: PLC0415
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from glnova.cli.entry import main; main()",
+            "daemon",
+            "start",
+            "--foreground",
+            "--socket",
+            str(socket_path),
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        # The daemon imports glnova from where this process found it, e.g. a source checkout.
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = request_daemon(socket_path, "status")
+        if status is not None:
+            return status
+        if process.poll() is not None:
+            return None
+        time.sleep(0.05)
+    return None
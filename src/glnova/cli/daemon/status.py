@@ -0,0 +1,33 @@
+"""Status command for daemon CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+def status_command(
+    socket_path: Annotated[
+        Path | None,
+        typer.Option("--socket", help="Path of the Unix socket. Defaults to the one of `glnova daemon start`."),
+    ] = None,
+) -> None:
+    """Show the process ID, uptime and number of commands and requests of the glnova daemon.
+
+    Args:
+        socket_path: Path of the Unix socket.
+
+    """
+    import json  # noqa: PLC0415
+
+    from glnova.cli.daemon.client import request_daemon  # noqa: PLC0415
+    from glnova.cli.daemon.protocol import default_socket_path  # noqa: PLC0415
+
+    socket_path = socket_path or default_socket_path()
+    status = request_daemon(socket_path, "status")
+    if status is None:
+        typer.echo(f"No glnova daemon is running on {socket_path}.", err=True)
+        raise typer.Exit(code=1)
+    print(json.dumps(status, indent=2))
@@ -0,0 +1,27 @@
+"""Console script of glnova."""
+
+from __future__ import annotations
+
+import sys
+
+
+def main() -> None:
+    """Run the CLI, answering shell completion requests without importing it.
+
+    Commands are sent to ``glnova daemon`` when it is running.
+    """
+    from glnova.cli.completion import serve_completion  # noqa: PLC0415
+
+    status = serve_completion()
+    if status is not None:
+        sys.exit(status)
+
+    from glnova.cli.daemon.client import route_command  # noqa: PLC0415
+
+    status = route_command(sys.argv[1:])
+    if status is not None:
+        sys.exit(status)
+
+    from glnova.cli.main import app  # noqa: PLC0415
+
+    app()
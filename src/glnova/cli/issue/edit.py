@@ -43,6 +43,13 @@ def edit_command(  # noqa: PLR0913
             help="Assignee IDs to assign to the issue. Repeat --assignee-ids for multiple values.",
         ),
     ] = None,
+    assignee_username: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--assignee-username",
+            help="Usernames or emails to assign to the issue, resolved to IDs and combined with --assignee-ids. Repeat --assignee-username for multiple values.",
+        ),
+    ] = None,
     labels: Annotated[
         list[str] | None,
         typer.Option(
@@ -165,6 +172,7 @@ def edit_command(  # noqa: PLR0913
         title: New title for the issue.
         description: New description for the issue.
         assignee_ids: Assignee IDs to assign to the issue.
+        assignee_username: Usernames or emails to assign to the issue.
         labels: Labels to set on the issue.
         add_labels: Labels to add to the issue.
         remove_labels: Labels to remove from the issue.
@@ -183,12 +191,15 @@ def edit_command(  # noqa: PLR0913
         base_url: Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.
 
     """
-    from typing import Any  # noqa: PLC0415
+    from glnova.cli.utils.profile import profile_phase  # noqa: PLC0415
+
+    with profile_phase("imports"):
+        from typing import Any  # noqa: PLC0415
 
-    from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
-    from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from glnova.cli.utils.convert import str_to_int  # noqa: PLC0415
-    from glnova.client.gitlab import GitLab  # noqa: PLC0415
+        from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+        from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+        from glnova.cli.utils.convert import str_to_int  # noqa: PLC0415
+        from glnova.client.gitlab import GitLab  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
@@ -199,12 +210,19 @@ def edit_command(  # noqa: PLR0913
 
     def api_call() -> tuple[dict[str, Any], dict[str, Any]]:
         with GitLab(token=token, base_url=base_url) as client:
+            assignee_ids_value = assignee_ids
+            if assignee_username:
+                resolved = client.user.resolve_user_ids(assignee_username)
+                missing = [identifier for identifier in assignee_username if identifier not in resolved]
+                if missing:
+                    raise ValueError(f"Could not resolve assignees: {', '.join(missing)}")
+                assignee_ids_value = [*(assignee_ids or []), *resolved.values()]
             return client.issue.edit_issue(
                 project_id=str_to_int(project_id),
                 issue_iid=issue_iid,
                 title=title,
                 description=description,
-                assignee_ids=assignee_ids,
+                assignee_ids=assignee_ids_value,
                 labels=labels,
                 add_labels=add_labels,
                 remove_labels=remove_labels,
@@ -75,12 +75,15 @@ def get_command(  # noqa: PLR0913
         base_url: Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.
 
     """
-    from typing import Any  # noqa: PLC0415
+    from glnova.cli.utils.profile import profile_phase  # noqa: PLC0415
 
-    from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
-    from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from glnova.cli.utils.convert import str_to_int_or_none  # noqa: PLC0415
-    from glnova.client.gitlab import GitLab  # noqa: PLC0415
+    with profile_phase("imports"):
+        from typing import Any  # noqa: PLC0415
+
+        from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+        from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+        from glnova.cli.utils.convert import str_to_int_or_none  # noqa: PLC0415
+        from glnova.client.gitlab import GitLab  # noqa: PLC0415
 
     # Validate arguments
     if issue_id is None and (project_id is None or issue_iid is None):
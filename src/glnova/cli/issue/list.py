@@ -281,6 +281,44 @@ def list_command(  # noqa: PLR0913
             help="ETag for conditional requests.",
         ),
     ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all-pages", help="Fetch every page from --page on instead of a single page."),
+    ] = False,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=1, help="Stop after this number of items, fetching as many pages as needed."),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            min=1,
+            help="Maximum number of pages fetched concurrently with --all-pages or --max-items, lowered while GitLab is overloaded.",
+        ),
+    ] = 1,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv"] | None,
+        typer.Option(
+            "--format",
+            help=(
+                "Output format: json prints one document with the data and the metadata, "
+                "ndjson and csv print one record per line as it is received and the metadata on stderr. "
+                "Defaults to json; cannot be used with --raw."
+            ),
+        ),
+    ] = None,
+    raw: Annotated[
+        bool,
+        typer.Option(
+            "--raw",
+            help="Write the response bodies as received, without decoding them, and the pagination headers on stderr.",
+        ),
+    ] = False,
+    output: Annotated[
+        str | None,
+        typer.Option("--output", help="File to write the response bodies of --raw to instead of stdout."),
+    ] = None,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -346,17 +384,31 @@ def list_command(  # noqa: PLR0913
         page: Page number for pagination.
         per_page: Number of items per page for pagination.
         etag: ETag for conditional requests.
+        all_pages: Fetch every page from --page on instead of a single page.
+        max_items: Stop after this number of items, fetching as many pages as needed.
+        jobs: Number of pages fetched concurrently with --all-pages or --max-items.
+        output_format: Output format, one of json, ndjson and csv; json if not given.
+        raw: Write the response bodies as received, without decoding them, and the pagination headers on stderr.
+        output: File to write the response bodies of --raw to instead of stdout.
         account_name: Name of the account to use for authentication.
         token: Token for authentication. If not provided, the token from the specified account will be used.
         base_url: Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.
 
     """
-    from typing import Any, cast  # noqa: PLC0415
+    from glnova.cli.utils.profile import profile_phase  # noqa: PLC0415
 
-    from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
-    from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from glnova.cli.utils.convert import str_to_int_or_none, str_to_literal_or_int_or_none  # noqa: PLC0415
-    from glnova.client.gitlab import GitLab  # noqa: PLC0415
+    with profile_phase("imports"):
+        from typing import Any, cast  # noqa: PLC0415
+
+        from glnova.cli.utils.api import (  # noqa: PLC0415
+            execute_api_command,
+            execute_paginated_command,
+            execute_raw_command,
+            validate_list_options,
+        )
+        from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+        from glnova.cli.utils.convert import str_to_int_or_none, str_to_literal_or_int_or_none  # noqa: PLC0415
+        from glnova.client.gitlab import GitLab  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
@@ -397,45 +449,86 @@ def list_command(  # noqa: PLR0913
             raise typer.Exit(code=1)
         search_in_list = cast(list[Literal["title", "description"]], list(search_in))
 
+    def list_page(client: Any, page_number: int, raw: bool = False, **kwargs: Any) -> Any:
+        list_issues = client.issue._list_issues if raw else client.issue.list_issues
+        return list_issues(
+            group=str_to_int_or_none(group),
+            project=str_to_int_or_none(project),
+            assignee_id=assignee_id_value,
+            assignee_username=assignee_username,
+            author_id=author_id,
+            author_username=author_username,
+            confidential=confidential,
+            created_after=created_after,
+            created_before=created_before,
+            due_date=due_date,
+            epic_id=epic_id_value,
+            health_status=health_status,
+            iids=iids,
+            search_in=search_in_list,
+            issue_type=issue_type,
+            iteration_id=iteration_id_value,
+            iteration_title=iteration_title,
+            labels=labels,
+            milestone_id=milestone_id,
+            milestone=milestone,
+            my_reaction_emoji=my_reaction_emoji,
+            non_archived=non_archived,
+            not_match=not_match,
+            order_by=order_by,
+            scope=scope,
+            search=search,
+            sort=sort,
+            state=state,
+            updated_after=updated_after,
+            updated_before=updated_before,
+            weight=weight_value,
+            with_labels_details=with_labels_details,
+            cursor=cursor,
+            page=page_number,
+            per_page=per_page,
+            etag=etag,
+            **kwargs,
+        )
+
+    output_format = validate_list_options(
+        raw=raw,
+        output_format=output_format,
+        output=output,
+        all_pages=all_pages,
+        max_items=max_items,
+        jobs=jobs,
+        etag=etag,
+        cursor=cursor,
+    )
+    if raw:
+        execute_raw_command(
+            lambda client, page_number: list_page(client, page_number, raw=True, stream=True),
+            token=token,
+            base_url=base_url,
+            command_name="glnova issue list",
+            start_page=page,
+            all_pages=all_pages,
+            output_path=output,
+        )
+        return
+
+    if all_pages or max_items is not None:
+        execute_paginated_command(
+            list_page,
+            token=token,
+            base_url=base_url,
+            command_name="glnova issue list",
+            output_format=output_format,
+            start_page=page,
+            per_page=per_page,
+            jobs=jobs,
+            max_items=max_items,
+        )
+        return
+
     def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
         with GitLab(token=token, base_url=base_url) as client:
-            return client.issue.list_issues(
-                group=str_to_int_or_none(group),
-                project=str_to_int_or_none(project),
-                assignee_id=assignee_id_value,
-                assignee_username=assignee_username,
-                author_id=author_id,
-                author_username=author_username,
-                confidential=confidential,
-                created_after=created_after,
-                created_before=created_before,
-                due_date=due_date,
-                epic_id=epic_id_value,
-                health_status=health_status,
-                iids=iids,
-                search_in=search_in_list,
-                issue_type=issue_type,
-                iteration_id=iteration_id_value,
-                iteration_title=iteration_title,
-                labels=labels,
-                milestone_id=milestone_id,
-                milestone=milestone,
-                my_reaction_emoji=my_reaction_emoji,
-                non_archived=non_archived,
-                not_match=not_match,
-                order_by=order_by,
-                scope=scope,
-                search=search,
-                sort=sort,
-                state=state,
-                updated_after=updated_after,
-                updated_before=updated_before,
-                weight=weight_value,
-                with_labels_details=with_labels_details,
-                cursor=cursor,
-                page=page,
-                per_page=per_page,
-                etag=etag,
-            )
+            return list_page(client, page)
 
-    execute_api_command(api_call=api_call, command_name="glnova issue list")
+    execute_api_command(api_call=api_call, command_name="glnova issue list", output_format=output_format)
@@ -2,10 +2,33 @@
 
 from __future__ import annotations
 
-import enum
-from typing import Annotated
+import time
 
-import typer
+_START = time.perf_counter()
+
+import enum  # noqa: E402
+import logging  # noqa: E402
+from typing import Annotated  # noqa: E402
+
+import typer  # noqa: E402
+from typer.core import TyperCommand, TyperGroup  # noqa: E402
+
+# Module, attribute and help of every command, imported only when the command is invoked.
+# Typer apps carry their own help.
+COMMANDS: dict[str, tuple[str, str, str | None]] = {
+    "bench": (
+        "glnova.cli.bench.main",
+        "bench_command",
+        "Benchmark a GitLab instance with a concurrent mix of issue calls.",
+    ),
+    "config": ("glnova.cli.config.main", "config_app", None),
+    "daemon": ("glnova.cli.daemon.main", "daemon_app", None),
+    "issue": ("glnova.cli.issue.main", "issue_app", None),
+    "merge-request": ("glnova.cli.merge_request.main", "merge_request_app", None),
+    "project": ("glnova.cli.project.main", "project_app", None),
+    "trace": ("glnova.cli.trace.main", "trace_app", None),
+    "user": ("glnova.cli.user.main", "user_app", None),
+}
 
 
 class LoggingLevel(str, enum.Enum):
@@ -19,56 +42,156 @@ class LoggingLevel(str, enum.Enum):
     CRITICAL = "CRITICAL"
 
 
+def load_command(name: str) -> TyperCommand | TyperGroup:
+    """Import a command of the CLI.
+
+    Args:
+        name: The name of the command, a key of `COMMANDS`.
+
+    Returns:
+        The click command or group.
+
+    """
+    import importlib  # noqa: PLC0415
+
+    from glnova.cli.utils.profile import profile_phase  # noqa: PLC0415
+
+    module_name, attribute, help_text = COMMANDS[name]
+    with profile_phase("imports"):
+        target = getattr(importlib.import_module(module_name), attribute)
+    if isinstance(target, typer.Typer):
+        return typer.main.get_group(target)
+    single = typer.Typer(rich_markup_mode="rich")
+    single.command(name=name, help=help_text)(target)
+    return typer.main.get_command(single)
+
+
+class LazyGroup(TyperGroup):
+    """Command group importing a command only when it is invoked or listed in the help.
+
+    Importing every command and the clients they use would add to the startup time of every invocation.
+    """
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        """List the commands, including the ones not imported yet.
+
+        Args:
+            ctx: Click context.
+
+        Returns:
+            The names of the commands.
+
+        """
+        return [*super().list_commands(ctx), *(name for name in COMMANDS if name not in self.commands)]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> TyperCommand | TyperGroup | None:
+        """Get a command, importing it on first use.
+
+        Args:
+            ctx: Click context.
+            cmd_name: The name of the command.
+
+        Returns:
+            The command, or None if there is no such command.
+
+        """
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in COMMANDS:
+            command = self.commands[cmd_name] = load_command(cmd_name)
+        return command
+
+
 # Create the main Typer app
 app = typer.Typer(
     name="glnova",
     help="Main CLI for glnova.",
     rich_markup_mode="rich",
+    cls=LazyGroup,
 )
 
 
-def setup_logging(level: LoggingLevel = LoggingLevel.INFO) -> None:
-    """Set up logging with Rich handler.
+class DeferredRichHandler(logging.Handler):
+    """Logging handler creating the rich handler of the CLI when the first record is emitted.
+
+    Most commands log nothing, so they do not pay for importing rich.
+    """
+
+    def __init__(self, level: str) -> None:
+        """Initialize the DeferredRichHandler.
+
+        Args:
+            level: Logging level.
+
+        """
+        super().__init__(level)
+        self.level_name = level
+        self.handler: logging.Handler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record with the rich handler.
+
+        Args:
+            record: The log record.
+
+        """
+        if self.handler is None:
+            self.handler = create_rich_handler(self.level_name)
+        self.handler.handle(record)
+
+
+def create_rich_handler(level: str) -> logging.Handler:
+    """Create the rich handler of the CLI, writing to stderr.
 
     Args:
         level: Logging level.
 
-    """
-    import logging  # noqa: PLC0415
+    Returns:
+        The handler.
 
+    """
     from rich.console import Console  # noqa: PLC0415
     from rich.logging import RichHandler  # noqa: PLC0415
 
-    logger = logging.getLogger("glnova")
-
-    logger.setLevel(level.value)
-
     console = Console(stderr=True)
-
-    # Remove any existing handlers to ensure RichHandler is used
-    for h in logger.handlers[:]:  # Use slice copy to avoid modification during iteration
-        logger.removeHandler(h)
-    # Add the RichHandler
-
     handler = RichHandler(
         console=console,
         rich_tracebacks=True,
         show_time=True,
         show_level=True,  # Keep level (e.g., DEBUG, INFO) for clarity
         markup=True,  # Enable Rich markup in messages for styling
-        level=level.value,  # Ensure handler respects the level
+        level=level,  # Ensure handler respects the level
         omit_repeated_times=False,
         log_time_format="%H:%M",
     )
-    handler.setLevel(level.value)
-    logger.addHandler(handler)
+    handler.setLevel(level)
+    return handler
+
+
+def setup_logging(level: LoggingLevel = LoggingLevel.INFO) -> None:
+    """Set up logging with Rich handler.
+
+    The Rich handler is created when the first record is emitted.
+
+    Args:
+        level: Logging level.
+
+    """
+    logger = logging.getLogger("glnova")
+
+    logger.setLevel(level.value)
+
+    # Remove any existing handlers to ensure RichHandler is used
+    for h in logger.handlers[:]:  # Use slice copy to avoid modification during iteration
+        logger.removeHandler(h)
+
+    logger.addHandler(DeferredRichHandler(level.value))
 
     # Prevent propagation to root logger to avoid duplicate output
     logger.propagate = False
 
 
 @app.callback()
-def main(
+def main(  # noqa: PLR0913
     ctx: typer.Context,
     config_path: Annotated[
         str | None,
@@ -81,6 +204,21 @@ def main(
         LoggingLevel,
         typer.Option("--verbose", "-v", help="Set verbosity level."),
     ] = LoggingLevel.INFO,
+    profile: Annotated[
+        bool,
+        typer.Option("--profile", help="Print a timing breakdown of the phases and requests of the command to stderr."),
+    ] = False,
+    profile_out: Annotated[
+        str | None,
+        typer.Option("--profile-out", help="Write cProfile statistics of the command to this file. Implies --profile."),
+    ] = None,
+    trace: Annotated[
+        str | None,
+        typer.Option(
+            "--trace",
+            help="Record the requests of the command to this trace file, in HAR format if it ends with .har and JSONL otherwise.",
+        ),
+    ] = None,
 ) -> None:
     """Set the main entry point for the CLI application.
 
@@ -88,10 +226,18 @@ def main(
         ctx: Typer context.
         config_path: Path to the configuration file.
         verbose: Verbosity level for logging.
+        profile: Whether to print a timing breakdown of the command to stderr.
+        profile_out: Path to write cProfile statistics to.
+        trace: Path of the trace file to record the requests to.
 
     """
     import os  # noqa: PLC0415
 
+    if profile or profile_out is not None:
+        start_profile(ctx=ctx, profile_out=profile_out)
+    if trace is not None:
+        start_trace(ctx=ctx, path=trace)
+
     config_path = config_path or os.getenv("GLNOVA_CONFIG_PATH")
 
     ctx.obj = {"config_path": config_path}
@@ -99,19 +245,51 @@ def main(
     setup_logging(verbose)
 
 
-def register_commands() -> None:
-    """Register CLI commands."""
-    from glnova.cli.config.main import config_app  # noqa: PLC0415
-    from glnova.cli.issue.main import issue_app  # noqa: PLC0415
-    from glnova.cli.merge_request.main import merge_request_app  # noqa: PLC0415
-    from glnova.cli.project.main import project_app  # noqa: PLC0415
-    from glnova.cli.user.main import user_app  # noqa: PLC0415
+def reset_start_time() -> None:
+    """Start the clock of ``--profile`` again, for a process running several commands, such as ``glnova daemon``."""
+    global _START  # noqa: PLW0603
+    _START = time.perf_counter()
+
+
+def start_profile(ctx: typer.Context, profile_out: str | None) -> None:
+    """Profile the command and print the report when the context closes.
+
+    Args:
+        ctx: Typer context.
+        profile_out: Path to write cProfile statistics to.
+
+    """
+    from glnova.cli.utils.profile import start_profiling, stop_profiling  # noqa: PLC0415
+
+    now = time.perf_counter()
+    profiler = start_profiling(start=_START, profile_out=profile_out)
+    profiler.record_phase("startup", now - _START)
+
+    def report() -> None:
+        end = time.perf_counter()
+        stopped = stop_profiling()
+        if stopped is not None:
+            typer.echo(stopped.render(end=end), err=True)
+
+    ctx.call_on_close(report)
+
+
+def start_trace(ctx: typer.Context, path: str) -> None:
+    """Record the requests of the command and close the trace file when the context closes.
+
+    Args:
+        ctx: Typer context.
+        path: Path of the trace file.
+
+    """
+    from glnova.client.events import add_default_event_hook, remove_default_event_hook  # noqa: PLC0415
+    from glnova.client.trace import TraceRecorder  # noqa: PLC0415
 
-    app.add_typer(config_app)
-    app.add_typer(issue_app)
-    app.add_typer(merge_request_app)
-    app.add_typer(project_app)
-    app.add_typer(user_app)
+    recorder = TraceRecorder(path)
+    add_default_event_hook(recorder)
 
+    def close() -> None:
+        remove_default_event_hook(recorder)
+        recorder.close()
 
-register_commands()
+    ctx.call_on_close(close)
@@ -8,7 +8,7 @@ from typing import Annotated, Literal
 import typer
 
 
-def list_command(  # noqa: PLR0913
+def list_command(  # noqa: PLR0913, PLR0915
     ctx: typer.Context,
     project_id: Annotated[
         str | None, typer.Option("--project-id", help="The project ID or name to filter merge requests.")
@@ -143,6 +143,44 @@ def list_command(  # noqa: PLR0913
         Literal["yes", "no"] | None, typer.Option("--wip", help="Filter merge requests by work-in-progress status.")
     ] = None,
     etag: Annotated[str | None, typer.Option("--etag", help="ETag for caching.")] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all-pages", help="Fetch every page from --page on instead of a single page."),
+    ] = False,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=1, help="Stop after this number of items, fetching as many pages as needed."),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            min=1,
+            help="Maximum number of pages fetched concurrently with --all-pages or --max-items, lowered while GitLab is overloaded.",
+        ),
+    ] = 1,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv"] | None,
+        typer.Option(
+            "--format",
+            help=(
+                "Output format: json prints one document with the data and the metadata, "
+                "ndjson and csv print one record per line as it is received and the metadata on stderr. "
+                "Defaults to json; cannot be used with --raw."
+            ),
+        ),
+    ] = None,
+    raw: Annotated[
+        bool,
+        typer.Option(
+            "--raw",
+            help="Write the response bodies as received, without decoding them, and the pagination headers on stderr.",
+        ),
+    ] = False,
+    output: Annotated[
+        str | None,
+        typer.Option("--output", help="File to write the response bodies of --raw to instead of stdout."),
+    ] = None,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -213,23 +251,37 @@ def list_command(  # noqa: PLR0913
         with_merge_status_recheck: Recheck merge status.
         wip: Filter merge requests by work-in-progress status.
         etag: ETag for caching.
+        all_pages: Fetch every page from --page on instead of a single page.
+        max_items: Stop after this number of items, fetching as many pages as needed.
+        jobs: Number of pages fetched concurrently with --all-pages or --max-items.
+        output_format: Output format, one of json, ndjson and csv; json if not given.
+        raw: Write the response bodies as received, without decoding them, and the pagination headers on stderr.
+        output: File to write the response bodies of --raw to instead of stdout.
         account_name: Name of the account to use for authentication.
         token: Token for authentication. If not provided, the token from the specified account will be used.
         base_url: Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.
 
     """
-    from typing import Any, cast  # noqa: PLC0415
+    from glnova.cli.utils.profile import profile_phase  # noqa: PLC0415
 
-    from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
-    from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from glnova.cli.utils.convert import (  # noqa: PLC0415
-        list_str_to_list_literal_or_none,
-        list_str_to_literal_or_list_int_or_none,
-        list_str_to_literal_or_list_str_or_none,
-        str_to_int_or_none,
-        str_to_literal_or_int_or_none,
-    )
-    from glnova.client.gitlab import GitLab  # noqa: PLC0415
+    with profile_phase("imports"):
+        from typing import Any, cast  # noqa: PLC0415
+
+        from glnova.cli.utils.api import (  # noqa: PLC0415
+            execute_api_command,
+            execute_paginated_command,
+            execute_raw_command,
+            validate_list_options,
+        )
+        from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+        from glnova.cli.utils.convert import (  # noqa: PLC0415
+            list_str_to_list_literal_or_none,
+            list_str_to_literal_or_list_int_or_none,
+            list_str_to_literal_or_list_str_or_none,
+            str_to_int_or_none,
+            str_to_literal_or_int_or_none,
+        )
+        from glnova.client.gitlab import GitLab  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
@@ -301,53 +353,95 @@ def list_command(  # noqa: PLR0913
     if reviewer_username_value in ("None", "Any"):
         reviewer_username_value = cast(Literal["None", "Any"], reviewer_username_value)
 
+    def list_page(client: Any, page_number: int, raw: bool = False, **kwargs: Any) -> Any:
+        list_merge_requests = (
+            client.merge_request._list_merge_requests if raw else client.merge_request.list_merge_requests
+        )
+        return list_merge_requests(
+            project_id=project_id_value,
+            group_id=group_id_value,
+            approved=approved,
+            approved_by_ids=approved_by_ids_value,
+            approved_by_usernames=approved_by_usernames_value,
+            approver_ids=approver_ids_value,
+            assignee_id=assignee_id_value,
+            assignee_username=assignee_username,
+            author_id=author_id_value,
+            author_username=author_username,
+            created_after=created_after,
+            created_before=created_before,
+            deployed_after=deployed_after,
+            deployed_before=deployed_before,
+            environment=environment,
+            iids=iids,
+            search_in=search_in_value,
+            labels=labels_value,
+            merge_user_id=merge_user_id,
+            merge_user_username=merge_user_username,
+            milestone=milestone_value,
+            my_reaction_emoji=my_reaction_emoji_value,
+            non_archived=non_archived,
+            not_match=not_match,
+            order_by=order_by,
+            page=page_number,
+            per_page=per_page,
+            render_html=render_html,
+            reviewer_id=reviewer_id_value,
+            reviewer_username=reviewer_username_value,
+            scope=scope,
+            search=search,
+            sort=sort,
+            source_branch=source_branch,
+            source_project_id=source_project_id,
+            state=state,
+            target_branch=target_branch,
+            updated_after=updated_after,
+            updated_before=updated_before,
+            view=view,
+            with_labels_details=with_labels_details,
+            with_merge_status_recheck=with_merge_status_recheck,
+            wip=wip,
+            etag=etag,
+            **kwargs,
+        )
+
+    output_format = validate_list_options(
+        raw=raw,
+        output_format=output_format,
+        output=output,
+        all_pages=all_pages,
+        max_items=max_items,
+        jobs=jobs,
+        etag=etag,
+    )
+    if raw:
+        execute_raw_command(
+            lambda client, page_number: list_page(client, page_number, raw=True, stream=True),
+            token=token,
+            base_url=base_url,
+            command_name="glnova merge-request list",
+            start_page=page,
+            all_pages=all_pages,
+            output_path=output,
+        )
+        return
+
+    if all_pages or max_items is not None:
+        execute_paginated_command(
+            list_page,
+            token=token,
+            base_url=base_url,
+            command_name="glnova merge-request list",
+            output_format=output_format,
+            start_page=page,
+            per_page=per_page,
+            jobs=jobs,
+            max_items=max_items,
+        )
+        return
+
     def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
         with GitLab(token=token, base_url=base_url) as client:
-            return client.merge_request.list_merge_requests(
-                project_id=project_id_value,
-                group_id=group_id_value,
-                approved=approved,
-                approved_by_ids=approved_by_ids_value,
-                approved_by_usernames=approved_by_usernames_value,
-                approver_ids=approver_ids_value,
-                assignee_id=assignee_id_value,
-                assignee_username=assignee_username,
-                author_id=author_id_value,
-                author_username=author_username,
-                created_after=created_after,
-                created_before=created_before,
-                deployed_after=deployed_after,
-                deployed_before=deployed_before,
-                environment=environment,
-                iids=iids,
-                search_in=search_in_value,
-                labels=labels_value,
-                merge_user_id=merge_user_id,
-                merge_user_username=merge_user_username,
-                milestone=milestone_value,
-                my_reaction_emoji=my_reaction_emoji_value,
-                non_archived=non_archived,
-                not_match=not_match,
-                order_by=order_by,
-                page=page,
-                per_page=per_page,
-                render_html=render_html,
-                reviewer_id=reviewer_id_value,
-                reviewer_username=reviewer_username_value,
-                scope=scope,
-                search=search,
-                sort=sort,
-                source_branch=source_branch,
-                source_project_id=source_project_id,
-                state=state,
-                target_branch=target_branch,
-                updated_after=updated_after,
-                updated_before=updated_before,
-                view=view,
-                with_labels_details=with_labels_details,
-                with_merge_status_recheck=with_merge_status_recheck,
-                wip=wip,
-                etag=etag,
-            )
+            return list_page(client, page)
 
-    execute_api_command(api_call=api_call, command_name="glnova merge-request list")
+    execute_api_command(api_call=api_call, command_name="glnova merge-request list", output_format=output_format)
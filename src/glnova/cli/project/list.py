@@ -283,6 +283,20 @@ def list_command(  # noqa: PLR0913
             help="Include security reports in the results.",
         ),
     ] = None,
+    page: Annotated[
+        int,
+        typer.Option(
+            "--page",
+            help="Page number for pagination.",
+        ),
+    ] = 1,
+    per_page: Annotated[
+        int,
+        typer.Option(
+            "--per-page",
+            help="Number of items per page for pagination.",
+        ),
+    ] = 20,
     etag: Annotated[
         str | None,
         typer.Option(
@@ -290,6 +304,44 @@ def list_command(  # noqa: PLR0913
             help="ETag for conditional requests.",
         ),
     ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all-pages", help="Fetch every page from --page on instead of a single page."),
+    ] = False,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=1, help="Stop after this number of items, fetching as many pages as needed."),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            min=1,
+            help="Maximum number of pages fetched concurrently with --all-pages or --max-items, lowered while GitLab is overloaded.",
+        ),
+    ] = 1,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv"] | None,
+        typer.Option(
+            "--format",
+            help=(
+                "Output format: json prints one document with the data and the metadata, "
+                "ndjson and csv print one record per line as it is received and the metadata on stderr. "
+                "Defaults to json; cannot be used with --raw."
+            ),
+        ),
+    ] = None,
+    raw: Annotated[
+        bool,
+        typer.Option(
+            "--raw",
+            help="Write the response bodies as received, without decoding them, and the pagination headers on stderr.",
+        ),
+    ] = False,
+    output: Annotated[
+        str | None,
+        typer.Option("--output", help="File to write the response bodies of --raw to instead of stdout."),
+    ] = None,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -353,18 +405,34 @@ def list_command(  # noqa: PLR0913
         with_shared: Include projects shared with groups.
         include_subgroups: Include projects from subgroups when filtering by group ID.
         with_security_reports: Include security reports in the results.
+        page: Page number for pagination.
+        per_page: Number of items per page for pagination.
         etag: ETag for conditional requests.
+        all_pages: Fetch every page from --page on instead of a single page.
+        max_items: Stop after this number of items, fetching as many pages as needed.
+        jobs: Number of pages fetched concurrently with --all-pages or --max-items.
+        output_format: Output format, one of json, ndjson and csv; json if not given.
+        raw: Write the response bodies as received, without decoding them, and the pagination headers on stderr.
+        output: File to write the response bodies of --raw to instead of stdout.
         account_name: Name of the account to use for authentication.
         token: Token for authentication. If not provided, the token from the specified account will be used.
         base_url: Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.
 
     """
-    from typing import Any  # noqa: PLC0415
+    from glnova.cli.utils.profile import profile_phase  # noqa: PLC0415
+
+    with profile_phase("imports"):
+        from typing import Any  # noqa: PLC0415
 
-    from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
-    from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from glnova.cli.utils.convert import str_to_int_or_none  # noqa: PLC0415
-    from glnova.client.gitlab import GitLab  # noqa: PLC0415
+        from glnova.cli.utils.api import (  # noqa: PLC0415
+            execute_api_command,
+            execute_paginated_command,
+            execute_raw_command,
+            validate_list_options,
+        )
+        from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+        from glnova.cli.utils.convert import str_to_int_or_none  # noqa: PLC0415
+        from glnova.client.gitlab import GitLab  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
@@ -373,47 +441,89 @@ def list_command(  # noqa: PLR0913
         base_url=base_url,
     )
 
+    def list_page(client: Any, page_number: int, raw: bool = False, **kwargs: Any) -> Any:
+        list_projects = client.project._list_projects if raw else client.project.list_projects
+        return list_projects(
+            user_id=str_to_int_or_none(user_id),
+            group_id=str_to_int_or_none(group_id),
+            archived=archived,
+            id_after=id_after,
+            id_before=id_before,
+            imported=imported,
+            include_hidden=include_hidden,
+            include_pending_delete=include_pending_delete,
+            last_activity_after=last_activity_after,
+            last_activity_before=last_activity_before,
+            membership=membership,
+            min_access_level=min_access_level,
+            order_by=order_by,
+            owned=owned,
+            repository_checksum_failed=repository_checksum_failed,
+            repository_storage=repository_storage,
+            search_namespaces=search_namespaces,
+            search=search,
+            simple=simple,
+            sort=sort,
+            starred=starred,
+            statistics=statistics,
+            topic_id=topic_id,
+            topic=topic,
+            updated_after=updated_after,
+            updated_before=updated_before,
+            visibility=visibility,
+            wiki_checksum_failed=wiki_checksum_failed,
+            with_custom_attributes=with_custom_attributes,
+            with_issues_enabled=with_issues_enabled,
+            with_merge_requests_enabled=with_merge_requests_enabled,
+            with_programming_language=with_programming_language,
+            marked_for_deletion_on=date.fromisoformat(marked_for_deletion_on) if marked_for_deletion_on else None,
+            active=active,
+            with_shared=with_shared,
+            include_subgroups=include_subgroups,
+            with_security_reports=with_security_reports,
+            page=page_number,
+            per_page=per_page,
+            etag=etag,
+            **kwargs,
+        )
+
+    output_format = validate_list_options(
+        raw=raw,
+        output_format=output_format,
+        output=output,
+        all_pages=all_pages,
+        max_items=max_items,
+        jobs=jobs,
+        etag=etag,
+    )
+    if raw:
+        execute_raw_command(
+            lambda client, page_number: list_page(client, page_number, raw=True, stream=True),
+            token=token,
+            base_url=base_url,
+            command_name="glnova project list",
+            start_page=page,
+            all_pages=all_pages,
+            output_path=output,
+        )
+        return
+
+    if all_pages or max_items is not None:
+        execute_paginated_command(
+            list_page,
+            token=token,
+            base_url=base_url,
+            command_name="glnova project list",
+            output_format=output_format,
+            start_page=page,
+            per_page=per_page,
+            jobs=jobs,
+            max_items=max_items,
+        )
+        return
+
     def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
         with GitLab(token=token, base_url=base_url) as client:
-            return client.project.list_projects(
-                user_id=str_to_int_or_none(user_id),
-                group_id=str_to_int_or_none(group_id),
-                archived=archived,
-                id_after=id_after,
-                id_before=id_before,
-                imported=imported,
-                include_hidden=include_hidden,
-                include_pending_delete=include_pending_delete,
-                last_activity_after=last_activity_after,
-                last_activity_before=last_activity_before,
-                membership=membership,
-                min_access_level=min_access_level,
-                order_by=order_by,
-                owned=owned,
-                repository_checksum_failed=repository_checksum_failed,
-                repository_storage=repository_storage,
-                search_namespaces=search_namespaces,
-                search=search,
-                simple=simple,
-                sort=sort,
-                starred=starred,
-                statistics=statistics,
-                topic_id=topic_id,
-                topic=topic,
-                updated_after=updated_after,
-                updated_before=updated_before,
-                visibility=visibility,
-                wiki_checksum_failed=wiki_checksum_failed,
-                with_custom_attributes=with_custom_attributes,
-                with_issues_enabled=with_issues_enabled,
-                with_merge_requests_enabled=with_merge_requests_enabled,
-                with_programming_language=with_programming_language,
-                marked_for_deletion_on=date.fromisoformat(marked_for_deletion_on) if marked_for_deletion_on else None,
-                active=active,
-                with_shared=with_shared,
-                include_subgroups=include_subgroups,
-                with_security_reports=with_security_reports,
-                etag=etag,
-            )
+            return list_page(client, page)
 
-    execute_api_command(api_call=api_call, command_name="glnova project list")
+    execute_api_command(api_call=api_call, command_name="glnova project list", output_format=output_format)
@@ -0,0 +1,21 @@
+"""Trace CLI commands for glnova."""
+
+from __future__ import annotations
+
+import typer
+
+trace_app = typer.Typer(
+    name="trace",
+    help="Inspect request traces.",
+    rich_markup_mode="rich",
+)
+
+
+def register_commands() -> None:
+    """Register trace subcommands."""
+    from glnova.cli.trace.summarize import summarize_command  # noqa: PLC0415
+
+    trace_app.command(name="summarize", help="Summarize a HAR or JSONL request trace.")(summarize_command)
+
+
+register_commands()
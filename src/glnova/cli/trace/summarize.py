@@ -0,0 +1,31 @@
+"""Summarize command for trace CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+
+def summarize_command(
+    path: Annotated[Path, typer.Argument(help="The HAR or JSONL trace file.", exists=True, dir_okay=False)],
+    top: Annotated[int, typer.Option("--top", help="Number of slowest requests to show.")] = 10,
+) -> None:
+    """Summarize a request trace by endpoint, with the slowest and the repeated requests.
+
+    Args:
+        path: The HAR or JSONL trace file.
+        top: Number of slowest requests to show.
+
+    """
+    import json  # noqa: PLC0415
+
+    from glnova.client.trace import load_trace, summarize_trace  # noqa: PLC0415
+
+    try:
+        entries = load_trace(path)
+    except (OSError, ValueError, KeyError) as e:
+        typer.echo(f"Error: cannot read trace {path}: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    print(json.dumps(summarize_trace(entries, top=top), indent=2, default=str))
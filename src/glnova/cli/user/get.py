@@ -44,11 +44,14 @@ def get_command(  # noqa: PLR0913
         base_url: Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.
 
     """
-    from typing import Any  # noqa: PLC0415
+    from glnova.cli.utils.profile import profile_phase  # noqa: PLC0415
 
-    from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
-    from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from glnova.client.gitlab import GitLab  # noqa: PLC0415
+    with profile_phase("imports"):
+        from typing import Any  # noqa: PLC0415
+
+        from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
+        from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+        from glnova.client.gitlab import GitLab  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
@@ -191,6 +191,44 @@ def list_command(  # noqa: PLR0913
             help="ETag for caching.",
         ),
     ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all-pages", help="Fetch every page from --page on instead of a single page."),
+    ] = False,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=1, help="Stop after this number of items, fetching as many pages as needed."),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            min=1,
+            help="Maximum number of pages fetched concurrently with --all-pages or --max-items, lowered while GitLab is overloaded.",
+        ),
+    ] = 1,
+    output_format: Annotated[
+        Literal["json", "ndjson", "csv"] | None,
+        typer.Option(
+            "--format",
+            help=(
+                "Output format: json prints one document with the data and the metadata, "
+                "ndjson and csv print one record per line as it is received and the metadata on stderr. "
+                "Defaults to json; cannot be used with --raw."
+            ),
+        ),
+    ] = None,
+    raw: Annotated[
+        bool,
+        typer.Option(
+            "--raw",
+            help="Write the response bodies as received, without decoding them, and the pagination headers on stderr.",
+        ),
+    ] = False,
+    output: Annotated[
+        str | None,
+        typer.Option("--output", help="File to write the response bodies of --raw to instead of stdout."),
+    ] = None,
     account_name: Annotated[
         str | None,
         typer.Option(
@@ -244,16 +282,30 @@ def list_command(  # noqa: PLR0913
         order_by: Attribute to order users by.
         sort: Sort order for users.
         etag: ETag for caching.
+        all_pages: Fetch every page from --page on instead of a single page.
+        max_items: Stop after this number of items, fetching as many pages as needed.
+        jobs: Number of pages fetched concurrently with --all-pages or --max-items.
+        output_format: Output format, one of json, ndjson and csv; json if not given.
+        raw: Write the response bodies as received, without decoding them, and the pagination headers on stderr.
+        output: File to write the response bodies of --raw to instead of stdout.
         account_name: Name of the account to use for authentication.
         token: Token for authentication. If not provided, the token from the specified account will be used.
         base_url: Base URL of the GitLab platform. If not provided, the base URL from the specified account will be used.
 
     """
-    from typing import Any  # noqa: PLC0415
+    from glnova.cli.utils.profile import profile_phase  # noqa: PLC0415
+
+    with profile_phase("imports"):
+        from typing import Any  # noqa: PLC0415
 
-    from glnova.cli.utils.api import execute_api_command  # noqa: PLC0415
-    from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
-    from glnova.client.gitlab import GitLab  # noqa: PLC0415
+        from glnova.cli.utils.api import (  # noqa: PLC0415
+            execute_api_command,
+            execute_paginated_command,
+            execute_raw_command,
+            validate_list_options,
+        )
+        from glnova.cli.utils.auth import get_auth_params  # noqa: PLC0415
+        from glnova.client.gitlab import GitLab  # noqa: PLC0415
 
     token, base_url = get_auth_params(
         config_path=ctx.obj["config_path"],
@@ -262,37 +314,77 @@ def list_command(  # noqa: PLR0913
         base_url=base_url,
     )
 
+    def list_page(client: Any, page_number: int, raw: bool = False, **kwargs: Any) -> Any:
+        list_users = client.user._list_users if raw else client.user.list_users
+        return list_users(
+            username=username,
+            public_email=public_email,
+            search=search,
+            active=active,
+            external=external,
+            blocked=blocked,
+            humans=humans,
+            created_after=created_after,
+            created_before=created_before,
+            exclude_active=exclude_active,
+            exclude_external=exclude_external,
+            exclude_humans=exclude_humans,
+            exclude_internal=exclude_internal,
+            without_project_bots=without_project_bots,
+            saml_provider_id=saml_provider_id,
+            extern_uid=extern_uid,
+            provider=provider,
+            two_factor=two_factor,
+            without_projects=without_projects,
+            admins=admins,
+            auditors=auditors,
+            skip_ldap=skip_ldap,
+            page=page_number,
+            per_page=per_page,
+            order_by=order_by,
+            sort=sort,
+            etag=etag,
+            **kwargs,
+        )
+
+    output_format = validate_list_options(
+        raw=raw,
+        output_format=output_format,
+        output=output,
+        all_pages=all_pages,
+        max_items=max_items,
+        jobs=jobs,
+        etag=etag,
+    )
+    if raw:
+        execute_raw_command(
+            lambda client, page_number: list_page(client, page_number, raw=True, stream=True),
+            token=token,
+            base_url=base_url,
+            command_name="glnova user list",
+            start_page=page,
+            all_pages=all_pages,
+            output_path=output,
+        )
+        return
+
+    if all_pages or max_items is not None:
+        execute_paginated_command(
+            list_page,
+            token=token,
+            base_url=base_url,
+            command_name="glnova user list",
+            output_format=output_format,
+            start_page=page,
+            per_page=per_page,
+            jobs=jobs,
+            max_items=max_items,
+        )
+        return
+
     def api_call() -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Implement the API call to list users."""
         with GitLab(base_url=base_url, token=token) as client:
-            return client.user.list_users(
-                username=username,
-                public_email=public_email,
-                search=search,
-                active=active,
-                external=external,
-                blocked=blocked,
-                humans=humans,
-                created_after=created_after,
-                created_before=created_before,
-                exclude_active=exclude_active,
-                exclude_external=exclude_external,
-                exclude_humans=exclude_humans,
-                exclude_internal=exclude_internal,
-                without_project_bots=without_project_bots,
-                saml_provider_id=saml_provider_id,
-                extern_uid=extern_uid,
-                provider=provider,
-                two_factor=two_factor,
-                without_projects=without_projects,
-                admins=admins,
-                auditors=auditors,
-                skip_ldap=skip_ldap,
-                page=page,
-                per_page=per_page,
-                order_by=order_by,
-                sort=sort,
-                etag=etag,
-            )
+            return list_page(client, page)
 
-    execute_api_command(api_call=api_call, command_name="glnova user list")
+    execute_api_command(api_call=api_call, command_name="glnova user list", output_format=output_format)
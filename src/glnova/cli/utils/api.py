@@ -4,29 +4,250 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Callable
+import os
+import sys
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import typer
 
+from glnova.cli.utils.output import OutputFormat, OutputWriter
+from glnova.cli.utils.profile import profile_phase
+
 logger = logging.getLogger("glnova")
 
+# Response headers reported on stderr by `execute_raw_command`.
+PAGINATION_HEADERS = ("X-Page", "X-Per-Page", "X-Prev-Page", "X-Next-Page", "X-Total", "X-Total-Pages", "Link")
+
+RAW_CHUNK_SIZE = 64 * 1024
+
+
+def validate_list_options(  # noqa: PLR0913
+    *,
+    raw: bool,
+    output_format: OutputFormat | None,
+    output: str | None,
+    all_pages: bool,
+    max_items: int | None,
+    jobs: int,
+    etag: str | None,
+    cursor: str | None = None,
+) -> OutputFormat:
+    """Check the combination of the output and pagination options of a list command.
+
+    Args:
+        raw: Whether the response bodies are written as is.
+        output_format: The output format, if given.
+        output: The file of the response bodies of --raw, if given.
+        all_pages: Whether every page is fetched.
+        max_items: The maximum number of items, if given.
+        jobs: The number of pages fetched concurrently.
+        etag: The ETag of a previous response, if given.
+        cursor: The keyset pagination cursor, if given.
+
+    Returns:
+        The output format, json by default.
+
+    Raises:
+        typer.Exit: If two of the options cannot be combined.
+
+    """
+    paginated = all_pages or max_items is not None
+    error = None
+    if raw and (max_items is not None or jobs > 1):
+        error = "--max-items and --jobs cannot be used with --raw."
+    elif raw and output_format is not None:
+        error = "--format cannot be used with --raw."
+    elif output is not None and not raw:
+        error = "--output can only be used with --raw."
+    elif paginated and etag is not None:
+        error = "--etag cannot be used with --all-pages or --max-items."
+    elif paginated and cursor is not None:
+        error = "--cursor cannot be used with --all-pages or --max-items."
+    if error is not None:
+        typer.echo(f"Error: {error}", err=True)
+        raise typer.Exit(code=1)
+    return output_format or "json"
+
 
 def execute_api_command(
     api_call: Callable[[], tuple[dict[str, Any] | list[dict[str, Any]], dict[str, Any]]],
     command_name: str = "Command",
+    output_format: OutputFormat = "json",
 ) -> None:
     """Execute an API command and output results.
 
+    Lists are written record by record, see `OutputWriter`, single objects are printed at once.
+    If the consumer of stdout closes it early, e.g. ``head``, the output stops without an error.
+
     Args:
         api_call: Callable that executes the API call and returns the result.
         command_name: Name of the command for error messages.
+        output_format: The output format.
 
     """
     try:
-        response_data, metadata = api_call()
+        with profile_phase("api"):
+            response_data, metadata = api_call()
 
-        print(json.dumps({"data": response_data, "metadata": metadata}, indent=2, default=str))
+        with profile_phase("output"):
+            single = not isinstance(response_data, list)
+            if single and output_format == "json":
+                print(json.dumps({"data": response_data, "metadata": metadata}, indent=2, default=str))
+                return
+            writer = OutputWriter(output_format=output_format, single=single)
+            writer.write([response_data] if single else response_data)
+            writer.close(metadata)
+    except BrokenPipeError:
+        silence_stdout()
     except Exception as e:
-        logger.exception("Error executing %s: %s", command_name, e)
+        logger.exception("Error executing %s", command_name)
         raise typer.Exit(1) from e
+
+
+def execute_paginated_command(  # noqa: PLR0913
+    list_page: Callable[[Any, int], Awaitable[tuple[Any, dict[str, Any]]]],
+    token: str | None,
+    base_url: str,
+    command_name: str = "Command",
+    output_format: OutputFormat = "json",
+    start_page: int = 1,
+    per_page: int = 20,
+    jobs: int = 1,
+    max_items: int | None = None,
+) -> None:
+    """Execute a list command over all its pages with the asynchronous client and output the records.
+
+    The records of every page are written as soon as the page and the pages before it have arrived,
+    while an items-per-second indicator is shown on stderr. The metadata holds the status code of
+    the last page, the number of pages and the number of records.
+
+    The pages are fetched through an `AIMDController` bounded by ``jobs``, so that the concurrency
+    drops, and the overloaded pages are requested again, when GitLab answers with 429 or 5xx errors.
+
+    Args:
+        list_page: Function sending the list request of a page number with an `AsyncGitLab` client.
+        token: The API token.
+        base_url: The base URL of the GitLab instance.
+        command_name: Name of the command for error messages.
+        output_format: The output format.
+        start_page: The first page.
+        per_page: The page size.
+        jobs: Maximum number of pages fetched concurrently.
+        max_items: Stop after this number of records.
+
+    """
+    import asyncio  # noqa: PLC0415
+
+    from glnova.cli.utils.pagination import Progress, fetch_pages  # noqa: PLC0415
+    from glnova.client.adaptive import AIMDController  # noqa: PLC0415
+    from glnova.client.async_gitlab import AsyncGitLab  # noqa: PLC0415
+
+    writer = OutputWriter(output_format=output_format)
+    progress = Progress()
+
+    def on_page(records: list[dict[str, Any]]) -> None:
+        writer.write(records)
+        progress.update(len(records))
+
+    async def run() -> dict[str, Any]:
+        async with AsyncGitLab(token=token, base_url=base_url) as client:
+            return await fetch_pages(
+                list_page,
+                client,
+                on_page=on_page,
+                start_page=start_page,
+                per_page=per_page,
+                jobs=jobs,
+                max_items=max_items,
+                controller=AIMDController(initial_limit=jobs, max_limit=jobs),
+            )
+
+    try:
+        with profile_phase("api"):
+            metadata = asyncio.run(run())
+        progress.finish()
+        with profile_phase("output"):
+            writer.close(metadata)
+    except BrokenPipeError:
+        silence_stdout()
+    except Exception as e:
+        logger.exception("Error executing %s", command_name)
+        raise typer.Exit(1) from e
+
+
+def execute_raw_command(  # noqa: PLR0913
+    request_page: Callable[[Any, int], Any],
+    token: str | None,
+    base_url: str,
+    command_name: str = "Command",
+    start_page: int = 1,
+    all_pages: bool = False,
+    output_path: str | None = None,
+) -> None:
+    """Execute a list command and write the response bodies as they are received, without decoding them.
+
+    Every body is followed by a newline, so that the pages of ``all_pages`` are one JSON document per line.
+    The status code, the ETag and the pagination headers of every page are written to stderr as a JSON line.
+
+    Args:
+        request_page: Function sending the list request of a page number with a `GitLab` client and
+            returning the `requests.Response`, sent with ``stream=True``.
+        token: The API token.
+        base_url: The base URL of the GitLab instance.
+        command_name: Name of the command for error messages.
+        start_page: The first page.
+        all_pages: Whether to follow the ``X-Next-Page`` header to the last page.
+        output_path: File to write the bodies to, stdout by default.
+
+    """
+    from contextlib import closing, nullcontext  # noqa: PLC0415
+
+    from glnova.client.gitlab import GitLab  # noqa: PLC0415
+
+    try:
+        with (
+            profile_phase("api"),
+            GitLab(token=token, base_url=base_url) as client,
+            open(output_path, "wb") if output_path else nullcontext(sys.stdout.buffer) as stream,
+        ):
+            page: int | None = start_page
+            while page is not None:
+                with closing(request_page(client, page)) as response:
+                    metadata = {
+                        "status_code": response.status_code,
+                        "etag": response.headers.get("Etag"),
+                        "headers": {
+                            name: response.headers[name] for name in PAGINATION_HEADERS if name in response.headers
+                        },
+                    }
+                    sys.stderr.write(json.dumps({"metadata": metadata}) + "\n")
+                    size = 0
+                    for chunk in response.iter_content(chunk_size=RAW_CHUNK_SIZE):
+                        stream.write(chunk)
+                        size += len(chunk)
+                    if size:
+                        stream.write(b"\n")
+                    stream.flush()
+                next_page = response.headers.get("X-Next-Page")
+                page = int(next_page) if all_pages and next_page else None
+    except BrokenPipeError:
+        silence_stdout()
+    except Exception as e:
+        logger.exception("Error executing %s", command_name)
+        raise typer.Exit(1) from e
+
+
+def silence_stdout() -> None:
+    """Point stdout to the null device after its consumer closed it.
+
+    The interpreter would otherwise fail again when it flushes stdout at exit. Streams without
+    a file descriptor, such as the output of a command run by ``glnova daemon``, are left as is.
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, fd)
+    os.close(devnull)
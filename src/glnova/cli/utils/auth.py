@@ -4,12 +4,49 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from glnova.config.manager import ConfigManager
+from glnova.cli.utils.profile import profile_phase
+
+if TYPE_CHECKING:
+    from glnova.config.manager import ConfigManager
 
 logger = logging.getLogger("glnova")
 
+# Configurations loaded by earlier commands of the process, by path, with the modification time and size of the file.
+_loaded_configs: dict[Path, tuple[tuple[int, int], ConfigManager]] = {}
+
+
+def load_config_manager(config_path: Path | str | None) -> ConfigManager:
+    """Load the configuration file, reusing the configuration loaded by an earlier command while the file is unchanged.
+
+    A long-running process such as ``glnova daemon`` then parses the file again only after it changes.
+
+    Args:
+        config_path: Path to the configuration file, the default location if None.
+
+    Returns:
+        The configuration manager with the configuration loaded.
 
+    """
+    from glnova.config.manager import ConfigManager  # noqa: PLC0415
+
+    config_manager = ConfigManager(filename=config_path)
+    try:
+        stat = config_manager.config_path.stat()
+    except OSError:
+        config_manager.load_config()
+        return config_manager
+    version = (stat.st_mtime_ns, stat.st_size)
+    loaded = _loaded_configs.get(config_manager.config_path)
+    if loaded is not None and loaded[0] == version:
+        return loaded[1]
+    config_manager.load_config()
+    _loaded_configs[config_manager.config_path] = (version, config_manager)
+    return config_manager
+
+
+@profile_phase("config")
 def get_auth_params(
     config_path: Path | str,
     account_name: str | None,
@@ -35,15 +72,13 @@ def get_auth_params(
                 account_name,
             )
 
-        config_manager = ConfigManager(filename=config_path)
-        config_manager.load_config()
+        config_manager = load_config_manager(config_path)
         account_config = config_manager.get_config(name=account_name)
         token = account_config.token
         base_url = account_config.base_url
         return token, base_url
     if token is None and base_url is None:
-        config_manager = ConfigManager(filename=config_path)
-        config_manager.load_config()
+        config_manager = load_config_manager(config_path)
 
         if config_manager.has_default_account():
             account_config = config_manager.get_config(name=None)
@@ -0,0 +1,159 @@
+"""Streaming output of the records printed by CLI commands."""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from collections.abc import Iterable
+from typing import Any, Literal, TextIO
+
+OutputFormat = Literal["json", "ndjson", "csv"]
+
+
+def _indent(text: str, prefix: str) -> str:
+    """Indent every line of a text but the first.
+
+    Args:
+        text: The text.
+        prefix: The indentation.
+
+    Returns:
+        The indented text.
+
+    """
+    return text.replace("\n", "\n" + prefix)
+
+
+def _csv_value(value: Any) -> str:
+    """Convert a field of a record to a CSV cell.
+
+    Args:
+        value: The field.
+
+    Returns:
+        The string itself, an empty cell for None and compact JSON for everything else.
+
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+class OutputWriter:
+    """Writer of the result of a command, one record at a time.
+
+    Records are written and flushed as they are handed over, so the output can be piped into
+    a consumer such as ``jq`` or ``head`` without the command holding it all. A slow consumer
+    slows the command down through the blocking writes to stdout.
+
+    The ``json`` format prints the same document as ``json.dumps({"data": ..., "metadata": ...}, indent=2)``,
+    with the metadata as a trailer. The line formats print the metadata on stderr.
+
+    The ``csv`` header is written before the later records are seen, so its columns are the fields of
+    the first record. Fields of later records missing from it are dropped, with a warning on stderr.
+    """
+
+    def __init__(
+        self,
+        output_format: OutputFormat = "json",
+        single: bool = False,
+        stream: TextIO | None = None,
+        err_stream: TextIO | None = None,
+    ) -> None:
+        """Initialize the OutputWriter.
+
+        Args:
+            output_format: The output format.
+            single: Whether the data is a single object rather than a list of records.
+            stream: The output stream, stdout by default.
+            err_stream: The stream of the metadata of the line formats, stderr by default.
+
+        """
+        self.output_format = output_format
+        self.single = single
+        self.stream = stream or sys.stdout
+        self.err_stream = err_stream or sys.stderr
+        self.count = 0
+        self._csv_writer: csv.DictWriter | None = None
+        self._dropped_fields: set[str] = set()
+
+    def __str__(self) -> str:
+        """Return a string representation of the writer.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<OutputWriter format={self.output_format} count={self.count}>"
+
+    def write(self, records: Iterable[dict[str, Any]]) -> None:
+        """Write records and flush them.
+
+        Args:
+            records: The records.
+
+        """
+        for record in records:
+            self._write_record(record)
+            self.count += 1
+        self.stream.flush()
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        """Write one record.
+
+        Args:
+            record: The record.
+
+        """
+        if self.output_format == "ndjson":
+            self.stream.write(json.dumps(record, default=str) + "\n")
+        elif self.output_format == "csv":
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(
+                    self.stream, fieldnames=list(record), extrasaction="ignore", lineterminator="\n"
+                )
+                self._csv_writer.writeheader()
+            self._warn_dropped_fields(record)
+            self._csv_writer.writerow({key: _csv_value(value) for key, value in record.items()})
+        elif self.single:
+            self.stream.write('{\n  "data": ' + _indent(json.dumps(record, indent=2, default=str), "  "))
+        else:
+            opening = '{\n  "data": [\n    ' if self.count == 0 else ",\n    "
+            self.stream.write(opening + _indent(json.dumps(record, indent=2, default=str), "    "))
+
+    def _warn_dropped_fields(self, record: dict[str, Any]) -> None:
+        """Warn on stderr, once per field, about fields of a record missing from the CSV header.
+
+        Args:
+            record: The record.
+
+        """
+        if self._csv_writer is None:
+            return
+        dropped = [key for key in record if key not in self._csv_writer.fieldnames and key not in self._dropped_fields]
+        if not dropped:
+            return
+        self._dropped_fields.update(dropped)
+        self.err_stream.write(f"Warning: CSV columns missing from the header were dropped: {', '.join(dropped)}\n")
+        self.err_stream.flush()
+
+    def close(self, metadata: dict[str, Any]) -> None:
+        """Finish the output with the metadata.
+
+        Args:
+            metadata: The metadata of the command.
+
+        """
+        if self.output_format != "json":
+            self.err_stream.write(json.dumps({"metadata": metadata}, default=str) + "\n")
+            self.err_stream.flush()
+            return
+        closing = "\n  ],\n" if self.count else '{\n  "data": [],\n'
+        if self.single:
+            closing = ",\n"
+        metadata_text = _indent(json.dumps(metadata, indent=2, default=str), "  ")
+        self.stream.write(f'{closing}  "metadata": {metadata_text}\n}}\n')
+        self.stream.flush()
@@ -0,0 +1,175 @@
+"""Fetching every page of a list command, several pages at a time."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TextIO
+
+from glnova.client.base import MAX_PER_PAGE
+
+if TYPE_CHECKING:
+    from glnova.client.adaptive import AIMDController
+
+
+class Progress:
+    """Progress indicator of a paginated command, in items per second.
+
+    The indicator is rewritten in place on stderr and is only shown when stderr is a terminal,
+    so that it does not end up in redirected output.
+    """
+
+    def __init__(self, stream: TextIO | None = None, enabled: bool | None = None, interval: float = 0.2) -> None:
+        """Initialize the Progress.
+
+        Args:
+            stream: The stream of the indicator, stderr by default.
+            enabled: Whether to show the indicator. Defaults to whether the stream is a terminal.
+            interval: Minimum number of seconds between two updates of the indicator.
+
+        """
+        self.stream = stream or sys.stderr
+        self.enabled = self.stream.isatty() if enabled is None else enabled
+        self.interval = interval
+        self.items = 0
+        self.pages = 0
+        self.start = time.perf_counter()
+        self._last_render = float("-inf")
+
+    def __str__(self) -> str:
+        """Return a string representation of the progress.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<Progress items={self.items} pages={self.pages}>"
+
+    @property
+    def rate(self) -> float:
+        """Items received per second since the start."""
+        elapsed = time.perf_counter() - self.start
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+    def update(self, items: int) -> None:
+        """Count a page.
+
+        Args:
+            items: The number of items of the page.
+
+        """
+        self.items += items
+        self.pages += 1
+        now = time.perf_counter()
+        if self.enabled and now - self._last_render >= self.interval:
+            self._last_render = now
+            self._render()
+
+    def finish(self) -> None:
+        """Show the final count and end the line of the indicator."""
+        if self.enabled:
+            self._render(end="\n")
+
+    def _render(self, end: str = "") -> None:
+        """Write the indicator.
+
+        Args:
+            end: The string written after the indicator.
+
+        """
+        self.stream.write(f"\r{self.items} items, {self.pages} pages, {self.rate:.1f} items/s{end}")
+        self.stream.flush()
+
+
+async def fetch_pages(  # noqa: PLR0913
+    list_page: Callable[[Any, int], Awaitable[tuple[Any, dict[str, Any]]]],
+    client: Any,
+    on_page: Callable[[list[dict[str, Any]]], None],
+    start_page: int = 1,
+    per_page: int = 20,
+    jobs: int = 1,
+    max_items: int | None = None,
+    controller: AIMDController | None = None,
+    max_retries: int = 3,
+    backoff: float = 0.5,
+) -> dict[str, Any]:
+    """Fetch the pages of a listing, up to ``jobs`` pages at a time, and hand them over in order.
+
+    GitLab does not return the number of pages of every listing, so the pages after the ones in
+    flight are requested as the earlier ones arrive, and the listing ends with the first page
+    shorter than the page size. Up to ``jobs - 1`` requests past the end are cancelled or discarded.
+
+    With a controller, its limit replaces ``jobs``. A page failing with an overload error (429, 5xx,
+    connection error or timeout) lowers the limit and is requested again, while no further pages are
+    requested until fewer pages than the lowered limit are in flight.
+
+    Args:
+        list_page: Function sending the list request of a page number with a client.
+        client: The asynchronous client.
+        on_page: Function receiving the records of every page, in page order.
+        start_page: The first page.
+        per_page: The page size.
+        jobs: Maximum number of pages fetched concurrently.
+        max_items: Stop after this number of records.
+        controller: Optional adaptive controller setting the number of pages fetched concurrently.
+        max_retries: Maximum number of retries of a page failing with overload errors, with a controller.
+        backoff: Seconds to wait before the first retry of a page, doubled on every further retry.
+
+    Returns:
+        The status code of the last page, the number of pages and the number of records.
+
+    """
+    page_size = min(per_page, MAX_PER_PAGE)
+    pending: deque[asyncio.Future[tuple[Any, dict[str, Any]]]] = deque()
+    next_page = start_page
+    items = 0
+    pages = 0
+    status_code = None
+
+    async def fetch(page_number: int) -> tuple[Any, dict[str, Any]]:
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                result = await list_page(client, page_number)
+            except Exception as e:
+                if controller is None or not controller.record_error(e) or attempt >= max_retries:
+                    raise
+                attempt += 1
+                await asyncio.sleep(backoff * 2 ** (attempt - 1))
+                continue
+            if controller is not None:
+                controller.record_success(time.perf_counter() - start)
+            return result
+
+    def schedule() -> None:
+        nonlocal next_page
+        limit = jobs if controller is None else controller.limit
+        while len(pending) < limit:
+            if max_items is not None and (next_page - start_page) * page_size >= max_items:
+                return
+            pending.append(asyncio.ensure_future(fetch(next_page)))
+            next_page += 1
+
+    try:
+        schedule()
+        while pending:
+            data, metadata = await pending.popleft()
+            status_code = metadata["status_code"]
+            if not isinstance(data, list) or not data:
+                break
+            records = data if max_items is None else data[: max_items - items]
+            on_page(records)
+            items += len(records)
+            pages += 1
+            if len(data) < page_size or (max_items is not None and items >= max_items):
+                break
+            schedule()
+    finally:
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return {"status_code": status_code, "pages": pages, "items": items}
@@ -0,0 +1,175 @@
+"""Timing breakdown of a CLI invocation for the ``--profile`` option."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+
+    from glnova.client.events import RequestEvent
+
+_active: Profiler | None = None
+
+
+class Profiler:
+    """Accumulate the time spent in the phases of a command and the requests it sends."""
+
+    def __init__(self, start: float, profile_out: str | None = None) -> None:
+        """Initialize the Profiler.
+
+        Args:
+            start: `time.perf_counter` value at which the CLI started loading.
+            profile_out: Path to write cProfile statistics to, if any.
+
+        """
+        self.start = start
+        self.profile_out = profile_out
+        self.phases: dict[str, float] = {}
+        self.events: list[RequestEvent] = []
+        self._cprofile: cProfile.Profile | None = None
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        """Add time to a phase.
+
+        Args:
+            name: The phase.
+            seconds: The duration in seconds.
+
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def record_event(self, event: RequestEvent) -> None:
+        """Record a request; used as a default event hook of the clients.
+
+        Args:
+            event: The request event.
+
+        """
+        self.events.append(event)
+
+    def enable(self) -> None:
+        """Start collecting request events and, if requested, cProfile statistics."""
+        from glnova.client.events import add_default_event_hook  # noqa: PLC0415
+
+        add_default_event_hook(self.record_event)
+        if self.profile_out is not None:
+            import cProfile  # noqa: PLC0415
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def disable(self) -> None:
+        """Stop collecting and write the cProfile statistics, if requested."""
+        from glnova.client.events import remove_default_event_hook  # noqa: PLC0415
+
+        remove_default_event_hook(self.record_event)
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.profile_out)
+            self._cprofile = None
+
+    def render(self, end: float) -> str:
+        """Render the phase table and the request timings.
+
+        Network time is the sum of the request durations; it is taken out of the ``api``
+        phase, whose remainder is the decoding and processing of the responses.
+
+        Args:
+            end: `time.perf_counter` value at which the command finished.
+
+        Returns:
+            The report.
+
+        """
+        total = end - self.start
+        network = sum(event.timings.get("total", 0.0) for event in self.events)
+        rows = []
+        for name, seconds in self.phases.items():
+            if name == "api":
+                rows.append((f"network ({len(self.events)} requests)", network))
+                rows.append(("api (decode/process)", max(seconds - network, 0.0)))
+            else:
+                rows.append((name, seconds))
+        rows.append(("other", max(total - sum(self.phases.values()), 0.0)))
+
+        width = max(len("total"), *(len(name) for name, _ in rows))
+        lines = [f"{'Phase':<{width}}  {'Time (ms)':>10}  {'Share':>6}"]
+        lines.extend(
+            f"{name:<{width}}  {seconds * 1000:>10.1f}  {seconds / total if total else 0.0:>6.1%}"
+            for name, seconds in rows
+        )
+        lines.append(f"{'total':<{width}}  {total * 1000:>10.1f}  {1:>6.1%}")
+        if self.events:
+            lines.extend(["", "Requests:"])
+            for event in self.events:
+                phases = ", ".join(
+                    f"{phase} {event.timings[phase] * 1000:.1f}"
+                    for phase in ("queue", "dns", "connect", "tls", "ttfb", "body")
+                    if phase in event.timings
+                )
+                size = "-" if event.bytes is None else f"{event.bytes} B"
+                lines.append(
+                    f"  {event.method} {event.endpoint_template} {event.status or event.error} "
+                    + f"{event.timings.get('total', 0.0) * 1000:.1f} ms ({phases}) {size}"
+                )
+        return "\n".join(lines)
+
+
+def start_profiling(start: float, profile_out: str | None = None) -> Profiler:
+    """Start profiling the current CLI invocation.
+
+    Args:
+        start: `time.perf_counter` value at which the CLI started loading.
+        profile_out: Path to write cProfile statistics to, if any.
+
+    Returns:
+        The active profiler.
+
+    """
+    global _active  # noqa: PLW0603
+    if _active is not None:
+        _active.disable()
+    _active = Profiler(start=start, profile_out=profile_out)
+    _active.enable()
+    return _active
+
+
+def stop_profiling() -> Profiler | None:
+    """Stop the active profiler.
+
+    Returns:
+        The profiler that was active, if any.
+
+    """
+    global _active  # noqa: PLW0603
+    profiler = _active
+    _active = None
+    if profiler is not None:
+        profiler.disable()
+    return profiler
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """Time a phase of the command if profiling is active.
+
+    Args:
+        name: The phase, e.g. "config".
+
+    Yields:
+        None.
+
+    """
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record_phase(name, time.perf_counter() - start)
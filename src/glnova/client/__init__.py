@@ -2,7 +2,93 @@
 
 from __future__ import annotations
 
-from glnova.client.async_gitlab import AsyncGitLab
-from glnova.client.gitlab import GitLab
+from typing import TYPE_CHECKING
 
-__all__ = ["AsyncGitLab", "GitLab"]
+from glnova.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from glnova.client.accounting import RequestAccountant
+    from glnova.client.adaptive import AIMDController
+    from glnova.client.async_gitlab import AsyncGitLab
+    from glnova.client.cassette import AsyncCassetteTransport, Cassette, CassetteTransport
+    from glnova.client.circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breaker
+    from glnova.client.deadline import Deadline
+    from glnova.client.events import EventHook, RequestEvent, add_default_event_hook, remove_default_event_hook
+    from glnova.client.gitlab import GitLab
+    from glnova.client.hedging import HedgePolicy
+    from glnova.client.limiter import ConcurrencyLimiter, Priority
+    from glnova.client.metrics import RequestMetrics
+    from glnova.client.middleware import (
+        AsyncMiddleware,
+        Middleware,
+        Request,
+        default_async_middlewares,
+        default_middlewares,
+    )
+    from glnova.client.trace import TraceRecorder
+    from glnova.client.transport import AsyncTransport, Transport, Urllib3Transport
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RequestAccountant": "glnova.client.accounting",
+        "AIMDController": "glnova.client.adaptive",
+        "AsyncGitLab": "glnova.client.async_gitlab",
+        "AsyncCassetteTransport": "glnova.client.cassette",
+        "Cassette": "glnova.client.cassette",
+        "CassetteTransport": "glnova.client.cassette",
+        "CircuitBreaker": "glnova.client.circuit_breaker",
+        "CircuitState": "glnova.client.circuit_breaker",
+        "get_circuit_breaker": "glnova.client.circuit_breaker",
+        "Deadline": "glnova.client.deadline",
+        "EventHook": "glnova.client.events",
+        "RequestEvent": "glnova.client.events",
+        "add_default_event_hook": "glnova.client.events",
+        "remove_default_event_hook": "glnova.client.events",
+        "GitLab": "glnova.client.gitlab",
+        "HedgePolicy": "glnova.client.hedging",
+        "ConcurrencyLimiter": "glnova.client.limiter",
+        "Priority": "glnova.client.limiter",
+        "RequestMetrics": "glnova.client.metrics",
+        "AsyncMiddleware": "glnova.client.middleware",
+        "Middleware": "glnova.client.middleware",
+        "Request": "glnova.client.middleware",
+        "default_async_middlewares": "glnova.client.middleware",
+        "default_middlewares": "glnova.client.middleware",
+        "TraceRecorder": "glnova.client.trace",
+        "AsyncTransport": "glnova.client.transport",
+        "Transport": "glnova.client.transport",
+        "Urllib3Transport": "glnova.client.transport",
+    },
+)
+
+__all__ = [
+    "AIMDController",
+    "AsyncCassetteTransport",
+    "AsyncGitLab",
+    "AsyncMiddleware",
+    "AsyncTransport",
+    "Cassette",
+    "CassetteTransport",
+    "CircuitBreaker",
+    "CircuitState",
+    "ConcurrencyLimiter",
+    "Deadline",
+    "EventHook",
+    "GitLab",
+    "HedgePolicy",
+    "Middleware",
+    "Priority",
+    "Request",
+    "RequestAccountant",
+    "RequestEvent",
+    "RequestMetrics",
+    "TraceRecorder",
+    "Transport",
+    "Urllib3Transport",
+    "add_default_event_hook",
+    "default_async_middlewares",
+    "default_middlewares",
+    "get_circuit_breaker",
+    "remove_default_event_hook",
+]
@@ -0,0 +1,299 @@
+"""Per-operation request accounting and detection of N+1 request patterns."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from glnova.client.events import add_default_event_hook, remove_default_event_hook
+from glnova.utils.exception import RequestBudgetExceededError
+
+if TYPE_CHECKING:
+    from glnova.client.base import Client
+    from glnova.client.events import RequestEvent
+
+logger = logging.getLogger("glnova")
+
+DEFAULT_OPERATION = "default"
+
+_SUGGESTIONS: dict[tuple[str, str], str] = {
+    ("GET", "/users/:id"): (
+        "list the users once with `user.list_users` and look them up by ID, "
+        "or resolve usernames with `user.resolve_user_ids`, which is backed by the user ID cache"
+    ),
+    ("GET", "/projects/:id"): (
+        "list the projects once with `project.list_projects`, "
+        "or resolve paths with `project.resolve_project_ids`, which is backed by the path ID cache"
+    ),
+    ("GET", "/projects/:id/issues/:id"): "fetch the issues in one request with `issue.list_issues(iids=[...])`",
+    ("GET", "/projects/:id/merge_requests/:id"): (
+        "fetch the merge requests in one request with `merge_request.list_merge_requests(iids=[...])`"
+    ),
+}
+
+_DEFAULT_SUGGESTION = "fetch the resources with one list request and a filter, or cache the responses"
+
+_operation: ContextVar[str | None] = ContextVar("glnova_operation", default=None)
+
+
+def get_suggestion(method: str, endpoint_template: str) -> str:
+    """Get the batch API or cache that removes repeated requests to an endpoint.
+
+    Args:
+        method: The HTTP method.
+        endpoint_template: The endpoint template, e.g. ``/users/:id``.
+
+    Returns:
+        The suggestion.
+
+    """
+    return _SUGGESTIONS.get((method.upper(), endpoint_template), _DEFAULT_SUGGESTION)
+
+
+class RequestAccountant:
+    """Event hook counting the requests of each operation by endpoint template.
+
+    Requests are attributed to the innermost `operation` block around them. When one
+    operation sends ``threshold`` or more requests to the same endpoint template that
+    differ only by ID, e.g. ``get_user`` called in a loop, a warning suggests the batch
+    API or cache that would remove them. ``report`` returns the counts for assertions,
+    and ``assert_budget`` fails when an operation sends more requests than allowed.
+
+    Example:
+        >>> with RequestAccountant(client) as accountant:
+        ...     with accountant.operation("review"):
+        ...         for merge_request in client.merge_request.list_merge_requests()[0]:
+        ...             client.user.get_user(account_id=merge_request["author"]["id"])
+        >>> accountant.assert_budget(10, operation="review")
+
+    """
+
+    def __init__(self, *clients: Client, threshold: int = 5, warn: bool = True) -> None:
+        """Initialize the RequestAccountant.
+
+        Args:
+            *clients: `GitLab` or `AsyncGitLab` clients to account for. If none are given,
+                every client created while the accountant is active is accounted for.
+            threshold: Number of requests to one endpoint template differing only by ID
+                from which an operation is reported as an N+1 pattern.
+            warn: Whether to log a warning for each N+1 pattern as it is detected.
+
+        Raises:
+            ValueError: If the threshold is lower than 2.
+
+        """
+        if threshold < 2:  # noqa: PLR2004
+            raise ValueError("threshold must be at least 2.")
+        self.clients = list(clients)
+        self.threshold = threshold
+        self.warn = warn
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[tuple[str, str], int]] = defaultdict(lambda: defaultdict(int))
+        self._endpoints: dict[tuple[str, str, str], set[str]] = defaultdict(set)
+        self._warned: set[tuple[str, str, str]] = set()
+        self._open: list[str] = []
+        self._active = False
+
+    def __str__(self) -> str:
+        """Return a string representation of the accountant.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<RequestAccountant requests={self.count()} threshold={self.threshold}>"
+
+    def __enter__(self) -> RequestAccountant:
+        """Start accounting.
+
+        Returns:
+            The accountant.
+
+        """
+        if self.clients:
+            for client in self.clients:
+                client.add_event_hook(self)
+        else:
+            add_default_event_hook(self)
+        self._active = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop accounting.
+
+        Args:
+            exc_type: The exception type.
+            exc_val: The exception value.
+            exc_tb: The traceback.
+
+        """
+        self._active = False
+        if self.clients:
+            for client in self.clients:
+                if self in client.event_hooks:
+                    client.remove_event_hook(self)
+        else:
+            remove_default_event_hook(self)
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Account for a request event.
+
+        Args:
+            event: The event.
+
+        """
+        if not self._active:
+            return
+        operation = self.current_operation()
+        key = (event.method.upper(), event.endpoint_template)
+        warn_count = 0
+        with self._lock:
+            self._counts[operation][key] += 1
+            if ":id" in event.endpoint_template:
+                endpoints = self._endpoints[(operation, *key)]
+                endpoints.add(event.endpoint)
+                if len(endpoints) >= self.threshold and (operation, *key) not in self._warned:
+                    self._warned.add((operation, *key))
+                    warn_count = len(endpoints)
+        if warn_count and self.warn:
+            logger.warning(
+                "Operation '%s' sent %d requests to %s %s that differ only by ID; %s.",
+                operation,
+                warn_count,
+                key[0],
+                key[1],
+                get_suggestion(*key),
+            )
+
+    def current_operation(self) -> str:
+        """Get the operation new requests are attributed to.
+
+        Returns:
+            The name of the innermost operation of the current context. Requests sent from
+            threads that do not inherit it, e.g. the workers of a thread pool, fall back to
+            the most recently opened operation.
+
+        """
+        operation = _operation.get()
+        if operation is not None:
+            return operation
+        with self._lock:
+            return self._open[-1] if self._open else DEFAULT_OPERATION
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[None]:
+        """Attribute the requests sent inside the block to an operation.
+
+        Args:
+            name: The name of the operation, e.g. ``sync-reviewers``.
+
+        Yields:
+            None.
+
+        """
+        token = _operation.set(name)
+        with self._lock:
+            self._open.append(name)
+        try:
+            yield
+        finally:
+            _operation.reset(token)
+            with self._lock:
+                self._open.remove(name)
+
+    def count(self, operation: str | None = None, endpoint: str | None = None, method: str | None = None) -> int:
+        """Count the requests accounted for.
+
+        Args:
+            operation: Only count the requests of this operation.
+            endpoint: Only count the requests to this endpoint template, e.g. ``/users/:id``.
+            method: Only count the requests with this HTTP method.
+
+        Returns:
+            The number of requests.
+
+        """
+        with self._lock:
+            return sum(
+                count
+                for name, counts in self._counts.items()
+                if operation is None or name == operation
+                for (request_method, template), count in counts.items()
+                if (endpoint is None or template == endpoint) and (method is None or request_method == method.upper())
+            )
+
+    def findings(self) -> list[dict[str, Any]]:
+        """Get the N+1 patterns detected so far.
+
+        Returns:
+            One dictionary per operation and endpoint template with ``threshold`` or more
+            requests differing only by ID, with the number of requests, the number of
+            distinct IDs and a suggestion, sorted by the number of requests.
+
+        """
+        with self._lock:
+            findings = [
+                {
+                    "operation": operation,
+                    "method": method,
+                    "endpoint": template,
+                    "count": self._counts[operation][(method, template)],
+                    "distinct": len(endpoints),
+                    "suggestion": get_suggestion(method, template),
+                }
+                for (operation, method, template), endpoints in self._endpoints.items()
+                if len(endpoints) >= self.threshold
+            ]
+        return sorted(findings, key=lambda finding: finding["count"], reverse=True)
+
+    def report(self) -> dict[str, Any]:
+        """Get the structured report of the requests accounted for.
+
+        Returns:
+            A dictionary with the total number of requests, the number of requests of each
+            operation by ``"METHOD /endpoint/template"``, and the N+1 findings.
+
+        """
+        with self._lock:
+            operations = {
+                operation: {
+                    "requests": sum(counts.values()),
+                    "endpoints": {
+                        f"{method} {template}": count
+                        for (method, template), count in sorted(counts.items(), key=lambda item: -item[1])
+                    },
+                }
+                for operation, counts in self._counts.items()
+            }
+        return {
+            "requests": sum(operation["requests"] for operation in operations.values()),
+            "operations": operations,
+            "findings": self.findings(),
+        }
+
+    def assert_budget(
+        self, max_requests: int, operation: str | None = None, endpoint: str | None = None, method: str | None = None
+    ) -> None:
+        """Fail if more requests were sent than allowed.
+
+        Args:
+            max_requests: The maximum number of requests.
+            operation: Only count the requests of this operation.
+            endpoint: Only count the requests to this endpoint template, e.g. ``/users/:id``.
+            method: Only count the requests with this HTTP method.
+
+        Raises:
+            RequestBudgetExceededError: If the budget is exceeded.
+
+        """
+        count = self.count(operation=operation, endpoint=endpoint, method=method)
+        if count > max_requests:
+            scope = " ".join(part for part in (method and method.upper(), endpoint) if part) or "all endpoints"
+            if operation is not None:
+                scope = f"{scope} in operation '{operation}'"
+            raise RequestBudgetExceededError(scope=scope, count=count, budget=max_requests)
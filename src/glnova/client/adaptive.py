@@ -0,0 +1,369 @@
+"""Adaptive (AIMD) concurrency control for fan-out operations."""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from glnova.utils.exception import DeadlineExceededError
+from glnova.utils.response import get_error_status
+
+logger = logging.getLogger("glnova")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    """Check whether an error was raised by a request failing without a response.
+
+    Args:
+        error: The exception raised by a request.
+
+    Returns:
+        True for connection errors and timeouts of `requests`, `aiohttp` and the standard library.
+
+    """
+    if isinstance(error, OSError):
+        # Includes the exceptions of requests, TimeoutError and aiohttp.ClientOSError.
+        return True
+    # aiohttp is only loaded by the asynchronous client, whose connection errors are not all OSErrors.
+    aiohttp = sys.modules.get("aiohttp")
+    return aiohttp is not None and isinstance(error, aiohttp.ClientConnectionError)
+
+
+class AIMDController:
+    """Additive-increase/multiplicative-decrease controller of a concurrency limit.
+
+    Every healthy response grows the limit by ``increase / limit``, i.e. by about
+    ``increase`` per round of ``limit`` requests. A 429, a 5xx, a connection error or
+    a latency above ``latency_tolerance`` times the smoothed latency multiplies the
+    limit by ``decrease_factor``. Decreases are at most once per ``cooldown`` so that
+    a burst of errors from the same round only backs off once.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+    ) -> None:
+        """Initialize the AIMDController.
+
+        Args:
+            initial_limit: Concurrency limit to start with.
+            min_limit: Lower bound of the limit.
+            max_limit: Upper bound of the limit.
+            increase: Growth of the limit per round of healthy responses.
+            decrease_factor: Factor, between 0 and 1, applied to the limit on backoff.
+            latency_tolerance: Ratio to the smoothed latency above which a response counts as a latency spike.
+            cooldown: Minimum number of seconds between two decreases.
+
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1).")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._limit = float(initial_limit)
+        self._latency: float | None = None
+        self._last_decrease = float("-inf")
+        self._increases = 0
+        self._decreases = 0
+
+    def __str__(self) -> str:
+        """Return a string representation of the controller.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<AIMDController limit={self.limit}>"
+
+    @property
+    def limit(self) -> int:
+        """Return the current concurrency limit.
+
+        Returns:
+            The number of requests allowed in flight.
+
+        """
+        return int(self._limit)
+
+    def record_success(self, latency: float) -> None:
+        """Record a healthy response and grow the limit, unless its latency is a spike.
+
+        Args:
+            latency: The latency of the request in seconds.
+
+        """
+        with self._lock:
+            baseline = self._latency
+            # Spikes are smoothed in as well, so that a lasting slowdown becomes the new baseline.
+            self._latency = latency if baseline is None else 0.9 * baseline + 0.1 * latency
+            if baseline is not None and latency > self.latency_tolerance * baseline:
+                self._decrease(f"latency spike ({latency:.3f} s vs {baseline:.3f} s)")
+                return
+            before = self.limit
+            self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+            if self.limit > before:
+                self._increases += 1
+                logger.debug("Adaptive concurrency limit increased from %d to %d.", before, self.limit)
+
+    def record_failure(self, reason: str) -> None:
+        """Record a sign of overload and back off.
+
+        Args:
+            reason: Why the request counts as a failure; logged with the decision.
+
+        """
+        with self._lock:
+            self._decrease(reason)
+
+    def record_error(self, error: BaseException) -> bool:
+        """Classify a request error and back off if it signals overload.
+
+        Rate limiting, server errors, connection errors and timeouts count as overload; other
+        HTTP errors, e.g. 404, exceeded deadlines and errors raised by the caller's code do not.
+
+        Args:
+            error: The exception raised by the request.
+
+        Returns:
+            Whether the error signals overload, in which case the request can be retried at the lower limit.
+
+        """
+        if isinstance(error, DeadlineExceededError):
+            return False
+        status = get_error_status(error)
+        if status is None:
+            if not _is_connection_error(error):
+                return False
+            self.record_failure(type(error).__name__)
+            return True
+        if status == 429 or status >= 500:  # noqa: PLR2004
+            self.record_failure(f"HTTP {status}")
+            return True
+        return False
+
+    def _decrease(self, reason: str) -> None:
+        """Shrink the limit multiplicatively, at most once per cooldown.
+
+        Args:
+            reason: Why the limit is decreased.
+
+        """
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        before = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._last_decrease = now
+        self._decreases += 1
+        logger.info("Adaptive concurrency limit decreased from %d to %d: %s.", before, self.limit, reason)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the limit and the decisions taken so far.
+
+        Returns:
+            A dictionary with the current limit, its bounds, the smoothed latency in seconds,
+            and the number of increases and decreases.
+
+        """
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "latency": self._latency,
+                "increases": self._increases,
+                "decreases": self._decreases,
+            }
+
+
+def map_adaptive(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    controller: AIMDController,
+    max_retries: int = 3,
+    backoff: float = 0.5,
+) -> list[R]:
+    """Apply a function to items on a thread pool whose concurrency follows the controller.
+
+    An item failing with an overload error (429, 5xx, connection error or timeout) is queued
+    again and retried once the concurrency has dropped below the lowered limit.
+
+    ``func`` runs on worker threads at the same time for several items, so it must be thread-safe.
+    A `GitLab` client may be shared between the workers: its requests then share its transport,
+    e.g. one `requests.Session`, whose connection pools and cookie jar are locked. Give each worker
+    its own client if ``func`` changes the state of the session, such as its headers or adapters.
+
+    Args:
+        func: The function issuing the request(s) for one item.
+        items: The items.
+        controller: The controller setting the concurrency and learning from the outcomes.
+        max_retries: Maximum number of retries of an item failing with overload errors.
+        backoff: Seconds to wait before the first retry of an item, doubled on every further retry.
+
+    Returns:
+        The results, in the order of the items.
+
+    Raises:
+        BaseException: The first error that is not an overload error, or the last overload error of
+            an item out of retries; no further items are started after it.
+
+    """
+    items = list(items)
+    results: list[Any] = [None] * len(items)
+    queue: deque[tuple[int, int]] = deque((index, 0) for index in range(len(items)))
+    condition = threading.Condition()
+    in_flight = 0
+    error: BaseException | None = None
+
+    def can_proceed() -> bool:
+        return error is not None or (bool(queue) and in_flight < controller.limit) or (not queue and not in_flight)
+
+    def run(index: int, attempt: int) -> None:
+        nonlocal in_flight, error
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        start = time.perf_counter()
+        retry = False
+        failure: BaseException | None = None
+        try:
+            results[index] = func(items[index])
+        except Exception as e:  # noqa: BLE001
+            retry = controller.record_error(e) and attempt < max_retries
+            failure = None if retry else e
+        except BaseException as e:
+            failure = e
+            raise
+        else:
+            controller.record_success(time.perf_counter() - start)
+        finally:
+            with condition:
+                if retry:
+                    logger.debug("Retrying item %d after an overload error (attempt %d).", index, attempt + 1)
+                    queue.append((index, attempt + 1))
+                elif failure is not None and error is None:
+                    error = failure
+                in_flight -= 1
+                condition.notify_all()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(controller.max_limit, len(items)))) as executor:
+        while True:
+            with condition:
+                condition.wait_for(can_proceed)
+                if error is not None or not queue:
+                    break
+                index, attempt = queue.popleft()
+                in_flight += 1
+            executor.submit(run, index, attempt)
+    if error is not None:
+        raise error
+    return results
+
+
+async def gather_adaptive(  # noqa: PLR0915
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    controller: AIMDController,
+    max_retries: int = 3,
+    backoff: float = 0.5,
+) -> list[R]:
+    """Await a coroutine per item with a concurrency that follows the controller.
+
+    An item failing with an overload error (429, 5xx, connection error or timeout) is queued
+    again and retried once the concurrency has dropped below the lowered limit.
+
+    Args:
+        func: The coroutine function issuing the request(s) for one item.
+        items: The items.
+        controller: The controller setting the concurrency and learning from the outcomes.
+        max_retries: Maximum number of retries of an item failing with overload errors.
+        backoff: Seconds to wait before the first retry of an item, doubled on every further retry.
+
+    Returns:
+        The results, in the order of the items.
+
+    Raises:
+        BaseException: The first error that is not an overload error, or the last overload error of
+            an item out of retries; no further items are started after it.
+
+    """
+    import asyncio  # noqa: PLC0415
+
+    items = list(items)
+    results: list[Any] = [None] * len(items)
+    queue: deque[tuple[int, int]] = deque((index, 0) for index in range(len(items)))
+    condition = asyncio.Condition()
+    in_flight = 0
+    error: BaseException | None = None
+
+    def can_proceed() -> bool:
+        return error is not None or (bool(queue) and in_flight < controller.limit) or (not queue and not in_flight)
+
+    async def run(index: int, attempt: int) -> None:
+        nonlocal in_flight, error
+        if attempt:
+            await asyncio.sleep(backoff * 2 ** (attempt - 1))
+        start = time.perf_counter()
+        retry = False
+        failure: BaseException | None = None
+        try:
+            results[index] = await func(items[index])
+        except Exception as e:  # noqa: BLE001
+            retry = controller.record_error(e) and attempt < max_retries
+            failure = None if retry else e
+        except BaseException as e:
+            failure = e
+            raise
+        else:
+            controller.record_success(time.perf_counter() - start)
+        finally:
+            async with condition:
+                if retry:
+                    logger.debug("Retrying item %d after an overload error (attempt %d).", index, attempt + 1)
+                    queue.append((index, attempt + 1))
+                elif failure is not None and error is None:
+                    error = failure
+                in_flight -= 1
+                condition.notify_all()
+
+    tasks: list[asyncio.Task[None]] = []
+    try:
+        while True:
+            async with condition:
+                await condition.wait_for(can_proceed)
+                if error is not None or not queue:
+                    break
+                index, attempt = queue.popleft()
+                in_flight += 1
+            tasks.append(asyncio.ensure_future(run(index, attempt)))
+        if error is None:
+            await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # The error, if any, is raised below rather than logged as never retrieved.
+    if error is not None:
+        raise error
+    return results
@@ -2,30 +2,96 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+from collections.abc import Callable
 from typing import Any
 
 from aiohttp import ClientResponse, ClientSession, ClientTimeout
+from aiohttp.connector import Connection
 
+from glnova.cache.path_id import PathIDCache
 from glnova.client.base import Client
+from glnova.client.circuit_breaker import CircuitBreaker
+from glnova.client.deadline import Deadline
+from glnova.client.events import EventHook, build_event, get_content_length
+from glnova.client.hedging import HedgePolicy
+from glnova.client.limiter import ConcurrencyLimiter, Priority
+from glnova.client.middleware import AsyncMiddleware, Request, default_async_middlewares, run_async_middlewares
+from glnova.client.timing import create_trace_config
+from glnova.client.transport import AsyncTransport
 from glnova.issue.async_issue import AsyncIssue
 from glnova.merge_request.async_merge_request import AsyncMergeRequest
 from glnova.project.async_project import AsyncProject
 from glnova.user.async_user import AsyncUser
 
+logger = logging.getLogger("glnova")
+
+_HEDGEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _encode_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Encode the boolean values of query parameters, which aiohttp rejects, the way GitLab expects them.
+
+    Args:
+        params: The query parameters.
+
+    Returns:
+        The query parameters with ``true`` and ``false`` for the booleans.
+
+    """
+    return {key: ("true" if value else "false") if isinstance(value, bool) else value for key, value in params.items()}
+
 
 class AsyncGitLab(Client):
     """Asynchronous GitLab API client."""
 
-    def __init__(self, token: str | None = None, base_url: str = "https://gitlab.com") -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        token: str | None = None,
+        base_url: str = "https://gitlab.com",
+        path_id_cache: PathIDCache | None = None,
+        circuit_breaker: CircuitBreaker | bool = False,
+        hedge_policy: HedgePolicy | None = None,
+        limiter: ConcurrencyLimiter | None = None,
+        middlewares: list[AsyncMiddleware] | None = None,
+        event_hooks: list[EventHook] | None = None,
+        transport: Callable[[], AsyncTransport] | None = None,
+    ) -> None:
         """Initialize the asynchronous GitLab client.
 
         Args:
             token: The API token for authentication.
             base_url: The base URL of the GitLab instance.
+            path_id_cache: Optional cache used to address projects by numeric ID.
+            circuit_breaker: A circuit breaker to guard requests with, or True to use the
+                process-wide circuit breaker of ``base_url``.
+            hedge_policy: Optional policy for sending hedged duplicates of slow GET requests.
+            limiter: Optional limiter capping the number of in-flight requests per priority class. A request
+                holds its slot until the body of its response has been read or the response released.
+            middlewares: Middlewares every request goes through, outermost first. Defaults to
+                `default_async_middlewares`, which merge the headers, add conditional request headers
+                and raise for error statuses; pass your own list to add, remove or reorder behavior.
+            event_hooks: Callables receiving a `RequestEvent` with the outcome and phase timings of every request.
+            transport: Factory of the transport opened when entering the context manager, e.g.
+                `AsyncCassetteTransport`. Defaults to `aiohttp.ClientSession`.
 
         """
-        super().__init__(token=token, base_url=base_url)
-        self.session: ClientSession | None = None
+        super().__init__(
+            token=token,
+            base_url=base_url,
+            path_id_cache=path_id_cache,
+            circuit_breaker=circuit_breaker,
+            event_hooks=event_hooks,
+        )
+        self.transport = transport
+        self.session: AsyncTransport | None = None
+        self.hedge_policy = hedge_policy
+        self.limiter = limiter
+        self.middlewares: list[AsyncMiddleware] = (
+            default_async_middlewares() if middlewares is None else list(middlewares)
+        )
 
         # Initialize resource handlers
         self.issue = AsyncIssue(client=self)
@@ -51,7 +117,10 @@ class AsyncGitLab(Client):
         """
         if self.session is not None and not self.session.closed:
             raise RuntimeError("AsyncGitLab session already open; do not re-enter context manager.")
-        self.session = ClientSession(headers=self.headers)
+        if self.transport is None:
+            self.session = ClientSession(headers=self.headers, trace_configs=[create_trace_config()])
+        else:
+            self.session = self.transport()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -80,13 +149,71 @@ class AsyncGitLab(Client):
         """
         return ClientSession(headers=headers, **kwargs)
 
-    async def _request(
+    async def _send(self, method: str, url: str, **kwargs: Any) -> ClientResponse:
+        """Send a single HTTP request, hedging it if it is idempotent and a hedge policy is set.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The HTTP response.
+
+        """
+        session = self.session
+        if session is None:
+            raise RuntimeError("AsyncGitLab session is not open.")
+        if self.hedge_policy is None or method.upper() not in _HEDGEABLE_METHODS:
+            return await session.request(method=method, url=url, **kwargs)
+
+        policy = self.hedge_policy
+        policy.record_request()
+
+        async def attempt() -> tuple[ClientResponse, float]:
+            start = time.perf_counter()
+            response = await session.request(method=method, url=url, **kwargs)
+            return response, time.perf_counter() - start
+
+        primary = asyncio.ensure_future(attempt())
+        tasks = {primary: False}
+        try:
+            delay = policy.delay()
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if not done and policy.try_acquire():
+                logger.debug("Hedging %s %s after %.3f s.", method, url, delay)
+                tasks[asyncio.ensure_future(attempt())] = True
+            pending = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if not succeeded:
+                    error = error or next(task.exception() for task in done)
+                    continue
+                winner = succeeded[0]
+                for loser in succeeded[1:]:
+                    loser.result()[0].release()
+                response, latency = winner.result()
+                policy.record_latency(latency)
+                if tasks[winner]:
+                    policy.record_hedge_won()
+                return response
+            raise error or RuntimeError("Hedged request finished without a response.")
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _request(  # noqa: PLR0913
         self,
         method: str,
         endpoint: str,
         etag: str | None = None,
         headers: dict | None = None,
         timeout: int = 30,
+        deadline: Deadline | None = None,
+        priority: Priority | str = Priority.NORMAL,
         **kwargs: Any,
     ) -> ClientResponse:
         """Make an asynchronous HTTP request to the GitLab API.
@@ -97,6 +224,64 @@ class AsyncGitLab(Client):
             etag: Optional ETag for conditional requests.
             headers: Optional headers to include in the request.
             timeout: Request timeout in seconds.
+            deadline: Optional deadline of the enclosing operation. The request timeout, and the time
+                spent waiting for a slot of the limiter, are capped by the time left.
+            priority: Priority class used by the limiter to admit the request.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The HTTP response. With a limiter, its slot is freed once the body has been read or the
+            response released or closed.
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed before or during the request.
+
+        """
+        request_kwargs: dict[str, Any] = {"etag": etag, "headers": headers, "timeout": timeout, "deadline": deadline}
+        if self.limiter is None:
+            return await self._dispatch(method=method, endpoint=endpoint, **request_kwargs, **kwargs)
+        queued_at = time.perf_counter()
+        try:
+            await self.limiter.acquire(priority=priority, timeout=None if deadline is None else deadline.remaining())
+        except asyncio.TimeoutError as e:
+            if deadline is None:
+                raise
+            raise deadline.exceed() from e
+        request_kwargs["queue_time"] = time.perf_counter() - queued_at
+        try:
+            response = await self._dispatch(method=method, endpoint=endpoint, **request_kwargs, **kwargs)
+        except BaseException:
+            self.limiter.release()
+            raise
+        connection = getattr(response, "connection", None)
+        if isinstance(connection, Connection):
+            # The body is still on the wire; the connection notifies once it is read, released or closed.
+            connection.add_callback(self.limiter.release)
+        else:
+            self.limiter.release()
+        return response
+
+    async def _dispatch(  # noqa: PLR0913
+        self,
+        method: str,
+        endpoint: str,
+        etag: str | None = None,
+        headers: dict | None = None,
+        timeout: int = 30,
+        deadline: Deadline | None = None,
+        queue_time: float | None = None,
+        **kwargs: Any,
+    ) -> ClientResponse:
+        """Send a request through the middlewares once it has been admitted by the limiter.
+
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            endpoint: The API endpoint.
+            etag: Optional ETag for conditional requests.
+            headers: Optional headers to include in the request.
+            timeout: Request timeout in seconds.
+            deadline: Optional deadline of the enclosing operation.
+            queue_time: Seconds the request waited for a slot of the limiter, reported as the ``queue`` timing.
             **kwargs: Additional arguments for the request.
 
         Returns:
@@ -108,18 +293,102 @@ class AsyncGitLab(Client):
                 "AsyncGitLab must be used as an async context manager. "
                 + "Use 'async with AsyncGitLab(...) as client:' to ensure proper resource cleanup."
             )
+        request = Request(
+            method=method,
+            endpoint=endpoint,
+            headers=headers,
+            etag=etag,
+            timeout=timeout,
+            deadline=deadline,
+            kwargs=kwargs,
+        )
+        if not self.event_hooks:
+            return await run_async_middlewares(
+                middlewares=self.middlewares, client=self, request=request, send=self._transmit
+            )
 
-        url = self._build_url(endpoint=endpoint)
-        conditional_headers = self._get_conditional_request_headers(etag=etag)
-        request_headers = {**self.headers, **conditional_headers, **(headers or {})}
-        timeout_obj = ClientTimeout(total=timeout)
-        response = await self.session.request(
-            method=method, url=url, headers=request_headers, timeout=timeout_obj, **kwargs
+        timings: dict[str, float] = {} if queue_time is None else {"queue": queue_time}
+        request.context["timings"] = timings
+        start = time.perf_counter()
+        try:
+            response = await run_async_middlewares(
+                middlewares=self.middlewares, client=self, request=request, send=self._transmit
+            )
+        except Exception as e:
+            timings["total"] = time.perf_counter() - start
+            self._emit_event(build_event(request=request, timings=timings, error=e))
+            raise
+        timings["total"] = time.perf_counter() - start
+        self._emit_event(
+            build_event(
+                request=request,
+                timings=timings,
+                status=response.status,
+                headers=response.headers,
+                size=get_content_length(response.headers) if response._body is None else len(response._body),
+            )
         )
+        return response
+
+    async def _transmit(self, request: Request) -> ClientResponse:  # noqa: PLR0912
+        """Send a prepared request over the session.
+
+        Args:
+            request: The request prepared by the middlewares.
+
+        Returns:
+            The HTTP response.
+
+        """
+        request.context["attempts"] = request.context.get("attempts", 0) + 1
+        send_kwargs = request.kwargs
+        if isinstance(send_kwargs.get("params"), dict):
+            send_kwargs = {**send_kwargs, "params": _encode_params(send_kwargs["params"])}
+        if "timings" in request.context:
+            send_kwargs = {**send_kwargs, "trace_request_ctx": request.context["timings"]}
+        deadline = request.deadline
+        resolved_endpoint, resolved_path = self._resolve_endpoint(endpoint=request.endpoint)
+        timeout = request.timeout
+        timeout_obj = ClientTimeout(total=timeout if deadline is None else deadline.request_timeout(timeout))
+        url = self._build_url(endpoint=resolved_endpoint)
+        request.context["url"] = url
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
         try:
-            response.raise_for_status()
+            response = await self._send(
+                method=request.method, url=url, headers=request.headers, timeout=timeout_obj, **send_kwargs
+            )
+            if resolved_path is not None and response.status == 404:  # noqa: PLR2004
+                # The cached ID may be stale; fall back to the path and only drop the entry
+                # if the path still resolves, i.e. the 404 was not about a missing sub-resource.
+                response.release()
+                url = self._build_url(endpoint=request.endpoint)
+                request.context["url"] = url
+                if deadline is not None:
+                    timeout_obj = ClientTimeout(total=deadline.request_timeout(timeout))
+                request.context["attempts"] += 1
+                response = await self._send(
+                    method=request.method, url=url, headers=request.headers, timeout=timeout_obj, **send_kwargs
+                )
+                if response.status != 404:  # noqa: PLR2004
+                    self._invalidate_resolved_path(resolved_path)
+        except asyncio.CancelledError:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_cancelled()
+            raise
+        except asyncio.TimeoutError as e:
+            if deadline is not None and deadline.expired:
+                # The timeout was cut short by the caller's deadline; it says nothing about the instance.
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_cancelled()
+                raise deadline.exceed() from e
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            raise
         except Exception:
-            response.release()
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
             raise
-
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_status(response.status)
         return response
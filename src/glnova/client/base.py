@@ -2,22 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Any
+import logging
+import re
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import unquote
+
+from glnova.client.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from glnova.client.events import get_default_event_hooks
+
+if TYPE_CHECKING:
+    from glnova.cache.path_id import PathIDCache, PathKind
+    from glnova.client.events import EventHook, RequestEvent
+
+logger = logging.getLogger("glnova")
+
+_PATH_ENDPOINT_PATTERN = re.compile(r"^/?(projects)/([^/]+)(.*)$")
+
+# Largest page size served by GitLab; larger ``per_page`` values are capped to it.
+MAX_PER_PAGE = 100
 
 
 class Client:
     """Abstract base class for GitLab clients."""
 
-    def __init__(self, token: str | None, base_url: str) -> None:
+    def __init__(
+        self,
+        token: str | None,
+        base_url: str,
+        path_id_cache: PathIDCache | None = None,
+        circuit_breaker: CircuitBreaker | bool = False,
+        event_hooks: list[EventHook] | None = None,
+    ) -> None:
         """Construct the base client.
 
         Args:
             token: The API token for authentication.
             base_url: The base URL of the GitLab instance.
+            path_id_cache: Optional cache used to rewrite project paths in endpoints to numeric IDs.
+            circuit_breaker: A circuit breaker to guard requests with, or True to use the
+                process-wide circuit breaker of ``base_url``.
+            event_hooks: Callables receiving a `RequestEvent` after every request, in addition to
+                the hooks registered with `add_default_event_hook`.
 
         """
         self.token = token
         self.base_url = base_url.rstrip("/")
+        self.path_id_cache = path_id_cache
+        self.circuit_breaker: CircuitBreaker | None = (
+            get_circuit_breaker(self.base_url) if circuit_breaker is True else circuit_breaker or None
+        )
+        self.event_hooks: list[EventHook] = [*get_default_event_hooks(), *(event_hooks or [])]
         self.headers: dict[str, Any] = {}
         if self.token:
             self.headers["Authorization"] = f"Bearer {self.token}"
@@ -53,6 +87,39 @@ class Client:
         """
         return f"{self.api_url}/{endpoint.lstrip('/')}"
 
+    def add_event_hook(self, hook: EventHook) -> None:
+        """Register a callable receiving a `RequestEvent` after every request.
+
+        Args:
+            hook: The callable.
+
+        """
+        self.event_hooks.append(hook)
+
+    def remove_event_hook(self, hook: EventHook) -> None:
+        """Unregister an event hook.
+
+        Args:
+            hook: The callable registered with `add_event_hook`.
+
+        """
+        self.event_hooks.remove(hook)
+
+    def _emit_event(self, event: RequestEvent) -> None:
+        """Pass an event to the event hooks.
+
+        A failing hook is logged and does not affect the request or the other hooks.
+
+        Args:
+            event: The event.
+
+        """
+        for hook in list(self.event_hooks):
+            try:
+                hook(event)
+            except Exception:
+                logger.warning("Event hook %r failed.", hook, exc_info=True)
+
     def _get_conditional_request_headers(
         self,
         etag: str | None = None,
@@ -70,3 +137,37 @@ class Client:
         if etag:
             headers["If-None-Match"] = etag
         return headers
+
+    def _resolve_endpoint(self, endpoint: str) -> tuple[str, tuple[PathKind, str] | None]:
+        """Rewrite a path-based project endpoint to use the cached numeric ID.
+
+        Args:
+            endpoint: The API endpoint, e.g. ``/projects/group%2Fproject/issues``.
+
+        Returns:
+            A tuple containing the (possibly rewritten) endpoint and, if it was rewritten,
+            the kind and path that were replaced so they can be invalidated later.
+
+        """
+        if self.path_id_cache is None:
+            return endpoint, None
+        match = _PATH_ENDPOINT_PATTERN.match(endpoint)
+        if match is None or match.group(2).isdigit():
+            return endpoint, None
+        kind = cast("PathKind", match.group(1))
+        path = unquote(match.group(2))
+        resource_id = self.path_id_cache.get(base_url=self.base_url, kind=kind, path=path)
+        if resource_id is None:
+            return endpoint, None
+        return f"/{kind}/{resource_id}{match.group(3)}", (kind, path)
+
+    def _invalidate_resolved_path(self, resolved_path: tuple[PathKind, str]) -> None:
+        """Invalidate a path that was rewritten by `_resolve_endpoint`.
+
+        Args:
+            resolved_path: The kind and path returned by `_resolve_endpoint`.
+
+        """
+        if self.path_id_cache is not None:
+            kind, path = resolved_path
+            self.path_id_cache.invalidate(base_url=self.base_url, kind=kind, path=path)
@@ -0,0 +1,462 @@
+"""Record/replay cassettes of the HTTP interactions of the GitLab clients."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Literal
+
+import requests
+from aiohttp import ClientResponse, ClientResponseError, ClientSession, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from yarl import URL
+
+from glnova.client.timing import create_trace_config
+from glnova.client.transport import Transport, _encode
+from glnova.utils.exception import CassetteMissError
+
+CassetteMode = Literal["record", "replay"]
+
+_SKIPPED_HEADERS = frozenset({"set-cookie", "content-encoding", "transfer-encoding"})
+
+
+def _normalize_param(value: Any) -> Any:
+    """Normalize the value of a query parameter the same way for both clients.
+
+    The synchronous client sends booleans as ``True`` and ``False`` while the asynchronous
+    one sends ``true`` and ``false``, so a key built from the raw values would differ.
+
+    Args:
+        value: The value.
+
+    Returns:
+        ``true`` or ``false`` for a boolean, a list of normalized values for a list or a tuple,
+        and the value itself otherwise.
+
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return [_normalize_param(item) for item in value]
+    return value
+
+
+def _get_key(method: str, url: str, params: dict[str, Any] | None) -> str:
+    """Get the key matching a request to its recorded interactions.
+
+    Args:
+        method: The HTTP method.
+        url: The URL.
+        params: The query parameters.
+
+    Returns:
+        The method and the URL with its normalized query parameters in sorted order.
+
+    """
+    query = _encode({key: _normalize_param(value) for key, value in sorted(params.items())}) if params else ""
+    if query:
+        url = f"{url}{'&' if '?' in url else '?'}{query}"
+    return f"{method.upper()} {url}"
+
+
+class Cassette:
+    """Recorded HTTP interactions, stored as compact JSON, gzipped if the path ends in ``.gz``.
+
+    Interactions are replayed in the order they were recorded for each method, URL and
+    query string, so a request recorded as a 200 and then as a 304 replays the same way.
+    Once the recordings of a request are used up, its last one is replayed again.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the Cassette, loading its interactions if the file exists.
+
+        Args:
+            path: The cassette file.
+
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.interactions: list[dict[str, Any]] = []
+        self._cursors: dict[str, int] = defaultdict(int)
+        self._index: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        if self.path.exists():
+            self.load()
+
+    def __str__(self) -> str:
+        """Return a string representation of the cassette.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<Cassette path={self.path} interactions={len(self.interactions)}>"
+
+    def __len__(self) -> int:
+        """Return the number of recorded interactions.
+
+        Returns:
+            The number of interactions.
+
+        """
+        return len(self.interactions)
+
+    def load(self) -> None:
+        """Load the interactions from the cassette file, replacing those in memory."""
+        raw = self.path.read_bytes()
+        if self.path.suffix == ".gz":
+            raw = gzip.decompress(raw)
+        data = json.loads(raw.decode("utf-8"))
+        with self._lock:
+            self.interactions = list(data.get("interactions", []))
+            self._cursors.clear()
+            self._index.clear()
+            for interaction in self.interactions:
+                self._index[interaction["key"]].append(interaction)
+
+    def save(self) -> None:
+        """Write the interactions to the cassette file."""
+        with self._lock:
+            data = {"version": 1, "interactions": self.interactions}
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        if self.path.suffix == ".gz":
+            raw = gzip.compress(raw)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(raw)
+
+    def record(  # noqa: PLR0913
+        self,
+        key: str,
+        status: int,
+        reason: str,
+        headers: dict[str, str],
+        body: bytes,
+        latency: float,
+    ) -> None:
+        """Add an interaction.
+
+        Args:
+            key: The key of the request, from its method, URL and query parameters.
+            status: The status code of the response.
+            reason: The reason phrase of the response.
+            headers: The response headers, e.g. ``Etag`` and the pagination headers.
+            body: The response body.
+            latency: The time the response took, in seconds.
+
+        """
+        try:
+            text, encoding = body.decode("utf-8"), None
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(body).decode("ascii"), "base64"
+        interaction = {
+            "key": key,
+            "status": status,
+            "reason": reason,
+            "headers": {name: value for name, value in headers.items() if name.lower() not in _SKIPPED_HEADERS},
+            "body": text,
+            "latency": round(latency, 6),
+        }
+        if encoding is not None:
+            interaction["encoding"] = encoding
+        with self._lock:
+            self.interactions.append(interaction)
+            self._index[key].append(interaction)
+
+    def play(self, key: str) -> dict[str, Any] | None:
+        """Get the next recorded interaction of a request.
+
+        Args:
+            key: The key of the request.
+
+        Returns:
+            The interaction, or None if the request was never recorded.
+
+        """
+        with self._lock:
+            recordings = self._index.get(key)
+            if not recordings:
+                return None
+            position = self._cursors[key]
+            self._cursors[key] = position + 1
+            return recordings[min(position, len(recordings) - 1)]
+
+    def rewind(self) -> None:
+        """Replay every request from its first recording again."""
+        with self._lock:
+            self._cursors.clear()
+
+
+def _get_body(interaction: dict[str, Any]) -> bytes:
+    """Get the body of a recorded interaction.
+
+    Args:
+        interaction: The interaction.
+
+    Returns:
+        The body.
+
+    """
+    if interaction.get("encoding") == "base64":
+        return base64.b64decode(interaction["body"])
+    return interaction["body"].encode("utf-8")
+
+
+class CassetteTransport:
+    """Transport of `GitLab` recording responses into, or replaying them from, a cassette.
+
+    In replay mode no connection is ever opened: requests without a recording raise
+    `CassetteMissError`. Use it through the ``transport`` argument of the client, e.g.
+    ``GitLab(transport=lambda: CassetteTransport(cassette, mode="replay"))``.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: CassetteMode = "replay",
+        transport: Transport | None = None,
+        latency: float = 0.0,
+    ) -> None:
+        """Initialize the CassetteTransport.
+
+        Args:
+            cassette: The cassette.
+            mode: "record" to send the requests and record the responses, "replay" to answer from the cassette.
+            transport: Transport sending the requests in record mode. Defaults to a `requests.Session`.
+            latency: Factor applied to the recorded latencies when replaying: 0 answers at once,
+                1 reproduces the recorded latencies.
+
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}.")
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+        self.transport = transport if transport is not None or mode == "replay" else requests.Session()
+
+    def __str__(self) -> str:
+        """Return a string representation of the transport.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<CassetteTransport mode={self.mode} cassette={self.cassette.path}>"
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, or replay its recorded response.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            **kwargs: Additional arguments for the request, e.g. ``params``.
+
+        Returns:
+            The HTTP response.
+
+        Raises:
+            CassetteMissError: If replaying a request that was not recorded.
+
+        """
+        key = _get_key(method, url, kwargs.get("params"))
+        if self.mode == "record" and self.transport is not None:
+            start = time.perf_counter()
+            response = self.transport.request(method, url, **kwargs)
+            body = response.content
+            self.cassette.record(
+                key=key,
+                status=response.status_code,
+                reason=response.reason or "",
+                headers=dict(response.headers),
+                body=body,
+                latency=time.perf_counter() - start,
+            )
+            return response
+
+        interaction = self.cassette.play(key)
+        if interaction is None:
+            raise CassetteMissError(method=method.upper(), url=key.split(" ", 1)[1])
+        if self.latency:
+            time.sleep(interaction["latency"] * self.latency)
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction["reason"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response._content = _get_body(interaction)
+        response._content_consumed = True
+        response.url = url
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self) -> None:
+        """Close the recording transport and, in record mode, save the cassette."""
+        if self.mode == "record":
+            self.cassette.save()
+        if self.transport is not None:
+            self.transport.close()
+
+
+class CassetteResponse:
+    """Replayed response exposing the parts of `aiohttp.ClientResponse` used by the client."""
+
+    def __init__(self, method: str, url: str, interaction: dict[str, Any]) -> None:
+        """Initialize the CassetteResponse.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The URL of the request.
+            interaction: The recorded interaction.
+
+        """
+        self.method = method
+        self.url = URL(url)
+        self.status: int = interaction["status"]
+        self.reason: str = interaction["reason"]
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction["headers"]))
+        self._body = _get_body(interaction)
+        self.closed = False
+
+    def __str__(self) -> str:
+        """Return a string representation of the response.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<CassetteResponse {self.method} {self.url} status={self.status}>"
+
+    async def read(self) -> bytes:
+        """Return the body.
+
+        Returns:
+            The body.
+
+        """
+        return self._body
+
+    async def text(self, encoding: str | None = None) -> str:
+        """Return the body as text.
+
+        Args:
+            encoding: The encoding. Defaults to UTF-8.
+
+        Returns:
+            The decoded body.
+
+        """
+        return self._body.decode(encoding or "utf-8")
+
+    async def json(self, **kwargs: Any) -> Any:
+        """Return the body decoded as JSON.
+
+        Args:
+            **kwargs: Ignored; accepted for compatibility with `aiohttp.ClientResponse.json`.
+
+        Returns:
+            The decoded body, or None if it is empty.
+
+        """
+        return json.loads(self._body) if self._body.strip() else None
+
+    def raise_for_status(self) -> None:
+        """Raise `aiohttp.ClientResponseError` for 4xx and 5xx statuses."""
+        if self.status >= 400:  # noqa: PLR2004
+            request_info = RequestInfo(url=self.url, method=self.method, headers=CIMultiDictProxy(CIMultiDict()))
+            raise ClientResponseError(request_info, (), status=self.status, message=self.reason, headers=self.headers)
+
+    def release(self) -> None:
+        """Release the response; nothing to do for a replayed response."""
+        self.closed = True
+
+    def close(self) -> None:
+        """Close the response; nothing to do for a replayed response."""
+        self.closed = True
+
+
+class AsyncCassetteTransport:
+    """Transport of `AsyncGitLab` recording responses into, or replaying them from, a cassette.
+
+    Use it through the ``transport`` argument of the client, e.g.
+    ``AsyncGitLab(transport=lambda: AsyncCassetteTransport(cassette, mode="replay"))``.
+    """
+
+    def __init__(self, cassette: Cassette, mode: CassetteMode = "replay", latency: float = 0.0) -> None:
+        """Initialize the AsyncCassetteTransport.
+
+        Args:
+            cassette: The cassette.
+            mode: "record" to send the requests and record the responses, "replay" to answer from the cassette.
+            latency: Factor applied to the recorded latencies when replaying: 0 answers at once,
+                1 reproduces the recorded latencies.
+
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}.")
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+        self.closed = False
+        self._session: ClientSession | None = None
+
+    def __str__(self) -> str:
+        """Return a string representation of the transport.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<AsyncCassetteTransport mode={self.mode} cassette={self.cassette.path}>"
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> ClientResponse | CassetteResponse:
+        """Send a request, or replay its recorded response.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            **kwargs: Additional arguments for the request, e.g. ``params``.
+
+        Returns:
+            The HTTP response.
+
+        Raises:
+            CassetteMissError: If replaying a request that was not recorded.
+
+        """
+        key = _get_key(method, url, kwargs.get("params"))
+        if self.mode == "record":
+            if self._session is None:
+                self._session = ClientSession(trace_configs=[create_trace_config()])
+            start = time.perf_counter()
+            response = await self._session.request(method=method, url=url, **kwargs)
+            body = await response.read()
+            self.cassette.record(
+                key=key,
+                status=response.status,
+                reason=response.reason or "",
+                headers=dict(response.headers),
+                body=body,
+                latency=time.perf_counter() - start,
+            )
+            return response
+
+        interaction = self.cassette.play(key)
+        if interaction is None:
+            raise CassetteMissError(method=method.upper(), url=key.split(" ", 1)[1])
+        if self.latency:
+            await asyncio.sleep(interaction["latency"] * self.latency)
+        return CassetteResponse(method=method.upper(), url=url, interaction=interaction)
+
+    async def close(self) -> None:
+        """Close the recording session and, in record mode, save the cassette."""
+        self.closed = True
+        if self.mode == "record":
+            self.cassette.save()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,240 @@
+"""Circuit breaker shared by the clients of a GitLab instance."""
+
+from __future__ import annotations
+
+import enum
+import logging
+import threading
+import time
+from typing import Any
+
+from glnova.utils.exception import CircuitOpenError
+
+logger = logging.getLogger("glnova")
+
+
+class CircuitState(str, enum.Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single GitLab instance.
+
+    The circuit opens after ``failure_threshold`` consecutive failures, i.e. connection
+    errors, timeouts or 5xx responses. While open, requests fail immediately with
+    `CircuitOpenError`. Once ``recovery_timeout`` has elapsed the circuit becomes
+    half-open and lets up to ``half_open_max_calls`` probe requests through; a
+    successful probe closes the circuit and a failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """Initialize the CircuitBreaker.
+
+        Args:
+            name: Name of the circuit, usually the base URL of the GitLab instance.
+            failure_threshold: Number of consecutive failures that opens the circuit.
+            recovery_timeout: Seconds to wait before sending half-open probes.
+            half_open_max_calls: Maximum number of concurrent probes while half-open.
+
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._rejected = 0
+
+    def __str__(self) -> str:
+        """Return a string representation of the circuit breaker.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<CircuitBreaker name={self.name} state={self.state.value}>"
+
+    def _update_state(self) -> None:
+        """Move an open circuit to half-open once the recovery timeout has elapsed."""
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+            logger.info("Circuit '%s' is half-open; sending probe requests.", self.name)
+
+    def _open(self) -> None:
+        """Open the circuit."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_calls = 0
+        logger.warning(
+            "Circuit '%s' opened after %d consecutive failures; failing fast for %.1f s.",
+            self.name,
+            self._consecutive_failures,
+            self.recovery_timeout,
+        )
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state of the circuit.
+
+        Returns:
+            CircuitState: The current state.
+
+        """
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def before_request(self) -> None:
+        """Admit a request or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probe slots in use.
+
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == CircuitState.CLOSED:
+                return
+            if self._state == CircuitState.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return
+            self._rejected += 1
+            retry_after = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(name=self.name, retry_after=retry_after)
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                logger.info("Circuit '%s' closed.", self.name)
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._half_open_calls = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN or (
+                self._state == CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def record_cancelled(self) -> None:
+        """Record a request that was cancelled before it completed.
+
+        A cancelled request says nothing about the health of the instance; it only frees its probe slot.
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_status(self, status: int) -> None:
+        """Record the outcome of a request from its HTTP status code.
+
+        Server errors count as failures; any other status means the instance is reachable.
+
+        Args:
+            status: The HTTP status code.
+
+        """
+        if status >= 500:  # noqa: PLR2004
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self) -> None:
+        """Close the circuit and clear all counters."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._half_open_calls = 0
+            self._rejected = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the state and counters of the circuit.
+
+        Returns:
+            A dictionary with the state, consecutive failures, rejected requests and
+            the seconds left before probes are sent.
+
+        """
+        with self._lock:
+            self._update_state()
+            retry_after = 0.0
+            if self._state == CircuitState.OPEN:
+                retry_after = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+            return {
+                "name": self.name,
+                "state": self._state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "rejected": self._rejected,
+                "retry_after": retry_after,
+            }
+
+
+_registry: dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    base_url: str,
+    failure_threshold: int = 5,
+    recovery_timeout: float = 30.0,
+    half_open_max_calls: int = 1,
+) -> CircuitBreaker:
+    """Get the process-wide circuit breaker of a GitLab instance.
+
+    Every client, synchronous or asynchronous, that uses the same base URL shares the
+    same circuit breaker. The settings only apply when the circuit breaker is created.
+
+    Args:
+        base_url: The base URL of the GitLab instance.
+        failure_threshold: Number of consecutive failures that opens the circuit.
+        recovery_timeout: Seconds to wait before sending half-open probes.
+        half_open_max_calls: Maximum number of concurrent probes while half-open.
+
+    Returns:
+        The circuit breaker of the instance.
+
+    """
+    key = base_url.rstrip("/")
+    with _registry_lock:
+        breaker = _registry.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name=key,
+                failure_threshold=failure_threshold,
+                recovery_timeout=recovery_timeout,
+                half_open_max_calls=half_open_max_calls,
+            )
+            _registry[key] = breaker
+        return breaker
+
+
+def get_circuit_breaker_states() -> dict[str, dict[str, Any]]:
+    """Return a snapshot of every registered circuit breaker.
+
+    Returns:
+        A dictionary mapping base URLs to circuit breaker snapshots.
+
+    """
+    with _registry_lock:
+        breakers = list(_registry.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -0,0 +1,85 @@
+"""Deadlines bounding operations that issue several requests."""
+
+from __future__ import annotations
+
+import time
+
+from glnova.utils.exception import DeadlineExceededError
+
+
+class Deadline:
+    """Overall time budget shared by the requests of an operation.
+
+    Pass the same deadline to every request of a paginated or fan-out operation with
+    ``deadline=...``. Each request is then given the smaller of its own timeout and the
+    time left, and requests made after the deadline fail with `DeadlineExceededError`
+    without being sent. Operations that stop early because of the deadline return what
+    they have collected so far and set `exceeded`.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the Deadline.
+
+        Args:
+            timeout: The total time budget in seconds, counted from now.
+
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+        self.exceeded = False
+
+    def __str__(self) -> str:
+        """Return a string representation of the deadline.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<Deadline remaining={self.remaining():.3f} exceeded={self.exceeded}>"
+
+    def remaining(self) -> float:
+        """Return the time left.
+
+        Returns:
+            The number of seconds until the deadline, or 0 if it has passed.
+
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Check whether the deadline has passed.
+
+        Returns:
+            True if no time is left, False otherwise.
+
+        """
+        return self.remaining() <= 0
+
+    def request_timeout(self, timeout: float) -> float:
+        """Derive the timeout of a single request from the remaining budget.
+
+        Args:
+            timeout: The timeout the request would use without a deadline.
+
+        Returns:
+            The smaller of ``timeout`` and the time left.
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed.
+
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.exceed()
+        return min(timeout, remaining)
+
+    def exceed(self) -> DeadlineExceededError:
+        """Mark the deadline as exceeded.
+
+        Returns:
+            The error to raise.
+
+        """
+        self.exceeded = True
+        return DeadlineExceededError(timeout=self.timeout)
@@ -0,0 +1,255 @@
+"""Structured events describing the requests sent by the GitLab clients."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from json import dumps
+from typing import Any
+from urllib.parse import urlencode
+
+from glnova.client.middleware import Request
+from glnova.utils.endpoint import get_endpoint_template
+from glnova.utils.response import get_error_status
+
+
+class RequestEvent:
+    """Outcome and phase timings of one request, as passed to the event hooks of a client.
+
+    Attributes:
+        method: The HTTP method.
+        endpoint: The API endpoint.
+        endpoint_template: The endpoint with its IDs replaced by ``:id``, for grouping.
+        url: The URL the request was last sent to, without the query parameters.
+        params: The query parameters.
+        request_bytes: The size of the request body.
+        status: The HTTP status code, or None if no response was received.
+        bytes: The size of the response body, or None if no response was received or the size
+            is unknown, i.e. the body was not read yet and has no ``Content-Length``.
+        retries: Number of times the request was sent again, e.g. after a stale path ID.
+        cache_outcome: "hit" for a 304 answer to a conditional request, "miss" for another
+            answer to one, None if the request was not conditional.
+        timings: Phase durations in seconds. ``total`` is always set; ``dns``, ``connect``,
+            ``tls``, ``ttfb`` and ``body`` are set when the phase was measured, and ``queue``
+            when the request waited for a slot of the limiter of the asynchronous client.
+        server_time: Processing time reported by the server in ``X-Runtime``, in seconds.
+        request_id: Identifier of the request reported by the server in ``X-Request-Id``.
+        error: Name of the exception raised by the request, if any.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        method: str,
+        endpoint: str,
+        url: str | None = None,
+        params: dict[str, Any] | None = None,
+        request_bytes: int = 0,
+        status: int | None = None,
+        size: int | None = None,
+        retries: int = 0,
+        cache_outcome: str | None = None,
+        timings: dict[str, float] | None = None,
+        server_time: float | None = None,
+        request_id: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Initialize the RequestEvent.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The API endpoint.
+            url: The URL the request was last sent to.
+            params: The query parameters.
+            request_bytes: The size of the request body in bytes.
+            status: The HTTP status code.
+            size: The size of the response body in bytes.
+            retries: Number of times the request was sent again.
+            cache_outcome: "hit", "miss" or None.
+            timings: Phase durations in seconds.
+            server_time: Processing time reported by the server, in seconds.
+            request_id: Identifier of the request reported by the server.
+            error: Name of the exception raised by the request.
+
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.endpoint_template = get_endpoint_template(endpoint)
+        self.url = url
+        self.params: dict[str, Any] = dict(params or {})
+        self.request_bytes = request_bytes
+        self.status = status
+        self.bytes = size
+        self.retries = retries
+        self.cache_outcome = cache_outcome
+        self.timings: dict[str, float] = dict(timings or {})
+        self.server_time = server_time
+        self.request_id = request_id
+        self.error = error
+
+    def __str__(self) -> str:
+        """Return a string representation of the event.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<RequestEvent {self.method} {self.endpoint_template} status={self.status}>"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the event as a JSON-serializable dictionary.
+
+        Returns:
+            The fields of the event.
+
+        """
+        return {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "endpoint_template": self.endpoint_template,
+            "url": self.url,
+            "params": dict(self.params),
+            "request_bytes": self.request_bytes,
+            "status": self.status,
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "cache_outcome": self.cache_outcome,
+            "timings": dict(self.timings),
+            "server_time": self.server_time,
+            "request_id": self.request_id,
+            "error": self.error,
+        }
+
+
+EventHook = Callable[[RequestEvent], None]
+
+_default_event_hooks: list[EventHook] = []
+
+
+def add_default_event_hook(hook: EventHook) -> None:
+    """Register an event hook on every client created afterwards.
+
+    Lets tools such as the CLI profiler observe the clients built by code they do not control.
+
+    Args:
+        hook: The callable.
+
+    """
+    _default_event_hooks.append(hook)
+
+
+def remove_default_event_hook(hook: EventHook) -> None:
+    """Stop registering an event hook on new clients.
+
+    Clients created while it was registered keep it.
+
+    Args:
+        hook: The callable registered with `add_default_event_hook`.
+
+    """
+    _default_event_hooks.remove(hook)
+
+
+def get_default_event_hooks() -> list[EventHook]:
+    """Get the event hooks registered on every new client.
+
+    Returns:
+        A copy of the list of hooks.
+
+    """
+    return list(_default_event_hooks)
+
+
+def _get_body_size(kwargs: dict[str, Any]) -> int:
+    """Get the size of the body of a request from its arguments.
+
+    Args:
+        kwargs: The arguments of the request, e.g. ``json`` or ``data``.
+
+    Returns:
+        The size in bytes, 0 if there is no body.
+
+    """
+    if kwargs.get("json") is not None:
+        return len(dumps(kwargs["json"], default=str).encode("utf-8"))
+    data = kwargs.get("data")
+    if isinstance(data, dict):
+        return len(urlencode([(key, value) for key, value in data.items() if value is not None], doseq=True))
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    if isinstance(data, bytes):
+        return len(data)
+    return 0
+
+
+def get_content_length(headers: Mapping[str, str]) -> int | None:
+    """Get the size of a response body announced in its ``Content-Length`` header.
+
+    Args:
+        headers: The headers of the response.
+
+    Returns:
+        The size in bytes, or None if the header is missing or malformed.
+
+    """
+    length = headers.get("Content-Length")
+    if length is None:
+        return None
+    try:
+        return int(length)
+    except ValueError:
+        return None
+
+
+def build_event(  # noqa: PLR0913
+    request: Request,
+    timings: dict[str, float],
+    status: int | None = None,
+    headers: Mapping[str, str] | None = None,
+    size: int | None = None,
+    error: BaseException | None = None,
+) -> RequestEvent:
+    """Build the event of a request from what its pipeline produced.
+
+    Args:
+        request: The request, after it went through the middlewares.
+        timings: The phase timings collected while sending it.
+        status: The status code of the response, if any.
+        headers: The headers of the response, if any.
+        size: The size of the response body in bytes, if any.
+        error: The exception raised by the request, if any.
+
+    Returns:
+        The event.
+
+    """
+    if status is None and error is not None:
+        status = get_error_status(error)
+    cache_outcome = None
+    if request.etag:
+        cache_outcome = "hit" if status == 304 else "miss"  # noqa: PLR2004
+    server_time = None
+    request_id = None
+    if headers is not None:
+        runtime = headers.get("X-Runtime")
+        if runtime:
+            try:
+                server_time = float(runtime)
+            except ValueError:
+                server_time = None
+        request_id = headers.get("X-Request-Id")
+    params = request.kwargs.get("params")
+    return RequestEvent(
+        method=request.method,
+        endpoint=request.endpoint,
+        url=request.context.get("url"),
+        params={key: value for key, value in params.items() if value is not None} if params else None,
+        request_bytes=_get_body_size(request.kwargs),
+        status=status,
+        size=size,
+        retries=max(request.context.get("attempts", 1) - 1, 0),
+        cache_outcome=cache_outcome,
+        timings=timings,
+        server_time=server_time,
+        request_id=request_id,
+        error=None if error is None else type(error).__name__,
+    )
@@ -2,31 +2,71 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
 from typing import Any
 
 import requests
 from requests import Response
 
+from glnova.cache.path_id import PathIDCache
 from glnova.client.base import Client
+from glnova.client.circuit_breaker import CircuitBreaker
+from glnova.client.deadline import Deadline
+from glnova.client.events import EventHook, build_event, get_content_length
+from glnova.client.middleware import Middleware, Request, default_middlewares, run_middlewares
+from glnova.client.timing import collect_timings
+from glnova.client.transport import Transport, create_session, get_default_transport
 from glnova.issue.issue import Issue
 from glnova.merge_request.merge_request import MergeRequest
 from glnova.project.project import Project
 from glnova.user.user import User
+from glnova.utils.exception import DeadlineExceededError
+
+# Size of the chunks in which bodies are read under a deadline, which is checked after every chunk.
+DEADLINE_CHUNK_SIZE = 16 * 1024
 
 
 class GitLab(Client):
     """Synchronous GitLab API client."""
 
-    def __init__(self, token: str | None = None, base_url: str = "https://gitlab.com") -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        token: str | None = None,
+        base_url: str = "https://gitlab.com",
+        path_id_cache: PathIDCache | None = None,
+        circuit_breaker: CircuitBreaker | bool = False,
+        middlewares: list[Middleware] | None = None,
+        transport: Callable[[], Transport] | None = None,
+        event_hooks: list[EventHook] | None = None,
+    ) -> None:
         """Initialize the GitLab client.
 
         Args:
             token: The API token for authentication.
             base_url: The base URL of the GitLab instance.
+            path_id_cache: Optional cache used to address projects by numeric ID.
+            circuit_breaker: A circuit breaker to guard requests with, or True to use the
+                process-wide circuit breaker of ``base_url``.
+            middlewares: Middlewares every request goes through, outermost first. Defaults to
+                `default_middlewares`, which merge the headers, add conditional request headers and
+                raise for error statuses; pass your own list to add, remove or reorder behavior.
+            transport: Factory of the transport opened when entering the context manager, e.g.
+                `Urllib3Transport`. Defaults to the factory set with `set_default_transport`, if any,
+                and otherwise to `create_session`.
+            event_hooks: Callables receiving a `RequestEvent` with the outcome and phase timings of every request.
 
         """
-        super().__init__(token=token, base_url=base_url)
-        self.session: requests.Session | None = None
+        super().__init__(
+            token=token,
+            base_url=base_url,
+            path_id_cache=path_id_cache,
+            circuit_breaker=circuit_breaker,
+            event_hooks=event_hooks,
+        )
+        self.transport = transport if transport is not None else get_default_transport()
+        self.session: Transport | None = None
+        self.middlewares: list[Middleware] = default_middlewares() if middlewares is None else list(middlewares)
 
         # Initialize resource handlers
         self.issue = Issue(client=self)
@@ -52,7 +92,7 @@ class GitLab(Client):
         """
         if self.session is not None:
             raise RuntimeError("GitLab session already open; do not re-enter context manager.")
-        self.session = requests.Session()
+        self.session = create_session() if self.transport is None else self.transport()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -68,16 +108,17 @@ class GitLab(Client):
             self.session.close()
             self.session = None
 
-    def _request(
+    def _request(  # noqa: PLR0913
         self,
         method: str,
         endpoint: str,
         etag: str | None = None,
         headers: dict | None = None,
         timeout: int = 30,
+        deadline: Deadline | None = None,
         **kwargs: Any,
     ) -> Response:
-        """Make an HTTP request to the GitLab API.
+        """Make an HTTP request to the GitLab API through the middlewares of the client.
 
         Args:
             method: The HTTP method (GET, POST, etc.).
@@ -85,25 +126,143 @@ class GitLab(Client):
             etag: The ETag value for conditional requests.
             headers: Additional headers for the request.
             timeout: Timeout for the request in seconds.
+            deadline: Optional deadline of the enclosing operation. The request timeout is capped by the time left,
+                and the body is read in chunks so that a body trickling in past the deadline is abandoned. As
+                `requests` applies timeouts to each socket operation, a single stalled read can still overrun
+                the deadline by up to the time that was left when the request was sent.
             **kwargs: Additional arguments for the request.
 
         Returns:
             The HTTP response.
 
+        Raises:
+            DeadlineExceededError: If the deadline has passed before or during the request.
+
         """
         if self.session is None:
             raise RuntimeError(
                 "GitLab must be used as a context manager. "
                 + "Use 'with GitLab(...) as client:' to ensure proper resource cleanup."
             )
-        url = self._build_url(endpoint=endpoint)
-        conditional_headers = self._get_conditional_request_headers(etag=etag)
-        request_headers = {**self.headers, **conditional_headers, **(headers or {})}
-        response = self.session.request(method, url, headers=request_headers, timeout=timeout, **kwargs)
+        request = Request(
+            method=method,
+            endpoint=endpoint,
+            headers=headers,
+            etag=etag,
+            timeout=timeout,
+            deadline=deadline,
+            kwargs=kwargs,
+        )
+        if not self.event_hooks:
+            return run_middlewares(middlewares=self.middlewares, client=self, request=request, send=self._transmit)
+
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
         try:
-            response.raise_for_status()
-        except Exception:
-            response.close()
+            with collect_timings(timings):
+                response = run_middlewares(
+                    middlewares=self.middlewares, client=self, request=request, send=self._transmit
+                )
+        except Exception as e:
+            timings["total"] = time.perf_counter() - start
+            self._emit_event(build_event(request=request, timings=timings, error=e))
             raise
+        timings["total"] = time.perf_counter() - start
+        self._emit_event(
+            build_event(
+                request=request,
+                timings=timings,
+                status=response.status_code,
+                headers=response.headers,
+                size=len(response.content) if response._content_consumed else get_content_length(response.headers),
+            )
+        )
+        return response
 
+    def _transmit(self, request: Request) -> Response:  # noqa: PLR0912
+        """Send a prepared request over the session.
+
+        Args:
+            request: The request prepared by the middlewares.
+
+        Returns:
+            The HTTP response.
+
+        """
+        if self.session is None:
+            raise RuntimeError("GitLab session is not open.")
+        request.context["attempts"] = request.context.get("attempts", 0) + 1
+        deadline = request.deadline
+        resolved_endpoint, resolved_path = self._resolve_endpoint(endpoint=request.endpoint)
+        url = self._build_url(endpoint=resolved_endpoint)
+        request.context["url"] = url
+        request_timeout = request.timeout if deadline is None else deadline.request_timeout(request.timeout)
+        kwargs = request.kwargs
+        # Under a deadline, the body is read by `_read_body` rather than by the transport.
+        read_body = deadline is not None and not kwargs.get("stream", False)
+        if read_body:
+            kwargs = {**kwargs, "stream": True}
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+        try:
+            response = self.session.request(
+                request.method, url, headers=request.headers, timeout=request_timeout, **kwargs
+            )
+            if resolved_path is not None and response.status_code == 404:  # noqa: PLR2004
+                # The cached ID may be stale; fall back to the path and only drop the entry
+                # if the path still resolves, i.e. the 404 was not about a missing sub-resource.
+                response.close()
+                url = self._build_url(endpoint=request.endpoint)
+                request.context["url"] = url
+                if deadline is not None:
+                    request_timeout = deadline.request_timeout(request.timeout)
+                request.context["attempts"] += 1
+                response = self.session.request(
+                    request.method, url, headers=request.headers, timeout=request_timeout, **kwargs
+                )
+                if response.status_code != 404:  # noqa: PLR2004
+                    self._invalidate_resolved_path(resolved_path)
+            if read_body:
+                self._read_body(response=response, deadline=deadline)
+        except DeadlineExceededError:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_cancelled()
+            raise
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if deadline is not None and deadline.expired:
+                # The timeout was cut short by the caller's deadline; it says nothing about the instance.
+                # `requests` reports read timeouts of a streamed body as connection errors.
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_cancelled()
+                raise deadline.exceed() from e
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            raise
+        except Exception:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            raise
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_status(response.status_code)
         return response
+
+    @staticmethod
+    def _read_body(response: Response, deadline: Deadline) -> None:
+        """Read the body of a streamed response, giving up once the deadline has passed.
+
+        Args:
+            response: The response, sent with ``stream=True``.
+            deadline: The deadline of the request.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before the body has been read.
+
+        """
+        chunks = []
+        for chunk in response.iter_content(chunk_size=DEADLINE_CHUNK_SIZE):
+            chunks.append(chunk)
+            if deadline.expired:
+                response.close()
+                raise deadline.exceed()
+        response._content = b"".join(chunks)
+        response._content_consumed = True
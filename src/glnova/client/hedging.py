@@ -0,0 +1,130 @@
+"""Hedging policy for idempotent requests of the asynchronous client."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Any
+
+
+class HedgePolicy:
+    """Decide when to send a hedged duplicate of a slow idempotent request.
+
+    The hedge delay is a percentile of the recently observed latencies, clamped to
+    ``[min_delay, max_delay]``. Until ``min_samples`` latencies have been observed,
+    ``initial_delay`` is used. The extra load is capped by a budget: every request
+    earns ``budget_ratio`` hedge tokens, up to ``max_tokens``, and every hedge spends
+    one, so at most about ``budget_ratio`` of the requests are duplicated.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        max_delay: float = 5.0,
+        budget_ratio: float = 0.1,
+        max_tokens: float = 10.0,
+        window: int = 500,
+        min_samples: int = 20,
+    ) -> None:
+        """Initialize the HedgePolicy.
+
+        Args:
+            percentile: Latency percentile, between 0 and 100, after which a hedge is sent.
+            initial_delay: Hedge delay in seconds used until enough latencies have been observed.
+            min_delay: Lower bound of the hedge delay in seconds.
+            max_delay: Upper bound of the hedge delay in seconds.
+            budget_ratio: Fraction of requests that may be hedged.
+            max_tokens: Maximum number of hedge tokens that can be saved up.
+            window: Number of recent latencies used to compute the percentile.
+            min_samples: Number of latencies required before the percentile is used.
+
+        """
+        if not 0 < percentile <= 100:  # noqa: PLR2004
+            raise ValueError("percentile must be in (0, 100].")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.max_tokens = max_tokens
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._tokens = max_tokens
+        self._requests = 0
+        self._hedges_fired = 0
+        self._hedges_won = 0
+        self._budget_exhausted = 0
+
+    def delay(self) -> float:
+        """Return the current hedge delay.
+
+        Returns:
+            The number of seconds to wait for a response before sending a hedge.
+
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(self._latencies)
+        index = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return min(self.max_delay, max(self.min_delay, ordered[index]))
+
+    def record_request(self) -> None:
+        """Record a hedgeable request and earn hedge budget for it."""
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget_ratio)
+
+    def record_latency(self, seconds: float) -> None:
+        """Record the latency of a completed attempt.
+
+        Args:
+            seconds: The latency in seconds.
+
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def try_acquire(self) -> bool:
+        """Spend a hedge token if the budget allows it.
+
+        Returns:
+            True if a hedge may be sent, False if the budget is exhausted.
+
+        """
+        with self._lock:
+            if self._tokens < 1:
+                self._budget_exhausted += 1
+                return False
+            self._tokens -= 1
+            self._hedges_fired += 1
+            return True
+
+    def record_hedge_won(self) -> None:
+        """Record that a hedge returned before the original request."""
+        with self._lock:
+            self._hedges_won += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the hedging counters.
+
+        Returns:
+            A dictionary with the number of hedgeable requests, hedges fired and won,
+            hedges skipped for lack of budget, the fire and win rates, and the current delay.
+
+        """
+        delay = self.delay()
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedges_fired": self._hedges_fired,
+                "hedges_won": self._hedges_won,
+                "budget_exhausted": self._budget_exhausted,
+                "fire_rate": self._hedges_fired / self._requests if self._requests else 0.0,
+                "win_rate": self._hedges_won / self._hedges_fired if self._hedges_fired else 0.0,
+                "delay": delay,
+            }
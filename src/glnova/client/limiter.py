@@ -0,0 +1,220 @@
+"""In-flight request limiter with priority lanes for the asynchronous client."""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import time
+from collections import deque
+from typing import Any
+
+
+class Priority(str, enum.Enum):
+    """Priority classes of requests."""
+
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+
+DEFAULT_WEIGHTS: dict[Priority, int] = {Priority.INTERACTIVE: 8, Priority.NORMAL: 4, Priority.BULK: 1}
+
+
+class ConcurrencyLimiter:
+    """Cap the number of in-flight requests and share the slots between priority lanes.
+
+    Requests queue in one lane per `Priority`. When a slot frees up, the next request is
+    taken from the lanes in proportion to their weights (stride scheduling), so with the
+    default weights interactive requests get eight slots for every bulk one while a
+    backlog of bulk requests still makes progress. Requests are served in arrival order
+    within a lane.
+
+    A slot counts a request until `release` is called; `AsyncGitLab` calls it once the body
+    of the response has been read, not when the headers arrive.
+    """
+
+    def __init__(self, max_in_flight: int = 10, weights: dict[Priority, int] | None = None) -> None:
+        """Initialize the ConcurrencyLimiter.
+
+        Args:
+            max_in_flight: Maximum number of requests in flight at once.
+            weights: Share of the freed slots given to each lane. Defaults to 8, 4 and 1
+                for interactive, normal and bulk requests.
+
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        if any(weight < 1 for weight in weights.values()):
+            raise ValueError("weights must be at least 1.")
+        self.max_in_flight = max_in_flight
+        self.weights = weights
+        self._in_flight = 0
+        self._queues: dict[Priority, deque[tuple[asyncio.Future[None], float]]] = {
+            priority: deque() for priority in Priority
+        }
+        self._passes: dict[Priority, float] = dict.fromkeys(Priority, 0.0)
+        self._wait_count: dict[Priority, int] = dict.fromkeys(Priority, 0)
+        self._wait_total: dict[Priority, float] = dict.fromkeys(Priority, 0.0)
+        self._wait_max: dict[Priority, float] = dict.fromkeys(Priority, 0.0)
+
+    def __str__(self) -> str:
+        """Return a string representation of the limiter.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<ConcurrencyLimiter in_flight={self._in_flight}/{self.max_in_flight} queued={self.queue_depth()}>"
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests holding a slot.
+
+        Returns:
+            The number of in-flight requests.
+
+        """
+        return self._in_flight
+
+    def queue_depth(self, priority: Priority | str | None = None) -> int:
+        """Return the number of requests waiting for a slot.
+
+        Args:
+            priority: Only count the requests of this lane. Counts every lane if None.
+
+        Returns:
+            The number of queued requests.
+
+        """
+        if priority is not None:
+            return len(self._queues[Priority(priority)])
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _record_wait(self, priority: Priority, seconds: float) -> None:
+        """Record how long a request waited for a slot.
+
+        Args:
+            priority: The lane of the request.
+            seconds: The wait time in seconds.
+
+        """
+        self._wait_count[priority] += 1
+        self._wait_total[priority] += seconds
+        self._wait_max[priority] = max(self._wait_max[priority], seconds)
+
+    async def acquire(self, priority: Priority | str = Priority.NORMAL, timeout: float | None = None) -> None:
+        """Wait for a free slot.
+
+        Args:
+            priority: The lane to queue the request in.
+            timeout: Maximum number of seconds to wait. Waits indefinitely if None.
+
+        Raises:
+            asyncio.TimeoutError: If no slot became free within ``timeout``.
+
+        """
+        priority = Priority(priority)
+        if self._in_flight < self.max_in_flight and self.queue_depth() == 0:
+            self._in_flight += 1
+            self._record_wait(priority, 0.0)
+            return
+
+        queue = self._queues[priority]
+        if not queue:
+            # A lane that was idle must not bank credit; it rejoins at the pace of the busy lanes.
+            active = [self._passes[lane] for lane in Priority if self._queues[lane]]
+            self._passes[priority] = max(self._passes[priority], min(active) if active else max(self._passes.values()))
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (future, time.monotonic())
+        queue.append(entry)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # The slot was handed over while we gave up; pass it on.
+                self.release()
+            else:
+                future.cancel()
+                queue.remove(entry)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next queued request."""
+        while True:
+            lanes = [priority for priority in Priority if self._queues[priority]]
+            if not lanes:
+                self._in_flight -= 1
+                return
+            priority = min(lanes, key=lambda lane: self._passes[lane])
+            future, queued_at = self._queues[priority].popleft()
+            if future.done():
+                continue
+            self._passes[priority] += 1 / self.weights[priority]
+            self._record_wait(priority, time.monotonic() - queued_at)
+            future.set_result(None)
+            return
+
+    def slot(self, priority: Priority | str = Priority.NORMAL, timeout: float | None = None) -> _Slot:
+        """Hold a slot for the duration of an ``async with`` block.
+
+        Args:
+            priority: The lane to queue the request in.
+            timeout: Maximum number of seconds to wait for the slot.
+
+        Returns:
+            An asynchronous context manager.
+
+        """
+        return _Slot(limiter=self, priority=Priority(priority), timeout=timeout)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the occupancy, queue depth and wait times of the limiter.
+
+        Returns:
+            A dictionary with the slot usage and, per lane, the queue depth and the
+            number, mean and maximum of the wait times in seconds.
+
+        """
+        lanes = {}
+        for priority in Priority:
+            count = self._wait_count[priority]
+            lanes[priority.value] = {
+                "queued": len(self._queues[priority]),
+                "admitted": count,
+                "wait_mean": self._wait_total[priority] / count if count else 0.0,
+                "wait_max": self._wait_max[priority],
+            }
+        return {"max_in_flight": self.max_in_flight, "in_flight": self._in_flight, "lanes": lanes}
+
+
+class _Slot:
+    """Asynchronous context manager holding a slot of a `ConcurrencyLimiter`."""
+
+    def __init__(self, limiter: ConcurrencyLimiter, priority: Priority, timeout: float | None) -> None:
+        """Initialize the slot.
+
+        Args:
+            limiter: The limiter to acquire the slot from.
+            priority: The lane to queue the request in.
+            timeout: Maximum number of seconds to wait for the slot.
+
+        """
+        self.limiter = limiter
+        self.priority = priority
+        self.timeout = timeout
+
+    async def __aenter__(self) -> None:
+        """Acquire the slot."""
+        await self.limiter.acquire(priority=self.priority, timeout=self.timeout)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the slot.
+
+        Args:
+            exc_type: The exception type.
+            exc_val: The exception value.
+            exc_tb: The traceback.
+
+        """
+        self.limiter.release()
@@ -0,0 +1,120 @@
+"""Request metrics of the GitLab clients in the Prometheus text exposition format."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from glnova.utils.metrics import DEFAULT_BUCKETS, MetricsRegistry
+
+if TYPE_CHECKING:
+    from glnova.client.base import Client
+    from glnova.client.events import RequestEvent
+
+
+class RequestMetrics:
+    """Standard request metrics of the GitLab clients, fed by their event hooks.
+
+    Clients that are not instrumented register no event hook and skip event collection
+    entirely, so the metrics cost nothing unless they are used.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize the RequestMetrics.
+
+        Args:
+            registry: The registry to create the metrics in. A new one is created if None.
+            buckets: The upper bounds of the buckets of the duration histogram, in seconds.
+
+        """
+        self.registry = registry or MetricsRegistry()
+        self.requests = self.registry.counter(
+            "glnova_requests_total", "Requests sent to the GitLab API.", ("method", "endpoint", "status")
+        )
+        self.duration = self.registry.histogram(
+            "glnova_request_duration_seconds",
+            "Duration of the requests sent to the GitLab API.",
+            ("method", "endpoint"),
+            buckets=buckets,
+        )
+        self.retries = self.registry.counter(
+            "glnova_request_retries_total", "Requests sent again, e.g. after a stale path ID.", ("endpoint",)
+        )
+        self.cache = self.registry.counter(
+            "glnova_cache_requests_total", "Conditional requests by outcome (hit or miss).", ("outcome",)
+        )
+        self.cache_hit_ratio = self.registry.gauge(
+            "glnova_cache_hit_ratio", "Share of the conditional requests answered with 304 Not Modified."
+        )
+        self.throttle = self.registry.counter(
+            "glnova_throttle_seconds_total", "Time requests spent waiting for a slot of the concurrency limiter."
+        )
+        self.in_flight = self.registry.gauge("glnova_requests_in_flight", "Requests being sent.")
+
+    def observe(self, event: RequestEvent) -> None:
+        """Record a request event; usable as an event hook.
+
+        Args:
+            event: The event.
+
+        """
+        status = "error" if event.status is None else str(event.status)
+        self.requests.inc(method=event.method, endpoint=event.endpoint_template, status=status)
+        self.duration.observe(event.timings.get("total", 0.0), method=event.method, endpoint=event.endpoint_template)
+        if event.retries:
+            self.retries.inc(event.retries, endpoint=event.endpoint_template)
+        if event.cache_outcome is not None:
+            self.cache.inc(outcome=event.cache_outcome)
+            hits = self.cache.get(outcome="hit")
+            self.cache_hit_ratio.set(hits / (hits + self.cache.get(outcome="miss")))
+        queue = event.timings.get("queue")
+        if queue:
+            self.throttle.inc(queue)
+
+    def instrument(self, client: Client) -> None:
+        """Record the requests of a client.
+
+        Registers `observe` as an event hook and counts the requests in flight around the
+        method sending them through the middlewares, `_request` for `GitLab` and `_dispatch`
+        for `AsyncGitLab`, so that requests waiting for a slot of the limiter are not counted.
+
+        Args:
+            client: A `GitLab` or `AsyncGitLab` client.
+
+        """
+        if inspect.iscoroutinefunction(client._request):  # type: ignore[attr-defined]
+            dispatch = client._dispatch  # type: ignore[attr-defined]
+
+            @functools.wraps(dispatch)
+            async def tracked_dispatch(*args: Any, **kwargs: Any) -> Any:
+                self.in_flight.inc()
+                try:
+                    return await dispatch(*args, **kwargs)
+                finally:
+                    self.in_flight.dec()
+
+            client._dispatch = tracked_dispatch  # type: ignore[attr-defined]
+        else:
+            request = client._request  # type: ignore[attr-defined]
+
+            @functools.wraps(request)
+            def tracked_request(*args: Any, **kwargs: Any) -> Any:
+                self.in_flight.inc()
+                try:
+                    return request(*args, **kwargs)
+                finally:
+                    self.in_flight.dec()
+
+            client._request = tracked_request  # type: ignore[attr-defined]
+        client.add_event_hook(self.observe)
+
+    def render(self) -> str:
+        """Render the metrics of the registry in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text.
+
+        """
+        return self.registry.render()
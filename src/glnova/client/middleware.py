@@ -0,0 +1,452 @@
+"""Request/response middleware pipeline of the GitLab clients."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+    from requests import Response
+
+    from glnova.client.base import Client
+    from glnova.client.deadline import Deadline
+
+
+# Number of times the on-error hooks may recover a request before its errors propagate.
+MAX_RECOVERIES = 10
+
+
+class Request:
+    """Description of a request as it travels through the middlewares."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, Any] | None = None,
+        etag: str | None = None,
+        timeout: float = 30,
+        deadline: Deadline | None = None,
+        kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the Request.
+
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            endpoint: The API endpoint.
+            headers: Headers given by the caller.
+            etag: The ETag value for conditional requests.
+            timeout: Timeout for the request in seconds.
+            deadline: Optional deadline of the enclosing operation.
+            kwargs: Additional arguments for the HTTP library, e.g. ``params`` or ``json``.
+
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.headers: dict[str, Any] = dict(headers or {})
+        self.etag = etag
+        self.timeout = timeout
+        self.deadline = deadline
+        self.kwargs: dict[str, Any] = dict(kwargs or {})
+        self.context: dict[str, Any] = {}
+        self._send: Callable[[Request], Any] | None = None
+
+    def __str__(self) -> str:
+        """Return a string representation of the request.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<Request method={self.method} endpoint={self.endpoint}>"
+
+    def send(self) -> Any:
+        """Send the request through the transport again, bypassing the middlewares.
+
+        Lets ``on_error`` hooks retry a request. For the asynchronous client the result must be awaited.
+
+        Returns:
+            The response, or an awaitable of it for the asynchronous client.
+
+        """
+        if self._send is None:
+            raise RuntimeError("The request is not being processed by a middleware pipeline.")
+        return self._send(self)
+
+
+class Middleware:
+    """Base class of the middlewares of the synchronous client.
+
+    ``before_request`` hooks run in order, ``after_response`` and ``on_error`` hooks in
+    reverse order, so the first middleware wraps all the others. Override only the hooks you need.
+    """
+
+    def before_request(self, client: Client, request: Request) -> None:
+        """Prepare the request before it is sent.
+
+        Args:
+            client: The client sending the request.
+            request: The request; may be modified in place.
+
+        """
+
+    def after_response(self, client: Client, request: Request, response: Response) -> Response:
+        """Process the response.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+            response: The response.
+
+        Returns:
+            The response passed on to the next middleware.
+
+        """
+        return response
+
+    def on_error(self, client: Client, request: Request, error: Exception) -> Response | None:
+        """Handle an error raised while sending the request or processing the response.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+            error: The error.
+
+        Returns:
+            A response to recover with, or None to let the error propagate.
+
+        """
+        return None
+
+
+class AsyncMiddleware:
+    """Base class of the middlewares of the asynchronous client.
+
+    The hooks mirror those of `Middleware` and run in the same order.
+    """
+
+    async def before_request(self, client: Client, request: Request) -> None:
+        """Prepare the request before it is sent.
+
+        Args:
+            client: The client sending the request.
+            request: The request; may be modified in place.
+
+        """
+
+    async def after_response(self, client: Client, request: Request, response: ClientResponse) -> ClientResponse:
+        """Process the response.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+            response: The response.
+
+        Returns:
+            The response passed on to the next middleware.
+
+        """
+        return response
+
+    async def on_error(self, client: Client, request: Request, error: Exception) -> ClientResponse | None:
+        """Handle an error raised while sending the request or processing the response.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+            error: The error.
+
+        Returns:
+            A response to recover with, or None to let the error propagate.
+
+        """
+        return None
+
+
+def _merge_headers(client: Client, request: Request) -> None:
+    """Put the client headers, e.g. authorization, under the headers of the request.
+
+    Args:
+        client: The client sending the request.
+        request: The request.
+
+    """
+    request.headers = {**client.headers, **request.headers}
+
+
+def _add_conditional_headers(client: Client, request: Request) -> None:
+    """Add the conditional request headers derived from the ETag of the request.
+
+    Args:
+        client: The client sending the request.
+        request: The request.
+
+    """
+    request.headers = {**client._get_conditional_request_headers(etag=request.etag), **request.headers}
+
+
+class HeadersMiddleware(Middleware):
+    """Merge the client headers into every request."""
+
+    def before_request(self, client: Client, request: Request) -> None:
+        """Merge the client headers into the request.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+
+        """
+        _merge_headers(client=client, request=request)
+
+
+class AsyncHeadersMiddleware(AsyncMiddleware):
+    """Merge the client headers into every request."""
+
+    async def before_request(self, client: Client, request: Request) -> None:
+        """Merge the client headers into the request.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+
+        """
+        _merge_headers(client=client, request=request)
+
+
+class ConditionalRequestMiddleware(Middleware):
+    """Send ``If-None-Match`` for requests that carry an ETag."""
+
+    def before_request(self, client: Client, request: Request) -> None:
+        """Add the conditional request headers.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+
+        """
+        _add_conditional_headers(client=client, request=request)
+
+
+class AsyncConditionalRequestMiddleware(AsyncMiddleware):
+    """Send ``If-None-Match`` for requests that carry an ETag."""
+
+    async def before_request(self, client: Client, request: Request) -> None:
+        """Add the conditional request headers.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+
+        """
+        _add_conditional_headers(client=client, request=request)
+
+
+class RaiseForStatusMiddleware(Middleware):
+    """Raise `requests.HTTPError` for 4xx and 5xx responses."""
+
+    def after_response(self, client: Client, request: Request, response: Response) -> Response:
+        """Raise for error statuses, closing the response first.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+            response: The response.
+
+        Returns:
+            The response.
+
+        """
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        return response
+
+
+class AsyncRaiseForStatusMiddleware(AsyncMiddleware):
+    """Raise `aiohttp.ClientResponseError` for 4xx and 5xx responses."""
+
+    async def after_response(self, client: Client, request: Request, response: ClientResponse) -> ClientResponse:
+        """Raise for error statuses, releasing the response first.
+
+        Args:
+            client: The client sending the request.
+            request: The request.
+            response: The response.
+
+        Returns:
+            The response.
+
+        """
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.release()
+            raise
+        return response
+
+
+def default_middlewares() -> list[Middleware]:
+    """Return the middlewares implementing the built-in behavior of the synchronous client.
+
+    Returns:
+        The header merging, conditional request and raise-for-status middlewares.
+
+    """
+    return [HeadersMiddleware(), ConditionalRequestMiddleware(), RaiseForStatusMiddleware()]
+
+
+def default_async_middlewares() -> list[AsyncMiddleware]:
+    """Return the middlewares implementing the built-in behavior of the asynchronous client.
+
+    Returns:
+        The header merging, conditional request and raise-for-status middlewares.
+
+    """
+    return [AsyncHeadersMiddleware(), AsyncConditionalRequestMiddleware(), AsyncRaiseForStatusMiddleware()]
+
+
+def run_middlewares(
+    middlewares: Sequence[Middleware],
+    client: Client,
+    request: Request,
+    send: Callable[[Request], Response],
+) -> Response:
+    """Send a request through a middleware pipeline.
+
+    A response returned by an ``on_error`` hook goes through the ``after_response`` hooks
+    again, starting with the one that raised, so e.g. a retried request is still checked for
+    its status whatever the order of the middlewares. After `MAX_RECOVERIES` recoveries, errors
+    propagate, so hooks rejecting every recovered response cannot loop forever.
+
+    Args:
+        middlewares: The middlewares, outermost first.
+        client: The client sending the request.
+        request: The request.
+        send: The transport sending the prepared request.
+
+    Returns:
+        The response returned by the outermost middleware.
+
+    """
+    request._send = send
+    recoveries = 0
+    try:
+        for middleware in middlewares:
+            middleware.before_request(client, request)
+        response = send(request)
+    except Exception as e:
+        recovered = _recover(middlewares, client, request, e)
+        if recovered is None:
+            raise
+        recoveries += 1
+        response = recovered
+    hooks = list(reversed(middlewares))
+    index = 0
+    while index < len(hooks):
+        try:
+            response = hooks[index].after_response(client, request, response)
+        except Exception as e:
+            recovered = None if recoveries >= MAX_RECOVERIES else _recover(middlewares, client, request, e)
+            if recovered is None:
+                raise
+            recoveries += 1
+            response = recovered
+            continue
+        index += 1
+    return response
+
+
+def _recover(middlewares: Sequence[Middleware], client: Client, request: Request, error: Exception) -> Response | None:
+    """Run the on-error hooks until one of them recovers.
+
+    Args:
+        middlewares: The middlewares, outermost first.
+        client: The client sending the request.
+        request: The request.
+        error: The error.
+
+    Returns:
+        The response of the first hook recovering from the error, or None.
+
+    """
+    for middleware in reversed(middlewares):
+        recovered = middleware.on_error(client, request, error)
+        if recovered is not None:
+            return recovered
+    return None
+
+
+async def run_async_middlewares(
+    middlewares: Sequence[AsyncMiddleware],
+    client: Client,
+    request: Request,
+    send: Callable[[Request], Awaitable[ClientResponse]],
+) -> ClientResponse:
+    """Send a request through an asynchronous middleware pipeline.
+
+    Responses returned by ``on_error`` hooks are processed as in :func:`run_middlewares`.
+
+    Args:
+        middlewares: The middlewares, outermost first.
+        client: The client sending the request.
+        request: The request.
+        send: The transport sending the prepared request.
+
+    Returns:
+        The response returned by the outermost middleware.
+
+    """
+    request._send = send
+    recoveries = 0
+    try:
+        for middleware in middlewares:
+            await middleware.before_request(client, request)
+        response = await send(request)
+    except Exception as e:
+        recovered = await _async_recover(middlewares, client, request, e)
+        if recovered is None:
+            raise
+        recoveries += 1
+        response = recovered
+    hooks = list(reversed(middlewares))
+    index = 0
+    while index < len(hooks):
+        try:
+            response = await hooks[index].after_response(client, request, response)
+        except Exception as e:
+            recovered = None if recoveries >= MAX_RECOVERIES else await _async_recover(middlewares, client, request, e)
+            if recovered is None:
+                raise
+            recoveries += 1
+            response = recovered
+            continue
+        index += 1
+    return response
+
+
+async def _async_recover(
+    middlewares: Sequence[AsyncMiddleware],
+    client: Client,
+    request: Request,
+    error: Exception,
+) -> ClientResponse | None:
+    """Run the asynchronous on-error hooks until one of them recovers.
+
+    Args:
+        middlewares: The middlewares, outermost first.
+        client: The client sending the request.
+        request: The request.
+        error: The error.
+
+    Returns:
+        The response of the first hook recovering from the error, or None.
+
+    """
+    for middleware in reversed(middlewares):
+        recovered = await middleware.on_error(client, request, error)
+        if recovered is not None:
+            return recovered
+    return None
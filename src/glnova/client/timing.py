@@ -0,0 +1,233 @@
+"""Collection of the phase timings of HTTP requests.
+
+The synchronous client times connections with instrumented urllib3 connection classes
+and the time to first byte and body download in `TimingHTTPAdapter` or `Urllib3Transport`.
+The asynchronous client gets the same phases from an aiohttp `TraceConfig`. Timings are
+written into the dictionary of the request being collected, if any, so the
+instrumentation costs next to nothing when no event hooks are registered.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
+from urllib3.connection import HTTPConnection, HTTPSConnection
+
+if TYPE_CHECKING:
+    from aiohttp import TraceConfig
+
+_local = threading.local()
+
+
+def get_current_timings() -> dict[str, float] | None:
+    """Get the timings dictionary of the request sent by the current thread.
+
+    Returns:
+        The dictionary, or None if no timings are being collected.
+
+    """
+    return getattr(_local, "timings", None)
+
+
+@contextmanager
+def collect_timings(timings: dict[str, float]) -> Iterator[dict[str, float]]:
+    """Collect the phase timings of the requests sent by the current thread.
+
+    Args:
+        timings: Dictionary receiving the phase durations in seconds.
+
+    Yields:
+        The dictionary.
+
+    """
+    previous = get_current_timings()
+    _local.timings = timings
+    try:
+        yield timings
+    finally:
+        _local.timings = previous
+
+
+def add_timing(phase: str, seconds: float) -> None:
+    """Add a duration to a phase of the request sent by the current thread, if collecting.
+
+    Args:
+        phase: The phase, e.g. "connect".
+        seconds: The duration in seconds.
+
+    """
+    timings = get_current_timings()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+class TimingHTTPConnection(HTTPConnection):
+    """HTTP connection timing the establishment of its socket."""
+
+    def _new_conn(self) -> Any:
+        """Open the socket, timing DNS resolution and TCP connect together.
+
+        Returns:
+            The socket.
+
+        """
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            add_timing("connect", time.perf_counter() - start)
+
+
+class TimingHTTPSConnection(HTTPSConnection):
+    """HTTPS connection timing the establishment of its socket and the TLS handshake."""
+
+    def _new_conn(self) -> Any:
+        """Open the socket, timing DNS resolution and TCP connect together.
+
+        Returns:
+            The socket.
+
+        """
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._connect_time = time.perf_counter() - start
+            add_timing("connect", self._connect_time)
+
+    def connect(self) -> None:
+        """Connect, timing the TLS handshake as the time not spent opening the socket."""
+        self._connect_time = 0.0
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            add_timing("tls", time.perf_counter() - start - self._connect_time)
+
+
+class _TimingHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool of timing HTTP connections."""
+
+    ConnectionCls = TimingHTTPConnection
+
+
+class _TimingHTTPSConnectionPool(HTTPSConnectionPool):
+    """Connection pool of timing HTTPS connections."""
+
+    ConnectionCls = TimingHTTPSConnection
+
+
+def install_timing(pool_manager: PoolManager) -> PoolManager:
+    """Make a pool manager open timing connections.
+
+    Args:
+        pool_manager: The pool manager, before it has opened any pool.
+
+    Returns:
+        The pool manager.
+
+    """
+    pool_manager.pool_classes_by_scheme = {"http": _TimingHTTPConnectionPool, "https": _TimingHTTPSConnectionPool}
+    return pool_manager
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """`requests` transport adapter recording connection, time to first byte and body timings."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with timing connections.
+
+        Args:
+            *args: Positional arguments for `HTTPAdapter.init_poolmanager`.
+            **kwargs: Keyword arguments for `HTTPAdapter.init_poolmanager`.
+
+        """
+        super().init_poolmanager(*args, **kwargs)
+        install_timing(self.poolmanager)
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        """Send a request, timing the response headers and, unless streaming, the body.
+
+        Args:
+            request: The prepared request.
+            *args: Positional arguments for `HTTPAdapter.send`.
+            **kwargs: Keyword arguments for `HTTPAdapter.send`.
+
+        Returns:
+            The response.
+
+        """
+        if get_current_timings() is None:
+            return super().send(request, *args, **kwargs)
+        start = time.perf_counter()
+        response = super().send(request, *args, **kwargs)
+        headers_received = time.perf_counter()
+        add_timing("ttfb", headers_received - start)
+        if not kwargs.get("stream"):
+            _ = response.content
+            add_timing("body", time.perf_counter() - headers_received)
+        return response
+
+
+def create_trace_config() -> TraceConfig:
+    """Create an aiohttp trace config recording the phase timings of a request.
+
+    The timings dictionary is passed to the request as ``trace_request_ctx``; requests
+    without one are not traced. aiohttp opens TLS connections in one step, so ``connect``
+    includes the TLS handshake, and ``ttfb`` runs from the start of the request to the
+    response headers.
+
+    Returns:
+        The trace config.
+
+    """
+    from aiohttp import TraceConfig  # noqa: PLC0415
+
+    def marks(context: SimpleNamespace) -> dict[str, float] | None:
+        timings = context.trace_request_ctx
+        return timings if isinstance(timings, dict) else None
+
+    async def on_request_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+        if marks(context) is not None:
+            context.request_start = time.perf_counter()
+
+    async def on_dns_resolvehost_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+        if marks(context) is not None:
+            context.dns_start = time.perf_counter()
+
+    async def on_dns_resolvehost_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+        timings = marks(context)
+        if timings is not None and hasattr(context, "dns_start"):
+            context.dns_time = time.perf_counter() - context.dns_start
+            timings["dns"] = timings.get("dns", 0.0) + context.dns_time
+
+    async def on_connection_create_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+        if marks(context) is not None:
+            context.connect_start = time.perf_counter()
+
+    async def on_connection_create_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+        timings = marks(context)
+        if timings is not None and hasattr(context, "connect_start"):
+            elapsed = time.perf_counter() - context.connect_start - getattr(context, "dns_time", 0.0)
+            timings["connect"] = timings.get("connect", 0.0) + elapsed
+
+    async def on_request_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+        timings = marks(context)
+        if timings is not None and hasattr(context, "request_start"):
+            timings["ttfb"] = timings.get("ttfb", 0.0) + time.perf_counter() - context.request_start
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
@@ -0,0 +1,321 @@
+"""Recording of the requests of a client session to HAR or JSONL trace files."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from glnova.version import __version__
+
+if TYPE_CHECKING:
+    from glnova.client.base import Client
+    from glnova.client.events import RequestEvent
+
+TraceFormat = Literal["jsonl", "har"]
+
+REDACTED = "[REDACTED]"
+
+_SENSITIVE_PATTERN = re.compile(r"token|password|secret|authorization|private", re.IGNORECASE)
+
+
+def _redact_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Replace the values of sensitive query parameters.
+
+    Args:
+        params: The query parameters.
+
+    Returns:
+        A copy of the parameters with the values of e.g. ``private_token`` redacted.
+
+    """
+    return {key: REDACTED if _SENSITIVE_PATTERN.search(key) else value for key, value in params.items()}
+
+
+def _redact_url(url: str | None) -> str | None:
+    """Redact the sensitive query parameters and credentials of a URL.
+
+    Args:
+        url: The URL.
+
+    Returns:
+        The redacted URL.
+
+    """
+    if not url:
+        return url
+    parts = urlsplit(url)
+    netloc = parts.netloc.rsplit("@", 1)[-1]
+    query = urlencode(_redact_params(dict(parse_qsl(parts.query, keep_blank_values=True))))
+    return urlunsplit((parts.scheme, netloc, parts.path, query, parts.fragment))
+
+
+def _get_entry(event: RequestEvent, started: datetime) -> dict[str, Any]:
+    """Convert a request event to a redacted trace entry.
+
+    Args:
+        event: The event.
+        started: When the request started.
+
+    Returns:
+        The fields of the event with the start time, the URL and the parameters redacted.
+
+    """
+    entry = event.as_dict()
+    entry["started"] = started.isoformat()
+    entry["url"] = _redact_url(event.url)
+    entry["params"] = _redact_params(event.params)
+    return entry
+
+
+def _get_har_entry(entry: dict[str, Any]) -> dict[str, Any]:
+    """Convert a trace entry to a HAR 1.2 entry.
+
+    The trace entry is kept under ``_glnova`` so that HAR files can be summarized like JSONL files.
+
+    Args:
+        entry: The trace entry.
+
+    Returns:
+        The HAR entry.
+
+    """
+    timings = entry["timings"]
+
+    def milliseconds(*phases: str) -> float:
+        values = [timings[phase] for phase in phases if phase in timings]
+        return round(sum(values) * 1000, 3) if values else -1
+
+    size = entry["bytes"]
+    return {
+        "startedDateTime": entry["started"],
+        "time": milliseconds("total"),
+        "request": {
+            "method": entry["method"],
+            "url": entry["url"] or entry["endpoint"],
+            "httpVersion": "HTTP/1.1",
+            "cookies": [],
+            "headers": [],
+            "queryString": [{"name": key, "value": str(value)} for key, value in entry["params"].items()],
+            "headersSize": -1,
+            "bodySize": entry["request_bytes"],
+        },
+        "response": {
+            "status": entry["status"] or 0,
+            "statusText": entry["error"] or "",
+            "httpVersion": "HTTP/1.1",
+            "cookies": [],
+            "headers": [],
+            "content": {"size": -1 if size is None else size, "mimeType": "application/json"},
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": -1 if size is None else size,
+        },
+        "cache": {},
+        "timings": {
+            "blocked": milliseconds("queue"),
+            "dns": milliseconds("dns"),
+            "connect": milliseconds("connect", "tls"),
+            "ssl": milliseconds("tls"),
+            "send": 0,
+            "wait": milliseconds("ttfb"),
+            "receive": milliseconds("body"),
+        },
+        "_glnova": entry,
+    }
+
+
+class TraceRecorder:
+    """Event hook writing every request of the clients it is attached to into a trace file.
+
+    JSONL traces are written one line per request as requests complete. HAR traces are
+    written when the recorder is closed. Query parameters that look like credentials,
+    e.g. ``private_token``, are redacted; request headers are never recorded.
+    """
+
+    def __init__(self, path: str | Path, trace_format: TraceFormat | None = None) -> None:
+        """Initialize the TraceRecorder.
+
+        Args:
+            path: The trace file, overwritten if it exists.
+            trace_format: "jsonl" or "har". Defaults to "har" for paths ending in ``.har``, "jsonl" otherwise.
+
+        """
+        self.path = Path(path)
+        self.trace_format: TraceFormat = trace_format or ("har" if self.path.suffix.lower() == ".har" else "jsonl")
+        if self.trace_format not in ("jsonl", "har"):
+            raise ValueError(f"Unsupported trace format: {self.trace_format}.")
+        self._lock = threading.Lock()
+        self._entries: list[dict[str, Any]] = []
+        self._file: IO[str] | None = self.path.open("w", encoding="utf-8") if self.trace_format == "jsonl" else None
+        self._closed = False
+
+    def __str__(self) -> str:
+        """Return a string representation of the recorder.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<TraceRecorder path={self.path} format={self.trace_format}>"
+
+    def __enter__(self) -> TraceRecorder:
+        """Enter the context manager.
+
+        Returns:
+            The recorder.
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the context manager, closing the trace file.
+
+        Args:
+            exc_type: The exception type.
+            exc_val: The exception value.
+            exc_tb: The traceback.
+
+        """
+        self.close()
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Record a request event.
+
+        Args:
+            event: The event.
+
+        """
+        started = datetime.now(timezone.utc) - timedelta(seconds=event.timings.get("total", 0.0))
+        entry = _get_entry(event=event, started=started)
+        with self._lock:
+            if self._closed:
+                return
+            if self._file is not None:
+                self._file.write(json.dumps(entry, default=str) + "\n")
+                self._file.flush()
+            else:
+                self._entries.append(entry)
+
+    def attach(self, client: Client) -> None:
+        """Record the requests of a client.
+
+        Args:
+            client: A `GitLab` or `AsyncGitLab` client.
+
+        """
+        client.add_event_hook(self)
+
+    def close(self) -> None:
+        """Stop recording and write the HAR file or close the JSONL file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                return
+            har = {
+                "log": {
+                    "version": "1.2",
+                    "creator": {"name": "glnova", "version": __version__},
+                    "entries": [_get_har_entry(entry) for entry in self._entries],
+                }
+            }
+            self.path.write_text(json.dumps(har, indent=2, default=str), encoding="utf-8")
+
+
+def load_trace(path: str | Path) -> list[dict[str, Any]]:
+    """Load the entries of a trace file written by `TraceRecorder`.
+
+    Args:
+        path: The HAR or JSONL trace file.
+
+    Returns:
+        The trace entries.
+
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    stripped = text.lstrip()
+    if stripped.startswith("{") and '"log"' in stripped[:100]:
+        try:
+            har = json.loads(text)
+        except json.JSONDecodeError:
+            har = None
+        if isinstance(har, dict) and "log" in har:
+            return [entry["_glnova"] for entry in har["log"].get("entries", []) if "_glnova" in entry]
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def summarize_trace(entries: list[dict[str, Any]], top: int = 10) -> dict[str, Any]:
+    """Aggregate trace entries by endpoint and find slow and repeated requests.
+
+    Args:
+        entries: The trace entries, as returned by `load_trace`.
+        top: Number of slowest requests to report.
+
+    Returns:
+        A dictionary with the overall totals, per endpoint template statistics sorted by total
+        time, the slowest requests, and the identical requests (same method, URL and
+        parameters) that were sent more than once.
+
+    """
+    groups: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+    for entry in entries:
+        groups[(entry["method"], entry["endpoint_template"])].append(entry)
+
+    endpoints = []
+    for (method, template), group in groups.items():
+        durations = sorted(entry["timings"].get("total", 0.0) for entry in group)
+        endpoints.append(
+            {
+                "method": method,
+                "endpoint": template,
+                "count": len(group),
+                "total_time": sum(durations),
+                "mean_time": sum(durations) / len(durations),
+                "p95_time": durations[min(len(durations) - 1, int(0.95 * len(durations)))],
+                "max_time": durations[-1],
+                "bytes": sum(entry.get("bytes") or 0 for entry in group),
+                "errors": sum(1 for entry in group if entry.get("error")),
+                "retries": sum(entry.get("retries", 0) for entry in group),
+                "cache_hits": sum(1 for entry in group if entry.get("cache_outcome") == "hit"),
+            }
+        )
+    endpoints.sort(key=lambda item: item["total_time"], reverse=True)
+
+    slowest = sorted(entries, key=lambda entry: entry["timings"].get("total", 0.0), reverse=True)[:top]
+
+    def key(entry: dict[str, Any]) -> tuple[str, str, str]:
+        url = entry.get("url") or entry["endpoint"]
+        return entry["method"], url, json.dumps(entry.get("params") or {}, sort_keys=True, default=str)
+
+    counts = Counter(key(entry) for entry in entries)
+    repeated = [
+        {"method": method, "url": url, "params": json.loads(params), "count": count}
+        for (method, url, params), count in counts.most_common()
+        if count > 1
+    ]
+
+    return {
+        "requests": len(entries),
+        "total_time": sum(entry["timings"].get("total", 0.0) for entry in entries),
+        "bytes": sum(entry.get("bytes") or 0 for entry in entries),
+        "endpoints": endpoints,
+        "slowest": [
+            {
+                "method": entry["method"],
+                "url": entry.get("url") or entry["endpoint"],
+                "status": entry.get("status"),
+                "time": entry["timings"].get("total", 0.0),
+                "started": entry.get("started"),
+            }
+            for entry in slowest
+        ],
+        "repeated": repeated,
+    }
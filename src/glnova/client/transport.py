@@ -0,0 +1,331 @@
+"""Transports sending the requests of the GitLab clients."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from json import dumps
+from typing import TYPE_CHECKING, Any, Protocol
+from urllib.parse import urlencode, urlsplit
+
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from glnova.client.timing import TimingHTTPAdapter, add_timing, install_timing
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+
+
+class Transport(Protocol):
+    """Interface of the objects sending the HTTP requests of `GitLab`.
+
+    `requests.Session` is a transport, and the default one.
+    """
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send an HTTP request.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            **kwargs: ``headers``, ``timeout``, ``params``, ``json`` or ``data``.
+
+        Returns:
+            The HTTP response.
+
+        """
+        ...
+
+    def close(self) -> None:
+        """Release the connections of the transport."""
+        ...
+
+
+class AsyncTransport(Protocol):
+    """Interface of the objects sending the HTTP requests of `AsyncGitLab`.
+
+    `aiohttp.ClientSession` is an asynchronous transport, and the default one.
+    """
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the transport has been closed.
+
+        Returns:
+            True if it was closed.
+
+        """
+        ...
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> ClientResponse:
+        """Send an HTTP request.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            **kwargs: ``headers``, ``timeout``, ``params``, ``json``, ``data`` or ``trace_request_ctx``.
+
+        Returns:
+            The HTTP response.
+
+        """
+        ...
+
+    async def close(self) -> None:
+        """Release the connections of the transport."""
+        ...
+
+
+_default_transport: Callable[[], Transport] | None = None
+
+
+def create_session() -> requests.Session:
+    """Create the default transport of `GitLab`, a `requests.Session` recording connection timings.
+
+    Returns:
+        The session.
+
+    """
+    session = requests.Session()
+    adapter = TimingHTTPAdapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def set_default_transport(factory: Callable[[], Transport] | None) -> None:
+    """Set the transport factory of the `GitLab` clients created without one afterwards.
+
+    Lets a long-running process, such as ``glnova daemon``, share warm connections between
+    the clients built by code it does not control.
+
+    Args:
+        factory: The transport factory, or None to go back to a new `requests.Session` per client.
+
+    """
+    global _default_transport  # noqa: PLW0603
+    _default_transport = factory
+
+
+def get_default_transport() -> Callable[[], Transport] | None:
+    """Get the transport factory of the `GitLab` clients created without one.
+
+    Returns:
+        The factory set with `set_default_transport`, if any.
+
+    """
+    return _default_transport
+
+
+def _encode(values: dict[str, Any]) -> str:
+    """Form-encode a mapping the way `requests` does, dropping None values.
+
+    Args:
+        values: The values to encode. Lists and tuples become repeated keys.
+
+    Returns:
+        The encoded string.
+
+    """
+    return urlencode([(key, value) for key, value in values.items() if value is not None], doseq=True)
+
+
+class Urllib3Transport:
+    """Lean transport sending requests straight through a `urllib3.PoolManager`.
+
+    It skips the per-call work of `requests.Session` (request preparation, environment
+    and cookie merging, hooks and adapters) while returning regular `requests.Response`
+    objects and raising `requests` exceptions, so the rest of the client is unaffected.
+    Only the request arguments used by glnova are supported: ``headers``, ``timeout``,
+    ``params``, ``json``, ``data`` and ``stream``.
+    """
+
+    def __init__(self, num_pools: int = 10, maxsize: int = 10, pool_manager: urllib3.PoolManager | None = None) -> None:
+        """Initialize the Urllib3Transport.
+
+        Args:
+            num_pools: Number of hosts to keep connection pools for.
+            maxsize: Number of connections to keep per host.
+            pool_manager: Pool manager to use instead of creating one. Connection timings are only
+                recorded for the pool manager created by the transport.
+
+        """
+        self.pool_manager = pool_manager or install_timing(
+            urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize, retries=False)
+        )
+
+    def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        data: dict[str, Any] | str | bytes | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send an HTTP request.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            headers: The request headers.
+            timeout: Total timeout in seconds.
+            params: Query string parameters.
+            json: Body to send as JSON.
+            data: Body to send form-encoded if it is a mapping, or as is.
+            stream: Whether to leave the body unread, to be read with ``iter_content`` and released
+                with ``close``, as with `requests`.
+
+        Returns:
+            The HTTP response.
+
+        Raises:
+            requests.Timeout: If the request timed out.
+            requests.ConnectionError: If the request failed at the connection level.
+
+        """
+        headers = dict(headers or {})
+        if params:
+            query = _encode(params)
+            if query:
+                url = f"{url}{'&' if '?' in url else '?'}{query}"
+        body: str | bytes | None = None
+        if json is not None:
+            body = dumps(json).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+        elif isinstance(data, dict):
+            body = _encode(data)
+            headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+        elif data is not None:
+            body = data
+        start = time.perf_counter()
+        try:
+            raw = self.pool_manager.request(
+                method,
+                url,
+                body=body,
+                headers=headers,
+                timeout=urllib3.Timeout(total=timeout) if timeout is not None else None,
+                preload_content=False,
+            )
+            headers_received = time.perf_counter()
+            if not stream:
+                try:
+                    content = raw.read()
+                finally:
+                    raw.release_conn()
+        except urllib3.exceptions.NewConnectionError as e:
+            # Checked first: urllib3 derives it from ConnectTimeoutError for backwards compatibility.
+            raise requests.ConnectionError(e) from e
+        except urllib3.exceptions.TimeoutError as e:
+            raise requests.Timeout(e) from e
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.ConnectionError(e) from e
+        add_timing("ttfb", headers_received - start)
+
+        response = requests.Response()
+        response.status_code = raw.status
+        response.headers = CaseInsensitiveDict(raw.headers)
+        if stream:
+            # Read lazily by requests, which releases the connection when the response is closed.
+            response.raw = raw
+        else:
+            add_timing("body", time.perf_counter() - headers_received)
+            response._content = content
+            response._content_consumed = True
+        response.reason = raw.reason or ""
+        response.url = url
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool_manager.clear()
+
+
+class SharedTransport:
+    """Transport sharing `requests.Session` objects, and their connection pools, between clients.
+
+    Every GitLab host and token gets its own sessions, so the cookies set for one account are
+    never sent on behalf of another. A session sends one request at a time: concurrent requests,
+    e.g. from the threads of a command, check out separate sessions, which are kept for later
+    requests. Clients close their transport when they exit; closing a shared transport keeps the
+    connections open for the next client, until `shutdown` is called.
+    """
+
+    def __init__(self, session_factory: Callable[[], requests.Session] = create_session) -> None:
+        """Initialize the SharedTransport.
+
+        Args:
+            session_factory: Factory of the sessions. Defaults to `create_session`.
+
+        """
+        self.session_factory = session_factory
+        self.requests = 0
+        self._idle: dict[tuple[str, str | None], list[requests.Session]] = {}
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        """Return a string representation of the transport.
+
+        Returns:
+            str: String representation.
+
+        """
+        return f"<SharedTransport sessions={len(self._sessions)} requests={self.requests}>"
+
+    def __call__(self) -> SharedTransport:
+        """Return the transport itself, so that it can be used as a transport factory.
+
+        Returns:
+            The transport.
+
+        """
+        return self
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send an HTTP request over an idle session of the host and token of the request.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            **kwargs: Arguments of `requests.Session.request`.
+
+        Returns:
+            The HTTP response.
+
+        """
+        parts = urlsplit(url)
+        key = (f"{parts.scheme}://{parts.netloc}", (kwargs.get("headers") or {}).get("Authorization"))
+        with self._lock:
+            self.requests += 1
+            idle = self._idle.setdefault(key, [])
+            session = idle.pop() if idle else None
+        if session is None:
+            session = self.session_factory()
+            with self._lock:
+                self._sessions.append(session)
+        try:
+            return session.request(method, url, **kwargs)
+        finally:
+            with self._lock:
+                idle.append(session)
+
+    def close(self) -> None:
+        """Keep the connections open for the next client."""
+
+    def shutdown(self) -> None:
+        """Close the pooled connections."""
+        with self._lock:
+            sessions = self._sessions
+            self._sessions = []
+            self._idle = {}
+        for session in sessions:
+            session.close()
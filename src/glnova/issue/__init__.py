@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from glnova.issue.async_issue import AsyncIssue
-from glnova.issue.issue import Issue
+from typing import TYPE_CHECKING
+
+from glnova.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from glnova.issue.async_issue import AsyncIssue
+    from glnova.issue.issue import Issue
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncIssue": "glnova.issue.async_issue",
+        "Issue": "glnova.issue.issue",
+    },
+)
 
 __all__ = ["AsyncIssue", "Issue"]
@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
-from glnova.merge_request.async_merge_request import AsyncMergeRequest
-from glnova.merge_request.merge_request import MergeRequest
+from typing import TYPE_CHECKING
+
+from glnova.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from glnova.merge_request.async_merge_request import AsyncMergeRequest
+    from glnova.merge_request.merge_request import MergeRequest
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncMergeRequest": "glnova.merge_request.async_merge_request",
+        "MergeRequest": "glnova.merge_request.merge_request",
+    },
+)
 
 __all__ = [
     "AsyncMergeRequest",
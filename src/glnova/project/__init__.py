@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from glnova.project.async_project import AsyncProject
-from glnova.project.project import Project
+from typing import TYPE_CHECKING
+
+from glnova.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from glnova.project.async_project import AsyncProject
+    from glnova.project.project import Project
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncProject": "glnova.project.async_project",
+        "Project": "glnova.project.project",
+    },
+)
 
 __all__ = ["AsyncProject", "Project"]
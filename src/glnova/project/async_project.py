@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import date, datetime
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from aiohttp import ClientResponse
 
+from glnova.client.adaptive import gather_adaptive
+from glnova.client.base import MAX_PER_PAGE
 from glnova.project.base import BaseProject
 from glnova.resource.async_resource import AsyncResource
+from glnova.utils.exception import DeadlineExceededError
 from glnova.utils.response import process_async_response_with_last_modified
 
+if TYPE_CHECKING:
+    from glnova.client.adaptive import AIMDController
+    from glnova.client.deadline import Deadline
+
+logger = logging.getLogger("glnova")
+
 
 class AsyncProject(AsyncResource, BaseProject):
     """Asynchronous GitLab Project resource."""
@@ -70,6 +80,8 @@ class AsyncProject(AsyncResource, BaseProject):
         with_shared: bool | None = None,
         include_subgroups: bool | None = None,
         with_security_reports: bool | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
         etag: str | None = None,
         **kwargs: Any,
     ) -> ClientResponse:
@@ -113,6 +125,8 @@ class AsyncProject(AsyncResource, BaseProject):
             with_shared: Include shared projects (for group projects). Defaults to None.
             include_subgroups: Include subgroup projects (for group projects). Defaults to None.
             with_security_reports: Include security reports (for group projects). Defaults to None.
+            page: Page number for pagination. Defaults to None.
+            per_page: Number of items per page for pagination. Defaults to None.
             etag: ETag for caching. Defaults to None.
             **kwargs: Additional keyword arguments.
 
@@ -158,6 +172,8 @@ class AsyncProject(AsyncResource, BaseProject):
             with_shared=with_shared,
             include_subgroups=include_subgroups,
             with_security_reports=with_security_reports,
+            page=page,
+            per_page=per_page,
         )
         return await self._get(endpoint, params=params, etag=etag, **kwargs)
 
@@ -216,6 +232,8 @@ class AsyncProject(AsyncResource, BaseProject):
         with_shared: bool | None = None,
         include_subgroups: bool | None = None,
         with_security_reports: bool | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
         etag: str | None = None,
         **kwargs: Any,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
@@ -259,6 +277,8 @@ class AsyncProject(AsyncResource, BaseProject):
             with_shared: Include shared projects (for group projects). Defaults to None.
             include_subgroups: Include subgroup projects (for group projects). Defaults to None.
             with_security_reports: Include security reports (for group projects). Defaults to None.
+            page: Page number for pagination. Defaults to None.
+            per_page: Number of items per page for pagination. Defaults to None.
             etag: ETag for caching. Defaults to None.
             **kwargs: Additional keyword arguments.
 
@@ -307,8 +327,125 @@ class AsyncProject(AsyncResource, BaseProject):
             with_shared=with_shared,
             include_subgroups=include_subgroups,
             with_security_reports=with_security_reports,
+            page=page,
+            per_page=per_page,
             etag=etag,
             **kwargs,
         )
         data, status_code, etag = await process_async_response_with_last_modified(response)
         return cast(list[dict[str, Any]], data), {"status_code": status_code, "etag": etag}
+
+    async def resolve_project_id(self, path: str, **kwargs: Any) -> int:
+        """Resolve a project path to its numeric ID.
+
+        The path ID cache of the client is consulted first and updated with the result.
+
+        Args:
+            path: The full path of the project, e.g. ``group/project``.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The numeric project ID.
+
+        """
+        cache = self.client.path_id_cache
+        if cache is not None:
+            cached = cache.get(base_url=self.client.base_url, kind="projects", path=path)
+            if cached is not None:
+                return cached
+        response = await self._get(endpoint=self._get_project_endpoint(project_id=path), **kwargs)
+        data, _, _ = await process_async_response_with_last_modified(response)
+        data = cast(dict[str, Any], data)
+        project_id = int(data["id"])
+        if cache is not None:
+            # Store the canonical path as well, in case the requested one is an old path of a renamed project.
+            mapping = {path: project_id, str(data.get("path_with_namespace", path)): project_id}
+            cache.update(base_url=self.client.base_url, kind="projects", mapping=mapping)
+        return project_id
+
+    async def resolve_project_ids(
+        self,
+        paths: list[str],
+        group_id: int | str | None = None,
+        per_page: int = 100,
+        deadline: Deadline | None = None,
+        controller: AIMDController | None = None,
+        **kwargs: Any,
+    ) -> dict[str, int]:
+        """Resolve several project paths to numeric IDs in one list projects sweep.
+
+        Cached paths are answered from the path ID cache of the client. The remaining
+        paths are matched against the projects the authenticated user is a member of,
+        or against the projects of ``group_id`` and its subgroups, page by page until
+        every path is found or the listing is exhausted.
+
+        Args:
+            paths: The full paths of the projects.
+            group_id: Optional group ID or path to restrict the sweep to.
+            per_page: Number of projects to request per page, capped to `MAX_PER_PAGE`.
+            deadline: Optional deadline bounding the whole sweep. If it passes, the paths resolved so far
+                are returned and ``deadline.exceeded`` is set.
+            controller: Optional adaptive controller. The sweep then requests ``controller.limit`` pages
+                at a time, and retries the pages failing with overload errors at the lowered limit.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            A dictionary mapping the requested paths to project IDs. Paths that could not be resolved are omitted.
+
+        """
+        cache = self.client.path_id_cache
+        resolved: dict[str, int] = {}
+        pending: dict[str, str] = {}
+        for path in paths:
+            cached = cache.get(base_url=self.client.base_url, kind="projects", path=path) if cache else None
+            if cached is None:
+                pending[path.strip("/").lower()] = path
+            else:
+                resolved[path] = cached
+
+        found: dict[str, int] = {}
+        page_size = min(per_page, MAX_PER_PAGE)
+
+        async def fetch(page_number: int) -> list[dict[str, Any]] | None:
+            try:
+                projects, _ = await self.list_projects(
+                    group_id=group_id,
+                    membership=True,
+                    include_subgroups=True,
+                    simple=True,
+                    page=page_number,
+                    per_page=page_size,
+                    deadline=deadline,
+                    **kwargs,
+                )
+            except DeadlineExceededError:
+                return None
+            return projects
+
+        page = 1
+        while pending:
+            pages = list(range(page, page + (1 if controller is None else controller.limit)))
+            if controller is None:
+                batches = [await fetch(page)]
+            else:
+                batches = await gather_adaptive(fetch, pages, controller=controller)
+            exhausted = False
+            for projects in batches:
+                if projects is None:
+                    logger.warning("Deadline exceeded while resolving project paths; returning partial results.")
+                    exhausted = True
+                    break
+                found.update(self._match_project_paths(projects=projects, pending=pending))
+                if len(projects) < page_size:
+                    exhausted = True
+                    break
+            if exhausted:
+                break
+            page += len(pages)
+
+        if pending:
+            logger.warning("Could not resolve project paths: %s", ", ".join(sorted(pending.values())))
+        if cache is not None:
+            cache.update(base_url=self.client.base_url, kind="projects", mapping=found)
+        resolved.update(found)
+        return resolved
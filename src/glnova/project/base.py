@@ -92,6 +92,8 @@ class BaseProject:
         with_shared: bool | None = None,
         include_subgroups: bool | None = None,
         with_security_reports: bool | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
     ) -> tuple[str, dict[str, Any]]:
         """Get endpoint and parameters for listing projects.
 
@@ -133,6 +135,8 @@ class BaseProject:
             with_shared: Include shared projects (for group projects). Defaults to None.
             include_subgroups: Include subgroup projects (for group projects). Defaults to None.
             with_security_reports: Include security reports (for group projects). Defaults to None.
+            page: Page number for pagination. Defaults to None.
+            per_page: Number of items per page for pagination. Defaults to None.
 
         Returns:
             A tuple containing the endpoint string and a dictionary of parameters.
@@ -216,6 +220,10 @@ class BaseProject:
                 min_access_level=min_access_level,
                 with_security_reports=with_security_reports,
             )
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
         return endpoint, params
 
     def _list_authenticated_user_projects_params(  # noqa: PLR0913
@@ -443,3 +451,37 @@ class BaseProject:
         """
         params: dict[str, Any] = {k: v for k, v in locals().items() if v is not None and k != "self"}
         return params
+
+    def _get_project_endpoint(self, project_id: int | str) -> str:
+        """Get the endpoint for a single project.
+
+        Args:
+            project_id: The project ID or path.
+
+        Returns:
+            The API endpoint for the project.
+
+        """
+        if isinstance(project_id, str):
+            project_id = project_id.replace("/", "%2F")
+        return f"/projects/{project_id}"
+
+    def _match_project_paths(self, projects: list[dict[str, Any]], pending: dict[str, str]) -> dict[str, int]:
+        """Match listed projects against the paths still waiting to be resolved.
+
+        Matched paths are removed from ``pending``.
+
+        Args:
+            projects: Project dictionaries as returned by the list projects endpoint.
+            pending: A dictionary mapping lower-cased paths to the paths as requested.
+
+        Returns:
+            A dictionary mapping the requested paths to project IDs.
+
+        """
+        resolved: dict[str, int] = {}
+        for project in projects:
+            key = str(project.get("path_with_namespace", "")).lower()
+            if key in pending:
+                resolved[pending.pop(key)] = int(project["id"])
+        return resolved
@@ -0,0 +1,19 @@
+"""Testing utilities for glnova."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from glnova.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from glnova.testing.mock_server import MockGitLab
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "MockGitLab": "glnova.testing.mock_server",
+    },
+)
+
+__all__ = ["MockGitLab"]
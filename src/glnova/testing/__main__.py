@@ -0,0 +1,8 @@
+"""Serve a mock GitLab with ``python -m glnova.testing``."""
+
+from __future__ import annotations
+
+from glnova.testing.mock_server import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Load generation against a GitLab instance with the asynchronous client."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from glnova.utils.response import get_error_status
+
+if TYPE_CHECKING:
+    from glnova.client.async_gitlab import AsyncGitLab
+    from glnova.client.events import RequestEvent
+
+OPERATIONS = ("list", "get", "edit")
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Parse a workload mix such as ``list=7,get=3``.
+
+    Args:
+        value: Comma-separated operations with their relative weights, from ``list``, ``get`` and ``edit``.
+
+    Returns:
+        The weight of every operation.
+
+    Raises:
+        ValueError: If an operation is unknown, a weight is negative or not a number, or all weights are zero.
+
+    """
+    mix: dict[str, float] = {}
+    for item in value.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{name}'; expected one of {', '.join(OPERATIONS)}.")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError as e:
+            raise ValueError(f"Invalid weight for '{name}': {weight}.") from e
+        if mix[name] < 0:
+            raise ValueError(f"Invalid weight for '{name}': {weight}.")
+    if not any(mix.values()):
+        raise ValueError("At least one operation must have a positive weight.")
+    return mix
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Get a percentile of sorted values with the nearest-rank method.
+
+    Args:
+        values: The sorted values.
+        fraction: The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        The percentile, or 0 if there are no values.
+
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+def _latency_summary(latencies: list[float]) -> dict[str, float]:
+    """Summarize latencies in milliseconds.
+
+    Args:
+        latencies: The latencies in seconds.
+
+    Returns:
+        The mean, median, p95, p99 and maximum latency in milliseconds.
+
+    """
+    values = sorted(latencies)
+    return {
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+        "max_ms": values[-1] * 1000 if values else 0.0,
+    }
+
+
+class _Traffic:
+    """Event hook adding up the requests and bytes sent by a client."""
+
+    def __init__(self) -> None:
+        """Initialize the _Traffic."""
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Count a request.
+
+        Args:
+            event: The event.
+
+        """
+        self.requests += 1
+        self.bytes_sent += event.request_bytes
+        self.bytes_received += event.bytes or 0
+
+
+async def run_load(  # noqa: PLR0913, PLR0915
+    client: AsyncGitLab,
+    project: int | str,
+    mix: dict[str, float],
+    concurrency: int = 8,
+    duration: float = 30.0,
+    rate: float | None = None,
+    per_page: int = 20,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """Drive a mix of list, get and edit calls against the issues of a project.
+
+    The IIDs for get and edit calls are taken from the first page of issues of the project.
+    Edits write back the current title of the issue, so they do not change its content.
+    With a target rate, calls are started on a fixed schedule and their latency is measured
+    from their scheduled start, so that a slow server is not hidden by calls started late.
+
+    Args:
+        client: An open asynchronous client.
+        project: The ID or path of the project.
+        mix: Relative weight of the ``list``, ``get`` and ``edit`` operations.
+        concurrency: Number of calls in flight.
+        duration: Seconds during which new calls are started.
+        rate: Target number of calls per second over all workers, or None for as many as possible.
+        per_page: Page size of the list calls.
+        seed: Seed of the random choice of operations.
+
+    Returns:
+        The report, with the number of calls, the throughput, the latency percentiles,
+        the error and 429 rates, the bytes transferred and the statistics of every operation.
+
+    Raises:
+        ValueError: If get or edit calls are requested but the project has no issues.
+
+    """
+    rng = random.Random(seed)
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    titles: dict[int, str] = {}
+    if "get" in names or "edit" in names:
+        issues, _ = await client.issue.list_issues(project=project, per_page=100)
+        titles = {issue["iid"]: issue["title"] for issue in issues}
+        if not titles:
+            raise ValueError(f"Project {project} has no issues to get or edit.")
+    iids = list(titles)
+
+    traffic = _Traffic()
+    client.add_event_hook(traffic)
+    latencies: dict[str, list[float]] = {name: [] for name in names}
+    errors: dict[str, int] = dict.fromkeys(names, 0)
+    throttled = 0
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    end = start + duration
+    next_slot = start
+
+    async def call(name: str) -> None:
+        if name == "list":
+            await client.issue.list_issues(project=project, per_page=per_page, page=rng.randint(1, 5))
+        elif name == "get":
+            await client.issue.get_issue(project_id=project, issue_iid=rng.choice(iids))
+        else:
+            iid = rng.choice(iids)
+            await client.issue.edit_issue(project_id=project, issue_iid=iid, title=titles[iid])
+
+    async def worker() -> None:
+        nonlocal next_slot, throttled
+        while True:
+            now = loop.time()
+            if rate:
+                scheduled = max(next_slot, now)
+                next_slot = scheduled + 1 / rate
+                if scheduled >= end:
+                    return
+                await asyncio.sleep(scheduled - now)
+            else:
+                scheduled = now
+                if scheduled >= end:
+                    return
+            name = rng.choices(names, weights)[0]
+            try:
+                await call(name)
+            except Exception as error:  # noqa: BLE001
+                errors[name] += 1
+                if get_error_status(error) == 429:  # noqa: PLR2004
+                    throttled += 1
+                continue
+            finally:
+                finished = loop.time()
+            latencies[name].append(finished - scheduled)
+
+    wall_start = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        client.remove_event_hook(traffic)
+    elapsed = time.perf_counter() - wall_start
+
+    succeeded = sum(len(values) for values in latencies.values())
+    failed = sum(errors.values())
+    calls = succeeded + failed
+    return {
+        "calls": calls,
+        "requests": traffic.requests,
+        "duration": elapsed,
+        "throughput": calls / elapsed if elapsed else 0.0,
+        "target_rate": rate,
+        "concurrency": concurrency,
+        "latency": _latency_summary([value for values in latencies.values() for value in values]),
+        "errors": failed,
+        "error_rate": failed / calls if calls else 0.0,
+        "throttled": throttled,
+        "throttled_rate": throttled / calls if calls else 0.0,
+        "bytes_sent": traffic.bytes_sent,
+        "bytes_received": traffic.bytes_received,
+        "operations": {
+            name: {
+                "calls": len(latencies[name]) + errors[name],
+                "errors": errors[name],
+                **_latency_summary(latencies[name]),
+            }
+            for name in names
+        },
+    }
@@ -0,0 +1,748 @@
+"""Local mock GitLab server for benchmarks, soak and memory tests.
+
+The server generates deterministic synthetic users, groups, projects, issues and merge
+requests on demand, so that listings of millions of records cost no memory. It emulates
+the pagination headers, ETags and conditional requests, and the rate-limit headers of
+GitLab, and can inject latency and faults.
+
+Usage:
+    python -m glnova.testing --port 8080 --projects 100 --issues-per-project 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import unquote, urlencode
+
+from aiohttp import web
+
+from glnova.utils.endpoint import get_endpoint_template
+
+API_PREFIX = "/api/v4"
+
+MAX_PER_PAGE = 100
+
+# GitLab omits the total headers of listings with more records than this.
+MAX_COUNTED_TOTAL = 10000
+
+_CREATED_AT = "2024-01-01T00:00:00.000Z"
+
+_SEGMENT = r"(?P<{}>[^/]+)"
+
+_ROUTES: list[tuple[str, re.Pattern[str], str]] = [
+    (
+        method,
+        re.compile("^" + pattern.format(project=_SEGMENT.format("project"), group=_SEGMENT.format("group")) + "$"),
+        name,
+    )
+    for method, pattern, name in [
+        ("GET", "/user", "_get_current_user"),
+        ("GET", "/users", "_list_users"),
+        ("GET", r"/users/(?P<user>\d+)", "_get_user"),
+        ("PUT", r"/users/(?P<user>\d+)", "_edit_user"),
+        ("GET", "/projects", "_list_projects"),
+        ("GET", "/groups/{group}/projects", "_list_projects"),
+        ("GET", "/projects/{project}", "_get_project"),
+        ("GET", "/issues", "_list_issues"),
+        ("GET", "/groups/{group}/issues", "_list_issues"),
+        ("GET", "/projects/{project}/issues", "_list_issues"),
+        ("GET", r"/projects/{project}/issues/(?P<iid>\d+)", "_get_issue"),
+        ("PUT", r"/projects/{project}/issues/(?P<iid>\d+)", "_edit_issue"),
+        ("GET", "/merge_requests", "_list_merge_requests"),
+        ("GET", "/groups/{group}/merge_requests", "_list_merge_requests"),
+        ("GET", "/projects/{project}/merge_requests", "_list_merge_requests"),
+        ("GET", r"/projects/{project}/merge_requests/(?P<iid>\d+)", "_get_merge_request"),
+        ("PUT", r"/projects/{project}/merge_requests/(?P<iid>\d+)", "_edit_merge_request"),
+    ]
+]
+
+
+class _Listing:
+    """A lazily generated listing of records."""
+
+    def __init__(self, total: int, get_item: Callable[[int], dict[str, Any]]) -> None:
+        """Initialize the _Listing.
+
+        Args:
+            total: The number of records.
+            get_item: Callable generating the record at an index.
+
+        """
+        self.total = total
+        self.get_item = get_item
+
+
+class MockGitLab:
+    """Mock of the GitLab REST API serving synthetic records.
+
+    Records are generated from their index, so any scale can be served. Group ``g`` holds
+    the projects ``p`` with ``(p - 1) % groups == g - 1``, and every project holds
+    ``issues_per_project`` issues and ``merge_requests_per_project`` merge requests with
+    IIDs starting at 1. Edits are kept in memory and change the ETags of the edited record
+    and of all listings. Listings accept ``page``, ``per_page`` and ``iids``; other filters
+    are ignored.
+
+    The server runs on the event loop of the caller with `start` and `stop`, or on a
+    background thread when used as a context manager::
+
+        with MockGitLab(projects=10, issues_per_project=1000) as server:
+            client = GitLab(token="token", base_url=server.url)
+
+    Attributes:
+        url: The base URL of the running server, to be passed to the clients.
+        requests: Number of requests served, by ``"METHOD /endpoint/template"``.
+        statuses: Number of responses, by status code.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        users: int = 100,
+        groups: int = 5,
+        projects: int = 20,
+        issues_per_project: int = 100,
+        merge_requests_per_project: int = 50,
+        description_size: int = 200,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        fault_rate: float = 0.0,
+        fault_statuses: tuple[int, ...] = (500, 502, 503),
+        rate_limit: int | None = None,
+        rate_limit_period: float = 60.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the MockGitLab.
+
+        Args:
+            users: Number of users.
+            groups: Number of groups.
+            projects: Number of projects.
+            issues_per_project: Number of issues of every project.
+            merge_requests_per_project: Number of merge requests of every project.
+            description_size: Number of characters of the descriptions of issues and merge requests.
+            latency: Delay added to every response in seconds.
+            jitter: Maximum random delay added on top of the latency in seconds.
+            fault_rate: Probability of answering a request with one of the fault statuses.
+            fault_statuses: The statuses of injected faults.
+            rate_limit: Number of requests allowed per period before answering with 429, or None for no limit.
+            rate_limit_period: Length of the rate-limit window in seconds.
+            seed: Seed of the random latency and faults.
+
+        """
+        self.users = users
+        self.groups = groups
+        self.projects = projects
+        self.issues_per_project = issues_per_project
+        self.merge_requests_per_project = merge_requests_per_project
+        self.description = ("lorem ipsum " * (description_size // 12 + 1))[:description_size]
+        self.latency = latency
+        self.jitter = jitter
+        self.fault_rate = fault_rate
+        self.fault_statuses = fault_statuses
+        self.rate_limit = rate_limit
+        self.rate_limit_period = rate_limit_period
+        self.url = ""
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self._random = random.Random(seed)
+        self._edits: dict[tuple[str, int, int], dict[str, Any]] = {}
+        self._version = 0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._runner: web.AppRunner | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def __str__(self) -> str:
+        """Return a string representation of the server.
+
+        Returns:
+            str: String representation.
+
+        """
+        return (
+            f"<MockGitLab url={self.url or None} projects={self.projects} issues_per_project={self.issues_per_project}>"
+        )
+
+    def create_app(self) -> web.Application:
+        """Create the aiohttp application serving the API.
+
+        Returns:
+            The application.
+
+        """
+        app = web.Application()
+        app.router.add_route("*", API_PREFIX + "/{tail:.*}", self._handle)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving on the running event loop.
+
+        Args:
+            host: The address to bind.
+            port: The port to bind, 0 for a free port.
+
+        Returns:
+            The base URL of the server.
+
+        """
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self.url = f"http://{bound_host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> MockGitLab:
+        """Start serving on the running event loop.
+
+        Returns:
+            The server.
+
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop serving.
+
+        Args:
+            exc_type: The exception type.
+            exc_val: The exception value.
+            exc_tb: The traceback.
+
+        """
+        await self.stop()
+
+    def __enter__(self) -> MockGitLab:
+        """Start serving on a background thread.
+
+        Returns:
+            The server.
+
+        """
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        self._thread = threading.Thread(target=loop.run_forever, name="glnova-mock-gitlab", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop serving and the background thread.
+
+        Args:
+            exc_type: The exception type.
+            exc_val: The exception value.
+            exc_tb: The traceback.
+
+        """
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a request to the API.
+
+        Args:
+            request: The request.
+
+        Returns:
+            The response.
+
+        """
+        start = time.perf_counter()
+        path = request.rel_url.raw_path[len(API_PREFIX) :].rstrip("/") or "/"
+        self.requests[f"{request.method} {get_endpoint_template(path)}"] += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        headers = self._rate_limit_headers()
+        if self.rate_limit is not None and self._window_count > self.rate_limit:
+            headers["Retry-After"] = headers["RateLimit-Reset-After"]
+            response = self._json_response({"message": "429 Too Many Requests"}, status=429, headers=headers)
+        elif self.fault_rate and self._random.random() < self.fault_rate:
+            status = self._random.choice(self.fault_statuses)
+            response = self._json_response({"message": f"{status} Injected fault"}, status=status, headers=headers)
+        else:
+            response = await self._dispatch(request, path, headers)
+        response.headers["X-Request-Id"] = f"mock-{sum(self.requests.values())}"
+        response.headers["X-Runtime"] = f"{time.perf_counter() - start:.6f}"
+        self.statuses[response.status] += 1
+        return response
+
+    def _rate_limit_headers(self) -> dict[str, str]:
+        """Count a request in the rate-limit window.
+
+        Returns:
+            The rate-limit headers of the response, empty if there is no rate limit.
+
+        """
+        if self.rate_limit is None:
+            return {}
+        now = time.monotonic()
+        if now - self._window_start >= self.rate_limit_period:
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+        reset_after = max(0.0, self.rate_limit_period - (now - self._window_start))
+        return {
+            "RateLimit-Limit": str(self.rate_limit),
+            "RateLimit-Observed": str(self._window_count),
+            "RateLimit-Remaining": str(max(0, self.rate_limit - self._window_count)),
+            "RateLimit-Reset": str(int(time.time() + reset_after)),
+            "RateLimit-Reset-After": str(max(1, round(reset_after))),
+        }
+
+    async def _dispatch(self, request: web.Request, path: str, headers: dict[str, str]) -> web.Response:
+        """Route a request to its handler and build the response.
+
+        Args:
+            request: The request.
+            path: The path of the request relative to the API prefix, still URL-encoded.
+            headers: Headers to add to the response.
+
+        Returns:
+            The response.
+
+        """
+        for method, pattern, name in _ROUTES:
+            match = pattern.match(path)
+            if match is None or method != request.method:
+                continue
+            body: dict[str, Any] = {}
+            if request.method == "PUT":
+                body = dict(request.query)
+                if request.can_read_body:
+                    body.update(
+                        await request.json() if request.content_type == "application/json" else await request.post()
+                    )
+            try:
+                result = getattr(self, name)(match=match.groupdict(), query=request.query, body=body)
+            except LookupError as error:
+                return self._json_response({"message": f"404 {error.args[0]} Not Found"}, status=404, headers=headers)
+            if isinstance(result, _Listing):
+                return self._page_response(request, path, result, headers)
+            return self._record_response(request, result, headers)
+        return self._json_response({"error": "404 Not Found"}, status=404, headers=headers)
+
+    def _json_response(self, data: Any, status: int = 200, headers: dict[str, str] | None = None) -> web.Response:
+        """Build a JSON response.
+
+        Args:
+            data: The payload.
+            status: The status code.
+            headers: Additional headers.
+
+        Returns:
+            The response.
+
+        """
+        return web.Response(
+            body=json.dumps(data).encode("utf-8"), status=status, headers=headers, content_type="application/json"
+        )
+
+    def _conditional_response(
+        self, request: web.Request, etag: str, get_data: Callable[[], Any], headers: dict[str, str]
+    ) -> web.Response:
+        """Build a response, answering 304 if the client holds the current ETag.
+
+        Args:
+            request: The request.
+            etag: The ETag of the payload.
+            get_data: Callable building the payload.
+            headers: Additional headers.
+
+        Returns:
+            The response.
+
+        """
+        headers["ETag"] = etag
+        if request.method == "GET" and request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+        return self._json_response(get_data(), headers=headers)
+
+    def _record_response(self, request: web.Request, record: dict[str, Any], headers: dict[str, str]) -> web.Response:
+        """Build the response for a single record.
+
+        Args:
+            request: The request.
+            record: The record.
+            headers: Additional headers.
+
+        Returns:
+            The response.
+
+        """
+        digest = hashlib.md5(json.dumps(record, sort_keys=True).encode("utf-8"), usedforsecurity=False).hexdigest()
+        return self._conditional_response(request, f'W/"{digest}"', lambda: record, headers)
+
+    def _page_response(
+        self, request: web.Request, path: str, listing: _Listing, headers: dict[str, str]
+    ) -> web.Response:
+        """Build the response for one page of a listing, with the pagination headers of GitLab.
+
+        Args:
+            request: The request.
+            path: The path of the request relative to the API prefix.
+            listing: The listing.
+            headers: Additional headers.
+
+        Returns:
+            The response.
+
+        """
+        page = max(1, int(request.query.get("page", 1)))
+        per_page = min(MAX_PER_PAGE, max(1, int(request.query.get("per_page", 20))))
+        total_pages = max(1, -(-listing.total // per_page))
+        start = (page - 1) * per_page
+        indexes = range(start, min(start + per_page, listing.total))
+        headers.update(
+            {
+                "X-Page": str(page),
+                "X-Per-Page": str(per_page),
+                "X-Prev-Page": str(page - 1) if page > 1 else "",
+                "X-Next-Page": str(page + 1) if page < total_pages else "",
+            }
+        )
+        base = f"{self.url}{API_PREFIX}{path}"
+        query = {key: value for key, value in request.query.items() if key not in ("page", "per_page")}
+        links = [("first", 1)]
+        if page > 1:
+            links.append(("prev", page - 1))
+        if page < total_pages:
+            links.append(("next", page + 1))
+        if listing.total <= MAX_COUNTED_TOTAL:
+            headers["X-Total"] = str(listing.total)
+            headers["X-Total-Pages"] = str(total_pages)
+            links.append(("last", total_pages))
+        headers["Link"] = ", ".join(
+            f'<{base}?{urlencode({**query, "page": number, "per_page": per_page})}>; rel="{rel}"'
+            for rel, number in links
+        )
+        raw_query = urlencode(sorted(request.query.items()))
+        key = f"{path}?{raw_query}#{self._version}".encode()
+        etag = f'W/"{hashlib.md5(key, usedforsecurity=False).hexdigest()}"'
+        return self._conditional_response(
+            request, etag, lambda: [listing.get_item(index) for index in indexes], headers
+        )
+
+    def _parse_project(self, value: str) -> int:
+        """Parse the ID or URL-encoded path of a project.
+
+        Args:
+            value: The ID, or the path, e.g. ``group-1%2Fproject-6``.
+
+        Returns:
+            The project ID.
+
+        Raises:
+            LookupError: If there is no such project.
+
+        """
+        match = re.fullmatch(r"(\d+)|group-\d+/project-(\d+)", unquote(value))
+        project = int(match.group(1) or match.group(2)) if match else 0
+        if not 1 <= project <= self.projects:
+            raise LookupError("Project")
+        return project
+
+    def _parse_group(self, value: str) -> int:
+        """Parse the ID or path of a group.
+
+        Args:
+            value: The ID, or the path, e.g. ``group-1``.
+
+        Returns:
+            The group ID.
+
+        Raises:
+            LookupError: If there is no such group.
+
+        """
+        match = re.fullmatch(r"(?:group-)?(\d+)", unquote(value))
+        group = int(match.group(1)) if match else 0
+        if not 1 <= group <= self.groups:
+            raise LookupError("Group")
+        return group
+
+    def _user(self, user: int) -> dict[str, Any]:
+        """Generate a user.
+
+        Args:
+            user: The user ID.
+
+        Returns:
+            The user.
+
+        """
+        record = {
+            "id": user,
+            "username": f"user-{user}",
+            "name": f"User {user}",
+            "state": "active",
+            "email": f"user-{user}@example.com",
+            "avatar_url": None,
+            "web_url": f"{self.url}/user-{user}",
+        }
+        record.update(self._edits.get(("users", 0, user), {}))
+        return record
+
+    def _project(self, project: int) -> dict[str, Any]:
+        """Generate a project.
+
+        Args:
+            project: The project ID.
+
+        Returns:
+            The project.
+
+        """
+        group = (project - 1) % self.groups + 1
+        return {
+            "id": project,
+            "name": f"project-{project}",
+            "path": f"project-{project}",
+            "path_with_namespace": f"group-{group}/project-{project}",
+            "namespace": {"id": group, "path": f"group-{group}", "kind": "group"},
+            "default_branch": "main",
+            "created_at": _CREATED_AT,
+            "web_url": f"{self.url}/group-{group}/project-{project}",
+        }
+
+    def _work_item(self, kind: str, project: int, iid: int) -> dict[str, Any]:
+        """Generate an issue or a merge request.
+
+        Args:
+            kind: "issues" or "merge_requests".
+            project: The project ID.
+            iid: The IID within the project.
+
+        Returns:
+            The issue or merge request.
+
+        """
+        per_project = self.issues_per_project if kind == "issues" else self.merge_requests_per_project
+        record_id = (project - 1) * per_project + iid
+        author = (record_id - 1) % self.users + 1
+        record: dict[str, Any] = {
+            "id": record_id,
+            "iid": iid,
+            "project_id": project,
+            "title": f"{'Issue' if kind == 'issues' else 'Merge request'} {iid} of project {project}",
+            "description": self.description,
+            "state": "closed" if iid % 4 == 0 else "opened",
+            "labels": [f"label-{iid % 7}"],
+            "author": {"id": author, "username": f"user-{author}", "name": f"User {author}"},
+            "assignees": [],
+            "created_at": _CREATED_AT,
+            "updated_at": _CREATED_AT,
+            "web_url": f"{self.url}/group-{(project - 1) % self.groups + 1}/project-{project}/-/{kind}/{iid}",
+        }
+        if kind == "merge_requests":
+            record.update({"source_branch": f"feature-{iid}", "target_branch": "main", "merge_status": "can_be_merged"})
+        record.update(self._edits.get((kind, project, iid), {}))
+        return record
+
+    def _edit(self, key: tuple[str, int, int], body: dict[str, Any]) -> None:
+        """Store the fields of an edit.
+
+        Args:
+            key: The kind, project and ID or IID of the record.
+            body: The edited fields.
+
+        """
+        edits = self._edits.setdefault(key, {})
+        edits.update(body)
+        edits["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+        self._version += 1
+
+    def _get_current_user(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> dict[str, Any]:
+        """Get the authenticated user, always user 1."""
+        return self._user(1)
+
+    def _list_users(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> _Listing:
+        """List the users, optionally filtered by ``username``."""
+        username = query.get("username")
+        if username is not None:
+            found = re.fullmatch(r"user-(\d+)", username)
+            user = int(found.group(1)) if found else 0
+            matches = [user] if 1 <= user <= self.users else []
+            return _Listing(len(matches), lambda index: self._user(matches[index]))
+        return _Listing(self.users, lambda index: self._user(index + 1))
+
+    def _get_user(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> dict[str, Any]:
+        """Get a user."""
+        user = int(match["user"])
+        if not 1 <= user <= self.users:
+            raise LookupError("User")
+        return self._user(user)
+
+    def _edit_user(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> dict[str, Any]:
+        """Edit a user."""
+        self._get_user(match=match, query=query, body=body)
+        self._edit(("users", 0, int(match["user"])), body)
+        return self._user(int(match["user"]))
+
+    def _list_projects(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> _Listing:
+        """List the projects, of a group if one is given."""
+        if "group" in match:
+            projects = range(self._parse_group(match["group"]), self.projects + 1, self.groups)
+            return _Listing(len(projects), lambda index: self._project(projects[index]))
+        return _Listing(self.projects, lambda index: self._project(index + 1))
+
+    def _get_project(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> dict[str, Any]:
+        """Get a project."""
+        return self._project(self._parse_project(match["project"]))
+
+    def _list_work_items(self, kind: str, match: dict[str, str], query: Any) -> _Listing:
+        """List the issues or merge requests of a project, a group or the instance.
+
+        Args:
+            kind: "issues" or "merge_requests".
+            match: The path parameters.
+            query: The query parameters.
+
+        Returns:
+            The listing.
+
+        """
+        per_project = self.issues_per_project if kind == "issues" else self.merge_requests_per_project
+        if "project" in match:
+            projects: range | list[int] = [self._parse_project(match["project"])]
+        elif "group" in match:
+            projects = range(self._parse_group(match["group"]), self.projects + 1, self.groups)
+        else:
+            projects = range(1, self.projects + 1)
+        iids = sorted({int(iid) for iid in query.getall("iids", []) + query.getall("iids[]", [])})
+        if iids:
+            selected = [iid for iid in iids if 1 <= iid <= per_project]
+            return _Listing(
+                len(projects) * len(selected),
+                lambda index: self._work_item(kind, projects[index // len(selected)], selected[index % len(selected)]),
+            )
+        return _Listing(
+            len(projects) * per_project,
+            lambda index: self._work_item(kind, projects[index // per_project], index % per_project + 1),
+        )
+
+    def _get_work_item(self, kind: str, match: dict[str, str]) -> dict[str, Any]:
+        """Get an issue or a merge request.
+
+        Args:
+            kind: "issues" or "merge_requests".
+            match: The path parameters.
+
+        Returns:
+            The issue or merge request.
+
+        Raises:
+            LookupError: If there is no such record.
+
+        """
+        project = self._parse_project(match["project"])
+        iid = int(match["iid"])
+        per_project = self.issues_per_project if kind == "issues" else self.merge_requests_per_project
+        if not 1 <= iid <= per_project:
+            raise LookupError("Issue" if kind == "issues" else "Merge Request")
+        return self._work_item(kind, project, iid)
+
+    def _list_issues(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> _Listing:
+        """List issues."""
+        return self._list_work_items("issues", match=match, query=query)
+
+    def _get_issue(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> dict[str, Any]:
+        """Get an issue."""
+        return self._get_work_item("issues", match=match)
+
+    def _edit_issue(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> dict[str, Any]:
+        """Edit an issue."""
+        record = self._get_work_item("issues", match=match)
+        self._edit(("issues", record["project_id"], record["iid"]), body)
+        return self._get_work_item("issues", match=match)
+
+    def _list_merge_requests(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> _Listing:
+        """List merge requests."""
+        return self._list_work_items("merge_requests", match=match, query=query)
+
+    def _get_merge_request(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> dict[str, Any]:
+        """Get a merge request."""
+        return self._get_work_item("merge_requests", match=match)
+
+    def _edit_merge_request(self, match: dict[str, str], query: Any, body: dict[str, Any]) -> dict[str, Any]:
+        """Edit a merge request."""
+        record = self._get_work_item("merge_requests", match=match)
+        self._edit(("merge_requests", record["project_id"], record["iid"]), body)
+        return self._get_work_item("merge_requests", match=match)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Serve a mock GitLab until interrupted.
+
+    Args:
+        argv: The command-line arguments. Defaults to ``sys.argv``.
+
+    """
+    parser = argparse.ArgumentParser(description="Serve a mock GitLab API with synthetic records.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind.")
+    parser.add_argument("--port", type=int, default=8080, help="Port to bind.")
+    parser.add_argument("--users", type=int, default=100, help="Number of users.")
+    parser.add_argument("--groups", type=int, default=5, help="Number of groups.")
+    parser.add_argument("--projects", type=int, default=20, help="Number of projects.")
+    parser.add_argument("--issues-per-project", type=int, default=100, help="Number of issues per project.")
+    parser.add_argument("--merge-requests-per-project", type=int, default=50, help="Number of MRs per project.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay of every response in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random extra delay in seconds.")
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="Probability of an injected 5xx answer.")
+    parser.add_argument("--rate-limit", type=int, default=None, help="Requests allowed per minute.")
+    args = parser.parse_args(argv)
+
+    server = MockGitLab(
+        users=args.users,
+        groups=args.groups,
+        projects=args.projects,
+        issues_per_project=args.issues_per_project,
+        merge_requests_per_project=args.merge_requests_per_project,
+        latency=args.latency,
+        jitter=args.jitter,
+        fault_rate=args.fault_rate,
+        rate_limit=args.rate_limit,
+    )
+
+    async def serve() -> None:
+        url = await server.start(host=args.host, port=args.port)
+        print(f"Serving a mock GitLab at {url}", flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from glnova.user.async_user import AsyncUser
-from glnova.user.user import User
+from typing import TYPE_CHECKING
+
+from glnova.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from glnova.user.async_user import AsyncUser
+    from glnova.user.user import User
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncUser": "glnova.user.async_user",
+        "User": "glnova.user.user",
+    },
+)
 
 __all__ = ["AsyncUser", "User"]
@@ -2,19 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from datetime import datetime
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from aiohttp import ClientResponse
 
+from glnova.cache.ttl import TTLCache
+from glnova.client.adaptive import gather_adaptive
 from glnova.resource.async_resource import AsyncResource
-from glnova.user.base import BaseUser
+from glnova.user.base import CURRENT_USER_CACHE_KEY, BaseUser
+from glnova.utils.exception import DeadlineExceededError
 from glnova.utils.response import process_async_response_with_last_modified
 
+if TYPE_CHECKING:
+    from glnova.client.adaptive import AIMDController
+    from glnova.client.async_gitlab import AsyncGitLab
+    from glnova.client.deadline import Deadline
+
+logger = logging.getLogger("glnova")
+
 
 class AsyncUser(BaseUser, AsyncResource):
     """Asynchronous GitLab User resource."""
 
+    def __init__(self, client: AsyncGitLab, user_id_ttl: float | None = 300.0) -> None:
+        """Initialize the AsyncUser resource.
+
+        Args:
+            client: An instance of the AsyncGitLab client.
+            user_id_ttl: Time to live in seconds of resolved user IDs. If None, they never expire.
+
+        """
+        super().__init__(client=client)
+        self.user_id_cache: TTLCache[int] = TTLCache(ttl=user_id_ttl)
+
     async def _get_user(
         self,
         account_id: int | None = None,
@@ -499,3 +522,120 @@ class AsyncUser(BaseUser, AsyncResource):
         if status_code == 304:  # noqa: PLR2004
             data = []
         return cast(list[dict[str, Any]], data), {"status_code": status_code, "etag": etag_value}
+
+    async def get_current_user_id(self, **kwargs: Any) -> int:
+        """Get the ID of the authenticated user.
+
+        The result is cached, so repeated calls do not issue further requests.
+
+        Args:
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The ID of the authenticated user.
+
+        """
+        cached = self.user_id_cache.get(CURRENT_USER_CACHE_KEY)
+        if cached is not None:
+            return cached
+        data, _ = await self.get_user(**kwargs)
+        user_id = int(data["id"])
+        self.user_id_cache.set(CURRENT_USER_CACHE_KEY, user_id)
+        if data.get("username"):
+            self.user_id_cache.set(self._user_cache_key(str(data["username"])), user_id)
+        return user_id
+
+    async def _lookup_user_id(self, identifier: str, **kwargs: Any) -> int | None:
+        """Look up the ID of a username or email and cache it.
+
+        Args:
+            identifier: The username or email.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The user ID, or None if no user matches.
+
+        """
+        users, _ = await self.list_users(**self._user_lookup_params(identifier), **kwargs)
+        user_id = self._match_user(identifier=identifier, users=users)
+        if user_id is not None:
+            self.user_id_cache.set(self._user_cache_key(identifier), user_id)
+        return user_id
+
+    async def resolve_user_id(self, identifier: str, **kwargs: Any) -> int | None:
+        """Resolve a username or email to a user ID.
+
+        Args:
+            identifier: The username (optionally prefixed with ``@``) or email.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            The user ID, or None if no user matches.
+
+        """
+        cached = self.user_id_cache.get(self._user_cache_key(identifier))
+        if cached is not None:
+            return cached
+        return await self._lookup_user_id(identifier, **kwargs)
+
+    async def resolve_user_ids(
+        self,
+        identifiers: list[str],
+        max_workers: int = 8,
+        deadline: Deadline | None = None,
+        controller: AIMDController | None = None,
+        **kwargs: Any,
+    ) -> dict[str, int]:
+        """Resolve several usernames or emails to user IDs.
+
+        Cached identifiers are answered from the user ID cache. The remaining ones are
+        looked up concurrently with one list users request each.
+
+        Args:
+            identifiers: The usernames (optionally prefixed with ``@``) or emails.
+            max_workers: Maximum number of concurrent lookups.
+            deadline: Optional deadline bounding all lookups. If it passes, the identifiers resolved so far
+                are returned and ``deadline.exceeded`` is set.
+            controller: Optional adaptive controller setting the number of concurrent lookups
+                instead of ``max_workers``.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A dictionary mapping the identifiers to user IDs. Identifiers that could not be resolved are omitted.
+
+        """
+        resolved: dict[str, int] = {}
+        pending: list[str] = []
+        for identifier in dict.fromkeys(identifiers):
+            cached = self.user_id_cache.get(self._user_cache_key(identifier))
+            if cached is None:
+                pending.append(identifier)
+            else:
+                resolved[identifier] = cached
+
+        if pending:
+            semaphore = asyncio.Semaphore(max(1, max_workers if controller is None else controller.max_limit))
+
+            async def lookup(identifier: str) -> int | None:
+                async with semaphore:
+                    try:
+                        return await self._lookup_user_id(identifier, deadline=deadline, **kwargs)
+                    except DeadlineExceededError:
+                        return None
+
+            if controller is None:
+                user_ids = await asyncio.gather(*(lookup(identifier) for identifier in pending))
+            else:
+                user_ids = await gather_adaptive(lookup, pending, controller=controller)
+            missing = []
+            for identifier, user_id in zip(pending, user_ids, strict=True):
+                if user_id is None:
+                    missing.append(identifier)
+                else:
+                    resolved[identifier] = user_id
+            if deadline is not None and deadline.exceeded:
+                logger.warning("Deadline exceeded while resolving users; returning partial results.")
+            elif missing:
+                logger.warning("Could not resolve users: %s", ", ".join(missing))
+
+        return resolved
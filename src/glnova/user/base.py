@@ -5,6 +5,9 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Literal
 
+CURRENT_USER_CACHE_KEY = "/user"
+"""Cache key under which the ID of the authenticated user is stored."""
+
 
 class BaseUser:
     """Base class for GitLab User resource."""
@@ -336,3 +339,51 @@ class BaseUser:
         params["sort"] = sort
 
         return endpoint, params, kwargs
+
+    def _user_cache_key(self, identifier: str) -> str:
+        """Normalize a username or email for use as a cache key.
+
+        Args:
+            identifier: The username (optionally prefixed with ``@``) or email.
+
+        Returns:
+            The normalized identifier.
+
+        """
+        return identifier.strip().removeprefix("@").lower()
+
+    def _user_lookup_params(self, identifier: str) -> dict[str, Any]:
+        """Get the list users filters that look up a username or email.
+
+        Args:
+            identifier: The username or email.
+
+        Returns:
+            A dictionary of keyword arguments for listing users.
+
+        """
+        key = self._user_cache_key(identifier)
+        if "@" in key:
+            return {"search": key}
+        return {"username": key}
+
+    def _match_user(self, identifier: str, users: list[dict[str, Any]]) -> int | None:
+        """Find the user matching a username or email exactly.
+
+        Searching by email is fuzzy, so the listed users are compared against the
+        email fields that are visible to the caller.
+
+        Args:
+            identifier: The username or email.
+            users: User dictionaries as returned by the list users endpoint.
+
+        Returns:
+            The ID of the matching user, or None if there is no exact match.
+
+        """
+        key = self._user_cache_key(identifier)
+        fields = ("email", "public_email", "commit_email") if "@" in key else ("username",)
+        for user in users:
+            if any(str(user.get(field) or "").lower() == key for field in fields):
+                return int(user["id"])
+        return None
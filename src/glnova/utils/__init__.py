@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
-from glnova.utils.log import get_version_information, setup_logger
-from glnova.utils.response import process_async_response_with_last_modified, process_response_with_last_modified
+from typing import TYPE_CHECKING
+
+from glnova.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from glnova.utils.log import get_version_information, setup_logger
+    from glnova.utils.metrics import MetricsRegistry, start_http_server
+    from glnova.utils.response import process_async_response_with_last_modified, process_response_with_last_modified
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "get_version_information": "glnova.utils.log",
+        "setup_logger": "glnova.utils.log",
+        "MetricsRegistry": "glnova.utils.metrics",
+        "start_http_server": "glnova.utils.metrics",
+        "process_async_response_with_last_modified": "glnova.utils.response",
+        "process_response_with_last_modified": "glnova.utils.response",
+    },
+)
 
 __all__ = [
+    "MetricsRegistry",
     "get_version_information",
     "process_async_response_with_last_modified",
     "process_response_with_last_modified",
     "setup_logger",
+    "start_http_server",
 ]
@@ -0,0 +1,25 @@
+"""Utility functions for API endpoints."""
+
+from __future__ import annotations
+
+import re
+
+_ID_SEGMENT_PATTERN = re.compile(r"^(\d+|.*%2[fF].*)$")
+
+
+def get_endpoint_template(endpoint: str) -> str:
+    """Replace the identifiers in an endpoint with a placeholder.
+
+    Numeric IDs and URL-encoded paths, e.g. ``group%2Fproject``, become ``:id``, so that
+    requests to the same API route can be grouped regardless of the resource they address.
+
+    Args:
+        endpoint: The API endpoint, e.g. ``/projects/42/issues/7``.
+
+    Returns:
+        The endpoint template, e.g. ``/projects/:id/issues/:id``.
+
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    segments = [":id" if _ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split("/")]
+    return "/" + "/".join(segments)
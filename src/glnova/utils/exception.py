@@ -14,3 +14,67 @@ class InvalidLiteralListError(ValueError):
 
         """
         super().__init__(f"All values must be one of the literals: {literal_tuple}")
+
+
+class CircuitOpenError(RuntimeError):
+    """Exception raised when a request is rejected by an open circuit breaker."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        """Initialize the CircuitOpenError.
+
+        Args:
+            name: Name of the circuit, usually the base URL of the GitLab instance.
+            retry_after: Seconds until the circuit sends probe requests again.
+
+        """
+        super().__init__(f"Circuit '{name}' is open; retry after {retry_after:.1f} s.")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(TimeoutError):
+    """Exception raised when the deadline of an operation has passed."""
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the DeadlineExceededError.
+
+        Args:
+            timeout: The total time budget of the operation in seconds.
+
+        """
+        super().__init__(f"Deadline of {timeout:.3f} s exceeded.")
+        self.timeout = timeout
+
+
+class CassetteMissError(LookupError):
+    """Exception raised when a replayed cassette has no recorded response for a request."""
+
+    def __init__(self, method: str, url: str) -> None:
+        """Initialize the CassetteMissError.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The URL of the request, with its query string.
+
+        """
+        super().__init__(f"No recorded response for {method} {url}.")
+        self.method = method
+        self.url = url
+
+
+class RequestBudgetExceededError(AssertionError):
+    """Exception raised when more requests were sent than a request budget allows."""
+
+    def __init__(self, scope: str, count: int, budget: int) -> None:
+        """Initialize the RequestBudgetExceededError.
+
+        Args:
+            scope: Description of the requests counted, e.g. ``GET /users/:id``.
+            count: The number of requests sent.
+            budget: The maximum number of requests allowed.
+
+        """
+        super().__init__(f"{count} requests sent to {scope}, budget is {budget}.")
+        self.scope = scope
+        self.count = count
+        self.budget = budget
@@ -0,0 +1,37 @@
+"""Lazy loading of the public objects of a package."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the module ``__getattr__`` and ``__dir__`` of a package importing its exports on first access.
+
+    Importing the package then costs nothing until one of its objects is used, so that, for example,
+    the synchronous client can be imported without aiohttp.
+
+    Args:
+        package: The name of the package, i.e. ``__name__``.
+        exports: The module defining every exported object, by name. A name may also be a subpackage.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions of the package.
+
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(exports[name])
+        value = module if module.__name__ == f"{package}.{name}" else getattr(module, name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,401 @@
+"""Metrics in the Prometheus text exposition format, and an HTTP exporter serving them."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Iterable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        The escaped value.
+
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Format a label set.
+
+    Args:
+        names: The label names.
+        values: The label values.
+        extra: An additional, already formatted, label.
+
+    Returns:
+        The label set in braces, or an empty string if there are no labels.
+
+    """
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The value, with integers written without a fractional part.
+
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    """Base class of the metrics: a name, a help text and values per label set."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: The metric name.
+            documentation: The help text.
+            labelnames: The names of the labels.
+
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        """Get the values of the labels in the order of the label names.
+
+        Args:
+            labels: The labels.
+
+        Returns:
+            The label values.
+
+        """
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects the labels {self.labelnames}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> Iterable[str]:
+        """Return the sample lines of the metric.
+
+        Returns:
+            The lines.
+
+        """
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+    def render(self) -> str:
+        """Render the metric in the text exposition format.
+
+        Returns:
+            The HELP and TYPE lines followed by the samples.
+
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: The non-negative increment.
+            **labels: The labels of the sample.
+
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        """Get the value of the counter.
+
+        Args:
+            **labels: The labels of the sample.
+
+        Returns:
+            The value, 0 if the label set was never incremented.
+
+        """
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    """Value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge.
+
+        Args:
+            value: The value.
+            **labels: The labels of the sample.
+
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the gauge.
+
+        Args:
+            amount: The increment, negative to decrease it.
+            **labels: The labels of the sample.
+
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrease the gauge.
+
+        Args:
+            amount: The decrement.
+            **labels: The labels of the sample.
+
+        """
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: Any) -> float:
+        """Get the value of the gauge.
+
+        Args:
+            **labels: The labels of the sample.
+
+        Returns:
+            The value, 0 if the label set was never set.
+
+        """
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: The metric name.
+            documentation: The help text.
+            labelnames: The names of the labels.
+            buckets: The upper bounds of the buckets, in increasing order; ``+Inf`` is added.
+
+        """
+        super().__init__(name=name, documentation=documentation, labelnames=labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record a value.
+
+        Args:
+            value: The value.
+            **labels: The labels of the sample.
+
+        """
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0, 0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][index] += 1
+                    break
+            state[1] += 1
+            state[2] += value
+
+    def get_count(self, **labels: Any) -> int:
+        """Get the number of observations.
+
+        Args:
+            **labels: The labels of the sample.
+
+        Returns:
+            The number of values recorded for the label set.
+
+        """
+        state = self._values.get(self._key(labels))
+        return 0 if state is None else state[1]
+
+    def _samples(self) -> Iterable[str]:
+        """Return the bucket, sum and count lines of the histogram.
+
+        Returns:
+            The lines.
+
+        """
+        with self._lock:
+            items = [(key, (list(state[0]), state[1], state[2])) for key, state in self._values.items()]
+        inf_label = 'le="+Inf"'
+        lines = []
+        for key, (counts, count, total) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, extra=f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, extra=inf_label)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize the MetricsRegistry."""
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> Any:
+        """Add a metric, or return the metric already registered under its name.
+
+        Args:
+            metric: The metric.
+
+        Returns:
+            The registered metric.
+
+        """
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+            raise ValueError(f"A different metric is already registered as {metric.name}.")
+        return existing
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name: The metric name.
+            documentation: The help text.
+            labelnames: The names of the labels.
+
+        Returns:
+            The counter.
+
+        """
+        return self._register(Counter(name=name, documentation=documentation, labelnames=labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name: The metric name.
+            documentation: The help text.
+            labelnames: The names of the labels.
+
+        Returns:
+            The gauge.
+
+        """
+        return self._register(Gauge(name=name, documentation=documentation, labelnames=labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name: The metric name.
+            documentation: The help text.
+            labelnames: The names of the labels.
+            buckets: The upper bounds of the buckets.
+
+        Returns:
+            The histogram.
+
+        """
+        return self._register(Histogram(name=name, documentation=documentation, labelnames=labelnames, buckets=buckets))
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text.
+
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics)
+
+
+def start_http_server(registry: MetricsRegistry, port: int = 9464, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve the metrics of a registry at ``/metrics`` from a daemon thread.
+
+    Args:
+        registry: The registry to expose.
+        port: The port to listen on; 0 picks a free port.
+        addr: The address to listen on.
+
+    Returns:
+        The server; call ``shutdown()`` and ``server_close()`` to stop it.
+
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Handler serving the exposition text."""
+
+        def do_GET(self) -> None:
+            """Serve the metrics."""
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            payload = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            """Silence the request log."""
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="glnova-metrics", daemon=True).start()
+    return server
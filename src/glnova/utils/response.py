@@ -2,10 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from aiohttp import ClientResponse
-from requests import Response
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+    from requests import Response
+
+
+def get_error_status(error: BaseException) -> int | None:
+    """Get the HTTP status code carried by a request error.
+
+    Args:
+        error: The exception raised by a request, e.g. `requests.HTTPError` or `aiohttp.ClientResponseError`.
+
+    Returns:
+        The status code, or None if the error did not come with a response.
+
+    """
+    status = getattr(error, "status", None)
+    if isinstance(status, int):
+        return status
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
 
 
 def process_response_with_last_modified(
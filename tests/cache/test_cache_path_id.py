@@ -0,0 +1,72 @@
+"""Unit tests for glnova.cache.path_id."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from glnova.cache.path_id import PathIDCache
+
+
+class TestPathIDCache:
+    """Test cases for the PathIDCache class."""
+
+    def test_init_with_default_path(self) -> None:
+        """Test initialization with the default cache path."""
+        with patch("platformdirs.user_cache_dir", return_value="/tmp/glnova-cache"):
+            cache = PathIDCache()
+        assert cache.cache_path == Path("/tmp/glnova-cache/path_ids.json")
+
+    def test_set_and_get(self, tmp_path: Path) -> None:
+        """Test storing and retrieving an ID."""
+        cache = PathIDCache(filename=tmp_path / "ids.json")
+        cache.set(base_url="https://gitlab.com", kind="projects", path="Group/Project", resource_id=42)
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/project") == 42  # noqa: PLR2004
+        assert cache.get(base_url="https://other.example.com", kind="projects", path="group/project") is None
+        assert len(cache) == 1
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Test that entries are shared through the cache file."""
+        filename = tmp_path / "ids.json"
+        PathIDCache(filename=filename).set(
+            base_url="https://gitlab.com", kind="projects", path="group/a", resource_id=7
+        )
+        reloaded = PathIDCache(filename=filename)
+        assert reloaded.get(base_url="https://gitlab.com", kind="projects", path="group/a") == 7  # noqa: PLR2004
+
+    def test_expired_entry(self, tmp_path: Path) -> None:
+        """Test that expired entries are not returned."""
+        cache = PathIDCache(filename=tmp_path / "ids.json", ttl=10)
+        with patch("glnova.cache.path_id.time.time", return_value=1000.0):
+            cache.set(base_url="https://gitlab.com", kind="projects", path="group/project", resource_id=1)
+        with patch("glnova.cache.path_id.time.time", return_value=1011.0):
+            assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/project") is None
+
+    def test_update_drops_renamed_paths(self, tmp_path: Path) -> None:
+        """Test that an old path pointing to a re-resolved ID is dropped."""
+        cache = PathIDCache(filename=tmp_path / "ids.json")
+        cache.set(base_url="https://gitlab.com", kind="projects", path="group/old", resource_id=5)
+        cache.update(base_url="https://gitlab.com", kind="projects", mapping={"group/new": 5})
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/old") is None
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/new") == 5  # noqa: PLR2004
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        """Test invalidating entries by path."""
+        cache = PathIDCache(filename=tmp_path / "ids.json")
+        cache.update(base_url="https://gitlab.com", kind="projects", mapping={"a/b": 1, "c/d": 2})
+        cache.invalidate(base_url="https://gitlab.com", kind="projects", path="a/b")
+        assert len(cache) == 1
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clearing the cache."""
+        filename = tmp_path / "ids.json"
+        cache = PathIDCache(filename=filename)
+        cache.set(base_url="https://gitlab.com", kind="projects", path="a/b", resource_id=1)
+        cache.clear()
+        assert json.loads(filename.read_text(encoding="utf-8")) == {}
+
+    def test_unreadable_file(self, tmp_path: Path) -> None:
+        """Test that an unreadable cache file is ignored."""
+        filename = tmp_path / "ids.json"
+        filename.write_text("not json", encoding="utf-8")
+        cache = PathIDCache(filename=filename)
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="a/b") is None
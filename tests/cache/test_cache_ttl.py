@@ -0,0 +1,52 @@
+"""Unit tests for glnova.cache.ttl."""
+
+from unittest.mock import patch
+
+from glnova.cache.ttl import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for the TTLCache class."""
+
+    def test_set_and_get(self) -> None:
+        """Test storing and retrieving a value."""
+        cache: TTLCache[int] = TTLCache(ttl=60)
+        cache.set("alice", 1)
+        assert cache.get("alice") == 1
+        assert "alice" in cache
+        assert cache.get("bob") is None
+
+    def test_expiry(self) -> None:
+        """Test that entries expire after the TTL."""
+        cache: TTLCache[int] = TTLCache(ttl=10)
+        with patch("glnova.cache.ttl.time.monotonic", return_value=100.0):
+            cache.set("alice", 1)
+        with patch("glnova.cache.ttl.time.monotonic", return_value=111.0):
+            assert cache.get("alice") is None
+        assert len(cache) == 0
+
+    def test_no_expiry(self) -> None:
+        """Test that entries never expire without a TTL."""
+        cache: TTLCache[int] = TTLCache(ttl=None)
+        cache.set("alice", 1)
+        with patch("glnova.cache.ttl.time.monotonic", return_value=1e12):
+            assert cache.get("alice") == 1
+
+    def test_maxsize_evicts_oldest(self) -> None:
+        """Test that the oldest entry is evicted when the cache is full."""
+        cache: TTLCache[int] = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("c") == 3  # noqa: PLR2004
+
+    def test_invalidate_and_clear(self) -> None:
+        """Test removing entries."""
+        cache: TTLCache[int] = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
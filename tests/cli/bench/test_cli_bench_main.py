@@ -0,0 +1,48 @@
+"""Unit tests for glnova.cli.bench.main."""
+
+import json
+
+from typer.testing import CliRunner
+
+from glnova.cli.main import app
+
+runner = CliRunner()
+
+
+class TestBenchCommand:
+    """Tests for the bench command."""
+
+    def test_mock(self) -> None:
+        """Test that a benchmark against the mock prints the report as JSON."""
+        result = runner.invoke(app, ["bench", "--mock", "--duration", "0.2", "--mix", "list=1,get=1", "--seed", "1"])
+
+        assert result.exit_code == 0
+        report = json.loads(result.stdout)
+        assert report["calls"] > 0
+        assert report["errors"] == 0
+        assert set(report["operations"]) == {"list", "get"}
+        assert set(report["latency"]) == {"mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"}
+
+    def test_invalid_mix(self) -> None:
+        """Test that an invalid mix exits with an error."""
+        result = runner.invoke(app, ["bench", "--mock", "--mix", "delete=1"])
+
+        assert result.exit_code == 1
+        assert "Unknown operation 'delete'" in result.stderr
+
+    def test_project_required(self) -> None:
+        """Test that a project is required without the mock."""
+        result = runner.invoke(app, ["bench", "--token", "token", "--base-url", "https://gitlab.example.com"])
+
+        assert result.exit_code == 1
+        assert "--project is required" in result.stderr
+
+    def test_unreachable(self) -> None:
+        """Test that a failure to discover the issues exits with an error."""
+        result = runner.invoke(
+            app,
+            ["bench", "--project", "1", "--mix", "get=1", "--token", "token", "--base-url", "http://127.0.0.1:9"],
+        )
+
+        assert result.exit_code == 1
+        assert "cannot start the benchmark" in result.stderr
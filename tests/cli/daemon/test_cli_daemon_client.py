@@ -0,0 +1,120 @@
+"""Unit tests for glnova.cli.daemon.client."""
+
+from __future__ import annotations
+
+import io
+import json
+import socket
+import threading
+
+import pytest
+
+from glnova.cli.daemon.client import find_command, request_daemon, route_command
+from glnova.cli.daemon.protocol import EXIT, REPLY, STDERR, STDOUT, recv_frame, send_frame
+
+
+@pytest.fixture
+def socket_path(tmp_path_factory):
+    """Return a socket path short enough for the limit of Unix socket paths."""
+    return tmp_path_factory.mktemp("d", numbered=True) / "s"
+
+
+def serve_once(path, frames):
+    """Listen on a socket, answer one connection with frames and return the received request."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+    received = {}
+
+    def handle():
+        conn, _ = server.accept()
+        with conn:
+            received["request"] = json.loads(recv_frame(conn)[1])
+            for kind, payload in frames:
+                send_frame(conn, kind, payload)
+        server.close()
+
+    thread = threading.Thread(target=handle, daemon=True)
+    thread.start()
+    return thread, received
+
+
+class TestFindCommand:
+    """Tests for find_command."""
+
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (["issue", "list"], "issue"),
+            (["--config-path", "c.yaml", "-v", "DEBUG", "user", "get"], "user"),
+            (["--profile", "project", "list"], "project"),
+            (["--trace", "t.har"], None),
+            ([], None),
+        ],
+    )
+    def test_find_command(self, args, expected) -> None:
+        """Test that the values of the root options are skipped."""
+        assert find_command(args) == expected
+
+
+class TestRouteCommand:
+    """Tests for route_command."""
+
+    def test_not_routed(self, socket_path) -> None:
+        """Test that commands run in the process without a daemon, for other commands or when disabled."""
+        env = {"GLNOVA_DAEMON_SOCKET": str(socket_path)}
+        thread, _ = serve_once(socket_path, [(EXIT, b'{"status": 0}')])
+
+        assert route_command(["config", "list"], env=env) is None
+        assert route_command(["issue", "list"], env={**env, "GLNOVA_NO_DAEMON": "1"}) is None
+        assert route_command(["issue", "list"], env={"GLNOVA_DAEMON_SOCKET": str(socket_path) + "x"}) is None
+        request_daemon(socket_path, "status")
+        thread.join(timeout=5)
+
+    def test_routed(self, socket_path) -> None:
+        """Test that the output of the daemon is relayed and its exit status returned."""
+        env = {"GLNOVA_DAEMON_SOCKET": str(socket_path), "GLNOVA_TOKEN": "t"}
+        thread, received = serve_once(
+            socket_path, [(STDOUT, b"out1\n"), (STDERR, b"err\n"), (STDOUT, b"out2\n"), (EXIT, b'{"status": 3}')]
+        )
+        stdout, stderr = io.BytesIO(), io.BytesIO()
+
+        status = route_command(["issue", "list", "--all-pages"], env=env, stdout=stdout, stderr=stderr)
+        thread.join(timeout=5)
+
+        assert status == 3  # noqa: PLR2004
+        assert stdout.getvalue() == b"out1\nout2\n"
+        assert stderr.getvalue() == b"err\n"
+        assert received["request"]["op"] == "run"
+        assert received["request"]["args"] == ["issue", "list", "--all-pages"]
+        assert received["request"]["env"] == env
+        assert received["request"]["isatty"] == [False, False]
+
+    def test_connection_lost(self, socket_path) -> None:
+        """Test that a daemon closing the connection before the exit status fails the command."""
+        thread, _ = serve_once(socket_path, [(STDOUT, b"partial")])
+        stdout, stderr = io.BytesIO(), io.BytesIO()
+
+        status = route_command(
+            ["user", "get"], env={"GLNOVA_DAEMON_SOCKET": str(socket_path)}, stdout=stdout, stderr=stderr
+        )
+        thread.join(timeout=5)
+
+        assert status == 1
+        assert b"closed the connection" in stderr.getvalue()
+
+
+class TestRequestDaemon:
+    """Tests for request_daemon."""
+
+    def test_reply(self, socket_path) -> None:
+        """Test that the reply of the daemon is returned."""
+        thread, received = serve_once(socket_path, [(REPLY, b'{"pid": 1}')])
+
+        assert request_daemon(socket_path, "status") == {"pid": 1}
+        thread.join(timeout=5)
+        assert received["request"] == {"op": "status"}
+
+    def test_no_daemon(self, socket_path) -> None:
+        """Test that None is returned without a daemon."""
+        assert request_daemon(socket_path, "status") is None
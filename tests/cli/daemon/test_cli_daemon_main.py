@@ -0,0 +1,102 @@
+"""Unit tests for glnova.cli.daemon."""
+
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from glnova.cli.daemon.client import request_daemon
+from glnova.cli.daemon.main import daemon_app
+from glnova.cli.daemon.server import DaemonServer
+from glnova.cli.daemon.start import start_command
+from glnova.cli.main import app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def socket_path(tmp_path_factory):
+    """Return a socket path short enough for the limit of Unix socket paths."""
+    return tmp_path_factory.mktemp("d", numbered=True) / "s"
+
+
+class TestDaemonAppConfiguration:
+    """Tests for daemon_app configuration."""
+
+    def test_daemon_app_has_correct_name(self) -> None:
+        """Test that the daemon app has the correct name."""
+        assert daemon_app.info.name == "daemon"
+
+    def test_daemon_app_commands(self) -> None:
+        """Test that the start, stop and status commands are registered."""
+        assert [command.name for command in daemon_app.registered_commands] == ["start", "stop", "status"]
+
+
+class TestDaemonCommands:
+    """Tests for the start, stop and status commands."""
+
+    def test_not_running(self, socket_path) -> None:
+        """Test status and stop without a running daemon."""
+        status = runner.invoke(app, ["daemon", "status", "--socket", str(socket_path)])
+        stop = runner.invoke(app, ["daemon", "stop", "--socket", str(socket_path)])
+
+        assert status.exit_code == 1
+        assert "No glnova daemon is running" in status.output
+        assert stop.exit_code == 0
+        assert "No glnova daemon is running" in stop.output
+
+    def test_foreground(self, socket_path) -> None:
+        """Test that the daemon serves in the process with --foreground until it is stopped."""
+        thread = threading.Thread(
+            target=start_command,
+            kwargs={"socket_path": socket_path, "idle_timeout": 0, "foreground": True},
+            daemon=True,
+        )
+        thread.start()
+        for _ in range(200):
+            if request_daemon(socket_path, "status") is not None:
+                break
+            thread.join(timeout=0.05)
+
+        status = runner.invoke(app, ["daemon", "status", "--socket", str(socket_path)])
+        started = runner.invoke(app, ["daemon", "start", "--socket", str(socket_path)])
+        stop = runner.invoke(app, ["daemon", "stop", "--socket", str(socket_path)])
+        thread.join(timeout=10)
+
+        assert status.exit_code == 0
+        assert json.loads(status.output)["socket"] == str(socket_path)
+        assert started.exit_code == 1
+        assert "already running" in started.output
+        assert stop.exit_code == 0
+        assert json.loads(stop.output)["stopped"] is True
+        assert not thread.is_alive()
+
+    def test_background(self, socket_path) -> None:
+        """Test that the daemon is started in a background process."""
+        result = runner.invoke(app, ["daemon", "start", "--socket", str(socket_path), "--idle-timeout", "60"])
+        try:
+            assert result.exit_code == 0, result.output
+            assert json.loads(result.output)["commands"] == 0
+        finally:
+            request_daemon(socket_path, "stop")
+
+    @patch("glnova.cli.daemon.start.spawn_daemon", return_value=None)
+    def test_background_failure(self, mock_spawn, socket_path) -> None:
+        """Test that a daemon failing to start in the background is reported."""
+        result = runner.invoke(app, ["daemon", "start", "--socket", str(socket_path)])
+
+        assert result.exit_code == 1
+        assert "--foreground" in result.output
+        mock_spawn.assert_called_once_with(socket_path=socket_path, idle_timeout=3600.0)
+
+    @patch.object(DaemonServer, "bind", side_effect=RuntimeError("belongs to another user."))
+    def test_foreground_bind_failure(self, mock_bind, socket_path) -> None:
+        """Test that a socket that cannot be bound is reported."""
+        result = runner.invoke(app, ["daemon", "start", "--foreground", "--socket", str(socket_path)])
+
+        assert result.exit_code == 1
+        assert "belongs to another user" in result.output
@@ -0,0 +1,74 @@
+"""Unit tests for glnova.cli.daemon.protocol."""
+
+from __future__ import annotations
+
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from glnova.cli.daemon.protocol import HEADER, REQUEST, STDOUT, default_socket_path, recv_frame, send_frame
+
+
+class TestDefaultSocketPath:
+    """Tests for default_socket_path."""
+
+    def test_socket_env(self) -> None:
+        """Test that GLNOVA_DAEMON_SOCKET sets the socket path."""
+        assert default_socket_path({"GLNOVA_DAEMON_SOCKET": "/run/d.sock"}) == Path("/run/d.sock")
+
+    def test_runtime_dir(self) -> None:
+        """Test that the socket is in a directory of the user in the runtime directory."""
+        path = default_socket_path({"XDG_RUNTIME_DIR": "/run/user/1", "TMPDIR": "/var/tmp"})
+
+        assert path.parent.parent == Path("/run/user/1")
+        assert path.parent.name.startswith("glnova-")
+        assert path.name == "daemon.sock"
+
+    def test_tmp(self) -> None:
+        """Test that /tmp is used without runtime and temporary directories."""
+        assert default_socket_path({}).parent.parent == Path("/tmp")
+
+
+class TestFrames:
+    """Tests for send_frame and recv_frame."""
+
+    def test_round_trip(self) -> None:
+        """Test that frames are received as sent, including empty and large ones."""
+        large = bytes(range(256)) * 1000
+        left, right = socket.socketpair()
+        with left, right:
+
+            def send() -> None:
+                send_frame(left, STDOUT, b"hello")
+                send_frame(left, STDOUT, b"")
+                send_frame(left, STDOUT, large)
+
+            thread = threading.Thread(target=send)
+            thread.start()
+
+            assert recv_frame(right) == (STDOUT, b"hello")
+            assert recv_frame(right) == (STDOUT, b"")
+            assert recv_frame(right) == (STDOUT, large)
+            thread.join()
+
+    def test_closed(self) -> None:
+        """Test that None is returned when the connection closes, even within a frame."""
+        left, right = socket.socketpair()
+        with right:
+            left.sendall(b"o\x00\x00\x00\x10abc")
+            left.close()
+
+            assert recv_frame(right) is None
+
+    def test_max_size(self) -> None:
+        """Test that a frame larger than max_size is rejected from its header, before its payload is read."""
+        left, right = socket.socketpair()
+        with left, right:
+            left.sendall(HEADER.pack(REQUEST, 2**32 - 1))
+            send_frame(left, REQUEST, b"{}")
+
+            with pytest.raises(ValueError, match="exceeds the limit"):
+                recv_frame(right, max_size=1024)
+            assert right.recv(HEADER.size + 2) == HEADER.pack(REQUEST, 2) + b"{}"
@@ -0,0 +1,173 @@
+"""Unit tests for glnova.cli.daemon.server."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from glnova.cli.daemon.client import connect, request_daemon, route_command
+from glnova.cli.daemon.protocol import HEADER, MAX_REQUEST_SIZE, REQUEST, recv_frame
+from glnova.cli.daemon.server import DaemonServer
+from glnova.client.transport import get_default_transport
+from glnova.testing.mock_server import MockGitLab
+
+
+@pytest.fixture
+def daemon(tmp_path_factory):
+    """Serve a daemon on a thread until the end of the test."""
+    socket_path = tmp_path_factory.mktemp("d", numbered=True) / "s"
+    server = DaemonServer(socket_path=socket_path, idle_timeout=None)
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    request_daemon(socket_path, "stop")
+    thread.join(timeout=10)
+
+
+def run(server, args, **env):
+    """Run a command through the daemon and return the exit status, stdout and stderr."""
+    stdout, stderr = io.BytesIO(), io.BytesIO()
+    status = route_command(
+        args, env={"GLNOVA_DAEMON_SOCKET": str(server.socket_path), **env}, stdout=stdout, stderr=stderr
+    )
+    return status, stdout.getvalue().decode(), stderr.getvalue().decode()
+
+
+class TestDaemonServer:
+    """Tests for DaemonServer."""
+
+    def test_run_commands(self, daemon) -> None:
+        """Test that commands run in the daemon share the connections of one transport."""
+        with MockGitLab(projects=1, issues_per_project=25) as server:
+            args = ["issue", "list", "--project", "1", "--per-page", "30", "--format", "ndjson"]
+            args += ["--token", "token", "--base-url", server.url]
+            for _ in range(2):
+                status, stdout, stderr = run(daemon, args)
+
+                assert status == 0, stderr
+                assert [json.loads(line)["iid"] for line in stdout.splitlines()] == list(range(1, 26))
+                assert json.loads(stderr)["metadata"]["status_code"] == 200  # noqa: PLR2004
+
+            status, stdout, _ = run(
+                daemon, ["user", "get", "--account-id", "1", "--token", "token", "--base-url", server.url]
+            )
+
+        assert status == 0
+        assert json.loads(stdout)["data"]["id"] == 1
+        assert get_default_transport() is daemon.transport
+        assert daemon.commands == 3  # noqa: PLR2004
+        assert daemon.transport.requests == 3  # noqa: PLR2004
+
+    def test_usage_error(self, daemon) -> None:
+        """Test that the exit status and the error of an invalid command are returned."""
+        status, stdout, stderr = run(daemon, ["issue", "list", "--no-such-option"])
+
+        assert status == 2  # noqa: PLR2004
+        assert stdout == ""
+        assert "--no-such-option" in stderr
+
+    def test_profile_starts_with_command(self, daemon) -> None:
+        """Test that --profile measures the command from when the daemon received it, not from the daemon start."""
+        time.sleep(0.5)
+
+        with MockGitLab(projects=1) as server:
+            status, _, stderr = run(
+                daemon, ["--profile", "project", "list", "--token", "token", "--base-url", server.url]
+            )
+
+        assert status == 0, stderr
+        total = next(line for line in stderr.splitlines() if line.startswith("total"))
+        assert float(total.split()[1]) < 500  # noqa: PLR2004
+
+    def test_silent_client(self, tmp_path_factory) -> None:
+        """Test that a client not sending its request is dropped after the request timeout."""
+        socket_path = tmp_path_factory.mktemp("d", numbered=True) / "s"
+        server = DaemonServer(socket_path=socket_path, idle_timeout=None, request_timeout=0.1)
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        silent = connect(socket_path)
+        try:
+            assert request_daemon(socket_path, "status")["commands"] == 0
+        finally:
+            silent.close()
+            request_daemon(socket_path, "stop")
+            thread.join(timeout=10)
+
+    def test_oversized_request(self, daemon) -> None:
+        """Test that a request larger than MAX_REQUEST_SIZE closes the connection and the daemon keeps serving."""
+        with connect(daemon.socket_path) as conn:
+            conn.sendall(HEADER.pack(REQUEST, MAX_REQUEST_SIZE + 1))
+
+            assert recv_frame(conn) is None
+        assert request_daemon(daemon.socket_path, "status")["commands"] == 0
+
+    def test_environment_restored(self, daemon, tmp_path) -> None:
+        """Test that the command runs in the directory and environment of the caller, restored afterwards."""
+        cwd = os.getcwd()
+        environ = dict(os.environ)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("accounts: {}\n")
+
+        with MockGitLab(projects=1) as server:
+            status, _, stderr = run(
+                daemon, ["project", "list", "--base-url", server.url], GLNOVA_CONFIG_PATH=str(config_path)
+            )
+
+        assert status == 1
+        assert "token" in stderr.lower()
+        assert os.getcwd() == cwd
+        assert dict(os.environ) == environ
+
+    def test_status_and_stop(self, tmp_path_factory) -> None:
+        """Test the status and stop requests, after which the socket is removed and the transport reset."""
+        socket_path = tmp_path_factory.mktemp("d", numbered=True) / "s"
+        server = DaemonServer(socket_path=socket_path, idle_timeout=None)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server.bind()
+        thread.start()
+
+        status = request_daemon(socket_path, "status")
+        reply = request_daemon(socket_path, "stop")
+        thread.join(timeout=10)
+
+        assert status["pid"] == os.getpid()
+        assert status["commands"] == 0
+        assert reply["stopped"] is True
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+        assert get_default_transport() is None
+
+    def test_already_listening(self, daemon) -> None:
+        """Test that a second server cannot bind the socket of a running one."""
+        with pytest.raises(RuntimeError, match="already listening"):
+            DaemonServer(socket_path=daemon.socket_path).bind()
+
+    def test_stale_socket(self, tmp_path_factory) -> None:
+        """Test that the socket left by a daemon that did not stop cleanly is replaced."""
+        socket_path = tmp_path_factory.mktemp("d", numbered=True) / "s"
+        stale = DaemonServer(socket_path=socket_path)
+        stale.bind()
+        stale._sock.close()
+
+        server = DaemonServer(socket_path=socket_path)
+        server.bind()
+        server.close()
+
+        assert not socket_path.exists()
+        assert str(server) == f"<DaemonServer socket={socket_path} commands=0>"
+
+    def test_idle_timeout(self, tmp_path_factory) -> None:
+        """Test that the server stops after the idle timeout."""
+        socket_path = tmp_path_factory.mktemp("d", numbered=True) / "s"
+        server = DaemonServer(socket_path=socket_path, idle_timeout=0.01)
+
+        server.serve_forever()
+
+        assert not socket_path.exists()
@@ -439,3 +439,44 @@ class TestEditCommandParameterTypes:
                 discussion_locked=None,
                 updated_at=None,
             )
+
+    def test_edit_command_assignee_username(self) -> None:
+        """Test edit_command resolves assignee usernames to IDs."""
+        ctx = MagicMock()
+        ctx.obj = {"config_path": None}
+
+        with (
+            patch("glnova.cli.utils.auth.get_auth_params") as mock_auth,
+            patch("glnova.client.gitlab.GitLab") as mock_gitlab,
+        ):
+
+            mock_auth.return_value = ("token", "https://gitlab.com")
+            mock_client = MagicMock()
+            mock_gitlab.return_value.__enter__.return_value = mock_client
+            mock_client.user.resolve_user_ids.return_value = {"alice": 7}
+            mock_client.issue.edit_issue.return_value = ({"id": 123}, {"status_code": 200, "etag": "etag123"})
+
+            edit_command(ctx, project_id="myproject", issue_iid=456, assignee_ids=[1], assignee_username=["alice"])
+
+            mock_client.user.resolve_user_ids.assert_called_once_with(["alice"])
+            assert mock_client.issue.edit_issue.call_args[1]["assignee_ids"] == [1, 7]
+
+    def test_edit_command_unresolved_assignee_username(self) -> None:
+        """Test edit_command fails when an assignee username cannot be resolved."""
+        ctx = MagicMock()
+        ctx.obj = {"config_path": None}
+
+        with (
+            patch("glnova.cli.utils.auth.get_auth_params") as mock_auth,
+            patch("glnova.client.gitlab.GitLab") as mock_gitlab,
+        ):
+
+            mock_auth.return_value = ("token", "https://gitlab.com")
+            mock_client = MagicMock()
+            mock_gitlab.return_value.__enter__.return_value = mock_client
+            mock_client.user.resolve_user_ids.return_value = {}
+
+            with pytest.raises(typer.Exit):
+                edit_command(ctx, project_id="myproject", issue_iid=456, assignee_username=["ghost"])
+
+            mock_client.issue.edit_issue.assert_not_called()
@@ -1,11 +1,17 @@
 """Simplified unit tests for glnova.cli.issue.list."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 import typer
+from typer.testing import CliRunner
 
 from glnova.cli.issue.list import list_command
+from glnova.cli.main import app
+from glnova.testing.mock_server import MockGitLab
+
+runner = CliRunner()
 
 
 class TestListCommandBasic:
@@ -26,6 +32,26 @@ class TestListCommandBasic:
         with patch("builtins.print"):
             list_command(ctx)
 
+    @patch("glnova.client.gitlab.GitLab")
+    @patch("glnova.cli.utils.auth.get_auth_params")
+    def test_list_command_ndjson_format(
+        self, mock_get_auth: MagicMock, mock_gitlab: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test list_command prints one issue per line with --format ndjson."""
+        ctx = MagicMock()
+        ctx.obj = {"config_path": None}
+
+        mock_get_auth.return_value = ("token", "https://gitlab.com")
+        mock_client = MagicMock()
+        mock_gitlab.return_value.__enter__.return_value = mock_client
+        mock_client.issue.list_issues.return_value = ([{"iid": 1}, {"iid": 2}], {"status_code": 200, "etag": None})
+
+        list_command(ctx, output_format="ndjson")
+
+        captured = capsys.readouterr()
+        assert captured.out == '{"iid": 1}\n{"iid": 2}\n'
+        assert '"status_code": 200' in captured.err
+
     @patch("glnova.client.gitlab.GitLab")
     @patch("glnova.cli.utils.auth.get_auth_params")
     def test_list_command_with_error(self, mock_get_auth: MagicMock, mock_gitlab: MagicMock) -> None:
@@ -163,3 +189,116 @@ class TestListCommandParameterConversions:
 
         with patch("builtins.print"):
             list_command(ctx, weight="Any")
+
+
+class TestListCommandAllPages:
+    """Tests for the --all-pages, --max-items and --jobs options of list_command."""
+
+    @pytest.mark.parametrize("jobs", ["1", "4"])
+    def test_all_pages(self, jobs: str) -> None:
+        """Test every issue of the project is printed once, in order, whatever the number of jobs."""
+        with MockGitLab(projects=1, issues_per_project=45) as server:
+            result = runner.invoke(
+                app,
+                [
+                    "issue",
+                    "list",
+                    "--project",
+                    "1",
+                    "--per-page",
+                    "10",
+                    "--all-pages",
+                    "--jobs",
+                    jobs,
+                    "--format",
+                    "ndjson",
+                    "--token",
+                    "token",
+                    "--base-url",
+                    server.url,
+                ],
+            )
+
+        assert result.exit_code == 0
+        iids = [json.loads(line)["iid"] for line in result.stdout.splitlines()]
+        assert iids == sorted(iids)
+        assert len(set(iids)) == 45  # noqa: PLR2004
+        assert json.loads(result.stderr)["metadata"] == {"status_code": 200, "pages": 5, "items": 45}
+
+    def test_max_items(self) -> None:
+        """Test the listing stops after --max-items issues and prints a JSON document."""
+        with MockGitLab(projects=1, issues_per_project=100) as server:
+            result = runner.invoke(
+                app,
+                [
+                    "issue",
+                    "list",
+                    "--project",
+                    "1",
+                    "--per-page",
+                    "20",
+                    "--max-items",
+                    "30",
+                    "--jobs",
+                    "3",
+                    "--token",
+                    "token",
+                    "--base-url",
+                    server.url,
+                ],
+            )
+            requests = server.requests["GET /projects/:id/issues"]
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert len(output["data"]) == 30  # noqa: PLR2004
+        assert output["metadata"]["items"] == 30  # noqa: PLR2004
+        assert requests == 2  # noqa: PLR2004
+
+    def test_etag_rejected(self) -> None:
+        """Test --etag cannot be combined with --all-pages."""
+        result = runner.invoke(
+            app,
+            ["issue", "list", "--all-pages", "--etag", "abc", "--token", "token", "--base-url", "http://127.0.0.1:9"],
+        )
+
+        assert result.exit_code == 1
+        assert "cannot be used with --all-pages" in result.stderr
+
+    def test_error(self) -> None:
+        """Test a failing page exits with an error."""
+        result = runner.invoke(
+            app,
+            ["issue", "list", "--all-pages", "--token", "token", "--base-url", "http://127.0.0.1:9"],
+        )
+
+        assert result.exit_code == 1
+
+
+class TestListCommandRaw:
+    """Tests for the --raw and --output options of list_command."""
+
+    def test_raw_output(self, tmp_path) -> None:
+        """Test --raw writes the response bodies to the --output file."""
+        path = tmp_path / "issues.ndjson"
+        arguments = ["issue", "list", "--project", "1", "--per-page", "10", "--all-pages", "--raw"]
+        with MockGitLab(projects=1, issues_per_project=25) as server:
+            result = runner.invoke(
+                app, [*arguments, "--output", str(path), "--token", "token", "--base-url", server.url]
+            )
+
+        assert result.exit_code == 0
+        assert result.stdout == ""
+        pages = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [len(page) for page in pages] == [10, 10, 5]
+        metadata = [json.loads(line)["metadata"] for line in result.stderr.splitlines()]
+        assert [item["headers"]["X-Page"] for item in metadata] == ["1", "2", "3"]
+
+    def test_output_requires_raw(self) -> None:
+        """Test --output is rejected without --raw."""
+        result = runner.invoke(
+            app, ["issue", "list", "--output", "issues.json", "--token", "token", "--base-url", "http://127.0.0.1:9"]
+        )
+
+        assert result.exit_code == 1
+        assert "--output can only be used with --raw" in result.stderr
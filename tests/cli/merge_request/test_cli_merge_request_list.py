@@ -13,6 +13,7 @@ from typer.testing import CliRunner
 
 from glnova.cli.main import app
 from glnova.cli.merge_request.list import list_command
+from glnova.testing.mock_server import MockGitLab
 
 
 class TestListCommand:
@@ -329,3 +330,56 @@ class TestListCommand:
         assert "--assignee-id" in output
         assert "--approved" in output
         assert "--labels" in output
+
+
+class TestListCommandAllPages:
+    """Tests for the --all-pages option of the merge request list command."""
+
+    def test_all_pages(self) -> None:
+        """Test --all-pages lists every merge request of the project."""
+        with MockGitLab(projects=1, merge_requests_per_project=25) as server:
+            result = CliRunner().invoke(
+                app,
+                [
+                    "merge-request",
+                    "list",
+                    "--project-id",
+                    "1",
+                    "--per-page",
+                    "10",
+                    "--all-pages",
+                    "--jobs",
+                    "2",
+                    "--format",
+                    "ndjson",
+                    "--token",
+                    "token",
+                    "--base-url",
+                    server.url,
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert len(result.stdout.splitlines()) == 25  # noqa: PLR2004
+
+    def test_raw_rejects_format(self) -> None:
+        """Test --format cannot be combined with --raw."""
+        result = CliRunner().invoke(
+            app,
+            [
+                "merge-request",
+                "list",
+                "--raw",
+                "--format",
+                "json",
+                "--project-id",
+                "1",
+                "--token",
+                "token",
+                "--base-url",
+                "http://127.0.0.1:9",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "--format cannot be used with --raw" in result.stderr
@@ -1,11 +1,17 @@
 """Simplified unit tests for glnova.cli.project.list."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 import typer
+from typer.testing import CliRunner
 
+from glnova.cli.main import app
 from glnova.cli.project.list import list_command
+from glnova.testing.mock_server import MockGitLab
+
+runner = CliRunner()
 
 
 class TestListCommandBasic:
@@ -107,3 +113,53 @@ class TestListCommandParameterConversions:
 
         with patch("builtins.print"):
             list_command(ctx, topic_id=789)
+
+
+class TestListCommandPages:
+    """Tests for the pagination options of list_command."""
+
+    def test_page(self) -> None:
+        """Test --page and --per-page select a single page."""
+        with MockGitLab(projects=12) as server:
+            result = runner.invoke(
+                app,
+                ["project", "list", "--page", "2", "--per-page", "5", "--token", "token", "--base-url", server.url],
+            )
+
+        assert result.exit_code == 0
+        assert [project["id"] for project in json.loads(result.stdout)["data"]] == [6, 7, 8, 9, 10]
+
+    def test_all_pages(self) -> None:
+        """Test --all-pages lists every project."""
+        with MockGitLab(projects=12) as server:
+            result = runner.invoke(
+                app,
+                [
+                    "project",
+                    "list",
+                    "--per-page",
+                    "5",
+                    "--all-pages",
+                    "--jobs",
+                    "2",
+                    "--format",
+                    "csv",
+                    "--token",
+                    "token",
+                    "--base-url",
+                    server.url,
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert len(result.stdout.splitlines()) == 13  # noqa: PLR2004
+
+    def test_raw_rejects_format(self) -> None:
+        """Test --format cannot be combined with --raw."""
+        result = runner.invoke(
+            app,
+            ["project", "list", "--raw", "--format", "json", "--token", "token", "--base-url", "http://127.0.0.1:9"],
+        )
+
+        assert result.exit_code == 1
+        assert "--format cannot be used with --raw" in result.stderr
@@ -0,0 +1,117 @@
+"""Unit tests for glnova.cli.completion."""
+
+import pytest
+from typer.testing import CliRunner
+
+from glnova.cli.completion import (
+    COMPLETE_VAR,
+    build_index,
+    complete,
+    load_index,
+    render_completion,
+    serve_completion,
+)
+from glnova.cli.main import app
+
+LINES = [
+    "glnova ",
+    "glnova is",
+    "glnova -v ",
+    "glnova issue list --st",
+    "glnova issue list --state ",
+    "glnova issue list --state=c",
+    "glnova issue list --state opened --s",
+    "glnova issue list --labels a --la",
+    "glnova merge-request list --order-by ",
+    "glnova issue get --project-id 1 --",
+]
+
+
+@pytest.fixture(scope="module")
+def index():
+    """Load the committed completion index."""
+    return load_index()
+
+
+class TestCompletionIndex:
+    """Tests for the completion index."""
+
+    def test_index_is_up_to_date(self, index) -> None:
+        """Test that the committed index matches the CLI; regenerate it with python -m glnova.cli.completion."""
+        assert index == build_index()
+
+    def test_choices(self, index) -> None:
+        """Test that literal choices are indexed."""
+        options = {
+            name: option
+            for option in index["commands"]["issue"]["commands"]["list"]["options"]
+            for name in option["names"]
+        }
+
+        assert options["--state"]["choices"] == ["opened", "closed", "all"]
+        assert "updated_at" in options["--order-by"]["choices"]
+        assert options["--confidential"]["takes_value"] is False
+
+
+class TestComplete:
+    """Tests for complete."""
+
+    def test_commands(self, index) -> None:
+        """Test that subcommands are completed by prefix."""
+        assert [value for value, _ in complete(index, ["issue"], "")] == ["edit", "get", "list"]
+        assert complete(index, [], "merge") == [("merge-request", "Manage GitLab merge requests.")]
+
+    def test_option_values(self, index) -> None:
+        """Test that option values are completed from their choices, also after an equals sign."""
+        assert complete(index, ["issue", "list", "--sort"], "") == [("asc", ""), ("desc", "")]
+        assert complete(index, ["issue", "list"], "--sort=d") == [("desc", "")]
+        assert complete(index, ["issue", "list", "--search"], "") == []
+
+    def test_used_options(self, index) -> None:
+        """Test that options already given are not offered again unless they can be repeated."""
+        values = [value for value, _ in complete(index, ["issue", "list", "--sort", "asc", "--labels", "a"], "--")]
+
+        assert "--sort" not in values
+        assert "--labels" in values
+        assert "--help" in values
+
+
+class TestRenderCompletion:
+    """Tests for render_completion and serve_completion."""
+
+    @pytest.mark.parametrize("line", LINES)
+    @pytest.mark.parametrize("shell", ["zsh", "fish"])
+    def test_matches_typer(self, index, shell, line) -> None:
+        """Test that the output is the one of the Typer completion, which also wraps long help texts."""
+        env = {
+            COMPLETE_VAR: f"complete_{shell}",
+            "_TYPER_COMPLETE_ARGS": line,
+            "_TYPER_COMPLETE_FISH_ACTION": "get-args",
+        }
+
+        result = CliRunner().invoke(app, [], prog_name="glnova", env=env)
+        output, status = render_completion(shell, index, env)
+
+        assert output.split() == result.stdout.split()
+        assert status == result.exit_code
+
+    def test_bash(self, index) -> None:
+        """Test the bash completion, which gets the words and the position of the cursor."""
+        env = {"COMP_WORDS": "glnova issue list --state", "COMP_CWORD": "3"}
+
+        assert render_completion("bash", index, env) == ("--state", 0)
+
+    def test_fish_is_args(self, index) -> None:
+        """Test that fish is told whether to complete files instead."""
+        env = {"_TYPER_COMPLETE_FISH_ACTION": "is-args"}
+
+        assert render_completion("fish", index, {**env, "_TYPER_COMPLETE_ARGS": "glnova is"}) == ("", 0)
+        assert render_completion("fish", index, {**env, "_TYPER_COMPLETE_ARGS": "glnova xyz"}) == ("", 1)
+
+    def test_serve(self, capsys) -> None:
+        """Test that completion requests are answered and other invocations are left to Typer."""
+        assert serve_completion({COMPLETE_VAR: "complete_bash", "COMP_WORDS": "glnova tr", "COMP_CWORD": "1"}) == 0
+        assert capsys.readouterr().out == "trace\n"
+        assert serve_completion({}) is None
+        assert serve_completion({COMPLETE_VAR: "source_bash"}) is None
+        assert serve_completion({COMPLETE_VAR: "complete_powershell"}) is None
@@ -0,0 +1,48 @@
+"""Unit tests for glnova.cli.entry."""
+
+from unittest.mock import patch
+
+import pytest
+
+from glnova.cli.entry import main
+
+
+class TestMain:
+    """Tests for the console script."""
+
+    @patch("glnova.cli.main.app")
+    def test_completion(self, mock_app, monkeypatch, capsys) -> None:
+        """Test that completion requests are answered without running the CLI."""
+        monkeypatch.setenv("_GLNOVA_COMPLETE", "complete_bash")
+        monkeypatch.setenv("COMP_WORDS", "glnova us")
+        monkeypatch.setenv("COMP_CWORD", "1")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out == "user\n"
+        mock_app.assert_not_called()
+
+    @patch("glnova.cli.main.app")
+    def test_run(self, mock_app, monkeypatch) -> None:
+        """Test that other invocations run the CLI."""
+        monkeypatch.delenv("_GLNOVA_COMPLETE", raising=False)
+
+        main()
+
+        mock_app.assert_called_once_with()
+
+    @patch("glnova.cli.main.app")
+    @patch("glnova.cli.daemon.client.route_command", return_value=3)
+    def test_routed(self, mock_route, mock_app, monkeypatch) -> None:
+        """Test that commands run by the daemon are not run in the process."""
+        monkeypatch.delenv("_GLNOVA_COMPLETE", raising=False)
+        monkeypatch.setattr("sys.argv", ["glnova", "issue", "list"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 3  # noqa: PLR2004
+        mock_route.assert_called_once_with(["issue", "list"])
+        mock_app.assert_not_called()
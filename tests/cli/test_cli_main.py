@@ -1,11 +1,14 @@
 """Unit tests for glnova.cli.main."""
 
 import logging
+import os
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import typer
 
-from glnova.cli.main import LoggingLevel, main, register_commands, setup_logging
+from glnova.cli.main import COMMANDS, DeferredRichHandler, LoggingLevel, app, load_command, main, setup_logging
 
 
 class TestLoggingLevel:
@@ -49,8 +52,12 @@ class TestSetupLogging:
         # Check that logger was configured
         logger = logging.getLogger("glnova")
         assert logger.level == logging.INFO
+        assert logger.propagate is False
 
-        # Check that RichHandler was created with correct parameters
+        # Check that the RichHandler is only created for the first record
+        mock_rich_handler.assert_not_called()
+        logger.info("message")
+        logger.info("message")
         mock_rich_handler.assert_called_once()
         call_kwargs = mock_rich_handler.call_args[1]
         assert call_kwargs["console"] == mock_console_instance
@@ -59,10 +66,7 @@ class TestSetupLogging:
         assert call_kwargs["show_level"] is True
         assert call_kwargs["markup"] is True
         assert call_kwargs["level"] == "INFO"
-
-        # Check that handler was added to logger
-        assert mock_handler_instance in logger.handlers
-        assert logger.propagate is False
+        assert mock_handler_instance.handle.call_count == 2  # noqa: PLR2004
 
     @patch("rich.logging.RichHandler")
     @patch("rich.console.Console")
@@ -77,22 +81,14 @@ class TestSetupLogging:
 
         logger = logging.getLogger("glnova")
         assert logger.level == logging.DEBUG
+        logger.debug("message")
 
         # Check RichHandler was created with DEBUG level
         call_kwargs = mock_rich_handler.call_args[1]
         assert call_kwargs["level"] == "DEBUG"
 
-    @patch("rich.logging.RichHandler")
-    @patch("rich.console.Console")
-    def test_setup_logging_removes_existing_handlers(
-        self, mock_console: MagicMock, mock_rich_handler: MagicMock
-    ) -> None:
+    def test_setup_logging_removes_existing_handlers(self) -> None:
         """Test that setup_logging removes existing handlers."""
-        mock_console_instance = MagicMock()
-        mock_console.return_value = mock_console_instance
-        mock_handler_instance = MagicMock()
-        mock_rich_handler.return_value = mock_handler_instance
-
         logger = logging.getLogger("glnova")
         existing_handler = MagicMock()
         logger.addHandler(existing_handler)
@@ -102,7 +98,8 @@ class TestSetupLogging:
         # Check that existing handler was removed
         assert existing_handler not in logger.handlers
         # And new handler was added
-        assert mock_handler_instance in logger.handlers
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], DeferredRichHandler)
 
 
 class TestMainCallback:
@@ -178,39 +175,56 @@ class TestMainCallback:
         mock_getenv.assert_not_called()
 
 
-class TestRegisterCommands:
-    """Tests for register_commands function."""
+class TestLazyCommands:
+    """Tests for the lazy registration of the commands."""
+
+    def test_help_lists_every_command(self) -> None:
+        """Test that the help lists the commands that are not imported yet."""
+        from typer.testing import CliRunner  # noqa: PLC0415
+
+        result = CliRunner().invoke(app, ["--help"])
 
-    @patch("glnova.cli.main.app")
-    @patch("glnova.cli.config.main.config_app")
-    @patch("glnova.cli.issue.main.issue_app")
-    def test_register_commands(
-        self, mock_issue_app: MagicMock, mock_config_app: MagicMock, mock_app: MagicMock
-    ) -> None:
-        """Test that register_commands adds the issue_app to main app."""
-        register_commands()
+        assert result.exit_code == 0
+        for name in COMMANDS:
+            assert name in result.stdout
 
-        # Check that add_typer was called with config_app
-        mock_app.add_typer.assert_any_call(mock_config_app)
-        # Check that add_typer was called with issue_app
-        mock_app.add_typer.assert_any_call(mock_issue_app)
+    def test_load_command(self) -> None:
+        """Test that Typer apps load as groups and functions as commands."""
+        issue = load_command("issue")
+        bench = load_command("bench")
 
-    @patch("glnova.cli.main.app")
-    @patch("glnova.cli.issue.main.issue_app")
-    def test_register_commands_imports_issue_app(self, mock_issue_app: MagicMock, mock_app: MagicMock) -> None:
-        """Test that register_commands imports the issue_app module."""
-        # Clear any cached imports
-        import sys  # noqa: PLC0415
+        assert issue.name == "issue"
+        assert {"get", "list", "edit"} <= set(issue.commands)
+        assert bench.name == "bench"
+        assert bench.help == COMMANDS["bench"][2]
 
-        modules_to_clear = [k for k in sys.modules if k.startswith("glnova.cli.issue")]
-        for module in modules_to_clear:
-            del sys.modules[module]
+    def test_unknown_command(self) -> None:
+        """Test that an unknown command is still reported as such."""
+        from typer.testing import CliRunner  # noqa: PLC0415
 
-        with patch.dict("sys.modules", {"glnova.cli.issue.main": MagicMock()}):
-            register_commands()
+        result = CliRunner().invoke(app, ["unknown"])
 
-        # The import should have been attempted
-        # This is tested implicitly by the fact that the function runs without ImportError
+        assert result.exit_code == 2  # noqa: PLR2004
+
+    def test_startup_imports(self) -> None:
+        """Test that the package and the issue commands import neither aiohttp nor rich."""
+        code = (
+            "import sys, glnova; assert 'requests' not in sys.modules; "
+            "import glnova.cli.main, glnova.cli.issue.get, glnova.cli.utils.api, glnova.cli.utils.auth, "
+            "glnova.client.gitlab; print(sorted({name.split('.')[0] for name in sys.modules}))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        modules = result.stdout
+        assert "'requests'" in modules
+        for name in ("aiohttp", "rich", "pydantic", "yaml"):
+            assert f"'{name}'" not in modules
 
 
 class TestMainAppConfiguration:
@@ -227,3 +241,34 @@ class TestMainAppConfiguration:
         from glnova.cli.main import app  # noqa: PLC0415
 
         assert "Main CLI for glnova" in app.info.help
+
+
+class TestProfileOption:
+    """Tests for the --profile option."""
+
+    def test_profile_prints_report(self, tmp_path) -> None:
+        """Test that --profile prints the phase table to stderr and leaves stdout untouched."""
+        from typer.testing import CliRunner  # noqa: PLC0415
+
+        from glnova.cli.main import app  # noqa: PLC0415
+
+        result = CliRunner().invoke(
+            app, ["--config-path", str(tmp_path / "config.yaml"), "--profile", "config", "list"]
+        )
+
+        assert result.exit_code == 0
+        assert "Phase" in result.stderr
+        assert "startup" in result.stderr
+        assert "Phase" not in result.stdout
+
+    def test_load_command_records_imports(self) -> None:
+        """Test that importing a command is reported as the imports phase."""
+        from glnova.cli.utils.profile import start_profiling, stop_profiling  # noqa: PLC0415
+
+        profiler = start_profiling(start=0.0)
+        try:
+            load_command("trace")
+        finally:
+            stop_profiling()
+
+        assert "imports" in profiler.phases
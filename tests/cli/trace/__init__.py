@@ -0,0 +1 @@
+"""Unit tests for glnova.cli.trace package."""
@@ -0,0 +1,15 @@
+"""Unit tests for glnova.cli.trace.main."""
+
+from glnova.cli.trace.main import trace_app
+
+
+class TestTraceAppConfiguration:
+    """Tests for trace_app configuration."""
+
+    def test_trace_app_has_correct_name(self) -> None:
+        """Test that the trace app has the correct name."""
+        assert trace_app.info.name == "trace"
+
+    def test_trace_app_has_help(self) -> None:
+        """Test that the trace app has help text."""
+        assert "Inspect request traces" in trace_app.info.help
@@ -0,0 +1,51 @@
+"""Unit tests for glnova.cli.trace.summarize."""
+
+import json
+
+from typer.testing import CliRunner
+
+from glnova.cli.main import app
+from glnova.client.events import RequestEvent
+from glnova.client.trace import TraceRecorder
+
+runner = CliRunner()
+
+
+class TestSummarizeCommand:
+    """Tests for the trace summarize command."""
+
+    def test_summarize(self, tmp_path) -> None:
+        """Test that the summary of a trace is printed as JSON."""
+        path = tmp_path / "trace.har"
+        with TraceRecorder(path) as recorder:
+            for _ in range(2):
+                recorder(RequestEvent(method="GET", endpoint="/users/1", status=200, timings={"total": 0.1}))
+
+        result = runner.invoke(app, ["trace", "summarize", str(path), "--top", "1"])
+
+        assert result.exit_code == 0
+        summary = json.loads(result.stdout)
+        assert summary["requests"] == 2  # noqa: PLR2004
+        assert len(summary["slowest"]) == 1
+        assert summary["repeated"][0]["count"] == 2  # noqa: PLR2004
+
+    def test_summarize_invalid_file(self, tmp_path) -> None:
+        """Test that an unreadable trace exits with an error."""
+        path = tmp_path / "trace.jsonl"
+        path.write_text("not json\n")
+
+        result = runner.invoke(app, ["trace", "summarize", str(path)])
+
+        assert result.exit_code == 1
+        assert "cannot read trace" in result.stderr
+
+    def test_trace_option(self, tmp_path) -> None:
+        """Test that the global --trace option creates the trace file."""
+        path = tmp_path / "trace.jsonl"
+
+        result = runner.invoke(
+            app, ["--config-path", str(tmp_path / "config.yaml"), "--trace", str(path), "config", "list"]
+        )
+
+        assert result.exit_code == 0
+        assert path.exists()
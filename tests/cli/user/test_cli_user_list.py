@@ -7,8 +7,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import typer
+from typer.testing import CliRunner
 
+from glnova.cli.main import app
 from glnova.cli.user.list import list_command
+from glnova.testing.mock_server import MockGitLab
+
+runner = CliRunner()
 
 
 class TestListCommand:
@@ -94,3 +99,41 @@ class TestListCommand:
             list_command(ctx=mock_context)
 
         assert exc_info.value.exit_code == 1
+
+
+class TestListCommandAllPages:
+    """Tests for the --all-pages option of the user list command."""
+
+    def test_all_pages(self) -> None:
+        """Test --all-pages lists every user."""
+        with MockGitLab(users=25) as server:
+            result = runner.invoke(
+                app,
+                [
+                    "user",
+                    "list",
+                    "--per-page",
+                    "10",
+                    "--all-pages",
+                    "--jobs",
+                    "3",
+                    "--format",
+                    "ndjson",
+                    "--token",
+                    "token",
+                    "--base-url",
+                    server.url,
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert len(result.stdout.splitlines()) == 25  # noqa: PLR2004
+
+    def test_raw_rejects_format(self) -> None:
+        """Test --format cannot be combined with --raw."""
+        result = runner.invoke(
+            app, ["user", "list", "--raw", "--format", "json", "--token", "token", "--base-url", "http://127.0.0.1:9"]
+        )
+
+        assert result.exit_code == 1
+        assert "--format cannot be used with --raw" in result.stderr
@@ -6,7 +6,8 @@ from unittest.mock import MagicMock
 import pytest
 import typer
 
-from glnova.cli.utils.api import execute_api_command
+from glnova.cli.utils.api import execute_api_command, execute_raw_command, validate_list_options
+from glnova.testing.mock_server import MockGitLab
 
 
 def test_execute_api_command_success(capsys):
@@ -41,6 +42,134 @@ def test_execute_api_command_exception(monkeypatch):
 
     # Logger.exception should have been called with the message and the command name and exception
     mock_logger.exception.assert_called_once()
-    call_args = mock_logger.exception.call_args[0]
-    assert call_args[1] == "MyCmd"
-    assert isinstance(call_args[2], ValueError)
+    assert mock_logger.exception.call_args[0] == ("Error executing %s", "MyCmd")
+
+
+def test_execute_api_command_ndjson(capsys):
+    """Should print one record per line and the metadata on stderr."""
+
+    def api_call():
+        return [{"id": 1}, {"id": 2}], {"meta": 1}
+
+    execute_api_command(api_call, command_name="MyCmd", output_format="ndjson")
+
+    captured = capsys.readouterr()
+    assert captured.out == '{"id": 1}\n{"id": 2}\n'
+    assert json.loads(captured.err) == {"metadata": {"meta": 1}}
+
+
+def test_execute_api_command_broken_pipe(monkeypatch):
+    """Should stop quietly when the consumer of stdout closes it."""
+
+    def api_call():
+        return [{"id": 1}], {"meta": 1}
+
+    def write(self, records):
+        raise BrokenPipeError
+
+    mock_silence = MagicMock()
+    monkeypatch.setattr("glnova.cli.utils.output.OutputWriter.write", write)
+    monkeypatch.setattr("glnova.cli.utils.api.silence_stdout", mock_silence)
+
+    execute_api_command(api_call, command_name="MyCmd")
+
+    mock_silence.assert_called_once_with()
+
+
+def test_execute_raw_command_all_pages(capsysbinary):
+    """Should write every response body as received, one per line, and the pagination headers on stderr."""
+    with MockGitLab(projects=1, issues_per_project=5) as server:
+        execute_raw_command(
+            lambda client, page: client.issue._list_issues(project=1, page=page, per_page=2, stream=True),
+            token="token",
+            base_url=server.url,
+            all_pages=True,
+        )
+
+    captured = capsysbinary.readouterr()
+    pages = [json.loads(line) for line in captured.out.splitlines()]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    metadata = [json.loads(line)["metadata"] for line in captured.err.splitlines()]
+    assert [item["headers"]["X-Page"] for item in metadata] == ["1", "2", "3"]
+    assert metadata[0]["headers"]["X-Total"] == "5"
+    assert metadata[0]["status_code"] == 200  # noqa: PLR2004
+
+
+def test_execute_raw_command_output_file(tmp_path, capsysbinary):
+    """Should write the body of a single page to the output file."""
+    path = tmp_path / "issues.json"
+    with MockGitLab(projects=1, issues_per_project=5) as server:
+        execute_raw_command(
+            lambda client, page: client.issue._list_issues(project=1, page=page, per_page=2, stream=True),
+            token="token",
+            base_url=server.url,
+            output_path=str(path),
+        )
+
+    assert len(json.loads(path.read_bytes())) == 2  # noqa: PLR2004
+    assert capsysbinary.readouterr().out == b""
+
+
+def test_execute_raw_command_exception(monkeypatch):
+    """Should log the exception and raise typer.Exit with code 1."""
+    mock_logger = MagicMock()
+    monkeypatch.setattr("glnova.cli.utils.api.logger", mock_logger)
+
+    with pytest.raises(typer.Exit):
+        execute_raw_command(
+            lambda client, page: client.issue._list_issues(project=1, page=page, stream=True),
+            token="token",
+            base_url="http://127.0.0.1:9",
+            command_name="MyCmd",
+        )
+
+    assert mock_logger.exception.call_args[0][1] == "MyCmd"
+
+
+LIST_OPTIONS = {
+    "raw": False,
+    "output_format": None,
+    "output": None,
+    "all_pages": False,
+    "max_items": None,
+    "jobs": 1,
+    "etag": None,
+    "cursor": None,
+}
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        ({}, "json"),
+        ({"output_format": "csv"}, "csv"),
+        ({"raw": True, "output": "out.json", "all_pages": True}, "json"),
+        ({"all_pages": True, "max_items": 5, "jobs": 4}, "json"),
+        ({"etag": "abc", "cursor": "xyz"}, "json"),
+    ],
+)
+def test_validate_list_options_valid(options, expected):
+    """Should return the output format of valid combinations, json by default."""
+    assert validate_list_options(**{**LIST_OPTIONS, **options}) == expected
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"raw": True, "jobs": 2}, "--max-items and --jobs cannot be used with --raw."),
+        ({"raw": True, "max_items": 5}, "--max-items and --jobs cannot be used with --raw."),
+        ({"raw": True, "output_format": "ndjson"}, "--format cannot be used with --raw."),
+        ({"output": "out.json"}, "--output can only be used with --raw."),
+        ({"all_pages": True, "etag": "abc"}, "--etag cannot be used with --all-pages or --max-items."),
+        ({"max_items": 5, "etag": "abc"}, "--etag cannot be used with --all-pages or --max-items."),
+        ({"all_pages": True, "cursor": "xyz"}, "--cursor cannot be used with --all-pages or --max-items."),
+        ({"raw": True, "all_pages": True, "cursor": "xyz"}, "--cursor cannot be used with --all-pages or --max-items."),
+    ],
+)
+def test_validate_list_options_invalid(options, message, capsys):
+    """Should print the error and raise typer.Exit for options that cannot be combined."""
+    with pytest.raises(typer.Exit) as exc_info:
+        validate_list_options(**{**LIST_OPTIONS, **options})
+
+    assert exc_info.value.exit_code == 1
+    assert capsys.readouterr().err == f"Error: {message}\n"
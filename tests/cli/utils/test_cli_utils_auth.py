@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from glnova.cli.utils.auth import get_auth_params
+from glnova.cli.utils.auth import get_auth_params, load_config_manager
 
 
 class TestGetAuthParams:
@@ -233,3 +233,27 @@ class TestGetAuthParams:
                 token=None,
                 base_url="https://custom.gitlab.com",
             )
+
+
+class TestLoadConfigManager:
+    """Tests for the load_config_manager function."""
+
+    def test_reuses_unchanged_config(self, tmp_path) -> None:
+        """Test that the configuration is parsed again only after the file changes."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("accounts:\n  a:\n    name: a\n    token: t1\n    base_url: https://a.example\n")
+
+        first = load_config_manager(config_file)
+        second = load_config_manager(config_file)
+        config_file.write_text("accounts:\n  a:\n    name: a\n    token: token2\n    base_url: https://a.example\n")
+        third = load_config_manager(config_file)
+
+        assert second is first
+        assert third is not first
+        assert third.get_config(name="a").token == "token2"
+
+    def test_missing_config(self, tmp_path) -> None:
+        """Test that a missing configuration file is loaded without being cached."""
+        config_file = tmp_path / "missing.yaml"
+
+        assert load_config_manager(config_file) is not load_config_manager(config_file)
@@ -0,0 +1,97 @@
+"""Unit tests for the streaming output of CLI commands."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+import pytest
+
+from glnova.cli.utils.output import OutputWriter
+
+RECORDS = [
+    {"id": 1, "title": "First", "labels": ["bug", "ui"], "author": {"id": 7}, "due_date": None},
+    {"id": 2, "title": "Second, with a comma", "labels": [], "author": {"id": 8}, "due_date": "2026-01-01"},
+]
+
+METADATA = {"status_code": 200, "etag": 'W/"abc"'}
+
+
+def _write(output_format: str, pages: list, single: bool = False) -> tuple[str, str]:
+    """Write pages of records and return the output and the error output."""
+    stream, err_stream = io.StringIO(), io.StringIO()
+    writer = OutputWriter(output_format=output_format, single=single, stream=stream, err_stream=err_stream)
+    for page in pages:
+        writer.write(page)
+    writer.close(METADATA)
+    return stream.getvalue(), err_stream.getvalue()
+
+
+class TestJsonFormat:
+    """Tests for the json format."""
+
+    @pytest.mark.parametrize("pages", [[RECORDS], [RECORDS[:1], RECORDS[1:]], [], [[]]])
+    def test_identical_to_json_dumps(self, pages: list) -> None:
+        """Test the streamed document is identical to the document dumped at once."""
+        output, errors = _write("json", pages)
+
+        data = [record for page in pages for record in page]
+        assert output == json.dumps({"data": data, "metadata": METADATA}, indent=2, default=str) + "\n"
+        assert errors == ""
+
+    def test_single_object(self) -> None:
+        """Test a single object is written as the data."""
+        output, _ = _write("json", [RECORDS[:1]], single=True)
+
+        assert output == json.dumps({"data": RECORDS[0], "metadata": METADATA}, indent=2, default=str) + "\n"
+
+
+class TestLineFormats:
+    """Tests for the ndjson and csv formats."""
+
+    def test_ndjson(self) -> None:
+        """Test one record is written per line and the metadata on stderr."""
+        output, errors = _write("ndjson", [RECORDS[:1], RECORDS[1:]])
+
+        assert [json.loads(line) for line in output.splitlines()] == RECORDS
+        assert json.loads(errors) == {"metadata": METADATA}
+
+    def test_csv(self) -> None:
+        """Test the header comes from the first record and nested values are written as JSON."""
+        output, errors = _write("csv", [RECORDS])
+
+        rows = list(csv.DictReader(io.StringIO(output)))
+        assert list(rows[0]) == list(RECORDS[0])
+        assert rows[0]["labels"] == '["bug","ui"]'
+        assert rows[0]["author"] == '{"id":7}'
+        assert rows[0]["due_date"] == ""
+        assert rows[1]["title"] == "Second, with a comma"
+        assert rows[1]["id"] == "2"
+        assert json.loads(errors) == {"metadata": METADATA}
+
+    def test_csv_ignores_extra_fields(self) -> None:
+        """Test fields missing from the header are dropped with one warning per field."""
+        output, errors = _write("csv", [[{"id": 1}, {"id": 2, "extra": True}], [{"id": 3, "extra": False, "more": 1}]])
+
+        assert output == "id\n1\n2\n3\n"
+        warnings = errors.splitlines()[:-1]
+        assert warnings == [
+            "Warning: CSV columns missing from the header were dropped: extra",
+            "Warning: CSV columns missing from the header were dropped: more",
+        ]
+
+    def test_flushes_every_page(self) -> None:
+        """Test every page is flushed as soon as it is written."""
+        stream = io.StringIO()
+        flushed = []
+        stream.flush = lambda: flushed.append(stream.getvalue())  # type: ignore[method-assign]
+        writer = OutputWriter(output_format="ndjson", stream=stream, err_stream=io.StringIO())
+
+        writer.write(RECORDS[:1])
+        writer.write(RECORDS[1:])
+
+        assert len(flushed) == 2  # noqa: PLR2004
+        assert flushed[0].count("\n") == 1
+        assert writer.count == 2  # noqa: PLR2004
+        assert str(writer) == "<OutputWriter format=ndjson count=2>"
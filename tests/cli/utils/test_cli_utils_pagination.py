@@ -0,0 +1,201 @@
+"""Unit tests for the pagination of CLI list commands."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from glnova.cli.utils.pagination import Progress, fetch_pages
+from glnova.client.adaptive import AIMDController
+
+
+class _Listing:
+    """Fake list endpoint recording the pages requested and the pages in flight."""
+
+    def __init__(self, total: int, server_page_size: int = 100) -> None:
+        self.total = total
+        self.server_page_size = server_page_size
+        self.requested: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def list_page(self, client: Any, page: int, per_page: int) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        self.requested.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later pages arrive first, to check that the pages are handed over in order.
+        await asyncio.sleep(0.001 * (10 - page % 10))
+        self.in_flight -= 1
+        size = min(per_page, self.server_page_size)
+        start = (page - 1) * size
+        return [{"id": index} for index in range(start, min(start + size, self.total))], {"status_code": 200}
+
+
+def _fetch(listing: _Listing, **kwargs: Any) -> tuple[list[int], dict[str, Any]]:
+    """Fetch the pages of a fake listing and return the IDs and the metadata."""
+    per_page = kwargs.get("per_page", 20)
+    ids: list[int] = []
+
+    async def list_page(client: Any, page: int) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        return await listing.list_page(client, page, per_page)
+
+    metadata = asyncio.run(
+        fetch_pages(list_page, None, on_page=lambda records: ids.extend(record["id"] for record in records), **kwargs)
+    )
+    return ids, metadata
+
+
+class TestFetchPages:
+    """Tests for fetch_pages."""
+
+    @pytest.mark.parametrize("jobs", [1, 3, 8])
+    def test_all_pages_in_order(self, jobs: int) -> None:
+        """Test every record is handed over once, in order, with up to jobs pages in flight."""
+        listing = _Listing(total=95)
+
+        ids, metadata = _fetch(listing, per_page=10, jobs=jobs)
+
+        assert ids == list(range(95))
+        assert metadata == {"status_code": 200, "pages": 10, "items": 95}
+        assert listing.max_in_flight <= jobs
+        assert max(listing.requested) <= 10 + jobs - 1
+
+    def test_exact_multiple_ends_with_empty_page(self) -> None:
+        """Test a listing filling its last page ends with the following empty page."""
+        listing = _Listing(total=40)
+
+        ids, metadata = _fetch(listing, per_page=20)
+
+        assert ids == list(range(40))
+        assert metadata["pages"] == 2  # noqa: PLR2004
+        assert listing.requested == [1, 2, 3]
+
+    def test_start_page(self) -> None:
+        """Test the pages before the start page are skipped."""
+        ids, _ = _fetch(_Listing(total=50), start_page=3, per_page=20, jobs=2)
+
+        assert ids == list(range(40, 50))
+
+    def test_max_items(self) -> None:
+        """Test no more records than max_items are handed over, nor more pages than needed requested."""
+        listing = _Listing(total=1000)
+
+        ids, metadata = _fetch(listing, per_page=20, jobs=4, max_items=45)
+
+        assert ids == list(range(45))
+        assert metadata["items"] == 45  # noqa: PLR2004
+        assert sorted(listing.requested) == [1, 2, 3]
+
+    def test_page_size_capped(self) -> None:
+        """Test a page size above the maximum of GitLab does not end the listing after the first page."""
+        ids, metadata = _fetch(_Listing(total=250), per_page=500)
+
+        assert ids == list(range(250))
+        assert metadata["pages"] == 3  # noqa: PLR2004
+
+    def test_error_cancels_pending_pages(self) -> None:
+        """Test an error of a page is raised and the other pages in flight are cancelled."""
+        cancelled = []
+
+        async def list_page(client: Any, page: int) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+            if page == 1:
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+            return [], {"status_code": 200}
+
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(fetch_pages(list_page, None, on_page=lambda records: None, jobs=3))
+
+        assert sorted(cancelled) == [2, 3]
+
+    def test_controller_retries_overloaded_pages(self) -> None:
+        """Test a page failing with an overload error is requested again while the concurrency drops."""
+        listing = _Listing(total=95)
+        failed: set[int] = set()
+
+        async def list_page(client: Any, page: int) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+            if page == 2 and page not in failed:  # noqa: PLR2004
+                failed.add(page)
+                raise requests.HTTPError("429", response=MagicMock(status_code=429))
+            return await listing.list_page(client, page, 10)
+
+        ids: list[int] = []
+        controller = AIMDController(initial_limit=4, max_limit=4, cooldown=0.0, latency_tolerance=1e6)
+        metadata = asyncio.run(
+            fetch_pages(
+                list_page,
+                None,
+                on_page=lambda records: ids.extend(record["id"] for record in records),
+                per_page=10,
+                controller=controller,
+                backoff=0.0,
+            )
+        )
+
+        assert ids == list(range(95))
+        assert metadata["pages"] == 10  # noqa: PLR2004
+        assert listing.requested.count(2) == 1
+        assert controller.snapshot()["decreases"] == 1
+
+    def test_controller_fails_fast_on_other_errors(self) -> None:
+        """Test a page failing with an error other than overload is not retried."""
+        calls = []
+
+        async def list_page(client: Any, page: int) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+            calls.append(page)
+            raise requests.HTTPError("404", response=MagicMock(status_code=404))
+
+        controller = AIMDController(initial_limit=1)
+        with pytest.raises(requests.HTTPError):
+            asyncio.run(fetch_pages(list_page, None, on_page=lambda records: None, controller=controller))
+
+        assert calls == [1]
+
+    def test_not_modified(self) -> None:
+        """Test a response without a list ends the listing."""
+
+        async def list_page(client: Any, page: int) -> tuple[dict[str, Any], dict[str, Any]]:
+            return {}, {"status_code": 304}
+
+        metadata = asyncio.run(fetch_pages(list_page, None, on_page=lambda records: None))
+
+        assert metadata == {"status_code": 304, "pages": 0, "items": 0}
+
+
+class TestProgress:
+    """Tests for Progress."""
+
+    def test_renders_items_per_second(self) -> None:
+        """Test the indicator shows the items, pages and rate, and ends its line."""
+        stream = io.StringIO()
+        progress = Progress(stream=stream, enabled=True, interval=0)
+
+        progress.update(20)
+        progress.update(5)
+        progress.finish()
+
+        output = stream.getvalue()
+        assert output.startswith("\r20 items, 1 pages, ")
+        assert "\r25 items, 2 pages, " in output
+        assert output.endswith(" items/s\n")
+        assert str(progress) == "<Progress items=25 pages=2>"
+
+    def test_disabled_when_not_a_terminal(self) -> None:
+        """Test the indicator is hidden when the stream is not a terminal."""
+        stream = io.StringIO()
+        progress = Progress(stream=stream)
+
+        progress.update(20)
+        progress.finish()
+
+        assert not progress.enabled
+        assert stream.getvalue() == ""
@@ -0,0 +1,85 @@
+"""Unit tests for the CLI profiling utils."""
+
+import pstats
+import time
+
+import pytest
+
+from glnova.cli.utils.profile import Profiler, profile_phase, start_profiling, stop_profiling
+from glnova.client.events import RequestEvent, get_default_event_hooks
+from glnova.client.gitlab import GitLab
+
+
+@pytest.fixture(autouse=True)
+def _stop_profiling():
+    """Make sure no profiler outlives a test."""
+    yield
+    stop_profiling()
+
+
+class TestProfiler:
+    """Tests for the Profiler class."""
+
+    def test_render(self) -> None:
+        """Test that the report splits the api phase into network and processing time."""
+        profiler = Profiler(start=0.0)
+        profiler.record_phase("startup", 0.1)
+        profiler.record_phase("api", 0.5)
+        profiler.record_phase("output", 0.1)
+        profiler.record_event(
+            RequestEvent(
+                method="GET",
+                endpoint="/projects/1/issues",
+                status=200,
+                size=2048,
+                timings={"total": 0.4, "connect": 0.05, "ttfb": 0.3},
+            )
+        )
+
+        report = profiler.render(end=1.0)
+
+        assert "network (1 requests)" in report
+        assert "api (decode/process)" in report
+        assert "GET /projects/:id/issues 200 400.0 ms (connect 50.0, ttfb 300.0) 2048 B" in report
+        lines = report.splitlines()
+        assert lines[0].startswith("Phase")
+        assert any(line.startswith("other") and "300.0" in line for line in lines)
+        assert any(line.startswith("total") and "1000.0" in line for line in lines)
+
+    def test_render_without_requests(self) -> None:
+        """Test that the request section is omitted when no request was sent."""
+        report = Profiler(start=0.0).render(end=0.5)
+
+        assert "Requests:" not in report
+
+
+class TestProfilePhase:
+    """Tests for profile_phase and the active profiler."""
+
+    def test_inactive(self) -> None:
+        """Test that phases are not recorded without an active profiler."""
+        with profile_phase("config"):
+            pass
+
+        assert stop_profiling() is None
+
+    def test_active(self) -> None:
+        """Test that phases and the requests of new clients are recorded while profiling."""
+        profiler = start_profiling(start=time.perf_counter())
+        with profile_phase("config"):
+            pass
+        client = GitLab()
+
+        assert "config" in profiler.phases
+        assert profiler.record_event in client.event_hooks
+        assert stop_profiling() is profiler
+        assert profiler.record_event not in get_default_event_hooks()
+
+    def test_profile_out(self, tmp_path) -> None:
+        """Test that cProfile statistics are written when requested."""
+        path = tmp_path / "glnova.prof"
+        start_profiling(start=time.perf_counter(), profile_out=str(path))
+        sum(range(1000))
+        stop_profiling()
+
+        assert pstats.Stats(str(path)).total_calls > 0
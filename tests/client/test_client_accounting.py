@@ -0,0 +1,149 @@
+"""Unit tests for the request accountant."""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from glnova.client.accounting import DEFAULT_OPERATION, RequestAccountant, get_suggestion
+from glnova.client.events import RequestEvent, get_default_event_hooks
+from glnova.client.gitlab import GitLab
+from glnova.utils.exception import RequestBudgetExceededError
+
+
+def _event(endpoint, method="GET"):
+    """Build a request event."""
+    return RequestEvent(method=method, endpoint=endpoint, status=200)
+
+
+@pytest.fixture
+def client():
+    """Create a client whose session answers every request with an empty list."""
+    client = GitLab(token="token", base_url="https://gitlab.example.com")
+    mock_session = MagicMock()
+    mock_session.request.return_value.status_code = 200
+    mock_session.request.return_value.content = b"[]"
+    mock_session.request.return_value.json.return_value = {"id": 1}
+    mock_session.request.return_value.headers = {}
+    client.session = mock_session
+    return client
+
+
+class TestRequestAccountant:
+    """Test cases for the RequestAccountant class."""
+
+    def test_detects_n_plus_one(self, client, caplog):
+        """Test that requests in a loop are grouped by template and reported with a suggestion."""
+        with RequestAccountant(client, threshold=3) as accountant, caplog.at_level(logging.WARNING, logger="glnova"):
+            with accountant.operation("review"):
+                client.merge_request.list_merge_requests()
+                for account_id in range(1, 5):
+                    client.user.get_user(account_id=account_id)
+            client.user.get_user(account_id=1)
+
+        report = accountant.report()
+
+        assert report["requests"] == 6  # noqa: PLR2004
+        assert report["operations"]["review"] == {
+            "requests": 5,
+            "endpoints": {"GET /users/:id": 4, "GET /merge_requests": 1},
+        }
+        assert report["operations"][DEFAULT_OPERATION]["requests"] == 1
+        assert report["findings"] == [
+            {
+                "operation": "review",
+                "method": "GET",
+                "endpoint": "/users/:id",
+                "count": 4,
+                "distinct": 4,
+                "suggestion": get_suggestion("GET", "/users/:id"),
+            }
+        ]
+        warnings = [record.getMessage() for record in caplog.records]
+        assert len(warnings) == 1
+        assert "Operation 'review' sent 3 requests to GET /users/:id" in warnings[0]
+        assert "resolve_user_ids" in warnings[0]
+        assert client.event_hooks == []
+
+    def test_repeated_identical_requests_are_not_n_plus_one(self):
+        """Test that requests to the same resource are not reported as differing by ID."""
+        with RequestAccountant(threshold=2) as accountant:
+            for _ in range(3):
+                accountant(_event("/users/1"))
+            accountant(_event("/users"))
+            accountant(_event("/users"))
+
+        assert accountant.findings() == []
+        assert accountant.count(endpoint="/users/:id") == 3  # noqa: PLR2004
+
+    def test_default_hook(self):
+        """Test that without clients the accountant is registered on new clients while active."""
+        with RequestAccountant() as accountant:
+            assert accountant in get_default_event_hooks()
+            assert accountant in GitLab(token="token").event_hooks
+
+        assert accountant not in get_default_event_hooks()
+        accountant(_event("/users/1"))
+        assert accountant.count() == 0
+
+    def test_thread_pool_falls_back_to_open_operation(self):
+        """Test that requests from worker threads are attributed to the open operation."""
+        with (
+            RequestAccountant() as accountant,
+            accountant.operation("resolve"),
+            ThreadPoolExecutor(max_workers=2) as executor,
+        ):
+            list(executor.map(accountant, [_event(f"/users/{index}") for index in range(4)]))
+
+        assert accountant.count(operation="resolve") == 4  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks(self):
+        """Test that concurrent tasks attribute their requests to their own operations."""
+        accountant = RequestAccountant()
+
+        async def run(name, count):
+            with accountant.operation(name):
+                for index in range(count):
+                    await asyncio.sleep(0)
+                    accountant(_event(f"/projects/{index}"))
+
+        with accountant:
+            await asyncio.gather(run("a", 2), run("b", 3))
+
+        assert accountant.count(operation="a") == 2  # noqa: PLR2004
+        assert accountant.count(operation="b") == 3  # noqa: PLR2004
+
+    def test_assert_budget(self):
+        """Test that exceeding a request budget raises an assertion error."""
+        with RequestAccountant(warn=False) as accountant, accountant.operation("sync"):
+            for index in range(3):
+                accountant(_event(f"/users/{index}"))
+            accountant(_event("/users/1", method="PUT"))
+
+        accountant.assert_budget(4, operation="sync")
+        accountant.assert_budget(1, method="put")
+        with pytest.raises(RequestBudgetExceededError, match="3 requests sent to GET /users/:id in operation 'sync'"):
+            accountant.assert_budget(2, operation="sync", endpoint="/users/:id", method="GET")
+        with pytest.raises(AssertionError, match="all endpoints, budget is 3"):
+            accountant.assert_budget(3)
+
+    def test_invalid_threshold(self):
+        """Test that a threshold below two is rejected."""
+        with pytest.raises(ValueError, match="threshold must be at least 2"):
+            RequestAccountant(threshold=1)
+
+    def test_str(self):
+        """Test the string representation."""
+        assert str(RequestAccountant()) == "<RequestAccountant requests=0 threshold=5>"
+
+
+class TestGetSuggestion:
+    """Test cases for get_suggestion."""
+
+    def test_known_and_unknown_endpoints(self):
+        """Test that known endpoints get their batch API and others a generic suggestion."""
+        assert "iids" in get_suggestion("get", "/projects/:id/issues/:id")
+        assert "cache" in get_suggestion("GET", "/groups/:id")
@@ -0,0 +1,241 @@
+"""Unit tests for adaptive concurrency control."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from glnova.client.adaptive import AIMDController, gather_adaptive, map_adaptive
+from glnova.utils.exception import DeadlineExceededError
+
+
+def _http_error(status_code):
+    """Build a requests HTTPError carrying a status code."""
+    response = MagicMock()
+    response.status_code = status_code
+    return requests.HTTPError(f"HTTP {status_code}", response=response)
+
+
+class _Interrupt(BaseException):
+    """BaseException standing for an interruption, such as KeyboardInterrupt, in a worker."""
+
+
+class TestAIMDController:
+    """Test cases for the AIMDController class."""
+
+    def test_invalid_arguments(self):
+        """Test that inconsistent limits and factors are rejected."""
+        with pytest.raises(ValueError, match="Limits"):
+            AIMDController(initial_limit=8, max_limit=4)
+        with pytest.raises(ValueError, match="decrease_factor"):
+            AIMDController(decrease_factor=1.0)
+
+    def test_additive_increase(self):
+        """Test that the limit grows by about one per round of healthy responses."""
+        controller = AIMDController(initial_limit=4, max_limit=5)
+        for _ in range(5):
+            controller.record_success(0.1)
+        assert controller.limit == 5  # noqa: PLR2004
+        for _ in range(20):
+            controller.record_success(0.1)
+        assert controller.limit == 5  # noqa: PLR2004
+        assert controller.snapshot()["increases"] == 1
+
+    def test_multiplicative_decrease(self):
+        """Test that overload halves the limit, at most once per cooldown."""
+        controller = AIMDController(initial_limit=8, cooldown=60.0)
+        controller.record_failure("HTTP 429")
+        controller.record_failure("HTTP 502")
+        assert controller.limit == 4  # noqa: PLR2004
+        assert controller.snapshot()["decreases"] == 1
+
+    def test_decrease_respects_min_limit(self):
+        """Test that the limit never drops below min_limit."""
+        controller = AIMDController(initial_limit=2, min_limit=2, cooldown=0.0)
+        controller.record_failure("HTTP 503")
+        assert controller.limit == 2  # noqa: PLR2004
+
+    def test_latency_spike(self):
+        """Test that a latency well above the smoothed latency backs off."""
+        controller = AIMDController(initial_limit=8, latency_tolerance=2.0)
+        controller.record_success(0.1)
+        controller.record_success(0.5)
+        assert controller.limit == 4  # noqa: PLR2004
+
+    def test_record_error(self):
+        """Test which errors count as overload."""
+        controller = AIMDController(initial_limit=16, cooldown=0.0)
+        assert controller.record_error(_http_error(404)) is False
+        assert controller.record_error(DeadlineExceededError(timeout=1.0)) is False
+        assert controller.record_error(ValueError("bug")) is False
+        assert controller.limit == 16  # noqa: PLR2004
+        controller.record_error(_http_error(429))
+        assert controller.limit == 8  # noqa: PLR2004
+        assert controller.record_error(requests.ConnectionError("down")) is True
+        assert controller.limit == 4  # noqa: PLR2004
+        error = Exception("server error")
+        error.status = 500
+        controller.record_error(error)
+        assert controller.limit == 2  # noqa: PLR2004
+
+    def test_str_representation(self):
+        """Test string representation."""
+        assert str(AIMDController(initial_limit=3)) == "<AIMDController limit=3>"
+
+
+class TestMapAdaptive:
+    """Test cases for the adaptive fan-out helpers."""
+
+    def test_map_adaptive(self):
+        """Test that the thread pool respects the limit and keeps the order of the results."""
+        controller = AIMDController(initial_limit=2, max_limit=2)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def work(item):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return item * 2
+
+        assert map_adaptive(work, range(6), controller=controller) == [0, 2, 4, 6, 8, 10]
+        assert peak <= 2  # noqa: PLR2004
+
+    def test_map_adaptive_error(self):
+        """Test that the first error that is not an overload error is raised without retries."""
+        controller = AIMDController(initial_limit=1, max_limit=4, cooldown=0.0)
+        calls = []
+
+        def work(item):
+            calls.append(item)
+            raise _http_error(404)
+
+        with pytest.raises(requests.HTTPError):
+            map_adaptive(work, range(5), controller=controller)
+        assert calls == [0]
+        assert controller.snapshot()["decreases"] == 0
+
+    def test_map_adaptive_retries_overload(self):
+        """Test that items failing with overload errors are retried at the lowered limit."""
+        controller = AIMDController(initial_limit=4, max_limit=4, cooldown=0.0, latency_tolerance=1e6)
+        lock = threading.Lock()
+        failures = {1, 2}
+        limits = []
+
+        def work(item):
+            with lock:
+                limits.append(controller.limit)
+                if item in failures:
+                    failures.discard(item)
+                    raise _http_error(429)
+            return item * 2
+
+        assert map_adaptive(work, range(6), controller=controller, backoff=0.0) == [0, 2, 4, 6, 8, 10]
+        assert controller.snapshot()["decreases"] == 2  # noqa: PLR2004
+        assert min(limits) < 4  # noqa: PLR2004
+
+    def test_map_adaptive_out_of_retries(self):
+        """Test that the overload error of an item out of retries is raised."""
+        controller = AIMDController(initial_limit=2, cooldown=0.0)
+        calls = []
+
+        def work(item):
+            calls.append(item)
+            if item == 0:
+                raise _http_error(503)
+            return item
+
+        with pytest.raises(requests.HTTPError):
+            map_adaptive(work, range(3), controller=controller, max_retries=2, backoff=0.0)
+        assert calls.count(0) == 3  # noqa: PLR2004
+
+    def test_map_adaptive_base_exception(self):
+        """Test that a BaseException raised by an item is raised instead of leaving the producer waiting."""
+        controller = AIMDController(initial_limit=2, max_limit=2)
+        outcome = []
+
+        def work(item):
+            if item == 1:
+                raise _Interrupt
+            return item
+
+        def call():
+            try:
+                map_adaptive(work, range(5), controller=controller)
+            except _Interrupt:
+                outcome.append("interrupted")
+
+        thread = threading.Thread(target=call, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+
+        assert outcome == ["interrupted"]
+
+    @pytest.mark.asyncio
+    async def test_gather_adaptive(self):
+        """Test that the coroutines respect the limit, which grows with healthy responses."""
+        controller = AIMDController(initial_limit=1, max_limit=3)
+        active = 0
+        peak = 0
+
+        async def work(item):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return item + 1
+
+        assert await gather_adaptive(work, range(10), controller=controller) == list(range(1, 11))
+        assert 1 < peak <= 3  # noqa: PLR2004
+        assert controller.limit == 3  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_gather_adaptive_error(self):
+        """Test that the first error is raised."""
+        controller = AIMDController(initial_limit=1)
+
+        async def work(item):
+            raise ValueError(item)
+
+        with pytest.raises(ValueError, match="0"):
+            await gather_adaptive(work, range(3), controller=controller)
+
+    @pytest.mark.asyncio
+    async def test_gather_adaptive_retries_overload(self):
+        """Test that coroutines failing with overload errors are retried at the lowered limit."""
+        controller = AIMDController(initial_limit=4, max_limit=4, cooldown=0.0, latency_tolerance=1e6)
+        attempts: dict[int, int] = {}
+
+        async def work(item):
+            attempts[item] = attempts.get(item, 0) + 1
+            await asyncio.sleep(0)
+            if item == 3 and attempts[item] < 3:  # noqa: PLR2004
+                raise _http_error(502)
+            return item
+
+        assert await gather_adaptive(work, range(5), controller=controller, backoff=0.0) == list(range(5))
+        assert attempts[3] == 3  # noqa: PLR2004
+        assert controller.snapshot()["decreases"] == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_gather_adaptive_base_exception(self):
+        """Test that a BaseException raised by a coroutine is raised instead of leaving the producer waiting."""
+        controller = AIMDController(initial_limit=2, max_limit=2)
+
+        async def work(item):
+            await asyncio.sleep(0)
+            if item == 1:
+                raise _Interrupt
+            return item
+
+        with pytest.raises(_Interrupt):
+            await asyncio.wait_for(gather_adaptive(work, range(5), controller=controller), timeout=5)
@@ -1,11 +1,51 @@
 """Unit tests for the asynchronous GitLab client."""
 
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aiohttp import ClientSession
 
+from glnova.cache.path_id import PathIDCache
 from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.circuit_breaker import CircuitBreaker
+from glnova.client.deadline import Deadline
+from glnova.client.hedging import HedgePolicy
+from glnova.client.limiter import ConcurrencyLimiter, Priority
+from glnova.utils.exception import CircuitOpenError, DeadlineExceededError
+
+
+class _SlowBodyHandler(BaseHTTPRequestHandler):
+    """Handler sending the headers at once and the body when the server's event is set."""
+
+    def do_GET(self):
+        """Reply with a JSON body held back until the event is set."""
+        body = b'{"id": 1}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.flush()
+        self.server.body_sent.wait(timeout=5)
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Silence the request log."""
+
+
+@pytest.fixture
+def slow_body_url():
+    """Serve `_SlowBodyHandler` on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowBodyHandler)
+    server.body_sent = threading.Event()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", server.body_sent
+    server.body_sent.set()
+    server.shutdown()
+    server.server_close()
 
 
 class TestAsyncGitLab:
@@ -76,9 +116,274 @@ class TestAsyncGitLab:
             assert response == mock_response
             mock_session.request.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_request_boolean_params(self):
+        """Test that boolean query parameters are sent as true and false."""
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.return_value = MagicMock(status=200)
+
+            client = AsyncGitLab(token="test_token", base_url="https://gitlab.com")
+            async with client:
+                await client._request("GET", "projects", params={"simple": True, "owned": False, "page": 2})
+
+            params = mock_session.request.call_args[1]["params"]
+            assert params == {"simple": "true", "owned": "false", "page": 2}
+
     @pytest.mark.asyncio
     async def test_request_without_session(self):
         """Test _request without entering context manager."""
         client = AsyncGitLab(token=None, base_url="https://gitlab.com")
         with pytest.raises(RuntimeError, match="AsyncGitLab must be used as an async context manager"):
             await client._request("GET", "repos/octocat/Hello-World")
+
+    @pytest.mark.asyncio
+    async def test_request_stale_cached_path(self, tmp_path):
+        """Test _request falls back to the path and invalidates a stale ID."""
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            not_found = MagicMock()
+            not_found.status = 404
+            ok = MagicMock()
+            ok.status = 200
+            mock_session.request.side_effect = [not_found, ok]
+
+            cache = PathIDCache(filename=tmp_path / "ids.json")
+            cache.set(base_url="https://gitlab.com", kind="projects", path="group/project", resource_id=42)
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com", path_id_cache=cache)
+            async with client:
+                # cSpell:disable
+                response = await client._request("GET", "/projects/group%2Fproject/issues")
+                # cSpell:enable
+
+            assert response is ok
+            first_url = mock_session.request.call_args_list[0][1]["url"]
+            assert first_url == "https://gitlab.com/api/v4/projects/42/issues"
+            not_found.release.assert_called_once()
+            assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/project") is None
+
+    @pytest.mark.asyncio
+    async def test_request_circuit_breaker(self):
+        """Test that _request fails fast once the circuit is open."""
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.side_effect = TimeoutError()
+
+            breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout=60)
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com", circuit_breaker=breaker)
+            async with client:
+                with pytest.raises(TimeoutError):
+                    await client._request("GET", "/projects")
+                with pytest.raises(CircuitOpenError):
+                    await client._request("GET", "/projects")
+
+            mock_session.request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_request_hedged_get(self):
+        """Test that a slow GET is hedged and the faster attempt wins."""
+        slow_response = MagicMock()
+        fast_response = MagicMock()
+        responses = [(0.5, slow_response), (0.0, fast_response)]
+
+        async def request(**kwargs):
+            delay, response = responses.pop(0)
+            await asyncio.sleep(delay)
+            return response
+
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.side_effect = request
+            policy = HedgePolicy(initial_delay=0.01)
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com", hedge_policy=policy)
+            async with client:
+                response = await client._request("GET", "projects/1")
+
+        assert response is fast_response
+        assert mock_session.request.call_count == 2  # noqa: PLR2004
+        snapshot = policy.snapshot()
+        assert snapshot["hedges_fired"] == 1
+        assert snapshot["hedges_won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_hedge_not_needed(self):
+        """Test that a fast GET is not hedged."""
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.return_value = MagicMock()
+            policy = HedgePolicy(initial_delay=1.0)
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com", hedge_policy=policy)
+            async with client:
+                await client._request("GET", "projects/1")
+
+        mock_session.request.assert_called_once()
+        assert policy.snapshot()["hedges_fired"] == 0
+        assert policy.snapshot()["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_hedge_budget_exhausted(self):
+        """Test that no hedge is sent when the budget is exhausted."""
+
+        async def request(**kwargs):
+            await asyncio.sleep(0.05)
+            return MagicMock()
+
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.side_effect = request
+            policy = HedgePolicy(initial_delay=0.01, max_tokens=0.0)
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com", hedge_policy=policy)
+            async with client:
+                await client._request("GET", "projects/1")
+
+        mock_session.request.assert_called_once()
+        assert policy.snapshot()["budget_exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_post_not_hedged(self):
+        """Test that non-idempotent requests are never hedged."""
+
+        async def request(**kwargs):
+            await asyncio.sleep(0.05)
+            return MagicMock()
+
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.side_effect = request
+            policy = HedgePolicy(initial_delay=0.01)
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com", hedge_policy=policy)
+            async with client:
+                await client._request("POST", "projects/1/issues")
+
+        mock_session.request.assert_called_once()
+        assert policy.snapshot()["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_request_hedge_primary_fails(self):
+        """Test that the hedge is used when the original attempt fails."""
+        hedge_response = MagicMock()
+        calls = []
+
+        async def request(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                await asyncio.sleep(0.05)
+                raise ConnectionError("boom")
+            await asyncio.sleep(0.1)
+            return hedge_response
+
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.side_effect = request
+            policy = HedgePolicy(initial_delay=0.01)
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com", hedge_policy=policy)
+            async with client:
+                response = await client._request("GET", "projects/1")
+
+        assert response is hedge_response
+
+    @pytest.mark.asyncio
+    async def test_request_deadline_caps_timeout(self):
+        """Test that the request timeout is capped by the time left before the deadline."""
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.return_value = MagicMock()
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com")
+            async with client:
+                await client._request("GET", "projects/1", timeout=30, deadline=Deadline(timeout=2.0))
+
+        assert mock_session.request.call_args[1]["timeout"].total <= 2.0  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_request_deadline_timeout(self):
+        """Test that a timeout cut short by the deadline is reported as exceeded."""
+        deadline = Deadline(timeout=1.0)
+
+        async def request(**kwargs):
+            deadline.expires_at = 0.0
+            raise asyncio.TimeoutError
+
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.side_effect = request
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com")
+            async with client:
+                with pytest.raises(DeadlineExceededError):
+                    await client._request("GET", "projects/1", deadline=deadline)
+
+        assert deadline.exceeded is True
+
+    @pytest.mark.asyncio
+    async def test_request_limiter(self):
+        """Test that requests are admitted through the limiter."""
+        limiter = ConcurrencyLimiter(max_in_flight=1)
+        active = 0
+        peak = 0
+
+        async def request(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return MagicMock()
+
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.side_effect = request
+            client = AsyncGitLab(token=None, base_url="https://gitlab.com", limiter=limiter)
+            async with client:
+                await asyncio.gather(
+                    client._request("GET", "projects/1", priority="bulk"),
+                    client._request("GET", "projects/2", priority=Priority.INTERACTIVE),
+                )
+
+        assert peak == 1
+        assert mock_session.request.call_count == 2  # noqa: PLR2004
+        assert limiter.in_flight == 0
+        assert "priority" not in mock_session.request.call_args[1]
+        assert limiter.snapshot()["lanes"]["interactive"]["admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_limiter_holds_slot_until_body_read(self, slow_body_url):
+        """Test that the slot of a request is freed once the body of its response has been read."""
+        url, body_sent = slow_body_url
+        limiter = ConcurrencyLimiter(max_in_flight=1)
+        async with AsyncGitLab(token="token", base_url=url, limiter=limiter) as client:
+            response = await client._request("GET", "projects/1")
+            assert limiter.in_flight == 1
+            body_sent.set()
+            assert await response.json() == {"id": 1}
+            assert limiter.in_flight == 0
+            body_sent.clear()
+
+            response = await client._request("GET", "projects/1")
+            assert limiter.in_flight == 1
+            response.release()
+            assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_request_limiter_deadline(self):
+        """Test that waiting for a slot is bounded by the deadline."""
+        limiter = ConcurrencyLimiter(max_in_flight=1)
+        await limiter.acquire()
+        deadline = Deadline(timeout=0.01)
+        client = AsyncGitLab(token=None, base_url="https://gitlab.com", limiter=limiter)
+        client.session = MagicMock()
+
+        with pytest.raises(DeadlineExceededError):
+            await client._request("GET", "projects/1", deadline=deadline)
+
+        assert deadline.exceeded is True
+        assert limiter.queue_depth() == 0
@@ -1,5 +1,6 @@
 """Unit tests for the base client."""
 
+from glnova.cache.path_id import PathIDCache
 from glnova.client.base import Client
 
 
@@ -70,3 +71,31 @@ class TestClient:
         client = Client(token=None, base_url="https://gitlab.com")
         headers = client._get_conditional_request_headers()
         assert headers == {}
+
+    def test_resolve_endpoint_without_cache(self):
+        """Test _resolve_endpoint leaves the endpoint unchanged without a cache."""
+        client = Client(token=None, base_url="https://gitlab.com")
+        # cSpell:disable
+        assert client._resolve_endpoint("/projects/group%2Fproject/issues") == (
+            "/projects/group%2Fproject/issues",
+            None,
+        )
+        # cSpell:enable
+
+    def test_resolve_endpoint_with_cache(self, tmp_path):
+        """Test _resolve_endpoint rewrites cached paths to numeric IDs."""
+        cache = PathIDCache(filename=tmp_path / "ids.json")
+        cache.set(base_url="https://gitlab.com", kind="projects", path="group/project", resource_id=42)
+        client = Client(token=None, base_url="https://gitlab.com", path_id_cache=cache)
+        # cSpell:disable
+        endpoint, resolved_path = client._resolve_endpoint("/projects/group%2Fproject/issues/1")
+        # cSpell:enable
+        assert endpoint == "/projects/42/issues/1"
+        assert resolved_path == ("projects", "group/project")
+        assert client._resolve_endpoint("/projects/42/issues") == ("/projects/42/issues", None)
+        # cSpell:disable
+        assert client._resolve_endpoint("/groups/group%2Fproject/issues") == ("/groups/group%2Fproject/issues", None)
+        # cSpell:enable
+
+        client._invalidate_resolved_path(resolved_path)
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/project") is None
@@ -0,0 +1,204 @@
+"""Unit tests for the record/replay cassettes."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiohttp
+import pytest
+import requests
+
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.cassette import AsyncCassetteTransport, Cassette, CassetteResponse, CassetteTransport
+from glnova.client.gitlab import GitLab
+from glnova.utils.exception import CassetteMissError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler answering with a user, a 304 for a matching ETag and a 404 for unknown users."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Reply to a GET request."""
+        if self.path.startswith("/api/v4/users/404"):
+            status, payload = 404, b'{"message": "404 User Not Found"}'
+        elif self.headers.get("If-None-Match") == '"v1"':
+            status, payload = 304, b""
+        else:
+            status, payload = 200, json.dumps({"id": 1, "path": self.path}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Etag", '"v1"')
+        self.send_header("X-Next-Page", "2")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Silence the request log."""
+
+
+@pytest.fixture
+def server_url():
+    """Serve the handler on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestCassette:
+    """Test cases for the Cassette class."""
+
+    @pytest.mark.parametrize("name", ["cassette.json", "cassette.json.gz"])
+    def test_save_and_load(self, tmp_path, name):
+        """Test that interactions round-trip through the file, gzipped or not."""
+        cassette = Cassette(tmp_path / name)
+        cassette.record(key="GET /a", status=200, reason="OK", headers={"Etag": "1"}, body=b"{}", latency=0.1)
+        cassette.record(key="GET /b", status=200, reason="OK", headers={}, body=b"\xff\x00", latency=0.1)
+        cassette.save()
+
+        loaded = Cassette(tmp_path / name)
+
+        assert len(loaded) == 2  # noqa: PLR2004
+        assert loaded.play("GET /a")["headers"] == {"Etag": "1"}
+        assert loaded.play("GET /b")["encoding"] == "base64"
+
+    def test_play_order(self, tmp_path):
+        """Test that recordings replay in order and the last one repeats."""
+        cassette = Cassette(tmp_path / "cassette.json")
+        cassette.record(key="GET /a", status=200, reason="OK", headers={}, body=b"", latency=0.0)
+        cassette.record(key="GET /a", status=304, reason="Not Modified", headers={}, body=b"", latency=0.0)
+
+        assert [cassette.play("GET /a")["status"] for _ in range(3)] == [200, 304, 304]
+        assert cassette.play("GET /missing") is None
+        cassette.rewind()
+        assert cassette.play("GET /a")["status"] == 200  # noqa: PLR2004
+
+    def test_skips_headers(self, tmp_path):
+        """Test that cookies and transfer headers are not recorded."""
+        cassette = Cassette(tmp_path / "cassette.json")
+        cassette.record(
+            key="GET /a", status=200, reason="OK", headers={"Set-Cookie": "s=1", "X-Total": "5"}, body=b"", latency=0
+        )
+
+        assert cassette.interactions[0]["headers"] == {"X-Total": "5"}
+
+
+class TestCassetteTransport:
+    """Test cases for the CassetteTransport class."""
+
+    def test_record_and_replay(self, tmp_path, server_url):
+        """Test that responses recorded by the client replay identically without a server."""
+        path = tmp_path / "cassette.json"
+        cassette = Cassette(path)
+        with GitLab(base_url=server_url, transport=lambda: CassetteTransport(cassette, mode="record")) as client:
+            recorded = client.user.get_user(account_id=1)
+            recorded_not_modified = client.user.get_user(account_id=1, etag='"v1"')
+            with pytest.raises(requests.HTTPError):
+                client.user.get_user(account_id=404)
+
+        replay = Cassette(path)
+        with GitLab(base_url=server_url, transport=lambda: CassetteTransport(replay, mode="replay")) as client:
+            assert client.user.get_user(account_id=1) == recorded
+            assert client.user.get_user(account_id=1, etag='"v1"') == recorded_not_modified
+            with pytest.raises(requests.HTTPError):
+                client.user.get_user(account_id=404)
+            response = client._request("GET", "/users/1")
+            assert response.headers["X-Next-Page"] == "2"
+            with pytest.raises(CassetteMissError, match="No recorded response for GET"):
+                client._request("GET", "/users/2")
+
+        assert recorded[1]["etag"] == '"v1"'
+        assert recorded_not_modified[1]["status_code"] == 304  # noqa: PLR2004
+
+    def test_replay_params(self, tmp_path):
+        """Test that requests are matched on their query parameters regardless of order."""
+        cassette = Cassette(tmp_path / "cassette.json")
+        cassette.record(
+            key="GET https://gitlab.example.com/api/v4/users?page=2&per_page=50",
+            status=200,
+            reason="OK",
+            headers={"Content-Type": "application/json"},
+            body=b"[]",
+            latency=0.05,
+        )
+        transport = CassetteTransport(cassette, latency=1.0)
+
+        start = time.perf_counter()
+        response = transport.request(
+            "GET", "https://gitlab.example.com/api/v4/users", params={"per_page": 50, "page": 2, "search": None}
+        )
+
+        assert response.json() == []
+        assert time.perf_counter() - start >= 0.05  # noqa: PLR2004
+
+    def test_invalid_mode(self, tmp_path):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError, match="Unsupported cassette mode"):
+            CassetteTransport(Cassette(tmp_path / "cassette.json"), mode="live")
+
+
+class TestAsyncCassetteTransport:
+    """Test cases for the AsyncCassetteTransport class."""
+
+    @pytest.mark.asyncio
+    async def test_record_and_replay(self, tmp_path, server_url):
+        """Test that responses recorded by the asynchronous client replay identically without a server."""
+        path = tmp_path / "cassette.json.gz"
+        cassette = Cassette(path)
+        async with AsyncGitLab(
+            base_url=server_url, transport=lambda: AsyncCassetteTransport(cassette, mode="record")
+        ) as client:
+            recorded = await client.user.get_user(account_id=1)
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client.user.get_user(account_id=404)
+
+        replay = Cassette(path)
+        async with AsyncGitLab(
+            base_url=server_url, transport=lambda: AsyncCassetteTransport(replay, mode="replay")
+        ) as client:
+            assert await client.user.get_user(account_id=1) == recorded
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await client.user.get_user(account_id=404)
+            with pytest.raises(CassetteMissError):
+                await client._request("GET", "/users/2")
+
+        assert exc_info.value.status == 404  # noqa: PLR2004
+        assert recorded[0]["id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_across_clients(self, tmp_path, server_url):
+        """Test that a cassette recorded by the synchronous client replays with the asynchronous one."""
+        path = tmp_path / "cassette.json"
+        params = {"membership": True, "archived": False, "topic": ["a", "b"], "per_page": 20}
+        cassette = Cassette(path)
+        with GitLab(base_url=server_url, transport=lambda: CassetteTransport(cassette, mode="record")) as client:
+            recorded = client._request("GET", "/projects", params=params).json()
+
+        replay = Cassette(path)
+        async with AsyncGitLab(
+            base_url=server_url, transport=lambda: AsyncCassetteTransport(replay, mode="replay")
+        ) as client:
+            response = await client._request("GET", "/projects", params=params)
+            assert await response.json() == recorded
+
+    @pytest.mark.asyncio
+    async def test_cassette_response(self):
+        """Test the body accessors of a replayed response."""
+        response = CassetteResponse(
+            method="GET",
+            url="https://gitlab.example.com/api/v4/user",
+            interaction={"status": 200, "reason": "OK", "headers": {"Etag": "1"}, "body": '{"id": 1}'},
+        )
+
+        assert await response.json() == {"id": 1}
+        assert await response.text() == '{"id": 1}'
+        assert response.headers["etag"] == "1"
+        response.raise_for_status()
+        response.release()
+        assert response.closed
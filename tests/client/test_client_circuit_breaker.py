@@ -0,0 +1,94 @@
+"""Unit tests for the circuit breaker."""
+
+from unittest.mock import patch
+
+import pytest
+
+from glnova.client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    get_circuit_breaker,
+    get_circuit_breaker_states,
+)
+from glnova.utils.exception import CircuitOpenError
+
+
+class TestCircuitBreaker:
+    """Test cases for the CircuitBreaker class."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens after the failure threshold."""
+        breaker = CircuitBreaker(name="test", failure_threshold=2, recovery_timeout=10)
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError, match="Circuit 'test' is open") as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_after > 0
+        assert breaker.snapshot()["rejected"] == 1
+
+    def test_half_open_probe_closes(self):
+        """Test that a successful half-open probe closes the circuit."""
+        breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout=10)
+        with patch("glnova.client.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("glnova.client.circuit_breaker.time.monotonic", return_value=111.0):
+            assert breaker.state == CircuitState.HALF_OPEN
+            breaker.before_request()
+            with pytest.raises(CircuitOpenError):
+                breaker.before_request()
+            breaker.record_status(200)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test that a failed half-open probe opens the circuit again."""
+        breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout=10)
+        with patch("glnova.client.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("glnova.client.circuit_breaker.time.monotonic", return_value=111.0):
+            breaker.before_request()
+            breaker.record_status(503)
+            assert breaker.state == CircuitState.OPEN
+
+    def test_cancelled_probe_frees_slot(self):
+        """Test that a cancelled probe frees its slot without reopening the circuit."""
+        breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_cancelled()
+        breaker.before_request()
+        assert breaker.state == CircuitState.HALF_OPEN
+
+    def test_client_errors_are_successes(self):
+        """Test that 4xx responses do not count as failures."""
+        breaker = CircuitBreaker(name="test", failure_threshold=1)
+        breaker.record_status(404)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_reset(self):
+        """Test resetting the circuit."""
+        breaker = CircuitBreaker(name="test", failure_threshold=1)
+        breaker.record_failure()
+        breaker.reset()
+        assert breaker.snapshot()["state"] == "closed"
+
+    def test_invalid_threshold(self):
+        """Test that the failure threshold must be positive."""
+        with pytest.raises(ValueError, match="failure_threshold"):
+            CircuitBreaker(failure_threshold=0)
+
+
+class TestCircuitBreakerRegistry:
+    """Test cases for the process-wide circuit breaker registry."""
+
+    def test_shared_per_base_url(self):
+        """Test that the same base URL returns the same circuit breaker."""
+        breaker = get_circuit_breaker("https://registry.example.com/")
+        assert get_circuit_breaker("https://registry.example.com") is breaker
+        assert get_circuit_breaker("https://other.example.com") is not breaker
+        assert get_circuit_breaker_states()["https://registry.example.com"]["state"] == "closed"
@@ -0,0 +1,43 @@
+"""Unit tests for deadlines."""
+
+from unittest.mock import patch
+
+import pytest
+
+from glnova.client.deadline import Deadline
+from glnova.utils.exception import DeadlineExceededError
+
+
+class TestDeadline:
+    """Test cases for the Deadline class."""
+
+    def test_remaining(self):
+        """Test that the remaining time counts down from the timeout."""
+        with patch("glnova.client.deadline.time.monotonic", return_value=100.0):
+            deadline = Deadline(timeout=3.0)
+        with patch("glnova.client.deadline.time.monotonic", return_value=101.0):
+            assert deadline.remaining() == 2.0  # noqa: PLR2004
+            assert deadline.expired is False
+        with patch("glnova.client.deadline.time.monotonic", return_value=104.0):
+            assert deadline.remaining() == 0.0
+            assert deadline.expired is True
+
+    def test_request_timeout_is_capped(self):
+        """Test that the request timeout is the smaller of its own timeout and the time left."""
+        with patch("glnova.client.deadline.time.monotonic", return_value=100.0):
+            deadline = Deadline(timeout=3.0)
+            assert deadline.request_timeout(30) == 3.0  # noqa: PLR2004
+            assert deadline.request_timeout(1) == 1
+        assert deadline.exceeded is False
+
+    def test_request_timeout_after_deadline(self):
+        """Test that requests after the deadline are rejected and the deadline is marked exceeded."""
+        deadline = Deadline(timeout=0.0)
+        with pytest.raises(DeadlineExceededError, match="Deadline"):
+            deadline.request_timeout(30)
+        assert deadline.exceeded is True
+
+    def test_str_representation(self):
+        """Test string representation."""
+        deadline = Deadline(timeout=0.0)
+        assert str(deadline) == "<Deadline remaining=0.000 exceeded=False>"
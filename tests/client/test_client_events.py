@@ -0,0 +1,222 @@
+"""Unit tests for the request events of the GitLab clients."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.events import RequestEvent, build_event, get_content_length
+from glnova.client.gitlab import GitLab
+from glnova.client.middleware import Request
+from glnova.client.timing import add_timing, collect_timings, get_current_timings
+from glnova.client.transport import Urllib3Transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler answering with a fixed body, a 304 for a matching ETag and a 404 for missing paths."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Reply to a GET request."""
+        payload = b'{"id": 1}'
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            payload = b""
+        elif "missing" in self.path:
+            self.send_response(404)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v1"')
+        self.send_header("X-Runtime", "0.012")
+        self.send_header("X-Request-Id", "req-1")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Silence the request log."""
+
+
+@pytest.fixture
+def server_url():
+    """Serve the handler on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestRequestEvent:
+    """Test cases for RequestEvent and build_event."""
+
+    def test_build_event_from_response(self):
+        """Test that the status, size, server headers and endpoint template are captured."""
+        request = Request(method="GET", endpoint="/projects/42/issues/7")
+        request.context["attempts"] = 2
+
+        event = build_event(
+            request=request,
+            timings={"total": 0.5},
+            status=200,
+            headers={"X-Runtime": "0.25", "X-Request-Id": "abc"},
+            size=10,
+        )
+
+        assert event.endpoint_template == "/projects/:id/issues/:id"
+        assert event.status == 200  # noqa: PLR2004
+        assert event.bytes == 10  # noqa: PLR2004
+        assert event.retries == 1
+        assert event.cache_outcome is None
+        assert event.server_time == 0.25  # noqa: PLR2004
+        assert event.request_id == "abc"
+        assert event.error is None
+        assert event.as_dict()["timings"] == {"total": 0.5}
+        assert str(event) == "<RequestEvent GET /projects/:id/issues/:id status=200>"
+
+    def test_build_event_cache_outcome(self):
+        """Test that conditional requests are reported as cache hits or misses."""
+        request = Request(method="GET", endpoint="/users/1", etag='"v1"')
+
+        assert build_event(request=request, timings={}, status=304).cache_outcome == "hit"
+        assert build_event(request=request, timings={}, status=200).cache_outcome == "miss"
+
+    def test_build_event_from_error(self):
+        """Test that the status of an HTTP error and the error name are captured."""
+        response = requests.Response()
+        response.status_code = 503
+        error = requests.HTTPError(response=response)
+
+        event = build_event(request=Request(method="GET", endpoint="/users"), timings={}, error=error)
+
+        assert event.status == 503  # noqa: PLR2004
+        assert event.error == "HTTPError"
+        assert event.bytes is None
+
+    def test_get_content_length(self):
+        """Test that missing and malformed Content-Length headers give no size."""
+        assert get_content_length({"Content-Length": "12"}) == 12  # noqa: PLR2004
+        assert get_content_length({"Content-Length": "n/a"}) is None
+        assert get_content_length({}) is None
+
+    def test_build_event_invalid_runtime(self):
+        """Test that a malformed X-Runtime header is ignored."""
+        event = build_event(
+            request=Request(method="GET", endpoint="/users"), timings={}, status=200, headers={"X-Runtime": "n/a"}
+        )
+
+        assert event.server_time is None
+        assert isinstance(event, RequestEvent)
+
+
+class TestTimingCollection:
+    """Test cases for the thread-local timing collection."""
+
+    def test_collect_timings(self):
+        """Test that timings are only recorded while collecting."""
+        add_timing("ttfb", 1.0)
+        assert get_current_timings() is None
+
+        with collect_timings({}) as timings:
+            add_timing("ttfb", 1.0)
+            add_timing("ttfb", 0.5)
+
+        assert timings == {"ttfb": 1.5}
+        assert get_current_timings() is None
+
+
+class TestClientEventHooks:
+    """Test cases for the event hooks of the clients."""
+
+    def test_add_and_remove_event_hook(self):
+        """Test that hooks can be registered and unregistered."""
+        client = GitLab(token="token")
+        hook = MagicMock()
+
+        client.add_event_hook(hook)
+        assert client.event_hooks == [hook]
+        client.remove_event_hook(hook)
+        assert client.event_hooks == []
+
+    def test_failing_hook_is_isolated(self, caplog):
+        """Test that a failing hook does not prevent the other hooks from running."""
+        received = []
+        client = GitLab(event_hooks=[MagicMock(side_effect=ValueError("boom")), received.append])
+
+        client._emit_event(RequestEvent(method="GET", endpoint="/users"))
+
+        assert len(received) == 1
+        assert "Event hook" in caplog.text
+
+    def test_sync_client_events(self, server_url):
+        """Test that the synchronous client reports the outcome and phases of a request."""
+        events = []
+        with GitLab(base_url=server_url, event_hooks=[events.append]) as client:
+            client._request("GET", "/projects/42")
+            client._request("GET", "/projects/42", etag='"v1"')
+
+        first, second = events
+        assert first.endpoint_template == "/projects/:id"
+        assert first.status == 200  # noqa: PLR2004
+        assert first.bytes == 9  # noqa: PLR2004
+        assert first.server_time == 0.012  # noqa: PLR2004
+        assert first.request_id == "req-1"
+        assert {"connect", "ttfb", "body", "total"} <= set(first.timings)
+        assert "connect" not in second.timings
+        assert second.status == 304  # noqa: PLR2004
+        assert second.cache_outcome == "hit"
+
+    def test_sync_client_stream_event(self, server_url):
+        """Test that a streamed body is not read to report its size."""
+        events = []
+        with GitLab(base_url=server_url, event_hooks=[events.append]) as client:
+            response = client._request("GET", "/projects/42", stream=True)
+            assert not response._content_consumed
+            response.close()
+
+        assert events[0].bytes == 9  # noqa: PLR2004
+
+    def test_sync_client_error_event(self, server_url):
+        """Test that failed requests are reported before the error propagates."""
+        events = []
+        with GitLab(base_url=server_url, event_hooks=[events.append]) as client, pytest.raises(requests.HTTPError):
+            client._request("GET", "/missing")
+
+        assert events[0].status == 404  # noqa: PLR2004
+        assert events[0].error == "HTTPError"
+
+    def test_urllib3_transport_events(self, server_url):
+        """Test that the urllib3 transport reports the same phases."""
+        events = []
+        with GitLab(base_url=server_url, transport=Urllib3Transport, event_hooks=[events.append]) as client:
+            client._request("GET", "/users/1")
+
+        assert events[0].status == 200  # noqa: PLR2004
+        assert {"connect", "ttfb", "body", "total"} <= set(events[0].timings)
+
+    @pytest.mark.asyncio
+    async def test_async_client_events(self, server_url):
+        """Test that the asynchronous client reports the outcome and phases of a request."""
+        events = []
+        async with AsyncGitLab(base_url=server_url, event_hooks=[events.append]) as client:
+            response = await client._request("GET", "/projects/42")
+            assert response._body is None
+            assert await response.json() == {"id": 1}
+
+        assert events[0].status == 200  # noqa: PLR2004
+        assert events[0].bytes == 9  # noqa: PLR2004
+        assert events[0].request_id == "req-1"
+        assert {"connect", "ttfb", "total"} <= set(events[0].timings)
+
+    @pytest.mark.asyncio
+    async def test_async_client_without_hooks(self, server_url):
+        """Test that requests are not traced when no hook is registered."""
+        async with AsyncGitLab(base_url=server_url) as client:
+            response = await client._request("GET", "/projects/42")
+            assert response.status == 200  # noqa: PLR2004
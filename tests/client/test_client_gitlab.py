@@ -1,11 +1,19 @@
 """Unit tests for the synchronous GitLab client."""
 
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
-from glnova.client.gitlab import GitLab
+from glnova.cache.path_id import PathIDCache
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breaker
+from glnova.client.deadline import Deadline
+from glnova.client.gitlab import DEADLINE_CHUNK_SIZE, GitLab
+from glnova.utils.exception import CircuitOpenError, DeadlineExceededError
 
 
 class TestGitLab:
@@ -75,3 +83,196 @@ class TestGitLab:
         client = GitLab(token=None, base_url="https://gitlab.com")
         with pytest.raises(RuntimeError, match="GitLab must be used as a context manager"):
             client._request("GET", "repos/octocat/Hello-World")
+
+    @patch("requests.Session")
+    def test_request_rewrites_cached_path(self, mock_session_class, tmp_path):
+        """Test _request addresses cached project paths by numeric ID."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_session.request.return_value = mock_response
+
+        cache = PathIDCache(filename=tmp_path / "ids.json")
+        cache.set(base_url="https://gitlab.com", kind="projects", path="group/project", resource_id=42)
+        client = GitLab(token=None, base_url="https://gitlab.com", path_id_cache=cache)
+        with client:
+            # cSpell:disable
+            client._request("GET", "/projects/group%2Fproject/issues")
+            # cSpell:enable
+
+        assert mock_session.request.call_args[0][1] == "https://gitlab.com/api/v4/projects/42/issues"
+
+    @patch("requests.Session")
+    def test_request_stale_cached_path(self, mock_session_class, tmp_path):
+        """Test _request falls back to the path and invalidates a stale ID."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        not_found = MagicMock()
+        not_found.status_code = 404
+        ok = MagicMock()
+        ok.status_code = 200
+        mock_session.request.side_effect = [not_found, ok]
+
+        cache = PathIDCache(filename=tmp_path / "ids.json")
+        cache.set(base_url="https://gitlab.com", kind="projects", path="group/project", resource_id=42)
+        client = GitLab(token=None, base_url="https://gitlab.com", path_id_cache=cache)
+        with client:
+            # cSpell:disable
+            response = client._request("GET", "/projects/group%2Fproject/issues")
+            # cSpell:enable
+
+        assert response is ok
+        not_found.close.assert_called_once()
+        # cSpell:disable
+        assert mock_session.request.call_args[0][1] == "https://gitlab.com/api/v4/projects/group%2Fproject/issues"
+        # cSpell:enable
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/project") is None
+
+    @patch("requests.Session")
+    def test_request_missing_sub_resource_keeps_cache(self, mock_session_class, tmp_path):
+        """Test a 404 for a missing sub-resource does not invalidate the cached ID."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        not_found = MagicMock()
+        not_found.status_code = 404
+        not_found.raise_for_status.side_effect = requests.HTTPError("404")
+        mock_session.request.return_value = not_found
+
+        cache = PathIDCache(filename=tmp_path / "ids.json")
+        cache.set(base_url="https://gitlab.com", kind="projects", path="group/project", resource_id=42)
+        client = GitLab(token=None, base_url="https://gitlab.com", path_id_cache=cache)
+        with client, pytest.raises(requests.HTTPError):
+            # cSpell:disable
+            client._request("GET", "/projects/group%2Fproject/issues/999")
+            # cSpell:enable
+
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/project") == 42  # noqa: PLR2004
+
+    def test_circuit_breaker_shared_with_async_client(self):
+        """Test that circuit_breaker=True uses the process-wide circuit breaker."""
+        client = GitLab(token=None, base_url="https://shared.example.com", circuit_breaker=True)
+        async_client = AsyncGitLab(token=None, base_url="https://shared.example.com/", circuit_breaker=True)
+        assert client.circuit_breaker is get_circuit_breaker("https://shared.example.com")
+        assert async_client.circuit_breaker is client.circuit_breaker
+        assert GitLab(token=None).circuit_breaker is None
+
+    @patch("requests.Session")
+    def test_request_circuit_breaker(self, mock_session_class):
+        """Test that _request fails fast once the circuit is open."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_session.request.side_effect = requests.ConnectionError("down")
+
+        breaker = CircuitBreaker(name="test", failure_threshold=2, recovery_timeout=60)
+        client = GitLab(token=None, base_url="https://gitlab.com", circuit_breaker=breaker)
+        with client:
+            for _ in range(2):
+                with pytest.raises(requests.ConnectionError):
+                    client._request("GET", "/projects")
+            with pytest.raises(CircuitOpenError):
+                client._request("GET", "/projects")
+
+        assert mock_session.request.call_count == 2  # noqa: PLR2004
+        assert breaker.state == CircuitState.OPEN
+
+    @patch("requests.Session")
+    def test_request_circuit_breaker_server_error(self, mock_session_class):
+        """Test that 5xx responses count as failures."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_response = MagicMock()
+        mock_response.status_code = 502
+        mock_response.raise_for_status.side_effect = requests.HTTPError("502")
+        mock_session.request.return_value = mock_response
+
+        breaker = CircuitBreaker(name="test", failure_threshold=1)
+        client = GitLab(token=None, base_url="https://gitlab.com", circuit_breaker=breaker)
+        with client, pytest.raises(requests.HTTPError):
+            client._request("GET", "/projects")
+
+        assert breaker.state == CircuitState.OPEN
+
+    @patch("requests.Session")
+    def test_request_deadline_caps_timeout(self, mock_session_class):
+        """Test that the request timeout is capped by the time left before the deadline."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+
+        client = GitLab(token=None, base_url="https://gitlab.com")
+        with client:
+            client._request("GET", "/projects", timeout=30, deadline=Deadline(timeout=2.0))
+
+        assert mock_session.request.call_args[1]["timeout"] <= 2.0  # noqa: PLR2004
+
+    @patch("requests.Session")
+    def test_request_deadline_expired(self, mock_session_class):
+        """Test that no request is sent once the deadline has passed."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+
+        deadline = Deadline(timeout=0.0)
+        client = GitLab(token=None, base_url="https://gitlab.com")
+        with client, pytest.raises(DeadlineExceededError):
+            client._request("GET", "/projects", deadline=deadline)
+
+        mock_session.request.assert_not_called()
+        assert deadline.exceeded is True
+
+    @patch("requests.Session")
+    def test_request_deadline_timeout(self, mock_session_class):
+        """Test that a timeout cut short by the deadline is reported as exceeded and not as a failure."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        deadline = Deadline(timeout=1.0)
+
+        def request(*args, **kwargs):
+            deadline.expires_at = 0.0
+            raise requests.Timeout("timed out")
+
+        mock_session.request.side_effect = request
+        breaker = CircuitBreaker(name="test", failure_threshold=1)
+        client = GitLab(token=None, base_url="https://gitlab.com", circuit_breaker=breaker)
+        with client, pytest.raises(DeadlineExceededError):
+            client._request("GET", "/projects", deadline=deadline)
+
+        assert deadline.exceeded is True
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_request_deadline_bounds_body(self):
+        """Test that a body trickling in past the deadline is abandoned, although no single read times out."""
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(10 * DEADLINE_CHUNK_SIZE))
+                self.end_headers()
+                try:
+                    for _ in range(20):
+                        self.wfile.write(b" " * (DEADLINE_CHUNK_SIZE // 2))
+                        self.wfile.flush()
+                        time.sleep(0.05)
+                except OSError:
+                    pass
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        deadline = Deadline(timeout=0.3)
+        start = time.monotonic()
+        try:
+            with (
+                GitLab(base_url=f"http://127.0.0.1:{server.server_address[1]}") as client,
+                pytest.raises(DeadlineExceededError),
+            ):
+                client._request("GET", "/projects", timeout=30, deadline=deadline)
+            elapsed = time.monotonic() - start
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert elapsed < 1.0
+        assert deadline.exceeded is True
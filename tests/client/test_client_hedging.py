@@ -0,0 +1,63 @@
+"""Unit tests for the hedging policy."""
+
+import pytest
+
+from glnova.client.hedging import HedgePolicy
+
+
+class TestHedgePolicy:
+    """Test cases for the HedgePolicy class."""
+
+    def test_invalid_percentile(self):
+        """Test that an out-of-range percentile is rejected."""
+        with pytest.raises(ValueError, match="percentile"):
+            HedgePolicy(percentile=0)
+
+    def test_initial_delay_until_enough_samples(self):
+        """Test that the initial delay is used until min_samples latencies are recorded."""
+        policy = HedgePolicy(initial_delay=0.3, min_samples=3)
+        policy.record_latency(1.0)
+        policy.record_latency(1.0)
+        assert policy.delay() == 0.3  # noqa: PLR2004
+
+    def test_delay_is_percentile(self):
+        """Test that the delay is the configured percentile of recent latencies."""
+        policy = HedgePolicy(percentile=90.0, min_samples=1, min_delay=0.0, max_delay=100.0)
+        for latency in range(1, 11):
+            policy.record_latency(float(latency))
+        assert policy.delay() == 9.0  # noqa: PLR2004
+
+    def test_delay_is_clamped(self):
+        """Test that the delay is clamped to the configured bounds."""
+        policy = HedgePolicy(min_samples=1, min_delay=0.1, max_delay=2.0)
+        policy.record_latency(10.0)
+        assert policy.delay() == 2.0  # noqa: PLR2004
+        policy = HedgePolicy(min_samples=1, min_delay=0.1, max_delay=2.0)
+        policy.record_latency(0.001)
+        assert policy.delay() == 0.1  # noqa: PLR2004
+
+    def test_budget(self):
+        """Test that hedges are limited by the token budget."""
+        policy = HedgePolicy(budget_ratio=0.5, max_tokens=1.0)
+        assert policy.try_acquire() is True
+        assert policy.try_acquire() is False
+        policy.record_request()
+        assert policy.try_acquire() is False
+        policy.record_request()
+        assert policy.try_acquire() is True
+
+    def test_snapshot(self):
+        """Test the counters reported by snapshot."""
+        policy = HedgePolicy(budget_ratio=0.5, max_tokens=1.0)
+        policy.record_request()
+        policy.record_request()
+        policy.try_acquire()
+        policy.record_hedge_won()
+        policy.try_acquire()
+        snapshot = policy.snapshot()
+        assert snapshot["requests"] == 2  # noqa: PLR2004
+        assert snapshot["hedges_fired"] == 1
+        assert snapshot["hedges_won"] == 1
+        assert snapshot["budget_exhausted"] == 1
+        assert snapshot["fire_rate"] == 0.5  # noqa: PLR2004
+        assert snapshot["win_rate"] == 1.0
@@ -0,0 +1,106 @@
+"""Unit tests for the concurrency limiter."""
+
+import asyncio
+
+import pytest
+
+from glnova.client.limiter import ConcurrencyLimiter, Priority
+
+
+class TestConcurrencyLimiter:
+    """Test cases for the ConcurrencyLimiter class."""
+
+    def test_invalid_arguments(self):
+        """Test that invalid limits and weights are rejected."""
+        with pytest.raises(ValueError, match="max_in_flight"):
+            ConcurrencyLimiter(max_in_flight=0)
+        with pytest.raises(ValueError, match="weights"):
+            ConcurrencyLimiter(weights={Priority.BULK: 0})
+
+    def test_str_representation(self):
+        """Test string representation."""
+        assert str(ConcurrencyLimiter(max_in_flight=2)) == "<ConcurrencyLimiter in_flight=0/2 queued=0>"
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight(self):
+        """Test that no more than max_in_flight requests hold a slot."""
+        limiter = ConcurrencyLimiter(max_in_flight=2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2  # noqa: PLR2004
+        assert limiter.in_flight == 0
+        assert limiter.queue_depth() == 0
+
+    @pytest.mark.asyncio
+    async def test_priority_lanes(self):
+        """Test that freed slots are shared between lanes by weight."""
+        limiter = ConcurrencyLimiter(max_in_flight=1, weights={Priority.INTERACTIVE: 2, Priority.BULK: 1})
+        await limiter.acquire()
+        order = []
+
+        async def work(priority, name):
+            async with limiter.slot(priority=priority):
+                order.append(name)
+
+        tasks = [asyncio.create_task(work(Priority.BULK, f"b{i}")) for i in range(3)]
+        tasks += [asyncio.create_task(work(Priority.INTERACTIVE, f"i{i}")) for i in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth() == 6  # noqa: PLR2004
+        assert limiter.queue_depth(Priority.BULK) == 3  # noqa: PLR2004
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["i0", "b0", "i1", "i2", "b1", "b2"]
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self):
+        """Test that a request that times out leaves the queue."""
+        limiter = ConcurrencyLimiter(max_in_flight=1)
+        await limiter.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await limiter.acquire(priority="bulk", timeout=0.01)
+
+        assert limiter.queue_depth() == 0
+        limiter.release()
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter(self):
+        """Test that a cancelled waiter does not keep a slot."""
+        limiter = ConcurrencyLimiter(max_in_flight=1)
+        await limiter.acquire()
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        assert limiter.queue_depth() == 0
+
+    @pytest.mark.asyncio
+    async def test_snapshot(self):
+        """Test the queue depth and wait times reported by snapshot."""
+        limiter = ConcurrencyLimiter(max_in_flight=1)
+        await limiter.acquire(priority=Priority.INTERACTIVE)
+        task = asyncio.create_task(limiter.acquire(priority=Priority.BULK))
+        await asyncio.sleep(0.01)
+        assert limiter.snapshot()["lanes"]["bulk"]["queued"] == 1
+        limiter.release()
+        await task
+
+        snapshot = limiter.snapshot()
+        assert snapshot["in_flight"] == 1
+        assert snapshot["lanes"]["interactive"]["admitted"] == 1
+        assert snapshot["lanes"]["bulk"]["admitted"] == 1
+        assert snapshot["lanes"]["bulk"]["queued"] == 0
+        assert snapshot["lanes"]["bulk"]["wait_max"] > 0
@@ -0,0 +1,133 @@
+"""Unit tests for the request metrics of the clients."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.events import RequestEvent
+from glnova.client.gitlab import GitLab
+from glnova.client.limiter import ConcurrencyLimiter
+from glnova.client.metrics import RequestMetrics
+
+
+class TestRequestMetrics:
+    """Test cases for the RequestMetrics class."""
+
+    def test_observe(self):
+        """Test that events update the request, retry, cache and throttle metrics."""
+        metrics = RequestMetrics()
+        metrics.observe(
+            RequestEvent(
+                method="GET",
+                endpoint="/projects/1",
+                status=304,
+                retries=1,
+                cache_outcome="hit",
+                timings={"total": 0.02, "queue": 0.5},
+            )
+        )
+        metrics.observe(RequestEvent(method="GET", endpoint="/projects/2", cache_outcome="miss", error="Timeout"))
+
+        assert metrics.requests.get(method="GET", endpoint="/projects/:id", status="304") == 1
+        assert metrics.requests.get(method="GET", endpoint="/projects/:id", status="error") == 1
+        assert metrics.duration.get_count(method="GET", endpoint="/projects/:id") == 2  # noqa: PLR2004
+        assert metrics.retries.get(endpoint="/projects/:id") == 1
+        assert metrics.cache_hit_ratio.get() == 0.5  # noqa: PLR2004
+        assert metrics.throttle.get() == 0.5  # noqa: PLR2004
+        assert "glnova_requests_total" in metrics.render()
+
+    def test_instrument_sync_client(self):
+        """Test that an instrumented client reports its requests."""
+        metrics = RequestMetrics()
+        client = GitLab(token="token")
+        metrics.instrument(client)
+        mock_session = MagicMock()
+        mock_session.request.return_value.status_code = 200
+        mock_session.request.return_value.content = b"{}"
+        mock_session.request.return_value.headers = {}
+
+        with client:
+            client.session = mock_session
+            client._request("GET", "/users/5")
+
+        assert metrics.requests.get(method="GET", endpoint="/users/:id", status="200") == 1
+        assert metrics.in_flight.get() == 0
+
+    @pytest.mark.asyncio
+    async def test_instrument_async_client(self):
+        """Test that an instrumented asynchronous client reports its requests and limiter waits."""
+        metrics = RequestMetrics()
+        client = AsyncGitLab(token="token", limiter=ConcurrencyLimiter(max_in_flight=1))
+        metrics.instrument(client)
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.read = AsyncMock(return_value=b"[]")
+        mock_session = MagicMock()
+        mock_session.request = AsyncMock(return_value=mock_response)
+
+        client.session = mock_session
+        await client._request("GET", "/users")
+
+        assert metrics.requests.get(method="GET", endpoint="/users", status="200") == 1
+        assert metrics.in_flight.get() == 0
+        assert "throttle" in metrics.render()
+
+    def test_in_flight_sync_client(self):
+        """Test that a request counts as in flight while it is sent, even when interrupted."""
+        metrics = RequestMetrics()
+        client = GitLab(token="token")
+        metrics.instrument(client)
+        seen = []
+
+        def request(*args, **kwargs):
+            seen.append(metrics.in_flight.get())
+            raise KeyboardInterrupt
+
+        with client:
+            client.session = MagicMock()
+            client.session.request.side_effect = request
+            with pytest.raises(KeyboardInterrupt):
+                client._request("GET", "/users/5")
+
+        assert seen == [1]
+        assert metrics.in_flight.get() == 0
+
+    @pytest.mark.asyncio
+    async def test_in_flight_async_client(self):
+        """Test that an asynchronous request counts as in flight while it is sent, even when cancelled."""
+        metrics = RequestMetrics()
+        client = AsyncGitLab(token="token", limiter=ConcurrencyLimiter(max_in_flight=1))
+        metrics.instrument(client)
+        seen = []
+
+        async def request(*args, **kwargs):
+            seen.append(metrics.in_flight.get())
+            raise asyncio.CancelledError
+
+        client.session = MagicMock()
+        client.session.request = AsyncMock(side_effect=request)
+        with pytest.raises(asyncio.CancelledError):
+            await client._request("GET", "/users")
+
+        assert seen == [1]
+        assert metrics.in_flight.get() == 0
+        assert client.limiter.in_flight == 0
+
+    def test_uninstrumented_client_has_no_hooks(self):
+        """Test that clients without metrics do not collect events."""
+        assert GitLab().event_hooks == []
+
+    def test_observe_overhead(self):
+        """Test that recording an event stays cheap."""
+        metrics = RequestMetrics()
+        event = RequestEvent(method="GET", endpoint="/projects/1/issues", status=200, timings={"total": 0.1})
+        count = 2000
+        start = time.perf_counter()
+        for _ in range(count):
+            metrics.observe(event)
+
+        assert (time.perf_counter() - start) / count < 50e-6  # noqa: PLR2004
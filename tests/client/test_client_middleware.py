@@ -0,0 +1,376 @@
+"""Unit tests for the middleware pipeline."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.base import Client
+from glnova.client.gitlab import GitLab
+from glnova.client.middleware import (
+    AsyncMiddleware,
+    AsyncRaiseForStatusMiddleware,
+    Middleware,
+    RaiseForStatusMiddleware,
+    Request,
+    default_async_middlewares,
+    default_middlewares,
+    run_async_middlewares,
+    run_middlewares,
+)
+
+
+class RecordingMiddleware(Middleware):
+    """Middleware recording the order of its hooks."""
+
+    def __init__(self, name, calls):
+        """Initialize the middleware."""
+        self.name = name
+        self.calls = calls
+
+    def before_request(self, client, request):
+        """Record the before-request hook."""
+        self.calls.append(f"before {self.name}")
+
+    def after_response(self, client, request, response):
+        """Record the after-response hook."""
+        self.calls.append(f"after {self.name}")
+        return response
+
+    def on_error(self, client, request, error):
+        """Record the on-error hook."""
+        self.calls.append(f"error {self.name}")
+
+
+class RetryMiddleware(Middleware):
+    """Middleware retrying a failed request once."""
+
+    def on_error(self, client, request, error):
+        """Resend the request once."""
+        if request.context.get("retried"):
+            return None
+        request.context["retried"] = True
+        return request.send()
+
+
+class TestRequest:
+    """Test cases for the Request class."""
+
+    def test_defaults(self):
+        """Test that the request copies its mutable arguments."""
+        headers = {"A": "1"}
+        request = Request(method="GET", endpoint="/projects", headers=headers)
+        request.headers["B"] = "2"
+        assert headers == {"A": "1"}
+        assert request.kwargs == {}
+        assert str(request) == "<Request method=GET endpoint=/projects>"
+
+    def test_send_outside_pipeline(self):
+        """Test that send fails outside a pipeline."""
+        with pytest.raises(RuntimeError, match="pipeline"):
+            Request(method="GET", endpoint="/projects").send()
+
+
+class TestRunMiddlewares:
+    """Test cases for the synchronous pipeline."""
+
+    def test_hook_order(self):
+        """Test that before hooks run in order and after hooks in reverse order."""
+        calls = []
+        middlewares = [RecordingMiddleware("outer", calls), RecordingMiddleware("inner", calls)]
+        response = MagicMock()
+
+        def send(request):
+            calls.append("send")
+            return response
+
+        result = run_middlewares(
+            middlewares, Client(token=None, base_url="https://gitlab.com"), Request("GET", "/"), send
+        )
+
+        assert result is response
+        assert calls == ["before outer", "before inner", "send", "after inner", "after outer"]
+
+    def test_on_error_propagates(self):
+        """Test that errors reach every on-error hook in reverse order and are re-raised."""
+        calls = []
+        middlewares = [RecordingMiddleware("outer", calls), RecordingMiddleware("inner", calls)]
+        client = Client(token=None, base_url="https://gitlab.com")
+
+        with pytest.raises(requests.ConnectionError):
+            run_middlewares(middlewares, client, Request("GET", "/"), MagicMock(side_effect=requests.ConnectionError))
+
+        assert calls == ["before outer", "before inner", "error inner", "error outer"]
+
+    def test_on_error_recovers(self):
+        """Test that an on-error hook can retry the request."""
+        response = MagicMock()
+        send = MagicMock(side_effect=[requests.ConnectionError("down"), response])
+        client = Client(token=None, base_url="https://gitlab.com")
+
+        result = run_middlewares([RetryMiddleware()], client, Request("GET", "/"), send)
+
+        assert result is response
+        assert send.call_count == 2  # noqa: PLR2004
+
+    def test_recovered_response_runs_remaining_hooks(self):
+        """Test that a recovered response still goes through the after-response hooks."""
+        response = MagicMock()
+        response.raise_for_status.side_effect = requests.HTTPError("404")
+        send = MagicMock(side_effect=[requests.ConnectionError("down"), response])
+        calls = []
+        middlewares = [RecordingMiddleware("outer", calls), RaiseForStatusMiddleware(), RetryMiddleware()]
+        client = Client(token=None, base_url="https://gitlab.com")
+
+        with pytest.raises(requests.HTTPError):
+            run_middlewares(middlewares, client, Request("GET", "/"), send)
+
+        response.raise_for_status.assert_called_once()
+        assert calls == ["before outer", "error outer"]
+
+    def test_recovery_resumes_at_failed_hook(self):
+        """Test that a response recovered in an after-response hook goes through that hook again."""
+        calls = []
+        recovered = MagicMock()
+
+        class FailingOnce(Middleware):
+            def after_response(self, client, request, response):
+                calls.append("after failing")
+                if response is not recovered:
+                    raise ValueError("bad")
+                return response
+
+            def on_error(self, client, request, error):
+                return recovered
+
+        middlewares = [RecordingMiddleware("outer", calls), FailingOnce(), RecordingMiddleware("inner", calls)]
+        client = Client(token=None, base_url="https://gitlab.com")
+
+        result = run_middlewares(middlewares, client, Request("GET", "/"), MagicMock())
+
+        assert result is recovered
+        assert calls == [
+            "before outer",
+            "before inner",
+            "after inner",
+            "after failing",
+            "error inner",
+            "after failing",
+            "after outer",
+        ]
+
+    def test_retried_response_checked_by_inner_status_check(self):
+        """Test that a response retried by an outer middleware is checked for its status again."""
+        failed, retried = MagicMock(), MagicMock()
+        failed.raise_for_status.side_effect = requests.HTTPError("503")
+        retried.raise_for_status.side_effect = requests.HTTPError("503")
+        send = MagicMock(side_effect=[failed, retried])
+        client = Client(token=None, base_url="https://gitlab.com")
+
+        with pytest.raises(requests.HTTPError):
+            run_middlewares([RetryMiddleware(), RaiseForStatusMiddleware()], client, Request("GET", "/"), send)
+
+        retried.raise_for_status.assert_called_once()
+        assert send.call_count == 2  # noqa: PLR2004
+
+    def test_recoveries_are_bounded(self):
+        """Test that a hook rejecting every recovered response does not loop forever."""
+
+        class AlwaysFailing(Middleware):
+            def after_response(self, client, request, response):
+                raise ValueError("bad")
+
+            def on_error(self, client, request, error):
+                return MagicMock()
+
+        client = Client(token=None, base_url="https://gitlab.com")
+
+        with pytest.raises(ValueError, match="bad"):
+            run_middlewares([AlwaysFailing()], client, Request("GET", "/"), MagicMock())
+
+    def test_default_middlewares(self):
+        """Test that the default middlewares merge headers and add the conditional header."""
+        client = Client(token="secret", base_url="https://gitlab.com")
+        request = Request("GET", "/", headers={"X-Test": "1"}, etag='"abc"')
+        send = MagicMock()
+
+        run_middlewares(default_middlewares(), client, request, send)
+
+        assert request.headers == {"Authorization": "Bearer secret", "If-None-Match": '"abc"', "X-Test": "1"}
+        send.return_value.raise_for_status.assert_called_once()
+
+    def test_caller_headers_take_precedence(self):
+        """Test that headers given by the caller override the client headers."""
+        client = Client(token="secret", base_url="https://gitlab.com")
+        request = Request("GET", "/", headers={"Authorization": "Bearer other"})
+
+        run_middlewares(default_middlewares(), client, request, MagicMock())
+
+        assert request.headers == {"Authorization": "Bearer other"}
+
+    def test_raise_for_status_closes_response(self):
+        """Test that error responses are closed before raising."""
+        response = MagicMock()
+        response.raise_for_status.side_effect = requests.HTTPError("404")
+        client = Client(token=None, base_url="https://gitlab.com")
+
+        with pytest.raises(requests.HTTPError):
+            run_middlewares([RaiseForStatusMiddleware()], client, Request("GET", "/"), lambda request: response)
+
+        response.close.assert_called_once()
+
+
+class TestRunAsyncMiddlewares:
+    """Test cases for the asynchronous pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_hook_order(self):
+        """Test that the asynchronous hooks run in the same order as the synchronous ones."""
+        calls = []
+
+        class Recording(AsyncMiddleware):
+            def __init__(self, name):
+                self.name = name
+
+            async def before_request(self, client, request):
+                calls.append(f"before {self.name}")
+
+            async def after_response(self, client, request, response):
+                calls.append(f"after {self.name}")
+                return response
+
+        async def send(request):
+            calls.append("send")
+            return MagicMock()
+
+        client = Client(token=None, base_url="https://gitlab.com")
+        await run_async_middlewares([Recording("outer"), Recording("inner")], client, Request("GET", "/"), send)
+
+        assert calls == ["before outer", "before inner", "send", "after inner", "after outer"]
+
+    @pytest.mark.asyncio
+    async def test_on_error_recovers(self):
+        """Test that an asynchronous on-error hook can retry the request."""
+        response = MagicMock()
+        send = AsyncMock(side_effect=[ConnectionError("down"), response])
+
+        class Retry(AsyncMiddleware):
+            async def on_error(self, client, request, error):
+                return await request.send()
+
+        client = Client(token=None, base_url="https://gitlab.com")
+        result = await run_async_middlewares([Retry()], client, Request("GET", "/"), send)
+
+        assert result is response
+
+    @pytest.mark.asyncio
+    async def test_recovered_response_runs_remaining_hooks(self):
+        """Test that a recovered response is still checked for its status."""
+        response = MagicMock()
+        response.raise_for_status.side_effect = requests.HTTPError("404")
+        send = AsyncMock(side_effect=[ConnectionError("down"), response])
+
+        class Retry(AsyncMiddleware):
+            async def on_error(self, client, request, error):
+                if isinstance(error, ConnectionError):
+                    return await request.send()
+                return None
+
+        client = Client(token=None, base_url="https://gitlab.com")
+        with pytest.raises(requests.HTTPError):
+            await run_async_middlewares([AsyncRaiseForStatusMiddleware(), Retry()], client, Request("GET", "/"), send)
+
+        response.raise_for_status.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_retried_response_checked_by_inner_status_check(self):
+        """Test that a response retried by an outer asynchronous middleware is checked for its status again."""
+        failed, retried = MagicMock(), MagicMock()
+        failed.raise_for_status.side_effect = requests.HTTPError("503")
+        retried.raise_for_status.side_effect = requests.HTTPError("503")
+        send = AsyncMock(side_effect=[failed, retried])
+
+        class Retry(AsyncMiddleware):
+            async def on_error(self, client, request, error):
+                if request.context.get("retried"):
+                    return None
+                request.context["retried"] = True
+                return await request.send()
+
+        client = Client(token=None, base_url="https://gitlab.com")
+        with pytest.raises(requests.HTTPError):
+            await run_async_middlewares([Retry(), AsyncRaiseForStatusMiddleware()], client, Request("GET", "/"), send)
+
+        retried.raise_for_status.assert_called_once()
+        assert send.await_count == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_default_middlewares(self):
+        """Test that the default asynchronous middlewares match the synchronous ones."""
+        client = Client(token="secret", base_url="https://gitlab.com")
+        request = Request("GET", "/", etag='"abc"')
+        response = MagicMock()
+
+        await run_async_middlewares(default_async_middlewares(), client, request, AsyncMock(return_value=response))
+
+        assert request.headers == {"If-None-Match": '"abc"', "Authorization": "Bearer secret"}
+        response.raise_for_status.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_raise_for_status_releases_response(self):
+        """Test that error responses are released before raising."""
+        response = MagicMock()
+        response.raise_for_status.side_effect = RuntimeError("404")
+        client = Client(token=None, base_url="https://gitlab.com")
+
+        with pytest.raises(RuntimeError):
+            await run_async_middlewares(
+                [AsyncRaiseForStatusMiddleware()], client, Request("GET", "/"), AsyncMock(return_value=response)
+            )
+
+        response.release.assert_called_once()
+
+
+class TestClientMiddlewares:
+    """Test cases for the middlewares of the clients."""
+
+    def test_default_middlewares(self):
+        """Test that the clients use the default middlewares."""
+        assert len(GitLab().middlewares) == 3  # noqa: PLR2004
+        assert len(AsyncGitLab().middlewares) == 3  # noqa: PLR2004
+
+    @patch("requests.Session")
+    def test_custom_middlewares(self, mock_session_class):
+        """Test that a client sends its requests through custom middlewares."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        calls = []
+
+        client = GitLab(token="secret", middlewares=[RecordingMiddleware("custom", calls), *default_middlewares()])
+        with client:
+            client._request("GET", "/projects", params={"page": 1})
+
+        assert calls == ["before custom", "after custom"]
+        kwargs = mock_session.request.call_args[1]
+        assert kwargs["headers"] == {"Authorization": "Bearer secret"}
+        assert kwargs["params"] == {"page": 1}
+
+    @pytest.mark.asyncio
+    async def test_async_custom_middlewares(self):
+        """Test that the asynchronous client sends its requests through custom middlewares."""
+        calls = []
+
+        class Recording(AsyncMiddleware):
+            async def before_request(self, client, request):
+                calls.append(request.method)
+
+        with patch("glnova.client.async_gitlab.ClientSession") as mock_session_class:
+            mock_session = AsyncMock()
+            mock_session_class.return_value = mock_session
+            mock_session.request.return_value = MagicMock()
+            client = AsyncGitLab(token=None, middlewares=[Recording()])
+            async with client:
+                await client._request("GET", "projects/1")
+
+        assert calls == ["GET"]
@@ -0,0 +1,241 @@
+"""Unit tests for the transports of the synchronous client."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+import urllib3
+
+from glnova.client.gitlab import GitLab
+from glnova.client.transport import SharedTransport, Urllib3Transport, get_default_transport, set_default_transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler echoing the request back as JSON."""
+
+    def _reply(self):
+        """Reply with the method, path, headers and body of the request."""
+        if self.path.startswith("/slow"):
+            time.sleep(0.5)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+        status = 404 if self.path.endswith("/missing") else 200
+        payload = json.dumps(
+            {
+                "method": self.command,
+                "path": self.path,
+                "content_type": self.headers.get("Content-Type"),
+                "authorization": self.headers.get("Authorization"),
+                "body": body,
+            }
+        ).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _reply  # noqa: N815
+    do_PUT = _reply  # noqa: N815
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Silence the request log."""
+
+
+@pytest.fixture
+def server_url():
+    """Serve the echo handler on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestUrllib3Transport:
+    """Test cases for the Urllib3Transport class."""
+
+    def test_get_with_params(self, server_url):
+        """Test that query parameters are encoded like requests does."""
+        transport = Urllib3Transport()
+        response = transport.request(
+            "GET", f"{server_url}/items", params={"labels": ["a", "b"], "state": None, "simple": True}
+        )
+
+        assert isinstance(response, requests.Response)
+        assert response.status_code == 200  # noqa: PLR2004
+        assert response.headers["etag"] == '"v1"'
+        assert response.json()["path"] == "/items?labels=a&labels=b&simple=True"
+        transport.close()
+
+    def test_put_json_and_form(self, server_url):
+        """Test that JSON and form bodies are encoded with their content type."""
+        transport = Urllib3Transport()
+
+        as_json = transport.request("PUT", f"{server_url}/items", json={"name": "x"}).json()
+        as_form = transport.request("PUT", f"{server_url}/items", data={"labels": "a,b", "title": None}).json()
+
+        assert as_json["content_type"] == "application/json"
+        assert json.loads(as_json["body"]) == {"name": "x"}
+        assert as_form["content_type"] == "application/x-www-form-urlencoded"
+        assert as_form["body"] == "labels=a%2Cb"
+
+    def test_error_status(self, server_url):
+        """Test that error statuses raise requests.HTTPError."""
+        response = Urllib3Transport().request("GET", f"{server_url}/missing")
+
+        assert response.status_code == 404  # noqa: PLR2004
+        with pytest.raises(requests.HTTPError):
+            response.raise_for_status()
+        response.close()
+
+    def test_stream(self, server_url):
+        """Test that streamed bodies are read on demand and release the connection when closed."""
+        transport = Urllib3Transport()
+        response = transport.request("GET", f"{server_url}/items", stream=True)
+
+        assert response._content is False
+        body = b"".join(response.iter_content(chunk_size=4))
+        response.close()
+
+        assert json.loads(body)["path"] == "/items"
+        assert transport.request("GET", f"{server_url}/items").json()["path"] == "/items"
+        transport.close()
+
+    def test_timeout(self, server_url):
+        """Test that timeouts raise requests.Timeout."""
+        with pytest.raises(requests.Timeout):
+            Urllib3Transport().request("GET", f"{server_url}/slow", timeout=0.05)
+
+    def test_connection_error(self):
+        """Test that connection failures raise requests.ConnectionError."""
+        pool_manager = MagicMock()
+        pool_manager.request.side_effect = urllib3.exceptions.NewConnectionError(None, "refused")
+
+        with pytest.raises(requests.ConnectionError):
+            Urllib3Transport(pool_manager=pool_manager).request("GET", "http://gitlab.invalid/")
+
+
+class TestGitLabTransport:
+    """Test cases for the transport of the GitLab client."""
+
+    def test_default_transport(self):
+        """Test that requests.Session is the default transport."""
+        with GitLab() as client:
+            assert isinstance(client.session, requests.Session)
+
+    def test_urllib3_transport(self, server_url):
+        """Test that the client works end to end over the urllib3 transport."""
+        client = GitLab(token="secret", base_url=server_url, transport=Urllib3Transport)
+        with client:
+            assert isinstance(client.session, Urllib3Transport)
+            data, metadata = client.user.get_user()
+
+        assert data["path"] == "/api/v4/user"
+        assert data["authorization"] == "Bearer secret"
+        assert metadata == {"status_code": 200, "etag": '"v1"'}
+        assert client.session is None
+
+    def test_urllib3_transport_error_status(self, server_url):
+        """Test that error statuses raise requests.HTTPError through the middlewares of the client."""
+        with (
+            GitLab(token="secret", base_url=server_url, transport=Urllib3Transport) as client,
+            pytest.raises(requests.HTTPError),
+        ):
+            client._request(method="GET", endpoint="/missing")
+
+    def test_default_transport_factory(self, server_url):
+        """Test that clients created without a transport use the default transport factory."""
+        shared = SharedTransport()
+        set_default_transport(shared)
+        try:
+            assert get_default_transport() is shared
+            for _ in range(2):
+                with GitLab(token="secret", base_url=server_url) as client:
+                    assert client.session is shared
+                    client.user.get_user()
+        finally:
+            set_default_transport(None)
+
+        assert get_default_transport() is None
+        assert shared.requests == 2  # noqa: PLR2004
+        with GitLab() as client:
+            assert isinstance(client.session, requests.Session)
+
+
+class TestSharedTransport:
+    """Test cases for SharedTransport."""
+
+    def test_close_keeps_session(self):
+        """Test that closing the transport keeps the sessions open until shutdown."""
+        session = MagicMock()
+        transport = SharedTransport(session_factory=lambda: session)
+        transport.request("GET", "http://gitlab.invalid/")
+
+        transport.close()
+        session.close.assert_not_called()
+        transport.shutdown()
+
+        session.close.assert_called_once_with()
+        assert transport() is transport
+        assert str(transport) == "<SharedTransport sessions=0 requests=1>"
+
+    def test_request(self):
+        """Test that requests are sent over a shared session and counted."""
+        session = MagicMock()
+        transport = SharedTransport(session_factory=lambda: session)
+
+        response = transport.request("GET", "http://gitlab.invalid/", timeout=1)
+
+        assert response is session.request.return_value
+        session.request.assert_called_once_with("GET", "http://gitlab.invalid/", timeout=1)
+        assert transport.requests == 1
+
+    def test_sessions_per_host_and_token(self):
+        """Test that every host and token gets its own session, reused by later requests."""
+        factory = MagicMock(side_effect=MagicMock)
+        transport = SharedTransport(session_factory=factory)
+
+        for token in ("a", "b", "a"):
+            transport.request("GET", "http://one.invalid/api/v4/user", headers={"Authorization": f"Bearer {token}"})
+        transport.request("GET", "http://two.invalid/api/v4/user", headers={"Authorization": "Bearer a"})
+
+        assert factory.call_count == 3  # noqa: PLR2004
+        assert transport.requests == 4  # noqa: PLR2004
+
+    def test_concurrent_requests(self):
+        """Test that concurrent requests never share a session and are all counted."""
+        in_use = set()
+        overlaps = []
+
+        def send(session, *args, **kwargs):
+            if session in in_use:
+                overlaps.append(session)
+            in_use.add(session)
+            time.sleep(0.01)
+            in_use.discard(session)
+
+        def factory():
+            session = MagicMock()
+            session.request.side_effect = lambda *args, **kwargs: send(session)
+            return session
+
+        transport = SharedTransport(session_factory=factory)
+        threads = [
+            threading.Thread(target=lambda: [transport.request("GET", "http://gitlab.invalid/") for _ in range(5)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not overlaps
+        assert transport.requests == 20  # noqa: PLR2004
+        assert len(transport._sessions) <= 4  # noqa: PLR2004
@@ -8,6 +8,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from aiohttp import ClientResponse
 
+from glnova.cache.path_id import PathIDCache
+from glnova.client.adaptive import AIMDController
+from glnova.client.deadline import Deadline
 from glnova.project.async_project import AsyncProject
 
 
@@ -92,8 +95,7 @@ class TestAsyncProjectListProjects:
 
         mock_project._get.assert_called_once()
         call_args = mock_project._get.call_args
-        assert call_args[1]["page"] == 3  # noqa: PLR2004
-        assert call_args[1]["per_page"] == 25  # noqa: PLR2004
+        assert call_args[1]["params"] == {"archived": True, "page": 3, "per_page": 25}
         assert response == mock_response
 
     @pytest.mark.asyncio
@@ -330,3 +332,105 @@ class TestPublicAsyncListProjects:
         assert call_args[1]["search"] == "database"
         assert call_args[1]["sort"] == "asc"
         assert call_args[1]["order_by"] == "name"
+
+
+class TestAsyncProjectResolveProjectIds:
+    """Test cases for resolving project paths to IDs asynchronously."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_project_ids_sweep(self, tmp_path):
+        """Test that uncached paths are resolved by paging through list_projects."""
+        client = MagicMock()
+        client.base_url = "https://gitlab.com"
+        client.path_id_cache = PathIDCache(filename=tmp_path / "ids.json")
+        project = AsyncProject(client=client)
+        project.list_projects = AsyncMock(return_value=([{"id": 2, "path_with_namespace": "group/a"}], {}))
+
+        result = await project.resolve_project_ids(["group/a", "group/b"], group_id="group")
+
+        assert result == {"group/a": 2}
+        project.list_projects.assert_called_once()
+        assert project.list_projects.call_args[1]["group_id"] == "group"
+        cache = client.path_id_cache
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/a") == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_resolve_project_ids_large_per_page(self, tmp_path):
+        """Test that a per_page above the GitLab maximum does not end the sweep after the first full page."""
+        client = MagicMock()
+        client.base_url = "https://gitlab.com"
+        client.path_id_cache = None
+        project = AsyncProject(client=client)
+        pages = {
+            1: [{"id": index, "path_with_namespace": f"group/p{index}"} for index in range(100)],
+            2: [{"id": 100, "path_with_namespace": "group/last"}],
+        }
+
+        async def list_projects(page, per_page, **kwargs):
+            return pages[page][:per_page], {}
+
+        project.list_projects = AsyncMock(side_effect=list_projects)
+
+        result = await project.resolve_project_ids(["group/last"], per_page=200)
+
+        assert result == {"group/last": 100}
+        assert project.list_projects.call_args[1]["per_page"] == 100  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_resolve_project_ids_deadline(self, tmp_path):
+        """Test that the sweep stops with partial results when the deadline passes."""
+        client = MagicMock()
+        client.base_url = "https://gitlab.com"
+        client.path_id_cache = None
+        project = AsyncProject(client=client)
+        deadline = Deadline(timeout=10.0)
+
+        async def list_projects(**kwargs):
+            raise deadline.exceed()
+
+        project.list_projects = AsyncMock(side_effect=list_projects)
+
+        result = await project.resolve_project_ids(["group/a"], deadline=deadline)
+
+        assert result == {}
+        assert deadline.exceeded is True
+
+    @pytest.mark.asyncio
+    async def test_resolve_project_ids_controller(self, tmp_path):
+        """Test that the sweep requests controller.limit pages at a time and stops at the last page."""
+        client = MagicMock()
+        client.base_url = "https://gitlab.com"
+        client.path_id_cache = None
+        project = AsyncProject(client=client)
+        controller = AIMDController(initial_limit=2, max_limit=2, latency_tolerance=1e6)
+        pages = {
+            1: [{"id": 1, "path_with_namespace": "group/a"}, {"id": 9, "path_with_namespace": "group/x"}],
+            2: [{"id": 2, "path_with_namespace": "group/b"}, {"id": 8, "path_with_namespace": "group/y"}],
+            3: [{"id": 3, "path_with_namespace": "group/c"}],
+        }
+
+        async def list_projects(page, **kwargs):
+            return pages.get(page, []), {}
+
+        project.list_projects = AsyncMock(side_effect=list_projects)
+
+        result = await project.resolve_project_ids(
+            ["group/a", "group/c", "group/missing"], per_page=2, controller=controller
+        )
+
+        assert result == {"group/a": 1, "group/c": 3}
+        assert sorted(call[1]["page"] for call in project.list_projects.call_args_list) == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_resolve_project_id(self, tmp_path):
+        """Test resolving a single project path."""
+        client = MagicMock()
+        client.base_url = "https://gitlab.com"
+        client.path_id_cache = None
+        project = AsyncProject(client=client)
+        project._get = AsyncMock()
+        with patch(
+            "glnova.project.async_project.process_async_response_with_last_modified",
+            AsyncMock(return_value=({"id": 5, "path_with_namespace": "group/a"}, 200, None)),
+        ):
+            assert await project.resolve_project_id("group/a") == 5  # noqa: PLR2004
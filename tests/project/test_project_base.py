@@ -394,3 +394,29 @@ class TestListProjectsHelper:
         endpoint, params = base_project._list_projects_helper(user_id=123, membership=False)
         assert endpoint == "/users/123/projects"
         assert params == {"membership": False}
+
+    def test_helper_pagination_params(self):
+        """Test that page and per_page are only included when given."""
+        base_project = BaseProject()
+        _endpoint, params = base_project._list_projects_helper(membership=True, page=2, per_page=100)
+        assert params == {"membership": True, "page": 2, "per_page": 100}
+
+
+class TestResolveProjectHelpers:
+    """Test cases for the project path resolution helpers."""
+
+    def test_get_project_endpoint(self):
+        """Test the single project endpoint."""
+        base_project = BaseProject()
+        # cSpell:disable
+        assert base_project._get_project_endpoint(project_id="group/project") == "/projects/group%2Fproject"
+        # cSpell:enable
+        assert base_project._get_project_endpoint(project_id=12) == "/projects/12"
+
+    def test_match_project_paths(self):
+        """Test matching listed projects against pending paths."""
+        base_project = BaseProject()
+        pending = {"group/a": "Group/A", "group/b": "group/b"}
+        projects = [{"id": 1, "path_with_namespace": "group/a"}, {"id": 3, "path_with_namespace": "group/c"}]
+        assert base_project._match_project_paths(projects=projects, pending=pending) == {"Group/A": 1}
+        assert pending == {"group/b": "group/b"}
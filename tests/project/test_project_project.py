@@ -5,8 +5,12 @@ from __future__ import annotations
 from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
+import requests
 from requests import Response
 
+from glnova.cache.path_id import PathIDCache
+from glnova.client.adaptive import AIMDController
+from glnova.client.deadline import Deadline
 from glnova.project.project import Project
 
 
@@ -86,8 +90,7 @@ class TestProjectListProjects:
 
         mock_project._get.assert_called_once()
         call_args = mock_project._get.call_args
-        assert call_args[1]["page"] == 2  # noqa: PLR2004
-        assert call_args[1]["per_page"] == 50  # noqa: PLR2004
+        assert call_args[1]["params"] == {"archived": True, "page": 2, "per_page": 50}
         assert response == mock_response
 
     def test_list_projects_multiple_filters(self):
@@ -275,3 +278,120 @@ class TestPublicListProjects:
         assert call_args[1]["visibility"] == "public"
         assert call_args[1]["search"] == "api"
         assert call_args[1]["sort"] == "asc"
+
+
+class TestProjectResolveProjectIds:
+    """Test cases for resolving project paths to IDs."""
+
+    def _make_project(self, tmp_path):
+        client = MagicMock()
+        client.base_url = "https://gitlab.com"
+        client.path_id_cache = PathIDCache(filename=tmp_path / "ids.json")
+        return Project(client=client), client.path_id_cache
+
+    def test_resolve_project_id_cached(self, tmp_path):
+        """Test that a cached path does not issue a request."""
+        project, cache = self._make_project(tmp_path)
+        cache.set(base_url="https://gitlab.com", kind="projects", path="group/project", resource_id=9)
+        project._get = MagicMock()
+        assert project.resolve_project_id("group/project") == 9  # noqa: PLR2004
+        project._get.assert_not_called()
+
+    @patch("glnova.project.project.process_response_with_last_modified")
+    def test_resolve_project_id_renamed(self, mock_process, tmp_path):
+        """Test resolving an old path stores both the old and canonical paths."""
+        project, cache = self._make_project(tmp_path)
+        project._get = MagicMock()
+        mock_process.return_value = ({"id": 9, "path_with_namespace": "group/new"}, 200, None)
+        assert project.resolve_project_id("group/old") == 9  # noqa: PLR2004
+        # cSpell:disable
+        project._get.assert_called_once_with(endpoint="/projects/group%2Fold")
+        # cSpell:enable
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/new") == 9  # noqa: PLR2004
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/old") == 9  # noqa: PLR2004
+
+    def test_resolve_project_ids_sweep(self, tmp_path):
+        """Test that uncached paths are resolved by paging through list_projects."""
+        project, cache = self._make_project(tmp_path)
+        cache.set(base_url="https://gitlab.com", kind="projects", path="group/cached", resource_id=1)
+        project.list_projects = MagicMock(
+            side_effect=[
+                ([{"id": 2, "path_with_namespace": "group/a"}, {"id": 3, "path_with_namespace": "group/x"}], {}),
+                ([{"id": 4, "path_with_namespace": "group/b"}], {}),
+            ]
+        )
+
+        result = project.resolve_project_ids(["group/cached", "group/a", "group/b", "group/missing"], per_page=2)
+
+        assert result == {"group/cached": 1, "group/a": 2, "group/b": 4}
+        assert project.list_projects.call_count == 2  # noqa: PLR2004
+        assert project.list_projects.call_args[1]["page"] == 2  # noqa: PLR2004
+        assert project.list_projects.call_args[1]["simple"] is True
+        assert cache.get(base_url="https://gitlab.com", kind="projects", path="group/b") == 4  # noqa: PLR2004
+
+    def test_resolve_project_ids_large_per_page(self, tmp_path):
+        """Test that a per_page above the GitLab maximum does not end the sweep after the first full page."""
+        project, _ = self._make_project(tmp_path)
+        pages = {
+            1: [{"id": index, "path_with_namespace": f"group/p{index}"} for index in range(100)],
+            2: [{"id": 100, "path_with_namespace": "group/last"}],
+        }
+        project.list_projects = MagicMock(side_effect=lambda page, per_page, **kwargs: (pages[page][:per_page], {}))
+
+        result = project.resolve_project_ids(["group/last"], per_page=200)
+
+        assert result == {"group/last": 100}
+        assert project.list_projects.call_args[1]["per_page"] == 100  # noqa: PLR2004
+
+    def test_resolve_project_ids_deadline(self, tmp_path):
+        """Test that the sweep stops with partial results when the deadline passes."""
+        project, _ = self._make_project(tmp_path)
+        deadline = Deadline(timeout=10.0)
+
+        def list_projects(page, **kwargs):
+            if page > 1:
+                raise deadline.exceed()
+            return [{"id": 2, "path_with_namespace": "group/a"}, {"id": 3, "path_with_namespace": "group/x"}], {}
+
+        project.list_projects = MagicMock(side_effect=list_projects)
+
+        result = project.resolve_project_ids(["group/a", "group/b"], per_page=2, deadline=deadline)
+
+        assert result == {"group/a": 2}
+        assert deadline.exceeded is True
+        assert project.list_projects.call_args[1]["deadline"] is deadline
+
+    def test_resolve_project_ids_controller(self, tmp_path):
+        """Test that the sweep requests controller.limit pages at a time and retries overloaded pages."""
+        project, _ = self._make_project(tmp_path)
+        controller = AIMDController(initial_limit=3, max_limit=3, cooldown=0.0, latency_tolerance=1e6)
+        overloaded = {2}
+        pages = {
+            1: [{"id": 1, "path_with_namespace": "group/a"}, {"id": 9, "path_with_namespace": "group/x"}],
+            2: [{"id": 2, "path_with_namespace": "group/b"}, {"id": 8, "path_with_namespace": "group/y"}],
+            3: [{"id": 3, "path_with_namespace": "group/c"}],
+        }
+
+        def list_projects(page, **kwargs):
+            if page in overloaded:
+                overloaded.discard(page)
+                response = MagicMock(status_code=503)
+                raise requests.HTTPError("503", response=response)
+            return pages.get(page, []), {}
+
+        project.list_projects = MagicMock(side_effect=list_projects)
+
+        with patch("glnova.client.adaptive.time.sleep"):
+            result = project.resolve_project_ids(["group/a", "group/b", "group/c"], per_page=2, controller=controller)
+
+        assert result == {"group/a": 1, "group/b": 2, "group/c": 3}
+        assert sorted(call[1]["page"] for call in project.list_projects.call_args_list) == [1, 2, 2, 3]
+        assert controller.snapshot()["decreases"] == 1
+
+    def test_resolve_project_ids_all_cached(self, tmp_path):
+        """Test that no sweep happens when every path is cached."""
+        project, cache = self._make_project(tmp_path)
+        cache.set(base_url="https://gitlab.com", kind="projects", path="group/a", resource_id=1)
+        project.list_projects = MagicMock()
+        assert project.resolve_project_ids(["group/a"]) == {"group/a": 1}
+        project.list_projects.assert_not_called()
@@ -0,0 +1,97 @@
+"""Unit tests for the load generator."""
+
+import asyncio
+
+import pytest
+
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.testing.load import parse_mix, percentile, run_load
+from glnova.testing.mock_server import MockGitLab
+
+
+def load(server: MockGitLab, **kwargs):
+    """Run a load against the mock server and return the report."""
+
+    async def run():
+        async with AsyncGitLab(token="token", base_url=server.url) as client:
+            return await run_load(client, **kwargs)
+
+    return asyncio.run(run())
+
+
+class TestParseMix:
+    """Test cases for parse_mix."""
+
+    def test_parse(self):
+        """Test that weights are parsed and default to 1."""
+        assert parse_mix("list=7, get=2.5,edit") == {"list": 7.0, "get": 2.5, "edit": 1.0}
+
+    @pytest.mark.parametrize(
+        ("value", "message"),
+        [
+            ("delete=1", "Unknown operation"),
+            ("list=x", "Invalid weight"),
+            ("list=-1", "Invalid weight"),
+            ("list=0", "positive"),
+        ],
+    )
+    def test_invalid(self, value, message):
+        """Test that unknown operations and invalid weights are rejected."""
+        with pytest.raises(ValueError, match=message):
+            parse_mix(value)
+
+
+class TestPercentile:
+    """Test cases for percentile."""
+
+    def test_nearest_rank(self):
+        """Test the nearest-rank percentiles."""
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 0.5) == 50  # noqa: PLR2004
+        assert percentile(values, 0.99) == 99  # noqa: PLR2004
+        assert percentile([], 0.5) == 0
+
+
+class TestRunLoad:
+    """Test cases for run_load."""
+
+    def test_report(self):
+        """Test that a mixed load reports the calls, latencies and bytes of every operation."""
+        with MockGitLab(projects=2, issues_per_project=10) as server:
+            report = load(server, project=1, mix={"list": 1, "get": 1, "edit": 1}, concurrency=4, duration=0.3, seed=0)
+            edits = server.requests["PUT /projects/:id/issues/:id"]
+            titles = {server._work_item("issues", 1, iid)["title"] for iid in range(1, 11)}
+
+        assert report["calls"] > 0
+        assert report["errors"] == 0
+        assert report["requests"] == report["calls"]
+        assert set(report["operations"]) == {"list", "get", "edit"}
+        assert sum(operation["calls"] for operation in report["operations"].values()) == report["calls"]
+        assert report["operations"]["edit"]["calls"] == edits
+        assert 0 < report["latency"]["p50_ms"] <= report["latency"]["p99_ms"] <= report["latency"]["max_ms"]
+        assert report["bytes_received"] > 0
+        assert report["bytes_sent"] > 0
+        assert titles == {f"Issue {iid} of project 1" for iid in range(1, 11)}
+
+    def test_rate(self):
+        """Test that a target rate limits the number of calls."""
+        with MockGitLab(projects=1, issues_per_project=5) as server:
+            report = load(server, project=1, mix={"list": 1}, concurrency=4, duration=0.5, rate=20)
+
+        assert 5 <= report["calls"] <= 12  # noqa: PLR2004
+        assert report["target_rate"] == 20  # noqa: PLR2004
+
+    def test_throttled(self):
+        """Test that 429 responses are counted as errors and throttled calls."""
+        with MockGitLab(projects=1, issues_per_project=5, rate_limit=5) as server:
+            report = load(server, project=1, mix={"get": 1}, concurrency=2, duration=0.2)
+
+        assert report["throttled"] > 0
+        assert report["errors"] == report["throttled"]
+        assert report["throttled_rate"] == report["error_rate"]
+
+    def test_empty_project(self):
+        """Test that get calls need issues to read."""
+        with MockGitLab(projects=1, issues_per_project=0) as server, pytest.raises(ValueError, match="no issues"):
+            load(server, project=1, mix={"get": 1}, duration=0.1)
@@ -0,0 +1,136 @@
+"""Unit tests for the mock GitLab server."""
+
+import aiohttp
+import pytest
+import requests
+
+from glnova.client.async_gitlab import AsyncGitLab
+from glnova.client.gitlab import GitLab
+from glnova.testing.mock_server import MAX_COUNTED_TOTAL, MockGitLab
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Serve a mock GitLab on a background thread."""
+    with MockGitLab(users=10, groups=2, projects=4, issues_per_project=30, merge_requests_per_project=5) as server:
+        yield server
+
+
+class TestMockGitLab:
+    """Test cases for the MockGitLab class."""
+
+    def test_pagination_headers(self, server):
+        """Test that listings are paginated with the headers of GitLab."""
+        with GitLab(token="token", base_url=server.url) as client:
+            response = client._request("GET", "/projects/2/issues", params={"page": 2, "per_page": 20})
+
+        assert [issue["iid"] for issue in response.json()] == list(range(21, 31))
+        assert response.headers["X-Page"] == "2"
+        assert response.headers["X-Prev-Page"] == "1"
+        assert response.headers["X-Next-Page"] == ""
+        assert response.headers["X-Total"] == "30"
+        assert response.headers["X-Total-Pages"] == "2"
+        assert 'rel="first"' in response.headers["Link"]
+        assert 'rel="last"' in response.headers["Link"]
+
+    def test_large_listings_omit_totals(self):
+        """Test that listings larger than GitLab counts are served lazily without total headers."""
+        with (
+            MockGitLab(projects=1000, issues_per_project=1000) as server,
+            GitLab(token="token", base_url=server.url) as client,
+        ):
+            response = client._request("GET", "/issues", params={"page": 10000, "per_page": 100})
+
+        issues = response.json()
+        assert MAX_COUNTED_TOTAL < 1000 * 1000
+        assert issues[-1]["id"] == 1000 * 1000
+        assert "X-Total" not in response.headers
+        assert response.headers["X-Next-Page"] == ""
+
+    def test_group_listing_and_filters(self, server):
+        """Test the group listings, the iids filter and the username filter."""
+        with GitLab(token="token", base_url=server.url) as client:
+            merge_requests, _ = client.merge_request.list_merge_requests(group_id=2, per_page=100)
+            issues, _ = client.issue.list_issues(project="group-1/project-3", iids=[2, 4, 99])
+            users, _ = client.user.list_users(username="user-3")
+            projects = client._request("GET", "/groups/group-2/projects").json()
+
+        assert {merge_request["project_id"] for merge_request in merge_requests} == {2, 4}
+        assert len(merge_requests) == 10  # noqa: PLR2004
+        assert [issue["iid"] for issue in issues] == [2, 4]
+        assert issues[0]["project_id"] == 3  # noqa: PLR2004
+        assert [user["id"] for user in users] == [3]
+        assert [project["path_with_namespace"] for project in projects] == ["group-2/project-2", "group-2/project-4"]
+
+    def test_etag_and_edit(self, server):
+        """Test that conditional requests are answered with 304 until the record is edited."""
+        with GitLab(token="token", base_url=server.url) as client:
+            issue, info = client.issue.get_issue(project_id=1, issue_iid=7)
+            _, not_modified = client.issue.get_issue(project_id=1, issue_iid=7, etag=info["etag"])
+            edited, _ = client.issue.edit_issue(project_id=1, issue_iid=7, title="Edited", labels=["bug"])
+            _, modified = client.issue.get_issue(project_id=1, issue_iid=7, etag=info["etag"])
+
+        assert issue["title"] == "Issue 7 of project 1"
+        assert not_modified["status_code"] == 304  # noqa: PLR2004
+        assert edited["title"] == "Edited"
+        assert modified["status_code"] == 200  # noqa: PLR2004
+        assert modified["etag"] != info["etag"]
+        assert server.requests["PUT /projects/:id/issues/:id"] >= 1
+
+    def test_not_found(self, server):
+        """Test that unknown records and routes are answered with 404."""
+        with GitLab(token="token", base_url=server.url) as client:
+            with pytest.raises(requests.HTTPError) as exc_info:
+                client.issue.get_issue(project_id=1, issue_iid=31)
+            assert exc_info.value.response.json() == {"message": "404 Issue Not Found"}
+            with pytest.raises(requests.HTTPError):
+                client.user.get_user(account_id=11)
+            with pytest.raises(requests.HTTPError):
+                client._request("GET", "/runners")
+
+    def test_rate_limit(self):
+        """Test that requests beyond the rate limit are answered with 429 and Retry-After."""
+        with MockGitLab(rate_limit=2) as server, GitLab(token="token", base_url=server.url) as client:
+            response = client._request("GET", "/user")
+            client._request("GET", "/user")
+            with pytest.raises(requests.HTTPError) as exc_info:
+                client._request("GET", "/user")
+
+        assert response.headers["RateLimit-Limit"] == "2"
+        assert response.headers["RateLimit-Remaining"] == "1"
+        assert exc_info.value.response.status_code == 429  # noqa: PLR2004
+        assert int(exc_info.value.response.headers["Retry-After"]) >= 1
+        assert server.statuses[429] == 1
+
+    def test_faults(self):
+        """Test that faults are injected at the configured rate."""
+        with (
+            MockGitLab(fault_rate=1.0, fault_statuses=(503,)) as server,
+            GitLab(base_url=server.url) as client,
+            pytest.raises(requests.HTTPError) as exc_info,
+        ):
+            client.user.get_user()
+
+        assert exc_info.value.response.status_code == 503  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_async_server(self):
+        """Test that the server runs on the event loop of the caller and adds its latency."""
+        async with (
+            MockGitLab(latency=0.05, projects=2) as server,
+            AsyncGitLab(token="token", base_url=server.url) as client,
+        ):
+            project = await client._request("GET", "/projects/group-1%2Fproject-1")
+            data = await project.json()
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client._request("GET", "/projects/3")
+
+        assert data["id"] == 1
+        assert float(project.headers["X-Runtime"]) >= 0.05  # noqa: PLR2004
+        assert server.url.startswith("http://127.0.0.1:")
+
+    def test_str(self):
+        """Test the string representation."""
+        assert str(MockGitLab(projects=3, issues_per_project=7)) == (
+            "<MockGitLab url=None projects=3 issues_per_project=7>"
+        )
@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from glnova.client.adaptive import AIMDController
+from glnova.client.deadline import Deadline
 from glnova.user.async_user import AsyncUser
 
 
@@ -176,3 +178,69 @@ class TestAsyncUser:
         result = await user.list_users()
 
         assert result == ([], {"status_code": 304, "etag": "etag123"})  # Special handling for 304 in list_users
+
+
+class TestAsyncUserResolver:
+    """Test cases for resolving usernames and emails to user IDs asynchronously."""
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_id_cached(self):
+        """Test that the authenticated user ID is fetched once."""
+        user = AsyncUser(client=MagicMock())
+        user.get_user = AsyncMock(return_value=({"id": 5, "username": "me"}, {"status_code": 200, "etag": None}))
+
+        assert await user.get_current_user_id() == 5  # noqa: PLR2004
+        assert await user.get_current_user_id() == 5  # noqa: PLR2004
+        user.get_user.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_resolve_user_ids(self):
+        """Test resolving several identifiers concurrently."""
+        user = AsyncUser(client=MagicMock())
+
+        async def list_users(username=None, search=None, **kwargs):
+            users = [{"id": 1, "username": "alice"}] if username == "alice" else []
+            return users, {"status_code": 200, "etag": None}
+
+        user.list_users = AsyncMock(side_effect=list_users)
+
+        result = await user.resolve_user_ids(["alice", "ghost"], max_workers=2)
+
+        assert result == {"alice": 1}
+        assert user.list_users.call_count == 2  # noqa: PLR2004
+        assert await user.resolve_user_id("alice") == 1
+        assert user.list_users.call_count == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_resolve_user_ids_deadline(self):
+        """Test that lookups cut short by the deadline are omitted."""
+        user = AsyncUser(client=MagicMock())
+        deadline = Deadline(timeout=10.0)
+
+        async def list_users(username=None, search=None, **kwargs):
+            if username == "alice":
+                return [{"id": 1, "username": "alice"}], {"status_code": 200, "etag": None}
+            raise deadline.exceed()
+
+        user.list_users = AsyncMock(side_effect=list_users)
+
+        result = await user.resolve_user_ids(["alice", "bob"], deadline=deadline)
+
+        assert result == {"alice": 1}
+        assert deadline.exceeded is True
+
+    @pytest.mark.asyncio
+    async def test_resolve_user_ids_adaptive(self):
+        """Test resolving several identifiers with an adaptive controller."""
+        user = AsyncUser(client=MagicMock())
+
+        async def list_users(username=None, search=None, **kwargs):
+            return [{"id": len(username), "username": username}], {"status_code": 200, "etag": None}
+
+        user.list_users = AsyncMock(side_effect=list_users)
+        controller = AIMDController(initial_limit=1)
+
+        result = await user.resolve_user_ids(["al", "bob", "carol"], controller=controller)
+
+        assert result == {"al": 2, "bob": 3, "carol": 5}
+        assert controller.limit > 1
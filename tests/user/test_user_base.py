@@ -246,3 +246,30 @@ class TestBaseUser:
         }
         assert params == expected_params
         assert kwargs == {"extra": "value"}
+
+
+class TestBaseUserLookup:
+    """Test cases for the user lookup helpers."""
+
+    def test_user_cache_key(self):
+        """Test normalizing usernames and emails."""
+        base_user = BaseUser()
+        assert base_user._user_cache_key(" @Alice ") == "alice"
+        assert base_user._user_cache_key("Alice@Example.com") == "alice@example.com"
+
+    def test_user_lookup_params(self):
+        """Test the list users filters for usernames and emails."""
+        base_user = BaseUser()
+        assert base_user._user_lookup_params("@alice") == {"username": "alice"}
+        assert base_user._user_lookup_params("alice@example.com") == {"search": "alice@example.com"}
+
+    def test_match_user(self):
+        """Test matching users exactly."""
+        base_user = BaseUser()
+        users = [
+            {"id": 1, "username": "alice2", "public_email": "alice2@example.com"},
+            {"id": 2, "username": "alice", "public_email": "Alice@Example.com"},
+        ]
+        assert base_user._match_user("alice", users) == 2  # noqa: PLR2004
+        assert base_user._match_user("alice@example.com", users) == 2  # noqa: PLR2004
+        assert base_user._match_user("bob", users) is None
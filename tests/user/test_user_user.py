@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+from glnova.client.adaptive import AIMDController
+from glnova.client.deadline import Deadline
 from glnova.user.user import User
 
 
@@ -152,3 +154,72 @@ class TestUser:
         result = user.list_users()
 
         assert result == ([], {"status_code": 304, "etag": "etag123"})  # Special handling for 304 in list_users
+
+
+class TestUserResolver:
+    """Test cases for resolving usernames and emails to user IDs."""
+
+    def test_get_current_user_id_cached(self):
+        """Test that the authenticated user ID is fetched once."""
+        user = User(client=MagicMock())
+        user.get_user = MagicMock(return_value=({"id": 5, "username": "me"}, {"status_code": 200, "etag": None}))
+
+        assert user.get_current_user_id() == 5  # noqa: PLR2004
+        assert user.get_current_user_id() == 5  # noqa: PLR2004
+        user.get_user.assert_called_once_with()
+        assert user.resolve_user_id("me") == 5  # noqa: PLR2004
+
+    def test_resolve_user_ids(self):
+        """Test resolving several identifiers with caching."""
+        user = User(client=MagicMock())
+        directory = {
+            "alice": [{"id": 1, "username": "alice"}],
+            "bob@example.com": [{"id": 2, "username": "bob", "public_email": "bob@example.com"}],
+        }
+
+        def list_users(username=None, search=None, **kwargs):
+            return directory.get(username or search, []), {"status_code": 200, "etag": None}
+
+        user.list_users = MagicMock(side_effect=list_users)
+
+        result = user.resolve_user_ids(["alice", "bob@example.com", "alice", "ghost"])
+
+        assert result == {"alice": 1, "bob@example.com": 2}
+        assert user.list_users.call_count == 3  # noqa: PLR2004
+
+        user.list_users.reset_mock()
+        assert user.resolve_user_ids(["@Alice"]) == {"@Alice": 1}
+        user.list_users.assert_not_called()
+
+    def test_resolve_user_ids_deadline(self):
+        """Test that lookups cut short by the deadline are omitted."""
+        user = User(client=MagicMock())
+        deadline = Deadline(timeout=10.0)
+
+        def list_users(username=None, search=None, **kwargs):
+            assert kwargs["deadline"] is deadline
+            if username == "alice":
+                return [{"id": 1, "username": "alice"}], {"status_code": 200, "etag": None}
+            raise deadline.exceed()
+
+        user.list_users = MagicMock(side_effect=list_users)
+
+        result = user.resolve_user_ids(["alice", "bob"], deadline=deadline)
+
+        assert result == {"alice": 1}
+        assert deadline.exceeded is True
+
+    def test_resolve_user_ids_adaptive(self):
+        """Test resolving several identifiers with an adaptive controller."""
+        user = User(client=MagicMock())
+
+        def list_users(username=None, search=None, **kwargs):
+            return [{"id": len(username), "username": username}], {"status_code": 200, "etag": None}
+
+        user.list_users = MagicMock(side_effect=list_users)
+        controller = AIMDController(initial_limit=1)
+
+        result = user.resolve_user_ids(["al", "bob", "carol"], controller=controller)
+
+        assert result == {"al": 2, "bob": 3, "carol": 5}
+        assert controller.limit > 1
@@ -0,0 +1,21 @@
+"""Unit tests for endpoint utilities."""
+
+from glnova.utils.endpoint import get_endpoint_template
+
+
+class TestEndpointUtils:
+    """Test cases for endpoint utilities."""
+
+    def test_numeric_ids(self):
+        """Test that numeric IDs are replaced."""
+        assert get_endpoint_template("/projects/42/issues/7") == "/projects/:id/issues/:id"
+
+    def test_encoded_paths(self):
+        """Test that URL-encoded paths are replaced and the query string is dropped."""
+        assert get_endpoint_template("projects/group%2Fproject/merge_requests?state=opened") == (
+            "/projects/:id/merge_requests"
+        )
+
+    def test_static_endpoint(self):
+        """Test that endpoints without IDs are unchanged."""
+        assert get_endpoint_template("/user") == "/user"
@@ -0,0 +1,44 @@
+"""Unit tests for lazy loading utilities."""
+
+import sys
+import types
+
+import pytest
+
+import glnova
+from glnova.utils.lazy import lazy_exports
+
+
+@pytest.fixture
+def package():
+    """Register a package exporting objects of other modules."""
+    module = types.ModuleType("lazy_package")
+    module.__getattr__, module.__dir__ = lazy_exports("lazy_package", {"dumps": "json", "JSONDecoder": "json.decoder"})
+    sys.modules["lazy_package"] = module
+    yield module
+    del sys.modules["lazy_package"]
+
+
+class TestLazyExports:
+    """Test cases for lazy_exports."""
+
+    def test_attribute(self, package):
+        """Test that an export is imported on first access and cached on the package."""
+        import json  # noqa: PLC0415
+
+        assert package.dumps is json.dumps
+        assert vars(package)["dumps"] is json.dumps
+
+    def test_subpackage(self):
+        """Test that an export naming a subpackage returns the subpackage."""
+        assert glnova.client is sys.modules["glnova.client"]
+        assert glnova.__version__ == sys.modules["glnova.version"].__version__
+
+    def test_unknown(self, package):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            _ = package.missing
+
+    def test_dir(self, package):
+        """Test that the exports are listed before they are imported."""
+        assert {"dumps", "JSONDecoder"} <= set(dir(package))
@@ -0,0 +1,88 @@
+"""Unit tests for the metrics utilities."""
+
+import urllib.request
+
+import pytest
+
+from glnova.utils.metrics import MetricsRegistry, start_http_server
+
+
+class TestMetricsRegistry:
+    """Test cases for the MetricsRegistry class."""
+
+    def test_counter_and_gauge(self):
+        """Test that counters and gauges render in the text exposition format."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs run.", ("state",))
+        gauge = registry.gauge("workers", "Active workers.")
+        counter.inc(state="done")
+        counter.inc(2, state='with "quote"')
+        gauge.set(3)
+        gauge.dec()
+
+        assert registry.render() == (
+            "# HELP jobs_total Jobs run.\n"
+            "# TYPE jobs_total counter\n"
+            'jobs_total{state="done"} 1\n'
+            'jobs_total{state="with \\"quote\\""} 2\n'
+            "# HELP workers Active workers.\n"
+            "# TYPE workers gauge\n"
+            "workers 2\n"
+        )
+
+    def test_histogram(self):
+        """Test that histograms render cumulative buckets, the sum and the count."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        lines = registry.render().splitlines()
+
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 2' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+        assert "latency_seconds_sum 5.55" in lines
+        assert "latency_seconds_count 3" in lines
+        assert histogram.get_count() == 3  # noqa: PLR2004
+
+    def test_register_existing(self):
+        """Test that a metric is created once and conflicting registrations are rejected."""
+        registry = MetricsRegistry()
+
+        assert registry.counter("hits", "Hits.") is registry.counter("hits", "Hits.")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("hits", "Hits.")
+
+    def test_invalid_labels(self):
+        """Test that samples must carry exactly the declared labels."""
+        counter = MetricsRegistry().counter("hits", "Hits.", ("endpoint",))
+
+        with pytest.raises(ValueError, match="expects the labels"):
+            counter.inc()
+        with pytest.raises(ValueError, match="only increase"):
+            counter.inc(-1, endpoint="/user")
+
+
+class TestStartHttpServer:
+    """Test cases for the metrics HTTP exporter."""
+
+    def test_serves_metrics(self):
+        """Test that the exporter serves the registry at /metrics only."""
+        registry = MetricsRegistry()
+        registry.counter("hits", "Hits.").inc()
+        server = start_http_server(registry, port=0)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert "hits 1" in body
+        assert content_type.startswith("text/plain; version=0.0.4")
@@ -4,7 +4,11 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from glnova.utils.response import process_async_response_with_last_modified, process_response_with_last_modified
+from glnova.utils.response import (
+    get_error_status,
+    process_async_response_with_last_modified,
+    process_response_with_last_modified,
+)
 
 
 class TestResponseUtils:
@@ -80,3 +84,25 @@ class TestResponseUtils:
         result = await process_async_response_with_last_modified(mock_response)
 
         assert result == ({"key": "value"}, 200, None)
+
+
+class TestGetErrorStatus:
+    """Test cases for get_error_status."""
+
+    def test_aiohttp_error(self):
+        """Test that the status of an aiohttp error is returned."""
+        error = MagicMock(spec=["status"])
+        error.status = 429
+
+        assert get_error_status(error) == 429  # noqa: PLR2004
+
+    def test_requests_error(self):
+        """Test that the status of the response of a requests error is returned."""
+        error = MagicMock(spec=["response"])
+        error.response.status_code = 502
+
+        assert get_error_status(error) == 502  # noqa: PLR2004
+
+    def test_no_response(self):
+        """Test that errors without a response have no status."""
+        assert get_error_status(ConnectionError()) is None